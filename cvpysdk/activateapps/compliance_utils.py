@@ -119,6 +119,7 @@ import requests
 
 from cvpysdk.activateapps.constants import ComplianceConstants
 from cvpysdk.exception import SDKException
+from cvpysdk.file_transfer import FileDownloader
 
 
 class ComplianceSearchUtils:
@@ -820,12 +821,44 @@ class Export:
             ],
         }
 
-    def download_export(self, download_folder):
+    def download_export(
+        self,
+        download_folder,
+        chunk_size=1024**2,
+        max_streams=4,
+        resume=True,
+        checksum=None,
+        progress_callback=None,
+    ):
         """Method to download the exported items to a zip file
 
+        The stream download uses concurrent byte range streams if the server supports them,
+        and resumes a partial download of the zip file in the folder.
+
         Args:
             download_folder     (str)   -   Path of the folder in which exported items zip file should be saved
 
+            chunk_size          (int)   -   Number of bytes read from the stream at a time
+
+                default: 1 MB
+
+            max_streams         (int)   -   Maximum number of concurrent byte range streams
+
+                default: 4
+
+            resume              (bool)  -   Whether to resume a partial download of the zip file
+
+                default: True
+
+            checksum            (str)   -   Expected SHA-256 hex digest of the zip file
+
+                default: None, the checksum is not verified
+
+            progress_callback   (callable)  -   Function called with the downloaded bytes and the
+            size of the zip file, as the file is downloaded
+
+                default: None
+
         Returns:
             (str) path of the downloaded zip file
 
@@ -874,20 +907,16 @@ class Export:
                 }
             )
 
-            flag, response = self._cvpysdk_object.make_request(
-                method="POST",
-                url=self._download_via_stream,
-                payload=self._download_file_json_req,
-                stream=True,
+            downloader = FileDownloader(
+                self._commcell,
+                self._download_via_stream,
+                self._download_file_json_req,
+                chunk_size=chunk_size,
+                max_streams=max_streams,
+                checksum=checksum,
+                progress_callback=progress_callback,
             )
-
-            if flag:
-                try:
-                    with open(download_file, "wb") as f:
-                        for content in response.iter_content():
-                            f.write(content)
-                except Exception:
-                    raise SDKException("Response", "102")
-                return download_file
-            else:
-                self._response_not_success(response)
+            try:
+                return downloader.download(download_file, resume=resume)
+            except OSError:
+                raise SDKException("Response", "102")
@@ -76,6 +76,8 @@ EdiscoveryClientOperations:
 
     search()                            --  returns the search response containing document details
 
+    iter_search()                       --  streams the documents of a search, page by page
+
     get_handler_id()                    --  returns the handler id for this Ediscovery client
 
     schedule()                          --  Creates or modifies the schedule associated with ediscovery client
@@ -159,6 +161,8 @@ EdiscoveryDataSource:
 
     search()                                --  returns the search response containing document details
 
+    iter_search()                           --  streams the documents of a search, page by page
+
     export()                                --  do export to CSV on data
 
     wait_for_export()                       --  waits for export to csv operation to finish
@@ -222,7 +226,9 @@ from ..activateapps.constants import (
     TargetApps,
 )
 from ..activateapps.entity_manager import EntityManagerTypes
+from ..datacube.search_iterator import SearchIterator
 from ..exception import SDKException
+from ..file_transfer import FileDownloader
 
 
 class EdiscoveryClients:
@@ -807,8 +813,17 @@ class EdiscoveryClientOperations:
             "Response", "101", self._commcell_object._update_response_(response.text)
         )
 
-    def _do_stream_download(self, guid, file_name, download_location):
-        """does stream download to file to local machine
+    def _do_stream_download(
+        self,
+        guid,
+        file_name,
+        download_location,
+        chunk_size=1024**2,
+        max_streams=4,
+        progress_callback=None,
+    ):
+        """does stream download to file to local machine, with concurrent byte range streams
+        if the server supports them
 
         Args:
 
@@ -818,6 +833,19 @@ class EdiscoveryClientOperations:
 
             file_name           (str)       --  File name for download
 
+            chunk_size          (int)       --  number of bytes read from the stream at a time
+
+                default: 1 MB
+
+            max_streams         (int)       --  maximum number of concurrent byte range streams
+
+                default: 4
+
+            progress_callback   (callable)  --  function called with the downloaded bytes and
+            the size of the file, as the file is downloaded
+
+                default: None
+
         Returns:
 
             Str     --  File path containing downloaded file
@@ -852,22 +880,18 @@ class EdiscoveryClientOperations:
             # full path of the file on local machine to be downloaded
             download_path = os.path.join(download_location, file_name)
 
-            # execute request to get the stream of content
+            # download the stream of content
             # using request id returned in the previous response
             request["requestId"] = request_id
-            flag1, response1 = self._cvpysdk_object.make_request(
-                "POST", self._services["DOWNLOAD_VIA_STREAM"], request, stream=True
+            downloader = FileDownloader(
+                self._commcell_object,
+                self._services["DOWNLOAD_VIA_STREAM"],
+                request,
+                chunk_size=chunk_size,
+                max_streams=max_streams,
+                progress_callback=progress_callback,
             )
-
-            # download chunks of 1MB each
-            chunk_size = 1024**2
-
-            if flag1:
-                with open(download_path, "wb") as file_pointer:
-                    for content in response1.iter_content(chunk_size=chunk_size):
-                        file_pointer.write(content)
-            else:
-                self._response_not_success(response1)
+            downloader.download(download_path)
         else:
             self._response_not_success(response)
 
@@ -1017,40 +1041,93 @@ class EdiscoveryClientOperations:
             search_params,
         )
         if flag:
-            if response.json():
-                if "errorCode" in response.json() and response.json()["errorCode"] != 0:
+            response_json = response.json()
+            if response_json:
+                if "errorCode" in response_json and response_json["errorCode"] != 0:
                     raise SDKException(
                         "EdiscoveryClients",
                         "102",
-                        f"Failed to perform search - {response.json().get('errLogMessage', '')}",
+                        f"Failed to perform search - {response_json.get('errLogMessage', '')}",
                     )
-                if "response" in response.json() and "docs" in response.json()["response"]:
-                    if "facets" in response.json():
-                        return (
-                            response.json()["response"]["numFound"],
-                            response.json()["response"]["docs"],
-                            response.json()["facets"],
-                        )
-                    elif "stats" in response.json():
-                        return (
-                            response.json()["response"]["numFound"],
-                            response.json()["response"]["docs"],
-                            response.json()["stats"],
-                        )
+                if "response" in response_json and "docs" in response_json["response"]:
+                    if "facets" in response_json:
+                        facets = response_json["facets"]
                     else:
-                        return (
-                            response.json()["response"]["numFound"],
-                            response.json()["response"]["docs"],
-                            {},
-                        )
+                        facets = response_json.get("stats", {})
+                    return (
+                        response_json["response"]["numFound"],
+                        response_json["response"]["docs"],
+                        facets,
+                    )
                 raise SDKException(
                     "EdiscoveryClients",
                     "102",
-                    f"Failed to search with response - {response.json()}",
+                    f"Failed to search with response - {response_json}",
                 )
             raise SDKException("EdiscoveryClients", "112")
         self._response_not_success(response)
 
+    def iter_search(
+        self, criteria=None, attr_list=None, params=None, page_size=500, limit=None, prefetch=True
+    ):
+        """streams the documents of a search on data source, page by page
+
+        Args:
+
+            criteria        (str)      --  containing criteria for query
+                                                (Default : None - returns all docs)
+
+            attr_list       (set)      --  Column names to be returned in results.
+                                                 Acts as 'fl' in query
+
+            params          (dict)     --  Any other params which needs to be passed.
+                                                'start' is the offset of the first document,
+                                                'rows' is replaced by the page size
+
+            page_size       (int)      --  number of documents fetched with each request
+
+                default: 500
+
+            limit           (int)      --  maximum number of documents to return
+
+                default: None (all the documents)
+
+            prefetch        (bool)     --  whether to fetch the next page while the current
+                                                page is consumed
+
+                default: True
+
+        Returns:
+
+            obj     --  SearchIterator yielding the document details, with the document count
+                            and facet/stats details as its num_found and facets attributes
+
+        Raises:
+
+            SDKException:
+
+                    if the input is not valid
+
+                    if failed to perform search of a page
+
+        """
+        if criteria and not isinstance(criteria, str):
+            raise SDKException("EdiscoveryClients", "101")
+        params = dict(params or {})
+        start = int(params.pop("start", 0))
+        params.pop("rows", None)
+
+        def fetch_page(offset, rows):
+            return self.search(
+                criteria=criteria,
+                attr_list=attr_list,
+                params={**params, "start": offset, "rows": rows},
+            )
+
+        return SearchIterator(
+            fetch_page, page_size=page_size, limit=limit, start=start, prefetch=prefetch
+        )
+
     def _get_associations(self):
         """returns the associations for this client
 
@@ -3119,6 +3196,55 @@ class EdiscoveryDatasource:
             criteria=criteria, attr_list=attr_list, params=params
         )
 
+    def iter_search(
+        self, criteria=None, attr_list=None, params=None, page_size=500, limit=None, prefetch=True
+    ):
+        """streams the documents of a search on data source, page by page
+
+        Args:
+
+            criteria        (str)      --  containing criteria for query
+                                                (Default : None - returns all docs)
+
+            attr_list       (set)      --  Column names to be returned in results.
+                                                 Acts as 'fl' in query
+
+            params          (dict)     --  Any other params which needs to be passed
+                                               Example : { "start" : "0" }
+
+            page_size       (int)      --  number of documents fetched with each request
+
+                default: 500
+
+            limit           (int)      --  maximum number of documents to return
+
+                default: None (all the documents)
+
+            prefetch        (bool)     --  whether to fetch the next page while the current
+                                                page is consumed
+
+                default: True
+
+        Returns:
+
+            obj     --  SearchIterator yielding the document details
+
+        Raises:
+
+            SDKException:
+
+                    if failed to perform search of a page
+
+        """
+        return self._ediscovery_client_ops.iter_search(
+            criteria=criteria,
+            attr_list=attr_list,
+            params=params,
+            page_size=page_size,
+            limit=limit,
+            prefetch=prefetch,
+        )
+
     def _form_request_options(self, req_name, reviewers, approvers, document_ids=None):
         """Returns the options for review request
 
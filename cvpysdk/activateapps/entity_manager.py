@@ -299,6 +299,7 @@ import time
 from enum import Enum
 
 from ..exception import SDKException
+from ..file_transfer import FileUploader
 from .constants import (
     ActivateEntityConstants,
     ClassifierConstants,
@@ -2744,18 +2745,42 @@ class Classifier:
 
         self._response_not_success(response)
 
-    def upload_data(self, zip_file, start_training=False):
+    def upload_data(
+        self,
+        zip_file,
+        start_training=False,
+        chunk_size=1048576,
+        progress_callback=None,
+        max_retries=3,
+    ):
         """Uploads the model training data set zip file to content analyzer machine
 
+        The zip file is streamed from disk in chunks, the next chunk being read while the current
+        chunk is sent, and a chunk that fails to upload is retried
+
         Args:
 
             zip_file        (str)       --      Zip file path
 
             start_training  (bool)      --      Denotes whether to start training on classifier or not
 
+            chunk_size      (int)       --      Number of bytes sent in each upload request
+
+                                                    default: 1MB
+
+            progress_callback   (callable)  --  Function called after each chunk with the bytes sent,
+                                                the size of the file, and the throughput in bytes per second
+
+                                                    default: None
+
+            max_retries     (int)       --      Number of retries of a chunk after a failure
+
+                                                    default: 3
+
         Returns:
 
-            None
+            dict    --  transfer statistics of the upload, with the bytes and chunks sent,
+                        the duration in seconds, and the throughput in bytes per second
 
         Raises
 
@@ -2765,54 +2790,40 @@ class Classifier:
 
 
         """
-        chunk_size = 1048576  # 1MB
         request_id = self._get_upload_request_id(zip_file=zip_file)
-        file_stat = os.stat(zip_file)
         req_length = len(request_id)
-        file_byte = open(zip_file, "rb")
-        flag_byte = self._get_upload_flag_bit(
-            flags=self._data_chunk_eof, request_data_length=req_length
-        )
         xml_byte = bytearray(request_id, "utf-8")
-        if file_stat.st_size <= chunk_size:
-            # full file upload
-            data_byte = file_byte.read()
-            file_byte.close()
-            payload = flag_byte + xml_byte + data_byte
-            flag, response = self._cvpysdk_obj.make_request(
-                method="POST", url=self._get_upload_api(), payload=payload
-            )
-            self._validate_upload_response(flag=flag, response=response, size=file_stat.st_size)
-        else:
-            # chunk based upload
-            file_size = file_stat.st_size
-            chunk_count = 1
-            while file_size > chunk_size:
-                flag_byte = self._get_upload_flag_bit(
-                    flags=self._data_chunk, request_data_length=req_length
-                )
-                file_size = file_size - chunk_size
-                data_byte = file_byte.read(chunk_size)
-                payload = flag_byte + xml_byte + data_byte
-                flag, response = self._cvpysdk_obj.make_request(
-                    method="POST", url=self._get_upload_api(), payload=payload
-                )
-                self._validate_upload_response(
-                    flag=flag, response=response, size=chunk_size * chunk_count
-                )
-                chunk_count = chunk_count + 1
+        upload_api = self._get_upload_api()
+        header_size = len(self._data_chunk) + 4 + len(xml_byte)
+
+        def send_chunk(chunk, offset, is_last):
+            """Uploads a chunk of the zip file, after writing the flag and request in its header"""
             flag_byte = self._get_upload_flag_bit(
-                flags=self._data_chunk_eof, request_data_length=req_length
+                flags=self._data_chunk_eof if is_last else self._data_chunk,
+                request_data_length=req_length,
             )
-            data_byte = file_byte.read(file_size)
+            chunk[:header_size] = flag_byte + xml_byte
             flag, response = self._cvpysdk_obj.make_request(
-                method="POST", url=self._get_upload_api(), payload=flag_byte + xml_byte + data_byte
+                method="POST", url=upload_api, payload=chunk
+            )
+            self._validate_upload_response(
+                flag=flag, response=response, size=offset + len(chunk) - header_size
             )
-            self._validate_upload_response(flag=flag, response=response, size=file_stat.st_size)
-            file_byte.close()
+
+        uploader = FileUploader(
+            send_chunk,
+            chunk_size=chunk_size,
+            header_size=header_size,
+            progress_callback=progress_callback,
+            max_retries=max_retries,
+        )
+        upload_stats = uploader.upload(zip_file)
+
         if start_training:
             self.start_training(wait_for=True)
 
+        return upload_stats
+
     def _get_entity_properties(self):
         """Get classifier entity properties
         Args:
@@ -62,6 +62,8 @@ FsoServer:
 
      search()                           --  returns the search response containing document details
 
+     iter_search()                      --  streams the documents of a search, page by page
+
      add_schedule()                     --  creates schedule for this fso server
 
      delete_schedule()                  --  deletes schedule for this fso server
@@ -117,6 +119,8 @@ FsoServerGroup:
 
      search()                           --  returns the search response containing document details
 
+     iter_search()                      --  streams the documents of a search, page by page
+
 FsoServerGroup Attributes:
 ---------------------------
 
@@ -501,6 +505,55 @@ class FsoServer:
             criteria=criteria, attr_list=attr_list, params=params
         )
 
+    def iter_search(
+        self, criteria=None, attr_list=None, params=None, page_size=500, limit=None, prefetch=True
+    ):
+        """streams the documents of a search on server data, page by page
+
+        Args:
+
+            criteria        (str)      --  containing criteria for query
+                                                (Default : None - returns all docs)
+
+            attr_list       (set)      --  Column names to be returned in results.
+                                                 Acts as 'fl' in query
+
+            params          (dict)     --  Any other params which needs to be passed
+                                               Example : { "start" : "0" }
+
+            page_size       (int)      --  number of documents fetched with each request
+
+                default: 500
+
+            limit           (int)      --  maximum number of documents to return
+
+                default: None (all the documents)
+
+            prefetch        (bool)     --  whether to fetch the next page while the current
+                                                page is consumed
+
+                default: True
+
+        Returns:
+
+            obj     --  SearchIterator yielding the document details
+
+        Raises:
+
+            SDKException:
+
+                    if failed to perform search of a page
+
+        """
+        return self._ediscovery_client_ops.iter_search(
+            criteria=criteria,
+            attr_list=attr_list,
+            params=params,
+            page_size=page_size,
+            limit=limit,
+            prefetch=prefetch,
+        )
+
     def add_schedule(self, schedule_name, pattern_json):
         """Creates the schedule and associate it with server
 
@@ -996,6 +1049,55 @@ class FsoServerGroup:
             criteria=criteria, attr_list=attr_list, params=params
         )
 
+    def iter_search(
+        self, criteria=None, attr_list=None, params=None, page_size=500, limit=None, prefetch=True
+    ):
+        """streams the documents of a search on client group data, page by page
+
+        Args:
+
+            criteria        (str)      --  containing criteria for query
+                                                (Default : None - returns all docs)
+
+            attr_list       (set)      --  Column names to be returned in results.
+                                                 Acts as 'fl' in query
+
+            params          (dict)     --  Any other params which needs to be passed
+                                               Example : { "start" : "0" }
+
+            page_size       (int)      --  number of documents fetched with each request
+
+                default: 500
+
+            limit           (int)      --  maximum number of documents to return
+
+                default: None (all the documents)
+
+            prefetch        (bool)     --  whether to fetch the next page while the current
+                                                page is consumed
+
+                default: True
+
+        Returns:
+
+            obj     --  SearchIterator yielding the document details
+
+        Raises:
+
+            SDKException:
+
+                    if failed to perform search of a page
+
+        """
+        return self._ediscovery_client_ops.iter_search(
+            criteria=criteria,
+            attr_list=attr_list,
+            params=params,
+            page_size=page_size,
+            limit=limit,
+            prefetch=prefetch,
+        )
+
     def get(self, server_name):
         """returns the FsoServer object for given server name
 
@@ -60,6 +60,8 @@ Projects:
 
     get_extracted_solr_query()          --  Construct a Solr query string for the given entity values
 
+    iter_search()                       --  streams the documents of a search on all the projects, page by page
+
 Project:
 
      __init__()                         --  initialise object of the Project class
@@ -84,6 +86,8 @@ Project:
 
      search()                           --  returns the search response containing document details from project
 
+     iter_search()                      --  streams the documents of a search on project, page by page
+
 
 Project Attributes
 --------------------
@@ -323,6 +327,55 @@ class Projects:
             criteria=criteria, attr_list=attr_list, params=params
         )
 
+    def iter_search(
+        self, criteria=None, attr_list=None, params=None, page_size=500, limit=None, prefetch=True
+    ):
+        """streams the documents of a search on all the projects, page by page
+
+        Args:
+
+            criteria        (str)      --  containing criteria for query
+                                                (Default : None - returns all docs)
+
+            attr_list       (set)      --  Column names to be returned in results.
+                                                 Acts as 'fl' in query
+
+            params          (dict)     --  Any other params which needs to be passed
+                                               Example : { "start" : "0" }
+
+            page_size       (int)      --  number of documents fetched with each request
+
+                default: 500
+
+            limit           (int)      --  maximum number of documents to return
+
+                default: None (all the documents)
+
+            prefetch        (bool)     --  whether to fetch the next page while the current
+                                                page is consumed
+
+                default: True
+
+        Returns:
+
+            obj     --  SearchIterator yielding the document details
+
+        Raises:
+
+            SDKException:
+
+                    if failed to perform search of a page
+
+        """
+        return self._ediscovery_client_ops.iter_search(
+            criteria=criteria,
+            attr_list=attr_list,
+            params=params,
+            page_size=page_size,
+            limit=limit,
+            prefetch=prefetch,
+        )
+
     def sensitive_files_count(self, app_type=EdiscoveryConstants.APP_TYPE_ALL):
         """
         Retrieve the count of sensitive files for a given application type.
@@ -664,6 +717,55 @@ class Project:
             criteria=criteria, attr_list=attr_list, params=params
         )
 
+    def iter_search(
+        self, criteria=None, attr_list=None, params=None, page_size=500, limit=None, prefetch=True
+    ):
+        """streams the documents of a search on entire project, page by page
+
+        Args:
+
+            criteria        (str)      --  containing criteria for query
+                                                (Default : None - returns all docs)
+
+            attr_list       (set)      --  Column names to be returned in results.
+                                                 Acts as 'fl' in query
+
+            params          (dict)     --  Any other params which needs to be passed
+                                               Example : { "start" : "0" }
+
+            page_size       (int)      --  number of documents fetched with each request
+
+                default: 500
+
+            limit           (int)      --  maximum number of documents to return
+
+                default: None (all the documents)
+
+            prefetch        (bool)     --  whether to fetch the next page while the current
+                                                page is consumed
+
+                default: True
+
+        Returns:
+
+            obj     --  SearchIterator yielding the document details
+
+        Raises:
+
+            SDKException:
+
+                    if failed to perform search of a page
+
+        """
+        return self._ediscovery_client_ops.iter_search(
+            criteria=criteria,
+            attr_list=attr_list,
+            params=params,
+            page_size=page_size,
+            limit=limit,
+            prefetch=prefetch,
+        )
+
     def share(self, user_or_group_name, allow_edit_permission=False, is_user=True, ops_type=1):
         """Shares project with given user or user group in commcell
 
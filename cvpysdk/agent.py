@@ -67,6 +67,8 @@ Agent:
 
     update_properties()         --  to update the agent properties
 
+    properties_copy()           --  returns a deep copy of the properties of the agent
+
     enable_backup()             --   enables the backup for the agent
 
     enable_backup_at_time()     --   enables the backup for the agent at the input time specified
@@ -96,6 +98,7 @@ from .backupset import Backupsets
 from .constants import AppIDAName
 from .exception import SDKException
 from .instance import Instances
+from .properties_view import PropertiesView, to_plain
 from .schedules import Schedules
 
 if TYPE_CHECKING:
@@ -810,7 +813,7 @@ class Agent:
         """Update the agent properties with the specified values.
 
         This method updates the agent's configuration using the provided dictionary of properties.
-        To modify agent properties, obtain a deep copy using `self.properties`, update the desired fields,
+        To modify agent properties, obtain a deep copy using `self.properties_copy()`, update the desired fields,
         and pass the modified dictionary to this method.
 
         Args:
@@ -821,12 +824,13 @@ class Agent:
 
         Example:
             >>> agent = Agent(...)
-            >>> props = agent.properties.copy()  # Get a deep copy of current properties
+            >>> props = agent.properties_copy()  # Get a deep copy of current properties
             >>> props['AgentProperties']['someProperty'] = 'newValue'
             >>> agent.update_properties(props)
             >>> print("Agent properties updated successfully")
         #ai-gen-doc
         """
+        properties_dict = to_plain(properties_dict)
         request_json = {
             "agentProperties": {
                 "AgentProperties": {},
@@ -843,11 +847,14 @@ class Agent:
         self._process_update_request(request_json)
 
     @property
-    def properties(self) -> Dict[str, Any]:
-        """Get a copy of the agent's properties.
+    def properties(self) -> PropertiesView:
+        """Get a read-only view of the agent's properties.
+
+        The view reads the current properties without copying them. Use `properties_copy()`
+        to get a dictionary which can be modified.
 
         Returns:
-            Dictionary containing the agent's properties and configuration details.
+            Read-only mapping containing the agent's properties and configuration details.
 
         Example:
             >>> agent = Agent(...)
@@ -855,6 +862,21 @@ class Agent:
             >>> print(agent_props)
             >>> # The returned dictionary contains agent-specific settings
 
+        #ai-gen-doc
+        """
+        return PropertiesView(self._agent_properties)
+
+    def properties_copy(self) -> Dict[str, Any]:
+        """Get a deep copy of the properties of the agent, which can be modified.
+
+        Returns:
+            A deep copy of the agent properties, to pass to `update_properties()`.
+
+        Example:
+            >>> props = agent.properties_copy()
+            >>> props['AgentProperties']['userDescription'] = 'Updated description'
+            >>> agent.update_properties(props)
+
         #ai-gen-doc
         """
         return copy.deepcopy(self._agent_properties)
@@ -905,7 +927,7 @@ class Agent:
 
         #ai-gen-doc
         """
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         update_properties["AgentProperties"]["userDescription"] = description
         self.update_properties(update_properties)
 
@@ -1314,7 +1336,7 @@ class Agent:
         if int(self.agent_id) != 137:
             raise SDKException("Agent", "102", f"Invalid operation for {self.agent_name}")
 
-        _agent_properties = self.properties
+        _agent_properties = self.properties_copy()
         _agent_properties["onePassProperties"]["onePassProp"]["ewsDetails"]["bUseEWS"] = True
         _agent_properties["onePassProperties"]["onePassProp"]["ewsDetails"]["ewsConnectionUrl"] = (
             ews_service_url
@@ -0,0 +1,318 @@
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""Main file for starting the backup jobs of a large number of subclients.
+
+TokenBucket and BackupDispatcher are the classes defined in this file.
+
+TokenBucket:        Class for the token bucket rate limiter used to pace the job submissions
+
+BackupDispatcher:   Class for starting the backup jobs of subclients across clients with a
+bounded pool of workers, at a limited rate
+
+
+TokenBucket:
+============
+    __init__(rate, burst)           --  initialise the token bucket with the rate and burst size
+
+    acquire()                       --  waits until a token is available, and takes it
+
+
+BackupDispatcher:
+=================
+    __init__(commcell_object)       --  initialise object of the BackupDispatcher class
+
+    __repr__()                      --  returns the string representation of the dispatcher
+
+    _get_backup_tasks()             --  gets the subclient objects to run the backups for
+
+    _run_backup()                   --  runs the backup job of a single subclient
+
+    run()                           --  runs the backup jobs of all the input subclients
+
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from requests.exceptions import RequestException
+
+from .backupset import Backupset
+from .exception import SDKException
+from .subclient import Subclient, Subclients
+
+if TYPE_CHECKING:
+    from .commcell import Commcell
+    from .job import Job
+
+
+class TokenBucket:
+    """
+    Thread safe token bucket rate limiter.
+
+    Tokens are added to the bucket at a fixed rate, up to the burst size, and each call to
+    `acquire` takes one token, waiting for the next token to be added if the bucket is empty.
+    This allows up to `burst` calls to go through at once, and `rate` calls per second after.
+
+    Key Features:
+        - Fixed token rate with a bounded burst
+        - Blocking acquire shared by multiple threads
+
+    #ai-gen-doc
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """Initialize the TokenBucket with the given rate and burst size.
+
+        Args:
+            rate: Number of tokens added to the bucket per second.
+            burst: Maximum number of tokens held by the bucket. Default is 1.
+
+        #ai-gen-doc
+        """
+        self.rate = float(rate)
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take a token from the bucket, waiting until a token is available.
+
+        Example:
+            >>> bucket = TokenBucket(rate=2, burst=4)
+            >>> bucket.acquire()
+
+        #ai-gen-doc
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            # reserve the token now, and wait for it outside of the lock
+            self._tokens -= 1
+            wait_time = -self._tokens / self.rate if self._tokens < 0 else 0
+
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+
+class BackupDispatcher:
+    """
+    Class for starting the backup jobs of a large number of subclients.
+
+    The backup jobs are started by a bounded pool of worker threads, and the job submissions
+    are paced with a token bucket instead of a fixed delay between the jobs. The subclients
+    can be given as Subclient objects, which are used as-is without fetching their properties
+    again, or as Backupset and Subclients objects, to run the backup of all their subclients,
+    which are built from the properties of the subclients list call. The subclients may
+    belong to any client of the commcell.
+
+    Key Features:
+        - Bounded number of concurrent backup requests
+        - Token bucket rate limiting of the job submissions
+        - Reuse of the properties of already loaded Subclient objects
+        - Subclients from any number of backupsets and clients in a single run
+
+    #ai-gen-doc
+    """
+
+    def __init__(
+        self,
+        commcell_object: Commcell,
+        max_workers: int = 8,
+        rate: float | None = 2,
+        burst: int = 4,
+    ) -> None:
+        """Initialize the BackupDispatcher for the given commcell.
+
+        Args:
+            commcell_object: Instance of the Commcell class.
+            max_workers: Maximum number of backup jobs started concurrently. Default is 8.
+            rate: Maximum number of backup jobs started per second, or None for no limit.
+                Default is 2.
+            burst: Number of backup jobs that can be started at once before the rate
+                applies. Default is 4.
+
+        Raises:
+            SDKException: If max_workers, rate or burst is not a positive number.
+
+        Example:
+            >>> dispatcher = BackupDispatcher(commcell, max_workers=16, rate=5)
+
+        #ai-gen-doc
+        """
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise SDKException(
+                "BackupDispatcher", "102", "max_workers should be a positive integer"
+            )
+
+        if rate is not None and (not isinstance(rate, (int, float)) or rate <= 0):
+            raise SDKException("BackupDispatcher", "102", "rate should be a positive number")
+
+        if not isinstance(burst, int) or burst < 1:
+            raise SDKException("BackupDispatcher", "102", "burst should be a positive integer")
+
+        self._commcell_object = commcell_object
+        self.max_workers = max_workers
+        self.rate = rate
+        self.burst = burst
+
+    def __repr__(self) -> str:
+        """Return the string representation of the BackupDispatcher instance.
+
+        Returns:
+            A string with the commcell name and the limits of the dispatcher.
+
+        #ai-gen-doc
+        """
+        return (
+            f'BackupDispatcher class instance for Commcell: "{self._commcell_object.commserv_name}"'
+            f" (max_workers={self.max_workers}, rate={self.rate})"
+        )
+
+    def _get_backup_tasks(
+        self, subclients: Subclient | Subclients | Backupset | Iterable
+    ) -> list[Subclient]:
+        """Get the Subclient objects to run the backups for from the input subclients.
+
+        Subclient objects are used as-is, while the Subclient objects of Backupset and
+        Subclients objects are built from the properties of their subclients list call,
+        without a request to get the properties of each subclient.
+
+        Args:
+            subclients: A Subclient, Subclients or Backupset object, or an iterable of them.
+
+        Returns:
+            List of the Subclient objects.
+
+        Raises:
+            SDKException: If an input is not a Subclient, Subclients or Backupset object.
+
+        #ai-gen-doc
+        """
+        if isinstance(subclients, (Subclient, Subclients, Backupset)):
+            subclients = [subclients]
+
+        tasks = []
+        for item in subclients:
+            if isinstance(item, Backupset):
+                item = item.subclients
+
+            if isinstance(item, Subclient):
+                tasks.append(item)
+            elif isinstance(item, Subclients):
+                tasks.extend(item.iter_objects(max_workers=self.max_workers))
+            else:
+                raise SDKException("BackupDispatcher", "101")
+
+        return tasks
+
+    def _run_backup(
+        self,
+        subclient: Subclient,
+        bucket: TokenBucket | None,
+        check_enabled: bool,
+        backup_options: dict,
+    ) -> Job | list | Exception | None:
+        """Run the backup job of a single subclient.
+
+        Args:
+            subclient: The Subclient object to run the backup for.
+            bucket: The token bucket to take a token from before the backup job is started.
+            check_enabled: Whether to skip the subclient if its backup activity is disabled,
+                or it has no storage policy.
+            backup_options: Arguments passed to the `backup()` method of the subclient.
+
+        Returns:
+            The Job object of the backup, the SDKException or the connection error raised
+            while starting the backup, or None if the subclient was skipped.
+
+        #ai-gen-doc
+        """
+        try:
+            if check_enabled and not (
+                subclient.is_backup_enabled and subclient.storage_policy is not None
+            ):
+                return None
+
+            if bucket is not None:
+                bucket.acquire()
+
+            return subclient.backup(**backup_options)
+        except (SDKException, RequestException, ValueError) as excp:
+            return excp
+
+    def run(
+        self,
+        subclients: Subclient | Subclients | Backupset | Iterable,
+        check_enabled: bool = True,
+        **backup_options: Any,
+    ) -> list:
+        """Run the backup jobs of all the input subclients.
+
+        Args:
+            subclients: The subclients to run the backups for, as a Subclient, Subclients or
+                Backupset object, or an iterable of them, from any clients of the commcell.
+            check_enabled: Whether to skip the subclients with the backup activity disabled,
+                or without a storage policy. Default is True.
+            **backup_options: Arguments passed to the `backup()` method of each subclient,
+                such as backup_level.
+
+        Returns:
+            list: The Job object of each started backup, or the SDKException or connection
+            error raised while starting it, in the order of the input subclients. Skipped
+            subclients are not included.
+
+        Raises:
+            SDKException: If an input is not a Subclient, Subclients or Backupset object.
+
+        Example:
+            >>> subclients = [
+            ...     commcell.clients.get('client1').agents.get('file system')
+            ...     .backupsets.get('defaultBackupSet').subclients.get('default'),
+            ...     commcell.clients.get('client2').agents.get('file system')
+            ...     .backupsets.get('defaultBackupSet'),
+            ... ]
+            >>> jobs = commcell.backup_dispatcher.run(subclients, backup_level='Full')
+            >>> print(f"Started {len(jobs)} backup jobs")
+
+        #ai-gen-doc
+        """
+        tasks = self._get_backup_tasks(subclients)
+
+        if not tasks:
+            return []
+
+        bucket = TokenBucket(self.rate, self.burst) if self.rate is not None else None
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(tasks))) as executor:
+            results = list(
+                executor.map(
+                    lambda subclient: self._run_backup(
+                        subclient, bucket, check_enabled, backup_options
+                    ),
+                    tasks,
+                )
+            )
+
+        return [result for result in results if result is not None]
@@ -16,10 +16,14 @@
 
 """Main file for performing backup set operations.
 
-Backupsets and Backupset are 2 classes defined in this file.
+Backupsets, BrowseEntry, _BrowseCache and Backupset are the classes defined in this file.
 
 Backupsets: Class for representing all the backup sets associated with a specific agent
 
+BrowseEntry: Class for a compact record of a single item of the browse response
+
+_BrowseCache: Class for the TTL and LRU bounded cache of the browse responses of a backupset
+
 Backupset:  Class for a single backup set selected for an agent,
 and to perform operations on that backup set
 
@@ -65,6 +69,49 @@ Backupsets:
     refresh()                       -- refresh the backupsets associated with the agent
 
 
+BrowseEntry:
+============
+    __init__()                      -- initialise the compact record of a browse item
+
+    from_result()                   -- creates the record from an item of the browse response
+
+    _format_time()                  -- formats the epoch time in the browse metadata format
+
+    __getitem__()                   -- returns the value of a legacy browse metadata key
+
+    __contains__()                  -- checks if the key is a legacy browse metadata key
+
+    get()                           -- returns the value of a legacy browse metadata key, or default
+
+    to_dict()                       -- converts the record to the legacy browse metadata dictionary
+
+    __repr__()                      -- returns the string representation of the record
+
+BrowseEntry Attributes
+----------------------
+
+    **modified_time**               -- returns the formatted modification time of the item
+
+    **backup_time**                 -- returns the formatted backup time of the item
+
+    **advanced_data**               -- returns the advanced data of the item
+
+
+_BrowseCache:
+=============
+    __init__()                      -- initialise the browse cache with the TTL and size bound
+
+    get_key()                       -- returns the cache key for the browse request JSON
+
+    get()                           -- returns the cached response for the key, if not expired
+
+    put()                           -- caches the response, evicting the least recently used ones
+
+    invalidate()                    -- removes the cached responses of a subclient, or all
+
+    __len__()                       -- returns the number of cached responses
+
+
 Backupset:
 ==========
     __init__()                      -- initialise object of Backupset with the specified backupset
@@ -78,9 +125,6 @@ Backupset:
 
     _get_backupset_properties()     -- get the properties of this backupset
 
-    _run_backup()                   -- runs full backup for the specified subclient,
-    and appends the job object to the return list
-
     _update()                       -- updates the properties of the backupset
 
     _get_epoch_time()               -- gets the Epoch time given the input time is in format
@@ -91,6 +135,8 @@ Backupset:
 
     _prepare_browse_options()       -- prepares the options for the Browse/find operation
 
+    _prepare_find_options()         -- prepares the filters for the find operation
+
     _prepare_browse_json()          -- prepares the JSON object for the browse request
 
     _process_browse_response()      -- retrieves the items from browse response
@@ -99,8 +145,14 @@ Backupset:
 
     _do_browse()                    -- performs a browse operation with the given options
 
+    _iter_browse()                  -- pages through the browse results using skip_node paging
+
+    _aggregate_browse()             -- gets the count and size of files with aggregate queries
+
     update_properties()             -- updates the backupset properties
 
+    properties_copy()               -- returns a deep copy of the properties of the backupset
+
     set_default_backupset()         -- sets the backupset as the default backup set for the agent,
     if not already default
 
@@ -111,6 +163,21 @@ Backupset:
 
     find()                          -- find content in the backupset
 
+    iter_browse()                   -- browse the content of the backupset page by page
+
+    iter_find()                     -- find content in the backupset page by page
+
+    walk()                          -- walks the backed up directory tree, similar to os.walk
+
+    enable_browse_cache()           -- enables caching of the browse responses of the backupset
+
+    disable_browse_cache()          -- disables caching of the browse responses of the backupset
+
+    invalidate_browse_cache()       -- removes the cached browse responses of a subclient or all
+
+    aggregate()                     -- gets the count and size of the backed up files, optionally
+    grouped by folder, extension or modification time
+
     list_media()                    -- List media required to browse and restore backed up data from the backupset
 
     refresh()                       -- refresh the properties of the backupset
@@ -131,17 +198,25 @@ Backupset instance Attributes
     **guid**                        -- treats the backupset GUID as a property
     of the Backupset class
 
+    **schedules**                   -- returns the schedules of the backupset, fetched
+    on first access
+
 """
 
 from __future__ import annotations
 
 import copy
+import json
 import threading
 import time
 from base64 import b64encode
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from .exception import SDKException
+from .properties_view import PropertiesView, to_plain
 from .schedules import Schedules
 from .subclient import Subclients
 
@@ -1129,6 +1204,386 @@ request_json['backupSetInfo'].update({
         return self._default_backup_set
 
 
+class BrowseEntry:
+    """
+    Compact record of a single file or folder from a browse or find response.
+
+    BrowseEntry keeps the attributes of a browse item in fixed slots, with the modification
+    and backup times held as raw epoch values, and formats the times only when they are
+    accessed. It supports the same keys as the metadata dictionary returned by `browse`,
+    so it can be used in place of the dictionary by existing code.
+
+    Key Features:
+        - Slot based storage of the browse item attributes
+        - Lazy formatting of the modified and backup times
+        - Dictionary style access to the legacy metadata keys
+        - Conversion to the legacy metadata dictionary
+
+    #ai-gen-doc
+    """
+
+    __slots__ = (
+        "path",
+        "name",
+        "snap_display_name",
+        "size",
+        "type",
+        "deleted",
+        "modification_epoch",
+        "backup_epoch",
+        "threat_analysis_data",
+        "_advanced_data",
+    )
+
+    _TIME_FORMAT = "%d/%m/%Y %H:%M:%S"
+
+    _KEYS = (
+        "name",
+        "snap_display_name",
+        "size",
+        "modified_time",
+        "type",
+        "backup_time",
+        "advanced_data",
+        "deleted",
+    )
+
+    def __init__(
+        self,
+        path: str,
+        name: str | None = None,
+        snap_display_name: str | None = None,
+        size: int | str | None = None,
+        item_type: str = "Folder",
+        deleted: bool | None = None,
+        modification_epoch: int = 0,
+        backup_epoch: int = 0,
+        advanced_data: dict | None = None,
+        threat_analysis_data: dict | None = None,
+    ) -> None:
+        """Initialize a BrowseEntry with the given browse item attributes.
+
+        Args:
+            path: Full path of the item.
+            name: Display name of the item.
+            snap_display_name: Name of the item as reported in the browse response.
+            size: Size of the item, as reported in the browse response.
+            item_type: Type of the item, either 'File' or 'Folder'.
+            deleted: Whether the item is deleted, or None if deleted items were not requested.
+            modification_epoch: Modification time of the item as a unix timestamp.
+            backup_epoch: Backup time of the item as a unix timestamp.
+            advanced_data: The advanced data of the item from the browse response.
+            threat_analysis_data: The flags of the item, for threat analysis browse requests.
+
+        #ai-gen-doc
+        """
+        self.path = path
+        self.name = name
+        self.snap_display_name = snap_display_name
+        self.size = size
+        self.type = item_type
+        self.deleted = deleted
+        self.modification_epoch = modification_epoch
+        self.backup_epoch = backup_epoch
+        self.threat_analysis_data = threat_analysis_data
+        self._advanced_data = advanced_data
+
+    @classmethod
+    def from_result(
+        cls,
+        result: dict,
+        parent_path: str,
+        show_deleted: bool = False,
+        threat_analysis: bool = False,
+    ) -> BrowseEntry:
+        """Create a BrowseEntry from an item of the dataResultSet of a browse response.
+
+        Args:
+            result: A single item of the dataResultSet of the browse response.
+            parent_path: The browsed path, used to build the path of items without one.
+            show_deleted: Whether deleted items were requested in the browse.
+            threat_analysis: Whether the browse was a threat analysis request.
+
+        Returns:
+            BrowseEntry: The compact record of the browse item.
+
+        Example:
+            >>> entry = BrowseEntry.from_result(result, 'c:\\data')
+            >>> print(entry.path, entry.type)
+
+        #ai-gen-doc
+        """
+        name = result.get("displayName")
+        flags = result.get("flags") or {}
+        advanced_data = result.get("advancedData") or {}
+
+        path = result["path"] if "path" in result else "\\".join([parent_path, name])
+
+        item_type = "File" if flags.get("file") in (True, "1") else "Folder"
+
+        if show_deleted and "deleted" in flags:
+            deleted = flags.get("deleted") in (True, "1")
+        else:
+            deleted = None
+
+        return cls(
+            path,
+            name=name,
+            snap_display_name=result.get("name"),
+            size=result.get("size"),
+            item_type=item_type,
+            deleted=deleted,
+            modification_epoch=int(result.get("modificationTime", 0)),
+            backup_epoch=int(advanced_data.get("backupTime", 0)),
+            advanced_data=result.get("advancedData"),
+            threat_analysis_data=result.get("flags") if threat_analysis else None,
+        )
+
+    @classmethod
+    def _format_time(cls, epoch: int) -> str | None:
+        """Format the unix timestamp in the local time, as done for the browse metadata.
+
+        Args:
+            epoch: The unix timestamp to format.
+
+        Returns:
+            The formatted time, or None if the timestamp is not set.
+
+        #ai-gen-doc
+        """
+        if epoch > 0:
+            return time.strftime(cls._TIME_FORMAT, time.localtime(epoch))
+        return None
+
+    @property
+    def modified_time(self) -> str | None:
+        """Get the modification time of the item in the 'dd/mm/YYYY HH:MM:SS' format.
+
+        Returns:
+            The formatted modification time, or None if it is not available.
+
+        #ai-gen-doc
+        """
+        return self._format_time(self.modification_epoch)
+
+    @property
+    def backup_time(self) -> str | None:
+        """Get the backup time of the item in the 'dd/mm/YYYY HH:MM:SS' format.
+
+        Returns:
+            The formatted backup time, or None if it is not available.
+
+        #ai-gen-doc
+        """
+        return self._format_time(self.backup_epoch)
+
+    @property
+    def advanced_data(self) -> dict | None:
+        """Get the advanced data of the item from the browse response.
+
+        Returns:
+            The advanced data dictionary of the item.
+
+        #ai-gen-doc
+        """
+        return self._advanced_data
+
+    def __getitem__(self, key: str) -> Any:
+        """Get the value of a key of the legacy browse metadata dictionary.
+
+        Args:
+            key: One of the keys of the metadata dictionary returned by `browse`.
+
+        Returns:
+            The value of the key for the item.
+
+        Raises:
+            KeyError: If the key is not a key of the browse metadata.
+
+        #ai-gen-doc
+        """
+        if key in self._KEYS:
+            return getattr(self, key)
+
+        if key == "threatAnalysisData" and self.threat_analysis_data is not None:
+            return self.threat_analysis_data
+
+        raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether the key is a key of the legacy browse metadata dictionary for the item.
+
+        Args:
+            key: The key to check.
+
+        Returns:
+            True if the key is available for the item, False otherwise.
+
+        #ai-gen-doc
+        """
+        if key == "threatAnalysisData":
+            return self.threat_analysis_data is not None
+        return key in self._KEYS
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get the value of a key of the legacy browse metadata dictionary, with a default.
+
+        Args:
+            key: One of the keys of the metadata dictionary returned by `browse`.
+            default: The value to return if the key is not available.
+
+        Returns:
+            The value of the key for the item, or the default value.
+
+        #ai-gen-doc
+        """
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> dict:
+        """Convert the entry to the legacy browse metadata dictionary.
+
+        Returns:
+            dict: The metadata of the item, in the same format as returned by `browse`.
+
+        Example:
+            >>> paths, entries = backupset.browse(path='c:\\data', compact_entries=True)
+            >>> metadata = entries[paths[0]].to_dict()
+            >>> print(metadata['modified_time'])
+
+        #ai-gen-doc
+        """
+        metadata = {key: getattr(self, key) for key in self._KEYS}
+
+        if self.threat_analysis_data is not None:
+            metadata["threatAnalysisData"] = self.threat_analysis_data
+
+        return metadata
+
+    def __repr__(self) -> str:
+        """Return the string representation of the BrowseEntry.
+
+        Returns:
+            A string containing the type and path of the item.
+
+        #ai-gen-doc
+        """
+        return f'BrowseEntry(path="{self.path}", type="{self.type}")'
+
+
+class _BrowseCache:
+    """
+    Thread safe cache of the browse responses of a backupset.
+
+    The responses are keyed by the browse request JSON, expire after a fixed time to live,
+    and the least recently used response is evicted once the cache is full. Each response
+    is tagged with the subclient it was browsed for, so the responses of a subclient can be
+    invalidated once a new backup job is run for it.
+
+    #ai-gen-doc
+    """
+
+    def __init__(self, ttl: float = 300, max_entries: int = 256) -> None:
+        """Initialize the browse cache.
+
+        Args:
+            ttl: Time, in seconds, a cached response is valid for.
+            max_entries: Maximum number of responses kept in the cache.
+
+        #ai-gen-doc
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(request_json: dict) -> str:
+        """Get the cache key for the browse request JSON.
+
+        Args:
+            request_json: The JSON of the browse request.
+
+        Returns:
+            The normalised JSON string of the request, used as the cache key.
+
+        #ai-gen-doc
+        """
+        return json.dumps(request_json, sort_keys=True, default=str)
+
+    def get(self, key: str) -> Any:
+        """Get the cached response for the key, if it is cached and not expired.
+
+        Args:
+            key: The cache key of the browse request.
+
+        Returns:
+            The cached response, or None if the response is not cached.
+
+        #ai-gen-doc
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            expiry, _, response = entry
+            if expiry <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return response
+
+    def put(self, key: str, subclient_id: int | str, response: Any) -> None:
+        """Cache the response for the key, evicting the least recently used responses.
+
+        Args:
+            key: The cache key of the browse request.
+            subclient_id: ID of the subclient browsed, or 0 for the whole backupset.
+            response: The browse response to cache.
+
+        #ai-gen-doc
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, str(subclient_id), response)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, subclient_id: int | str | None = None) -> None:
+        """Remove the cached responses of the subclient, or all the cached responses.
+
+        The responses of browses of the whole backupset are removed along with the responses
+        of the subclient, as they include the content of the subclient.
+
+        Args:
+            subclient_id: ID of the subclient to remove the responses for.
+                Default is None, to remove all the cached responses.
+
+        #ai-gen-doc
+        """
+        with self._lock:
+            if subclient_id is None:
+                self._entries.clear()
+                return
+
+            subclient_ids = (str(subclient_id), "0")
+            for key in [key for key, entry in self._entries.items() if entry[1] in subclient_ids]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        """Return the number of cached responses, including any expired ones.
+
+        #ai-gen-doc
+        """
+        return len(self._entries)
+
+
 class Backupset:
     """
     Class for managing and performing operations on a specific backupset.
@@ -1287,8 +1742,9 @@ class Backupset:
         self._plan_obj = None
 
         self.subclients = None
-        self.schedules = None
+        self._schedules = None
         self._hidden_subclient = None
+        self._browse_cache = None
         self.refresh()
 
         self._default_browse_options = {
@@ -1314,6 +1770,7 @@ class Backupset:
             "browse_view_name": "VOLUMEVIEW",
             "compare_backups_req": 0,
             "comparison_job_id": 0,
+            "compact_entries": False,
             "_subclient_id": 0,
             "_raw_response": False,
             "_custom_queries": False,
@@ -1429,38 +1886,6 @@ class Backupset:
         else:
             raise SDKException("Response", "101", self._update_response_(response.text))
 
-    def _run_backup(self, subclient_name: str, return_list: list, **kwargs: dict) -> None:
-        """Trigger a backup job for the specified subclient and append its Job object to the provided list.
-
-        This method initiates a backup job for the given subclient if backup activity is enabled and a storage policy is set.
-        The resulting Job object (or an SDKException instance if an error occurs) is appended to the `return_list`.
-        Additional keyword arguments are passed to the subclient's `backup()` method, allowing customization of the backup operation.
-
-        Args:
-            subclient_name: The name of the subclient for which to trigger the backup.
-            return_list: The list to which the resulting Job object or SDKException will be appended.
-            **kwargs: Additional arguments to pass to the subclient's `backup()` method, such as:
-                - backup_level (str): The type of backup to run (e.g., 'Full', 'Incremental').
-                - advanced_options (dict): Advanced backup options to include in the request.
-
-        Example:
-            >>> jobs = []
-            >>> backupset._run_backup('default', jobs, backup_level='Full')
-            >>> for job in jobs:
-            ...     print(job)
-            >>> # jobs will contain Job objects for successful backups or SDKException instances for failures
-
-        #ai-gen-doc
-        """
-        try:
-            subclient = self.subclients.get(subclient_name)
-            if subclient.is_backup_enabled and subclient.storage_policy is not None:
-                job = subclient.backup(**kwargs)
-                return_list.append(job)
-                time.sleep(2)  # Staggering the next backup job to be started
-        except SDKException as excp:
-            return_list.append(excp)
-
     def _process_update_reponse(self, request_json: dict) -> tuple[bool, str, str]:
         """Execute the Backupset update API using the provided request JSON and parse the response.
 
@@ -1662,6 +2087,48 @@ class Backupset:
         self._set_defaults(options, self._default_browse_options)
         return options
 
+    def _prepare_find_options(self, options: dict) -> dict:
+        """Prepare the options for a find operation from the find specific filter options.
+
+        Sets the find operation and path defaults, and converts the file_name and file_size_*
+        options to the browse filters.
+
+        Args:
+            options: A dictionary containing user-specified find options.
+
+        Returns:
+            The same dictionary, updated with the find operation and filters.
+
+        Example:
+            >>> options = backupset._prepare_find_options({'file_name': '*.txt'})
+            >>> print(options['filters'])
+            [('FileName', '*.txt')]
+
+        #ai-gen-doc
+        """
+        if "operation" not in options:
+            options["operation"] = "find"
+
+        if "path" not in options:
+            options["path"] = "\\**\\*"
+
+        if "filters" not in options:
+            options["filters"] = []
+
+        if "file_name" in options:
+            options["filters"].append(("FileName", options["file_name"]))
+
+        if "file_size_gt" in options:
+            options["filters"].append(("FileSize", options["file_size_gt"], "GTE"))
+
+        if "file_size_lt" in options:
+            options["filters"].append(("FileSize", options["file_size_lt"], "LTE"))
+
+        if "file_size_et" in options:
+            options["filters"].append(("FileSize", options["file_size_et"], "EQUALSBLAH"))
+
+        return options
+
     def _prepare_browse_json(self, options: dict) -> dict:
         """Prepare the JSON object required for a browse request.
 
@@ -1964,7 +2431,8 @@ class Backupset:
         Returns:
             A tuple containing:
                 - A list of file or folder paths extracted from the browse response.
-                - A dictionary mapping each path to its associated metadata retrieved from the browse.
+                - A dictionary mapping each path to its associated metadata retrieved from the browse,
+                  or to a BrowseEntry if the `compact_entries` option is set.
 
         Raises:
             SDKException: If the browse/search operation fails, the response is empty, or the response indicates failure.
@@ -2038,67 +2506,15 @@ class Backupset:
                 if "all_versions" in options["operation"]:
                     return self._process_browse_all_versions_response(result_set, options)
 
-                for result in result_set:
-                    name = result.get("displayName")
-                    snap_display_name = result.get("name")
-
-                    if "path" in result:
-                        path = result["path"]
-                    else:
-                        path = "\\".join([options["path"], name])
-
-                    if "modificationTime" in result and int(result["modificationTime"]) > 0:
-                        mod_time = time.localtime(int(result["modificationTime"]))
-                        mod_time = time.strftime("%d/%m/%Y %H:%M:%S", mod_time)
-                    else:
-                        mod_time = None
-
-                    if (
-                        "backupTime" in result["advancedData"]
-                        and int(result["advancedData"]["backupTime"]) > 0
-                    ):
-                        bkp_time = time.localtime(int(result["advancedData"]["backupTime"]))
-                        bkp_time = time.strftime("%d/%m/%Y %H:%M:%S", bkp_time)
-                    else:
-                        bkp_time = None
-
-                    if "file" in result["flags"]:
-                        if result["flags"]["file"] in (True, "1"):
-                            file_or_folder = "File"
-                        else:
-                            file_or_folder = "Folder"
-                    else:
-                        file_or_folder = "Folder"
-
-                    if "size" in result:
-                        size = result["size"]
-                    else:
-                        size = None
-
-                    if show_deleted and "deleted" in result.get("flags"):
-                        deleted = True if result["flags"].get("deleted") in (True, "1") else False
-                    else:
-                        deleted = None
-
-                    paths_dict[path] = {
-                        "name": name,
-                        "snap_display_name": snap_display_name,
-                        "size": size,
-                        "modified_time": mod_time,
-                        "type": file_or_folder,
-                        "backup_time": bkp_time,
-                        "advanced_data": result["advancedData"],
-                        "deleted": deleted,
-                    }
-
-                    if (
-                        "threatAnalysisRequest" in options
-                        and options["threatAnalysisRequest"]
-                        and "flags" in result
-                    ):
-                        paths_dict[path]["threatAnalysisData"] = result["flags"]
+                threat_analysis = bool(options.get("threatAnalysisRequest"))
+                compact_entries = options.get("compact_entries", False)
 
-                    paths.append(path)
+                for result in result_set:
+                    entry = BrowseEntry.from_result(
+                        result, options["path"], show_deleted, threat_analysis
+                    )
+                    paths_dict[entry.path] = entry if compact_entries else entry.to_dict()
+                    paths.append(entry.path)
 
                 return paths, paths_dict
             else:
@@ -2141,6 +2557,18 @@ class Backupset:
         options = self._prepare_browse_options(options)
         request_json = self._prepare_browse_json(options)
 
+        cache_key = None
+        if self._browse_cache is not None and options["operation"] in (
+            "browse",
+            "find",
+            "all_versions",
+        ):
+            cache_key = self._browse_cache.get_key(request_json)
+            response = self._browse_cache.get(cache_key)
+
+            if response is not None:
+                return self._process_browse_response(True, response, options)
+
         flag, response = self._cvpysdk_object.make_request("POST", self._BROWSE, request_json)
 
         attempt = 1
@@ -2153,13 +2581,103 @@ class Backupset:
             else:
                 break
             attempt += 1
-        return self._process_browse_response(flag, response, options)
+
+        result = self._process_browse_response(flag, response, options)
+
+        if cache_key is not None:
+            self._browse_cache.put(cache_key, options["_subclient_id"], response)
+
+        return result
+
+    def _iter_browse(
+        self, options: dict[str, Any], empty_folder: bool = False
+    ) -> Iterator[tuple[str, dict]]:
+        """Page through the browse results of the given options using skip_node paging.
+
+        Each page is requested with `_do_browse`, and its items are yielded one at a time.
+        A page is dropped as soon as all of its items are consumed, and unless disabled with
+        the `prefetch` option, the next page is requested in the background while the items
+        of the current page are being consumed.
+
+        Args:
+            options: Browse options for the request. In addition to the browse options:
+                - page_size (int): Number of items requested per page. Default is 1000.
+                - prefetch (bool): Whether to request the next page in the background.
+                  Default is True.
+            empty_folder: Whether an empty first page, as returned for an empty folder,
+                yields no items instead of raising. Default is False.
+
+        Returns:
+            Iterator of (path, metadata) tuples, in the same format as the items of the
+            browse response.
+
+        Raises:
+            SDKException: If the browse request fails or the response is not successful.
+
+        Example:
+            >>> for path, metadata in backupset._iter_browse({'path': 'c:\\data', 'page_size': 500}):
+            ...     print(path, metadata['size'])
+
+        #ai-gen-doc
+        """
+        prefetch = options.pop("prefetch", True)
+        options.setdefault("page_size", 1000)
+        options = self._prepare_browse_options(options)
+
+        page_size = int(options["page_size"])
+        first_node = int(options["skip_node"])
+
+        def fetch_page(skip_node):
+            page_options = dict(options)
+            page_options["skip_node"] = skip_node
+
+            # an empty page is not retried, as it is expected after the last full page
+            try:
+                return self._do_browse(page_options, retry=0)
+            except SDKException as excp:
+                # an empty page has no items in the result set, or an empty response
+                is_empty_page = (excp.exception_module, excp.exception_id) in (
+                    ("Subclient", "110"),
+                    ("Subclient", "111"),
+                    ("Response", "102"),
+                )
+                if is_empty_page and (empty_folder or skip_node > first_node):
+                    return [], {}
+                raise
+
+        def iter_pages():
+            executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+            try:
+                skip_node = first_node
+                page = fetch_page(skip_node)
+
+                while True:
+                    paths, paths_dict = page
+                    is_last_page = len(paths) < page_size
+                    skip_node += page_size
+
+                    next_page = None
+                    if executor is not None and not is_last_page:
+                        next_page = executor.submit(fetch_page, skip_node)
+
+                    for path in paths:
+                        yield path, paths_dict[path]
+
+                    if is_last_page:
+                        break
+
+                    page = next_page.result() if next_page else fetch_page(skip_node)
+            finally:
+                if executor is not None:
+                    executor.shutdown(wait=False, cancel_futures=True)
+
+        return iter_pages()
 
     def update_properties(self, properties_dict: dict) -> None:
         """Update the properties of the backupset.
 
         This method updates the backupset's properties using the provided dictionary.
-        To modify properties safely, use `self.properties` to obtain a deep copy of the current properties,
+        To modify properties safely, use `self.properties_copy()` to obtain a deep copy of the current properties,
         make the necessary changes, and then pass the updated dictionary to this method.
 
         Args:
@@ -2170,12 +2688,13 @@ class Backupset:
 
         Example:
             >>> backupset = Backupset()
-            >>> props = backupset.properties  # Get a deep copy of current properties
+            >>> props = backupset.properties_copy()  # Get a deep copy of current properties
             >>> props['backupType'] = 'Full'  # Modify the desired property
             >>> backupset.update_properties(props)  # Update the backupset with new properties
 
         #ai-gen-doc
         """
+        properties_dict = to_plain(properties_dict)
         request_json = {
             "backupsetProperties": {},
             "association": {
@@ -2199,11 +2718,15 @@ class Backupset:
             )
 
     @property
-    def properties(self) -> dict:
-        """Get the properties of the backupset.
+    def properties(self) -> PropertiesView:
+        """Get a read-only view of the properties of the backupset.
+
+        The view reads the current properties without copying them. Use `properties_copy()`
+        to get a dictionary which can be modified.
 
         Returns:
-            dict: A dictionary containing the properties and configuration details of the backupset.
+            PropertiesView: A read-only mapping of the properties and configuration details of
+                the backupset.
 
         Example:
             >>> backupset = Backupset()
@@ -2211,6 +2734,21 @@ class Backupset:
             >>> print(props)
             >>> # Output will be a dictionary with backupset configuration details
 
+        #ai-gen-doc
+        """
+        return PropertiesView(self._properties)
+
+    def properties_copy(self) -> dict:
+        """Get a deep copy of the properties of the backupset, which can be modified.
+
+        Returns:
+            A deep copy of the backupset properties, to pass to `update_properties()`.
+
+        Example:
+            >>> props = backupset.properties_copy()
+            >>> props['backupType'] = 'Full'
+            >>> backupset.update_properties(props)
+
         #ai-gen-doc
         """
         return copy.deepcopy(self._properties)
@@ -2542,9 +3080,10 @@ class Backupset:
     def backup(self, **kwargs: dict) -> list:
         """Run backup jobs for all subclients in this backupset.
 
-        This method initiates backup jobs for each subclient associated with the backupset.
-        You can specify various backup options using keyword arguments, which are passed
-        to each subclient's backup operation.
+        This method initiates backup jobs for each subclient associated with the backupset,
+        using the backup dispatcher of the commcell, which bounds the number of concurrent
+        requests and the rate at which the jobs are started. You can specify various backup
+        options using keyword arguments, which are passed to each subclient's backup operation.
 
         Commonly used keyword arguments include:
             - backup_level (str): The level of backup to perform. Options are
@@ -2566,21 +3105,7 @@ class Backupset:
 
         #ai-gen-doc
         """
-        return_list = []
-        thread_list = []
-
-        if self.subclients.all_subclients:
-            for subclient in self.subclients.all_subclients:
-                thread = threading.Thread(
-                    target=self._run_backup, args=(subclient, return_list), kwargs=kwargs
-                )
-                thread_list.append(thread)
-                thread.start()
-
-        for thread in thread_list:
-            thread.join()
-
-        return return_list
+        return self._commcell_object.backup_dispatcher.run(self.subclients, **kwargs)
 
     def browse(self, *args: Any, **kwargs: Any) -> tuple[list, dict]:
         """Browse the content of the Backupset.
@@ -2594,6 +3119,8 @@ class Backupset:
             - show_deleted: Whether to include deleted items (bool)
             - from_time: Start time for the browse window (str, format 'YYYY-MM-DD HH:MM:SS')
             - to_time: End time for the browse window (str, format 'YYYY-MM-DD HH:MM:SS')
+            - compact_entries: Whether to return a BrowseEntry instead of a metadata
+              dictionary for each path, formatting the times only when accessed (bool)
 
         For a full list of supported options, refer to the
         `default_browse_options` documentation:
@@ -2687,28 +3214,441 @@ class Backupset:
         else:
             options = kwargs
 
-        if "operation" not in options:
-            options["operation"] = "find"
+        return self._do_browse(self._prepare_find_options(options))
 
-        if "path" not in options:
-            options["path"] = "\\**\\*"
+    def iter_browse(self, *args: Any, **kwargs: Any) -> Iterator[tuple[str, dict]]:
+        """Browse the content of the Backupset page by page, yielding the items lazily.
 
-        if "filters" not in options:
-            options["filters"] = []
+        Unlike `browse`, which returns all the items of a single large request, the items are
+        requested in pages of `page_size` items using skip_node paging, and only the current
+        page (and the prefetched next page) is held in memory.
 
-        if "file_name" in options:
-            options["filters"].append(("FileName", options["file_name"]))
+        Accepts the same options as `browse`, either as a dictionary or as keyword arguments,
+        along with:
+            - page_size (int): Number of items requested per page. Default is 1000.
+            - prefetch (bool): Whether to request the next page in the background. Default is True.
 
-        if "file_size_gt" in options:
-            options["filters"].append(("FileSize", options["file_size_gt"], "GTE"))
+        Returns:
+            Iterator of (path, metadata) tuples, with the same metadata as returned by `browse`.
 
-        if "file_size_lt" in options:
-            options["filters"].append(("FileSize", options["file_size_lt"], "LTE"))
+        Example:
+            >>> for path, metadata in backupset.iter_browse(path='c:\\hello', page_size=5000):
+            ...     print(path, metadata['type'])
 
-        if "file_size_et" in options:
-            options["filters"].append(("FileSize", options["file_size_et"], "EQUALSBLAH"))
+        #ai-gen-doc
+        """
+        if args and isinstance(args[0], dict):
+            options = args[0]
+        else:
+            options = kwargs
 
-        return self._do_browse(options)
+        options["operation"] = "browse"
+
+        return self._iter_browse(options)
+
+    def iter_find(self, *args: Any, **kwargs: Any) -> Iterator[tuple[str, dict]]:
+        """Search the backed up content of the backupset page by page, yielding the items lazily.
+
+        Accepts the same filter options as `find`, either as a dictionary or as keyword
+        arguments, along with:
+            - page_size (int): Number of items requested per page. Default is 1000.
+            - prefetch (bool): Whether to request the next page in the background. Default is True.
+
+        Returns:
+            Iterator of (path, metadata) tuples, with the same metadata as returned by `find`.
+
+        Example:
+            >>> for path, metadata in backupset.iter_find(file_name='*.log', page_size=10000):
+            ...     print(path, metadata['size'])
+
+        #ai-gen-doc
+        """
+        if args and isinstance(args[0], dict):
+            options = args[0]
+        else:
+            options = kwargs
+
+        return self._iter_browse(self._prepare_find_options(options))
+
+    def walk(
+        self,
+        top: str = "\\",
+        max_depth: int | None = None,
+        max_workers: int = 4,
+        onerror: Callable[[SDKException], None] | None = None,
+        **options: Any,
+    ) -> Iterator[tuple[str, list[str], list[str]]]:
+        """Walk the backed up directory tree of the backupset, similar to `os.walk`.
+
+        The folders are browsed concurrently, with up to `max_workers` browse requests in
+        flight at a time, and a (dirpath, dirnames, filenames) tuple is yielded for each
+        folder as soon as its browse completes. The folders are therefore not yielded in
+        the top-down order of `os.walk`, but a folder is always yielded before its
+        subfolders, and the subfolders are browsed only after the folder is yielded, so
+        removing names from `dirnames` prunes the walk.
+
+        Args:
+            top: The backed up path to start walking from. Default is the root.
+            max_depth: Maximum depth of the folders to browse below `top`, where the
+                subfolders of `top` are at depth 1. Default is None (no limit).
+            max_workers: Maximum number of concurrent browse requests. Default is 4.
+            onerror: Function called with the SDKException of a folder that failed to
+                browse, after which the walk continues. If not given, the error is raised.
+            **options: Browse options applied to each folder, such as show_deleted,
+                from_time, to_time, copy_precedence, filters or page_size.
+
+        Returns:
+            Iterator of (dirpath, dirnames, filenames) tuples, one for each folder.
+
+        Raises:
+            SDKException: If the inputs are not valid, or a folder failed to browse and
+                no `onerror` function is given.
+
+        Example:
+            >>> for dirpath, dirnames, filenames in backupset.walk('c:\\data', max_depth=2):
+            ...     dirnames[:] = [name for name in dirnames if name != 'tmp']
+            ...     print(dirpath, len(filenames))
+
+        #ai-gen-doc
+        """
+        if not isinstance(top, str):
+            raise SDKException("Backupset", "101")
+
+        if max_depth is not None and (not isinstance(max_depth, int) or max_depth < 0):
+            raise SDKException("Backupset", "102", "max_depth should be a non-negative integer")
+
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise SDKException("Backupset", "102", "max_workers should be a positive integer")
+
+        options["operation"] = "browse"
+        options["compact_entries"] = True
+        options.setdefault("page_size", self._default_browse_options["page_size"])
+
+        top = top.rstrip("\\") or "\\"
+
+        def browse_folder(dirpath):
+            folder_options = dict(options, path=dirpath, prefetch=False)
+            dirs, files = {}, []
+
+            for path, entry in self._iter_browse(folder_options, empty_folder=True):
+                if entry.type == "Folder":
+                    dirs[entry.name] = path
+                else:
+                    files.append(entry.name)
+
+            return dirs, files
+
+        def walk_tree():
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            pending = {executor.submit(browse_folder, top): (top, 0)}
+
+            try:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        dirpath, depth = pending.pop(future)
+
+                        try:
+                            dirs, files = future.result()
+                        except SDKException as excp:
+                            if onerror is None:
+                                raise
+                            onerror(excp)
+                            continue
+
+                        dirnames = list(dirs)
+                        yield dirpath, dirnames, files
+
+                        if max_depth is not None and depth >= max_depth:
+                            continue
+
+                        for name in dirnames:
+                            if name in dirs:
+                                child = executor.submit(browse_folder, dirs[name])
+                                pending[child] = (dirs[name], depth + 1)
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        return walk_tree()
+
+    def enable_browse_cache(self, ttl: float = 300, max_entries: int = 256) -> None:
+        """Enable caching of the browse, find and all versions responses of the backupset.
+
+        Repeated browses with the same request, such as the same subclient, path, time range
+        and copy precedence, are served from the cache until the response expires. The
+        cached responses of a subclient are invalidated when a backup job is run for it with
+        the SDK, or when data is deleted from it. Backup jobs started outside of this session
+        are not seen, so the `ttl` bounds how long a stale response can be returned;
+        `invalidate_browse_cache` can be used to invalidate the cache explicitly.
+
+        Args:
+            ttl: Time, in seconds, a cached response is valid for. Default is 300.
+            max_entries: Maximum number of responses kept in the cache, after which the
+                least recently used response is evicted. Default is 256.
+
+        Raises:
+            SDKException: If ttl or max_entries is not a positive number.
+
+        Example:
+            >>> backupset.enable_browse_cache(ttl=600, max_entries=1000)
+            >>> paths, metadata = backupset.browse(path='c:\\data')  # requested from the server
+            >>> paths, metadata = backupset.browse(path='c:\\data')  # served from the cache
+
+        #ai-gen-doc
+        """
+        if not isinstance(ttl, (int, float)) or ttl <= 0:
+            raise SDKException("Backupset", "102", "ttl should be a positive number")
+
+        if not isinstance(max_entries, int) or max_entries < 1:
+            raise SDKException("Backupset", "102", "max_entries should be a positive integer")
+
+        if self._browse_cache is None:
+            self._browse_cache = _BrowseCache(ttl, max_entries)
+        else:
+            self._browse_cache.ttl = ttl
+            self._browse_cache.max_entries = max_entries
+
+    def disable_browse_cache(self) -> None:
+        """Disable caching of the browse responses, and drop all the cached responses.
+
+        Example:
+            >>> backupset.disable_browse_cache()
+
+        #ai-gen-doc
+        """
+        self._browse_cache = None
+
+    def invalidate_browse_cache(self, subclient_id: int | str | None = None) -> None:
+        """Remove the cached browse responses of a subclient, or of the whole backupset.
+
+        Args:
+            subclient_id: ID of the subclient to remove the cached responses for.
+                Default is None, to remove all the cached responses of the backupset.
+
+        Example:
+            >>> backupset.invalidate_browse_cache(subclient.subclient_id)
+
+        #ai-gen-doc
+        """
+        if self._browse_cache is not None:
+            self._browse_cache.invalidate(subclient_id)
+
+    def _aggregate_browse(self, options: dict, where_clause: list[dict]) -> dict[str, int]:
+        """Get the count and total size of the backed up files matching the where clause.
+
+        Sends a single browse request with a COUNT and a SUM aggregate query, so only the
+        aggregate values are returned by the server, and not the matching items.
+
+        Args:
+            options: Browse options for the request, such as path, from_time, to_time,
+                copy_precedence or _subclient_id.
+            where_clause: The criteria of the files to aggregate, in addition to the criteria
+                selecting only files.
+
+        Returns:
+            Dictionary with the 'count' of the matching files and their total 'size' in bytes.
+
+        Raises:
+            SDKException: If the browse request fails, or the response has no aggregate results.
+
+        #ai-gen-doc
+        """
+        where_clause = [
+            {"criteria": {"field": "Flags", "dataOperator": "IN", "values": ["file"]}}
+        ] + where_clause
+
+        options = dict(options)
+        options["operation"] = "find"
+        options["opType"] = 1
+        options["_raw_response"] = True
+        options["_custom_queries"] = [
+            {
+                "type": "AGGREGATE",
+                "queryId": "count",
+                "aggrParam": {"aggrType": "COUNT"},
+                "whereClause": where_clause,
+            },
+            {
+                "type": "AGGREGATE",
+                "queryId": "size",
+                "aggrParam": {"aggrType": "SUM", "field": "FileSize"},
+                "whereClause": where_clause,
+            },
+        ]
+
+        _, response_json = self._do_browse(options)
+
+        # the responses of the queries are matched by their queryId, never by their position
+        aggregates = {}
+        for browse_response in response_json.get("browseResponses", []):
+            browse_result = browse_response.get("browseResult", {})
+            query_id = browse_response.get("queryId", browse_result.get("queryId"))
+
+            if query_id in ("count", "size"):
+                aggr_result_set = browse_result.get("aggrResultSet")
+                if not aggr_result_set:
+                    raise SDKException(
+                        "Backupset",
+                        "102",
+                        f"Browse response of the {query_id} query is missing aggrResultSet",
+                    )
+                aggregates[query_id] = aggr_result_set[0]
+
+        count = aggregates.get("count", {}).get("count")
+        if count is None:
+            raise SDKException("Backupset", "102", "Browse response is missing the file count")
+
+        # the sum of the sizes is not returned when no file matches
+        size = aggregates.get("size", {}).get("result")
+        if size is None:
+            if int(count):
+                raise SDKException("Backupset", "102", "Browse response is missing the file size")
+            size = 0
+
+        return {"count": int(count), "size": int(size)}
+
+    def aggregate(
+        self,
+        path: str = "\\",
+        group_by: str | None = None,
+        groups: list | None = None,
+        max_workers: int = 4,
+        **options: Any,
+    ) -> dict:
+        """Get the count and total size of the backed up files, without listing the files.
+
+        The values are computed by the server with aggregate browse queries, so only the
+        aggregate values are returned, and not the backed up items. The values can be grouped
+        by folder, file extension or modification time bucket, with one aggregate request
+        sent for each group, up to `max_workers` at a time.
+
+        Args:
+            path: The backed up folder to aggregate the files of, recursively.
+                Default is the root.
+            group_by: How to group the files, one of:
+                - None: No grouping, the values for all the files under the path.
+                - 'folder': Grouped by the subfolders of the path. Files directly under the
+                  path are not included in any group.
+                - 'extension': Grouped by the file extensions given in `groups`.
+                - 'mtime': Grouped by the modification time buckets given in `groups`.
+            groups: The groups to aggregate:
+                - For 'folder', the names of the subfolders. Default is all the subfolders
+                  of the path, which are listed with a browse of the path.
+                - For 'extension', the file extensions, such as ['txt', 'pdf']. Required.
+                - For 'mtime', the ascending boundaries of the buckets as unix timestamps,
+                  where [t0, t1, t2] gives the buckets [t0, t1) and [t1, t2). Required.
+            max_workers: Maximum number of concurrent aggregate requests. Default is 4.
+            **options: Browse options for the requests, such as show_deleted, from_time,
+                to_time, copy_precedence or job_id.
+
+        Returns:
+            Dictionary with the 'count' and total 'size' in bytes of the files, if not grouped.
+            Otherwise, a dictionary mapping each group, the folder name, extension or
+            (start, end) bucket, to the dictionary of its 'count' and 'size'.
+
+        Raises:
+            SDKException: If the inputs are not valid, or an aggregate request fails.
+
+        Example:
+            >>> backupset.aggregate('c:\\data')
+            {'count': 1250, 'size': 73400320}
+            >>> backupset.aggregate('c:\\data', group_by='extension', groups=['pdf', 'docx'])
+            {'pdf': {'count': 200, 'size': 52428800}, 'docx': {'count': 45, 'size': 1048576}}
+
+        #ai-gen-doc
+        """
+        if not isinstance(path, str):
+            raise SDKException("Backupset", "101")
+
+        if group_by not in (None, "folder", "extension", "mtime"):
+            raise SDKException(
+                "Backupset", "102", "group_by should be one of 'folder', 'extension' or 'mtime'"
+            )
+
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise SDKException("Backupset", "102", "max_workers should be a positive integer")
+
+        path = path.rstrip("\\")
+        options["path"] = path + "\\**\\*"
+
+        if group_by is None:
+            return self._aggregate_browse(options, [])
+
+        if group_by == "folder":
+            if groups is None:
+                folder_options = dict(options, path=path or "\\", compact_entries=True)
+                folder_options["operation"] = "browse"
+                try:
+                    _, entries = self._do_browse(folder_options)
+                except SDKException as excp:
+                    # browse of an empty folder has no items in the result set
+                    if excp.exception_module != "Subclient" or excp.exception_id != "110":
+                        raise
+                    entries = {}
+                groups = [entry.name for entry in entries.values() if entry.type == "Folder"]
+
+            group_requests = {
+                name: (dict(options, path=f"{path}\\{name}\\**\\*"), []) for name in groups
+            }
+
+        elif group_by == "extension":
+            if not groups:
+                raise SDKException("Backupset", "102", "groups should list the file extensions")
+
+            group_requests = {
+                extension: (
+                    options,
+                    [
+                        {
+                            "criteria": {
+                                "field": "FileName",
+                                "values": [f"*.{extension.lstrip('.')}"],
+                            }
+                        }
+                    ],
+                )
+                for extension in groups
+            }
+
+        else:
+            if not groups or len(groups) < 2 or list(groups) != sorted(groups):
+                raise SDKException(
+                    "Backupset", "102", "groups should list at least two ascending timestamps"
+                )
+
+            group_requests = {
+                (start, end): (
+                    options,
+                    [
+                        {
+                            "criteria": {
+                                "field": "ModifiedTime",
+                                "dataOperator": "GTE",
+                                "values": [str(int(start))],
+                            }
+                        },
+                        {
+                            "criteria": {
+                                "field": "ModifiedTime",
+                                "dataOperator": "LT",
+                                "values": [str(int(end))],
+                            }
+                        },
+                    ],
+                )
+                for start, end in zip(groups, groups[1:])
+            }
+
+        if not group_requests:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(group_requests))) as executor:
+            futures = {
+                group: executor.submit(self._aggregate_browse, group_options, where_clause)
+                for group, (group_options, where_clause) in group_requests.items()
+            }
+            return {group: future.result() for group, future in futures.items()}
 
     def delete_data(self, paths: str | list[str]) -> None:
         """Delete specified items from the backupset index, making them unavailable for browsing and recovery.
@@ -2733,6 +3673,7 @@ class Backupset:
         options = {"operation": "delete_data", "path": paths}
 
         files, _ = self._do_browse(options)
+        self.invalidate_browse_cache(options["_subclient_id"] or None)
 
         # Delete operation does not return any result, hence consider the operation successful
         if files:
@@ -2826,7 +3767,28 @@ class Backupset:
         self._get_backupset_properties()
 
         self.subclients = Subclients(self)
-        self.schedules = Schedules(self)
+        self._schedules = None
+
+    @property
+    def schedules(self) -> Schedules:
+        """Get the Schedules instance configured for this Backupset.
+
+        The schedules are fetched when the property is first accessed after the backupset
+        is initialized or refreshed.
+
+        Returns:
+            Schedules: An object representing all schedules associated with the backupset.
+
+        Example:
+            >>> schedules = backupset.schedules  # Access schedules property
+            >>> print(f"Schedules object: {schedules}")
+
+        #ai-gen-doc
+        """
+        if self._schedules is None:
+            self._schedules = Schedules(self)
+
+        return self._schedules
 
     def backed_up_files_count(self, path: str = "\\**\\*") -> int:
         """Get the total number of files backed up in all subclients of this backupset for a given path.
@@ -93,7 +93,7 @@ class SharepointBackupset(Backupset):
         ]["accounts"]
         for account in accounts:
             if account.get("serviceType", -1) == 52:
-                azure_storage_account_information = account
+                azure_storage_account_information = account.copy()
         return azure_storage_account_information
 
     @azure_storage_details.setter
@@ -125,7 +125,7 @@ class SharepointBackupset(Backupset):
 
         #ai-gen-doc
         """
-        backupset_properties = self.properties
+        backupset_properties = self.properties_copy()
         backupset_properties["sharepointBackupSet"]["spOffice365BackupSetProp"]["serviceAccounts"][
             "accounts"
         ].append(azure_storage_account_information)
@@ -207,6 +207,8 @@ Client
 
     update_properties()          --  to update the client properties
 
+    properties_copy()            --  returns a deep copy of the properties of the client
+
     enable_backup()              --  enables the backup for the client
 
     enable_backup_at_time()      --  enables the backup for the client at the input time specified
@@ -420,7 +422,7 @@ import os
 import re
 import time
 from base64 import b64encode
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
 if TYPE_CHECKING:
     from .commcell import Commcell
@@ -431,11 +433,13 @@ from .constants import AppIDAName, AppIDAType, OSType, ResourcePoolAppType
 from .deployment.install import Install
 from .deployment.uninstall import Uninstall
 from .exception import SDKException
+from .file_transfer import FileUploader
 from .job import Job
 from .name_change import NameChange
 from .network import Network
 from .network_throttle import NetworkThrottle
 from .organization import Organizations
+from .properties_view import PropertiesView, to_plain
 from .schedules import Schedules
 from .security.security_association import SecurityAssociation
 from .security.user import Users
@@ -7341,7 +7345,7 @@ class Client:
         """Update the properties of the client.
 
         This method updates the client configuration using the provided properties dictionary.
-        To modify client properties, obtain a deep copy of the current properties using `self.properties`,
+        To modify client properties, obtain a deep copy of the current properties using `self.properties_copy()`,
         make the necessary changes, and then pass the updated dictionary to this method.
 
         Args:
@@ -7352,13 +7356,14 @@ class Client:
 
         Example:
             >>> client = Client(...)
-            >>> props = client.properties.copy()  # Get a deep copy of current properties
+            >>> props = client.properties_copy()  # Get a deep copy of current properties
             >>> props['clientProps']['clientName'] = "NewClientName"
             >>> client.update_properties(props)
             >>> print("Client properties updated successfully")
 
         #ai-gen-doc
         """
+        properties_dict = to_plain(properties_dict)
         request_json = {
             "clientProperties": {},
             "association": {"entity": [{"clientName": self.client_name}]},
@@ -7377,11 +7382,14 @@ class Client:
         self._process_update_request(request_json)
 
     @property
-    def properties(self) -> Dict[str, Any]:
-        """Get a copy of the client properties.
+    def properties(self) -> PropertiesView:
+        """Get a read-only view of the client properties.
+
+        The view reads the current properties without copying them. Use `properties_copy()`
+        to get a dictionary which can be modified.
 
         Returns:
-            Dictionary containing all properties associated with the client.
+            Read-only mapping containing all properties associated with the client.
 
         Example:
             >>> client = Client(...)
@@ -7389,6 +7397,21 @@ class Client:
             >>> print(f"Client properties: {props}")
             >>> # The returned dictionary contains key-value pairs for client configuration
 
+        #ai-gen-doc
+        """
+        return PropertiesView(self._properties)
+
+    def properties_copy(self) -> Dict[str, Any]:
+        """Get a deep copy of the properties of the client, which can be modified.
+
+        Returns:
+            A deep copy of the client properties, to pass to `update_properties()`.
+
+        Example:
+            >>> props = client.properties_copy()
+            >>> props['clientProps']['clientName'] = "NewClientName"
+            >>> client.update_properties(props)
+
         #ai-gen-doc
         """
         return copy.deepcopy(self._properties)
@@ -7537,7 +7560,7 @@ class Client:
             >>> # The client's display name is now updated to "ProductionServer01"
         #ai-gen-doc
         """
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         update_properties["client"]["displayName"] = display_name
         self.update_properties(update_properties)
 
@@ -7605,7 +7628,7 @@ class Client:
 
         #ai-gen-doc
         """
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         update_properties["client"]["TimeZone"]["TimeZoneName"] = timezone
         update_properties["client"]["timezoneSetByUser"] = True
         self.update_properties(update_properties)
@@ -9005,15 +9028,32 @@ class Client:
         """
         return self.readiness_details.is_mongodb_ready()
 
-    def upload_file(self, source_file_path: str, destination_folder: str) -> None:
+    def upload_file(
+        self,
+        source_file_path: str,
+        destination_folder: str,
+        chunk_size: int = 2 * 1024**2,
+        progress_callback: Optional[Callable[[int, int, float], None]] = None,
+        max_retries: int = 3,
+    ) -> dict:
         """Upload a source file from the controller machine to a destination folder on the client machine.
 
         This method transfers the specified file to the client, either as a single upload or in chunks,
-        depending on the file size.
+        depending on the file size. The chunks are streamed from disk, the next chunk being read while
+        the current chunk is sent, and a chunk that fails to upload is retried, instead of restarting
+        the upload of the file.
 
         Args:
             source_file_path: Path to the source file on the controller machine.
             destination_folder: Path to the destination folder on the client machine where the file will be copied.
+            chunk_size: Number of bytes sent in each upload request. Default is 2 MB.
+            progress_callback: Optional function called after each chunk with the bytes sent, the size of
+                the file, and the throughput in bytes per second.
+            max_retries: Number of retries of a chunk after a failure. Default is 3.
+
+        Returns:
+            dict: The transfer statistics of the upload, with the bytes and chunks sent, the duration in
+            seconds, and the throughput in bytes per second.
 
         Raises:
             SDKException: If the file upload fails, the response is empty, or the response indicates failure.
@@ -9025,9 +9065,7 @@ class Client:
 
         #ai-gen-doc
         """
-        chunk_size = 1024**2 * 2
-        request_id = None
-        chunk_offset = None
+        upload_state = {"request_id": None, "chunk_offset": None}
 
         file_name = os.path.split(source_file_path)[-1]
 
@@ -9040,25 +9078,31 @@ class Client:
             "ParentFolderPath": b64encode(destination_folder.encode("utf-8")),
         }
 
-        file_stream = open(source_file_path, "rb")
+        def send_chunk(chunk, offset, is_last):
+            """Uploads a chunk of the file, with the request id of the previous chunks"""
+            if offset == 0 and is_last:
+                upload_url = self._services["UPLOAD_FULL_FILE"] % (self.client_id)
+                self._make_request(upload_url, chunk, headers)
+                return
 
-        if file_size <= chunk_size:
-            upload_url = self._services["UPLOAD_FULL_FILE"] % (self.client_id)
-            self._make_request(upload_url, file_stream.read(), headers)
-        else:
             upload_url = self._services["UPLOAD_CHUNKED_FILE"] % (self.client_id)
-            while file_size > chunk_size:
-                file_size = file_size - chunk_size
-                headers["FileEOF"] = str(0)
-                request_id, chunk_offset = self._make_request(
-                    upload_url, file_stream.read(chunk_size), headers, request_id, chunk_offset
-                )
-
-            headers["FileEOF"] = str(1)
-            self._make_request(
-                upload_url, file_stream.read(file_size), headers, request_id, chunk_offset
+            chunk_headers = dict(headers, FileEOF=str(int(is_last)))
+            upload_state["request_id"], upload_state["chunk_offset"] = self._make_request(
+                upload_url,
+                chunk,
+                chunk_headers,
+                upload_state["request_id"],
+                upload_state["chunk_offset"],
             )
 
+        uploader = FileUploader(
+            send_chunk,
+            chunk_size=chunk_size,
+            progress_callback=progress_callback,
+            max_retries=max_retries,
+        )
+        return uploader.upload(source_file_path)
+
     def upload_folder(self, source_dir: str, destination_dir: str):
         """Upload a folder from the controller machine to the specified destination on the client machine.
 
@@ -9475,7 +9519,7 @@ class Client:
         """
         if not isinstance(owner_list, list):
             raise SDKException("Client", "101")
-        properties_dict = self.properties
+        properties_dict = self.properties_copy()
         owners, current_owners = list(), list()
         if "owners" in properties_dict.get("clientProps", {}).get("securityAssociations", {}).get(
             "ownerAssociations", {}
@@ -10666,7 +10710,7 @@ class Client:
 
         #ai-gen-doc
         """
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         update_properties["client"]["EnableContentIndexing"] = "true"
         self.update_properties(update_properties)
 
@@ -10682,7 +10726,7 @@ class Client:
             >>> print("Content indexing disabled for client.")
         #ai-gen-doc
         """
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         update_properties["client"]["EnableContentIndexing"] = "false"
         self.update_properties(update_properties)
 
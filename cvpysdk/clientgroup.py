@@ -140,6 +140,8 @@ ClientGroup:
 
     update_properties()             -- to update the client group properties
 
+    properties_copy()               -- returns a deep copy of the properties of the client group
+
     add_additional_setting()        -- adds registry key to client group property
 
     delete_additional_setting()     -- Delete registry key from client group property
@@ -195,6 +197,7 @@ from .exception import SDKException
 from .job import Job
 from .network import Network
 from .network_throttle import NetworkThrottle
+from .properties_view import PropertiesView, to_plain
 
 
 class ClientGroups:
@@ -1800,11 +1803,15 @@ class ClientGroup:
             )
 
     @property
-    def properties(self) -> dict:
-        """Get the properties of the client group.
+    def properties(self) -> PropertiesView:
+        """Get a read-only view of the properties of the client group.
+
+        The view reads the current properties without copying them. Use `properties_copy()`
+        to get a dictionary which can be modified.
 
         Returns:
-            dict: A dictionary containing the properties and configuration details of the client group.
+            PropertiesView: A read-only mapping of the properties and configuration details of
+                the client group.
 
         Example:
             >>> client_group = ClientGroup(commcell_object, 'MyClientGroup')
@@ -1812,6 +1819,21 @@ class ClientGroup:
             >>> print(group_props)
             {'clientGroupId': 123, 'clientGroupName': 'MyClientGroup', ...}
 
+        #ai-gen-doc
+        """
+        return PropertiesView(self._properties)
+
+    def properties_copy(self) -> dict:
+        """Get a deep copy of the properties of the client group, which can be modified.
+
+        Returns:
+            A deep copy of the client group properties, to pass to `update_properties()`.
+
+        Example:
+            >>> props = client_group.properties_copy()
+            >>> props['clientGroup']['description'] = "Updated description"
+            >>> client_group.update_properties(props)
+
         #ai-gen-doc
         """
         return copy.deepcopy(self._properties)
@@ -2708,7 +2730,7 @@ class ClientGroup:
         """Update the properties of the client group.
 
         This method updates the client group properties using the provided dictionary.
-        You can obtain a deep copy of the current properties using `self.properties`,
+        You can obtain a deep copy of the current properties using `self.properties_copy()`,
         modify the desired fields, and then pass the updated dictionary to this method.
 
         Args:
@@ -2719,7 +2741,7 @@ class ClientGroup:
 
         Example:
             >>> # Get a deep copy of current properties
-            >>> props = client_group.properties
+            >>> props = client_group.properties_copy()
             >>> # Modify a property
             >>> props['clientGroup']['description'] = "Updated description"
             >>> # Update the client group with new properties
@@ -2727,6 +2749,7 @@ class ClientGroup:
 
         #ai-gen-doc
         """
+        properties_dict = to_plain(properties_dict)
         request_json = {
             "clientGroupOperationType": 2,
             "clientGroupDetail": {"clientGroup": {"clientGroupName": self.name}},
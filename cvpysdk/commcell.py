@@ -256,6 +256,12 @@ Commcell instance Attributes
     **job_controller**          --  returns the instance of the `JobController` class,
     to interact with all the jobs finished / running on the Commcell
 
+    **backup_dispatcher**       --  returns the instance of the `BackupDispatcher` class,
+    to run the backup jobs of many subclients with bounded concurrency
+
+    **inventory**               --  returns the instance of the `CommcellInventory` class,
+    to take snapshots of the client / agent / instance / backupset / subclient tree
+
     **users**                   --  returns the instance of the `Users` class,
     to interact with the users added to the Commcell
 
@@ -385,12 +391,14 @@ from .activateapps.tco import CostAssessment
 from .activitycontrol import ActivityControl
 from .alert import Alerts
 from .array_management import ArrayManagement
+from .backup_dispatcher import BackupDispatcher
 from .backup_network_pairs import BackupNetworkPairs
 from .cleanroom.recovery_groups import RecoveryGroups
 from .cleanroom.target import CleanroomTargets
 from .client import Client, Clients
 from .clientgroup import ClientGroups
 from .clouddiscovery.cloud_discovery import AWSDiscovery, AzureDiscovery
+from .commcell_inventory import CommcellInventory
 from .commcell_migration import CommCellMigration, GlobalRepositoryCell
 from .constants import UserRole
 from .content_analyzer import ContentAnalyzers
@@ -716,6 +724,8 @@ class Commcell:
         self._resource_pool = None
         self._plans = None
         self._job_controller = None
+        self._backup_dispatcher = None
+        self._inventory = None
         self._users = None
         self._roles = None
         self._credentials = None
@@ -904,7 +914,11 @@ class Commcell:
         del self._content_analyzers
         del self._resource_pool
         del self._plans
+        if self._job_controller is not None:
+            self._job_controller.unsubscribe_all()
         del self._job_controller
+        del self._backup_dispatcher
+        del self._inventory
         del self._users
         del self._download_center
         del self._organizations
@@ -2326,6 +2340,51 @@ class Commcell:
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
+    @property
+    def backup_dispatcher(self) -> BackupDispatcher:
+        """Get the BackupDispatcher instance associated with this Commcell.
+
+        Returns:
+            BackupDispatcher: An instance for starting the backup jobs of many subclients with
+            a bounded number of workers, at a limited rate.
+
+        Example:
+            >>> dispatcher = commcell.backup_dispatcher
+            >>> dispatcher.max_workers = 16
+            >>> jobs = dispatcher.run([backupset1, backupset2], backup_level='Full')
+
+        #ai-gen-doc
+        """
+        try:
+            if self._backup_dispatcher is None:
+                self._backup_dispatcher = BackupDispatcher(self)
+
+            return self._backup_dispatcher
+        except AttributeError:
+            return USER_LOGGED_OUT_MESSAGE
+
+    @property
+    def inventory(self) -> CommcellInventory:
+        """Get the CommcellInventory instance associated with this Commcell.
+
+        Returns:
+            CommcellInventory: An instance for taking snapshots of the client / agent /
+            instance / backupset / subclient tree of the Commcell.
+
+        Example:
+            >>> snapshot = commcell.inventory.snapshot(scope='subclient')
+            >>> print(len(snapshot.nodes('subclient')))
+
+        #ai-gen-doc
+        """
+        try:
+            if self._inventory is None:
+                self._inventory = CommcellInventory(self)
+
+            return self._inventory
+        except AttributeError:
+            return USER_LOGGED_OUT_MESSAGE
+
     @property
     def users(self) -> Users:
         """Get the Users instance associated with this Commcell.
@@ -3479,7 +3538,14 @@ class Commcell:
         self._content_analyzers = None
         self._resource_pool = None
         self._plans = None
+
+        # stop the job state poller, so it does not keep running for the dropped controller
+        if self._job_controller is not None:
+            self._job_controller.unsubscribe_all()
+
         self._job_controller = None
+        self._backup_dispatcher = None
+        self._inventory = None
         self._users = None
         self._roles = None
         self._credentials = None
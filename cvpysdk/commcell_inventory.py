@@ -0,0 +1,689 @@
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""Main file for taking a snapshot of the client / agent / instance / backupset / subclient tree.
+
+InventoryNode, InventorySnapshot and CommcellInventory are the classes defined in this file.
+
+InventoryNode:      Class for the lightweight record of an entity of the tree
+
+InventorySnapshot:  Class for the in-memory index of the tree, which hands out the node records,
+or the hydrated objects of the entities on demand
+
+CommcellInventory:  Class for fetching the tree of the commcell, level by level, with the
+requests of each level sent concurrently
+
+
+InventoryNode:
+==============
+    __init__(level, node_id, name, parent, properties)  --  initialise the node record
+
+    __repr__()                      --  returns the string representation of the node
+
+    key                             --  returns the key of the node in the snapshot
+
+    path                            --  returns the names of the node and its ancestors
+
+    iter_descendants(level)         --  iterates over the descendants of the node
+
+
+InventorySnapshot:
+==================
+    __init__(commcell_object, scope)    --  initialise the empty snapshot
+
+    __repr__()                      --  returns the string representation of the snapshot
+
+    __len__()                       --  returns the number of nodes in the snapshot
+
+    _add_node()                     --  adds a node to the snapshot
+
+    nodes(level)                    --  returns the nodes of the level
+
+    get_node(key)                   --  returns the node with the given key
+
+    find(level, name)               --  returns the nodes of the level with the given name
+
+    hydrate(node)                   --  returns the object of the entity of the node
+
+    iter_objects(level)             --  hydrates the nodes of the level concurrently
+
+
+CommcellInventory:
+==================
+    __init__(commcell_object)       --  initialise object of the CommcellInventory class
+
+    __repr__()                      --  returns the string representation of the inventory
+
+    _get_properties()               --  gets the properties of the entities of a list call
+
+    _fetch_level()                  --  runs the list calls of a level concurrently
+
+    snapshot()                      --  takes a snapshot of the tree of the commcell
+
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from .exception import SDKException
+
+if TYPE_CHECKING:
+    from .commcell import Commcell
+
+
+class InventoryNode:
+    """
+    Lightweight record of a client, agent, instance, backupset or subclient of the commcell.
+
+    The node holds the id, the name and the properties of the entity returned by the list
+    call of its level, and links to its parent and children nodes, without the requests
+    made by the constructors of the entity classes.
+
+    #ai-gen-doc
+    """
+
+    __slots__ = ("level", "id", "name", "parent", "children", "properties")
+
+    def __init__(
+        self,
+        level: str,
+        node_id: str,
+        name: str,
+        parent: InventoryNode | None = None,
+        properties: dict | None = None,
+    ) -> None:
+        """Initialize the InventoryNode.
+
+        Args:
+            level: Level of the node, one of client, agent, instance, backupset or subclient.
+            node_id: Id of the entity. The application id for the agents.
+            name: Name of the entity, in lower case.
+            parent: Node of the parent entity. Default is None.
+            properties: Properties of the entity returned by the list call. Default is None.
+
+        #ai-gen-doc
+        """
+        self.level = level
+        self.id = node_id
+        self.name = name
+        self.parent = parent
+        self.children = []
+        self.properties = properties or {}
+
+    def __repr__(self) -> str:
+        """Return the string representation of the InventoryNode.
+
+        Returns:
+            A string with the level, name and id of the node.
+
+        #ai-gen-doc
+        """
+        return f'InventoryNode({self.level}: "{self.name}", id={self.id})'
+
+    @property
+    def key(self) -> tuple:
+        """Get the key of the node in the snapshot.
+
+        The keys are the same as the entity keys of the ScheduleSnapshot class, so both
+        snapshots can be joined on them.
+
+        Returns:
+            tuple: ("client", client_id), ("agent", client_id, app_id), ("instance", id),
+            ("backupset", id) or ("subclient", id).
+
+        #ai-gen-doc
+        """
+        if self.level == "agent":
+            return "agent", int(self.parent.id), int(self.id)
+        return self.level, int(self.id)
+
+    @property
+    def path(self) -> list[str]:
+        """Get the names of the node and its ancestors, starting from the client.
+
+        Returns:
+            list: Names of the client, agent, instance, backupset and subclient of the node,
+            up to the level of the node.
+
+        Example:
+            >>> node.path
+            ['client1', 'file system', 'defaultinstancename', 'defaultbackupset', 'default']
+
+        #ai-gen-doc
+        """
+        path = []
+        node = self
+        while node is not None:
+            path.append(node.name)
+            node = node.parent
+        return path[::-1]
+
+    def iter_descendants(self, level: str | None = None) -> Iterator[InventoryNode]:
+        """Iterate over the descendants of the node, breadth first.
+
+        Args:
+            level: Level of the descendants to return, or None for all levels.
+                Default is None.
+
+        Yields:
+            InventoryNode: The descendant nodes.
+
+        #ai-gen-doc
+        """
+        nodes = list(self.children)
+        while nodes:
+            children = []
+            for node in nodes:
+                if level is None or node.level == level:
+                    yield node
+                children.extend(node.children)
+            nodes = children
+
+
+class InventorySnapshot:
+    """
+    In-memory index of the client / agent / instance / backupset / subclient tree of a commcell.
+
+    The snapshot indexes the nodes by key and by level. The objects of the entities are
+    only created when the nodes are hydrated. They are created from the ids in the
+    snapshot, without looking the ids up by name, and each object is created once per
+    snapshot.
+
+    Attributes:
+        scope: The deepest level fetched in the snapshot.
+        errors: The SDKException raised by the list calls that failed, by the key of the
+            node the call was made for. The children of those nodes are not in the snapshot.
+
+    #ai-gen-doc
+    """
+
+    def __init__(self, commcell_object: Commcell, scope: str) -> None:
+        """Initialize an empty InventorySnapshot.
+
+        Args:
+            commcell_object: Instance of the Commcell class.
+            scope: The deepest level fetched in the snapshot.
+
+        #ai-gen-doc
+        """
+        self._commcell_object = commcell_object
+        self.scope = scope
+        self.errors = {}
+
+        self._nodes = {}
+        self._levels = {level: [] for level in CommcellInventory.LEVELS}
+        self._objects = {}
+        self._object_locks = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """Return the string representation of the InventorySnapshot.
+
+        Returns:
+            A string with the commcell name and the number of nodes of each level.
+
+        #ai-gen-doc
+        """
+        counts = ", ".join(
+            f"{level}s={len(nodes)}" for level, nodes in self._levels.items() if nodes
+        )
+        return (
+            f'InventorySnapshot class instance for Commcell: "{self._commcell_object.commserv_name}"'
+            f" ({counts})"
+        )
+
+    def __len__(self) -> int:
+        """Get the number of nodes in the snapshot.
+
+        Returns:
+            The total number of nodes of all the levels.
+
+        #ai-gen-doc
+        """
+        return len(self._nodes)
+
+    def _add_node(
+        self,
+        level: str,
+        node_id: Any,
+        name: str,
+        parent: InventoryNode | None,
+        properties: dict,
+    ) -> InventoryNode:
+        """Add a node to the snapshot, and to the children of its parent.
+
+        Args:
+            level: Level of the node.
+            node_id: Id of the entity.
+            name: Name of the entity.
+            parent: Node of the parent entity, None for the clients.
+            properties: Properties of the entity returned by the list call.
+
+        Returns:
+            InventoryNode: The node added to the snapshot.
+
+        #ai-gen-doc
+        """
+        node = InventoryNode(level, str(node_id), name.lower(), parent, properties)
+
+        if parent is not None:
+            parent.children.append(node)
+
+        self._nodes[node.key] = node
+        self._levels[level].append(node)
+        return node
+
+    def nodes(self, level: str) -> list[InventoryNode]:
+        """Get the nodes of a level of the snapshot.
+
+        Args:
+            level: One of client, agent, instance, backupset or subclient.
+
+        Returns:
+            list: The nodes of the level.
+
+        Raises:
+            SDKException: If the level is not valid.
+
+        Example:
+            >>> for node in snapshot.nodes('subclient'):
+            ...     print('/'.join(node.path))
+
+        #ai-gen-doc
+        """
+        if level not in self._levels:
+            raise SDKException("CommcellInventory", "101")
+
+        return list(self._levels[level])
+
+    def get_node(self, key: tuple) -> InventoryNode | None:
+        """Get the node with the given key.
+
+        Args:
+            key: Key of the node, like ("subclient", 12) or ("agent", 2, 33).
+
+        Returns:
+            InventoryNode: The node, or None if the snapshot has no node with the key.
+
+        #ai-gen-doc
+        """
+        return self._nodes.get(key)
+
+    def find(self, level: str, name: str) -> list[InventoryNode]:
+        """Get the nodes of a level with the given name.
+
+        Args:
+            level: One of client, agent, instance, backupset or subclient.
+            name: Name of the entity, case insensitive.
+
+        Returns:
+            list: The nodes of the level with the name.
+
+        Raises:
+            SDKException: If the level is not valid.
+
+        Example:
+            >>> default_subclients = snapshot.find('subclient', 'default')
+
+        #ai-gen-doc
+        """
+        return [node for node in self.nodes(level) if node.name == name.lower()]
+
+    def hydrate(self, node: InventoryNode) -> Any:
+        """Get the object of the entity of the node, creating it on first access.
+
+        The objects of the ancestors of the node are created too, once per snapshot. The
+        subclient objects are created from the properties in the snapshot, without a
+        request to get the properties of the subclient.
+
+        Args:
+            node: A node of the snapshot.
+
+        Returns:
+            The Client, Agent, Instance, Backupset or Subclient object of the node.
+
+        Example:
+            >>> subclient = snapshot.hydrate(snapshot.find('subclient', 'default')[0])
+            >>> subclient.backup()
+
+        #ai-gen-doc
+        """
+        from .agent import Agent
+        from .backupset import Backupset
+        from .client import Client
+        from .instance import Instance
+        from .subclient import Subclient
+
+        with self._lock:
+            if node.key in self._objects:
+                return self._objects[node.key]
+            object_lock = self._object_locks.setdefault(node.key, threading.Lock())
+
+        # the objects are created under a lock per node, so the objects of the parent nodes
+        # are created once when their children are hydrated concurrently
+        with object_lock:
+            if node.key not in self._objects:
+                if node.level == "client":
+                    entity = Client(self._commcell_object, node.name, node.id)
+                elif node.level == "agent":
+                    entity = Agent(self.hydrate(node.parent), node.name, node.id)
+                elif node.level == "instance":
+                    entity = Instance(self.hydrate(node.parent), node.name, node.id)
+                elif node.level == "backupset":
+                    entity = Backupset(self.hydrate(node.parent), node.name, node.id)
+                else:
+                    entity = Subclient._from_properties(
+                        self.hydrate(node.parent), node.name, node.id, node.properties
+                    )
+
+                with self._lock:
+                    self._objects[node.key] = entity
+
+        return self._objects[node.key]
+
+    def iter_objects(self, level: str, max_workers: int = 8) -> Iterator[Any]:
+        """Hydrate the nodes of a level concurrently, yielding the objects in order.
+
+        Args:
+            level: One of client, agent, instance, backupset or subclient.
+            max_workers: Maximum number of objects created concurrently. Default is 8.
+
+        Returns:
+            Iterator over the objects of the nodes of the level.
+
+        Raises:
+            SDKException: If the level or max_workers is not valid.
+
+        Example:
+            >>> for subclient in snapshot.iter_objects('subclient', max_workers=16):
+            ...     print(subclient.subclient_name, subclient.storage_policy)
+
+        #ai-gen-doc
+        """
+        nodes = self.nodes(level)
+
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise SDKException(
+                "CommcellInventory", "102", "max_workers should be a positive integer"
+            )
+
+        def _iter_objects() -> Iterator[Any]:
+            if not nodes:
+                return
+
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(nodes))) as executor:
+                yield from executor.map(self.hydrate, nodes)
+
+        return _iter_objects()
+
+
+class CommcellInventory:
+    """
+    Class for taking snapshots of the client / agent / instance / backupset / subclient tree.
+
+    The tree is fetched breadth first, level by level, with the list calls of each level sent
+    concurrently by a bounded pool of workers. The instances and backupsets of a client are
+    fetched with a single call per client, and the subclients with a single call per agent,
+    so the number of requests does not depend on the number of instances or backupsets.
+
+    Key Features:
+        - Breadth first fetch of the whole tree, or down to a given level
+        - Concurrent list calls within each level
+        - Lightweight node records, and objects created on demand
+        - List call failures recorded per node instead of failing the snapshot
+
+    #ai-gen-doc
+    """
+
+    LEVELS = ("client", "agent", "instance", "backupset", "subclient")
+
+    def __init__(self, commcell_object: Commcell) -> None:
+        """Initialize the CommcellInventory for the given commcell.
+
+        Args:
+            commcell_object: Instance of the Commcell class.
+
+        #ai-gen-doc
+        """
+        self._commcell_object = commcell_object
+        self._cvpysdk_object = commcell_object._cvpysdk_object
+        self._services = commcell_object._services
+        self._update_response_ = commcell_object._update_response_
+
+    def __repr__(self) -> str:
+        """Return the string representation of the CommcellInventory.
+
+        Returns:
+            A string with the commcell name.
+
+        #ai-gen-doc
+        """
+        return f'CommcellInventory class instance for Commcell: "{self._commcell_object.commserv_name}"'
+
+    def _get_properties(self, url: str, properties_key: str) -> list[dict]:
+        """Get the properties of the entities returned by a list call.
+
+        Args:
+            url: URL of the list call.
+            properties_key: Key of the list of properties in the response.
+
+        Returns:
+            list: Properties of the entities. Empty if the response has no entities.
+
+        Raises:
+            SDKException: If the response is not success.
+
+        #ai-gen-doc
+        """
+        flag, response = self._cvpysdk_object.make_request("GET", url)
+
+        if not flag:
+            raise SDKException("Response", "101", self._update_response_(response.text))
+
+        return (response.json() or {}).get(properties_key) or []
+
+    def _fetch_level(
+        self,
+        nodes: list[InventoryNode],
+        get_url: Callable[[InventoryNode], str],
+        properties_key: str,
+        snapshot: InventorySnapshot,
+        max_workers: int,
+    ) -> list[tuple[InventoryNode, list[dict]]]:
+        """Run the list calls of a level concurrently, one call per node.
+
+        Args:
+            nodes: The nodes to run the list calls for.
+            get_url: Function returning the URL of the list call of a node.
+            properties_key: Key of the list of properties in the responses.
+            snapshot: The snapshot to record the failed list calls in.
+            max_workers: Maximum number of list calls sent concurrently.
+
+        Returns:
+            list: The nodes, and the properties returned by their list calls, in order.
+            The nodes with a failed list call are not included.
+
+        #ai-gen-doc
+        """
+
+        def _fetch(node: InventoryNode) -> tuple[InventoryNode, list[dict] | SDKException]:
+            try:
+                return node, self._get_properties(get_url(node), properties_key)
+            except SDKException as excp:
+                return node, excp
+
+        if not nodes:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(nodes))) as executor:
+            results = list(executor.map(_fetch, nodes))
+
+        fetched = []
+        for node, properties in results:
+            if isinstance(properties, SDKException):
+                snapshot.errors[node.key] = properties
+            else:
+                fetched.append((node, properties))
+
+        return fetched
+
+    def snapshot(
+        self,
+        scope: str = "subclient",
+        clients: list[str] | None = None,
+        max_workers: int = 16,
+    ) -> InventorySnapshot:
+        """Take a snapshot of the tree of the commcell, down to the given level.
+
+        Args:
+            scope: The deepest level to fetch, one of client, agent, instance, backupset or
+                subclient. Default is subclient.
+            clients: Names of the clients to fetch the tree of, or None for all the clients
+                of the commcell. Default is None.
+            max_workers: Maximum number of list calls sent concurrently. Default is 16.
+
+        Returns:
+            InventorySnapshot: The snapshot of the tree.
+
+        Raises:
+            SDKException: If the scope or max_workers is not valid, or if the clients of the
+                commcell could not be listed.
+
+        Example:
+            >>> snapshot = commcell.inventory.snapshot(scope='backupset', max_workers=32)
+            >>> for node in snapshot.nodes('backupset'):
+            ...     print('/'.join(node.path))
+
+        #ai-gen-doc
+        """
+        if scope not in self.LEVELS:
+            raise SDKException("CommcellInventory", "101")
+
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise SDKException(
+                "CommcellInventory", "102", "max_workers should be a positive integer"
+            )
+
+        depth = self.LEVELS.index(scope)
+        snapshot = InventorySnapshot(self._commcell_object, scope)
+
+        client_names = None if clients is None else {name.lower() for name in clients}
+        for client_name, client in self._commcell_object.clients.all_clients.items():
+            if client_names is None or client_name in client_names:
+                snapshot._add_node("client", client["id"], client_name, None, client)
+
+        if depth >= 1:
+            for client_node, agents in self._fetch_level(
+                snapshot.nodes("client"),
+                lambda node: self._services["GET_ALL_AGENTS"] % node.id,
+                "agentProperties",
+                snapshot,
+                max_workers,
+            ):
+                for agent in agents:
+                    entity = agent["idaEntity"]
+                    snapshot._add_node(
+                        "agent", entity["applicationId"], entity["appName"], client_node, agent
+                    )
+
+        if depth >= 2:
+            # instances of all the agents of a client are listed with a single call
+            for client_node, instances in self._fetch_level(
+                [node for node in snapshot.nodes("client") if node.children],
+                lambda node: self._services["GET_ALL_INSTANCES"] % node.id,
+                "instanceProperties",
+                snapshot,
+                max_workers,
+            ):
+                agent_nodes = {node.id: node for node in client_node.children}
+                for instance in instances:
+                    entity = instance["instance"]
+                    agent_node = agent_nodes.get(str(entity.get("applicationId")))
+                    if agent_node is None:
+                        agent_node = next(
+                            (
+                                node
+                                for node in client_node.children
+                                if node.name in entity.get("appName", "").lower()
+                            ),
+                            None,
+                        )
+
+                    if agent_node is not None:
+                        snapshot._add_node(
+                            "instance",
+                            entity["instanceId"],
+                            entity["instanceName"],
+                            agent_node,
+                            instance,
+                        )
+
+        if depth >= 3:
+            # backupsets of all the instances of a client are listed with a single call
+            for client_node, backupsets in self._fetch_level(
+                [
+                    node
+                    for node in snapshot.nodes("client")
+                    if any(True for _ in node.iter_descendants("instance"))
+                ],
+                lambda node: self._services["GET_ALL_BACKUPSETS"] % node.id,
+                "backupsetProperties",
+                snapshot,
+                max_workers,
+            ):
+                for backupset in backupsets:
+                    entity = backupset["backupSetEntity"]
+                    instance_node = snapshot.get_node(("instance", int(entity["instanceId"])))
+
+                    if instance_node is not None:
+                        snapshot._add_node(
+                            "backupset",
+                            entity["backupsetId"],
+                            entity["backupsetName"],
+                            instance_node,
+                            backupset,
+                        )
+
+        if depth >= 4:
+            for agent_node, subclients in self._fetch_level(
+                [
+                    node
+                    for node in snapshot.nodes("agent")
+                    if any(True for _ in node.iter_descendants("backupset"))
+                ],
+                lambda node: self._services["GET_ALL_SUBCLIENTS"] % (node.parent.id, node.id),
+                "subClientProperties",
+                snapshot,
+                max_workers,
+            ):
+                for subclient in subclients:
+                    entity = subclient["subClientEntity"]
+                    backupset_node = snapshot.get_node(("backupset", int(entity["backupsetId"])))
+
+                    if backupset_node is not None:
+                        snapshot._add_node(
+                            "subclient",
+                            entity["subclientId"],
+                            entity["subclientName"],
+                            backupset_node,
+                            subclient,
+                        )
+
+        return snapshot
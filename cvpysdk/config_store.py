@@ -0,0 +1,555 @@
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""Main file for storing the configuration of the commcell on disk, and detecting its drift.
+
+ConfigDiff and ConfigStore are the classes defined in this file.
+
+ConfigDiff:     Class for the differences between the stored and the current configuration
+
+ConfigStore:    Class for the SQLite store of the configuration of the commcell, synced
+incrementally with the commcell
+
+
+ConfigDiff:
+===========
+    __init__()                      --  initialise the empty diff
+
+    __repr__()                      --  returns the string representation of the diff
+
+    __len__()                       --  returns the number of changed entities
+
+    __bool__()                      --  returns True if any entity changed
+
+    changes(entity_type)            --  returns the changes of the entities of a type
+
+    _get_changed_paths()            --  gets the paths of the changed keys of two payloads
+
+
+ConfigStore:
+============
+    __init__(commcell_object, path) --  initialise the store, and create its table
+
+    __repr__()                      --  returns the string representation of the store
+
+    _connect()                      --  returns a connection to the SQLite database
+
+    _get_marker()                   --  gets the modification marker of a list entry
+
+    _get_json()                     --  gets the JSON response of a GET request
+
+    _list_entities()                --  lists the entities of the given types
+
+    _fetch_payload()                --  fetches the full properties of an entity
+
+    load(entity_type)               --  loads the stored entities
+
+    sync()                          --  syncs the store with the commcell, and returns the diff
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from typing import TYPE_CHECKING, Any
+
+from .exception import SDKException
+
+if TYPE_CHECKING:
+    from .commcell import Commcell
+
+
+class ConfigDiff:
+    """
+    Differences between the configuration in the store and the configuration of the commcell.
+
+    Attributes:
+        added: (entity_type, entity_id, name) of the entities not in the store.
+        removed: (entity_type, entity_id, name) of the stored entities not in the commcell.
+        modified: (entity_type, entity_id, name, changed_paths) of the entities with changed
+            properties, with the paths of the changed keys of the properties.
+
+    #ai-gen-doc
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty ConfigDiff.
+
+        #ai-gen-doc
+        """
+        self.added = []
+        self.removed = []
+        self.modified = []
+
+    def __repr__(self) -> str:
+        """Return the string representation of the ConfigDiff.
+
+        Returns:
+            A string with the number of added, removed and modified entities.
+
+        #ai-gen-doc
+        """
+        return (
+            f"ConfigDiff(added={len(self.added)}, removed={len(self.removed)}, "
+            f"modified={len(self.modified)})"
+        )
+
+    def __len__(self) -> int:
+        """Get the number of changed entities.
+
+        Returns:
+            The number of added, removed and modified entities.
+
+        #ai-gen-doc
+        """
+        return len(self.added) + len(self.removed) + len(self.modified)
+
+    def __bool__(self) -> bool:
+        """Check if any entity changed.
+
+        Returns:
+            True if any entity was added, removed or modified, False otherwise.
+
+        #ai-gen-doc
+        """
+        return len(self) > 0
+
+    def changes(self, entity_type: str) -> dict[str, list]:
+        """Get the changes of the entities of a type.
+
+        Args:
+            entity_type: One of the entity types of the ConfigStore class.
+
+        Returns:
+            dict: The added, removed and modified entities of the type.
+
+        Example:
+            >>> diff.changes('plan')['modified']
+            [('plan', '12', 'server plan', ['plan.rpo.backupFrequency'])]
+
+        #ai-gen-doc
+        """
+        return {
+            "added": [entity for entity in self.added if entity[0] == entity_type],
+            "removed": [entity for entity in self.removed if entity[0] == entity_type],
+            "modified": [entity for entity in self.modified if entity[0] == entity_type],
+        }
+
+    @staticmethod
+    def _get_changed_paths(old: Any, new: Any, path: str = "") -> list[str]:
+        """Get the paths of the keys with different values in two payloads.
+
+        Dictionaries are compared key by key, and all other values, including lists, are
+        compared as a whole.
+
+        Args:
+            old: The stored payload.
+            new: The current payload.
+            path: Path of the payloads in their parent payload. Default is "".
+
+        Returns:
+            list: Paths of the changed keys, joined with dots.
+
+        #ai-gen-doc
+        """
+        if isinstance(old, dict) and isinstance(new, dict):
+            changed_paths = []
+            for key in sorted(set(old) | set(new), key=str):
+                key_path = f"{path}.{key}" if path else str(key)
+                if key not in old or key not in new:
+                    changed_paths.append(key_path)
+                else:
+                    changed_paths.extend(
+                        ConfigDiff._get_changed_paths(old[key], new[key], key_path)
+                    )
+            return changed_paths
+
+        return [] if old == new else [path]
+
+
+class ConfigStore:
+    """
+    SQLite store of the configuration of the commcell, synced incrementally with the commcell.
+
+    Each synced entity is stored with its full properties and a modification marker. The
+    commcell does not return the modification time of these entities, so the marker is a
+    fingerprint of the entry of the entity in its list call. On sync, the entities are listed
+    with one call per entity type, and the full properties are only fetched for the entities
+    that are new or have a different marker. The list entries of the subclients and of the
+    schedules are their full properties, so they are never fetched one by one.
+
+    The list entries of the clients, the plans and the storage policies only have a few
+    fields such as their id and name, which do not change when their settings are modified.
+    The clients, subclients, plans and storage policies are therefore fully refreshed on
+    every sync by default, see `FULL_REFRESH_TYPES`, and only the schedules are synced
+    incrementally.
+
+    The supported entity types are client, subclient, plan, storage_policy and schedule.
+    The clients and the subclients are listed with the commcell inventory snapshot.
+
+    Key Features:
+        - On-disk store in a single SQLite file
+        - Incremental sync, fetching only the entities with a changed marker
+        - Diff of the added, removed and modified entities, with the changed keys
+        - Drift check without updating the stored baseline
+
+    #ai-gen-doc
+    """
+
+    ENTITY_TYPES = ("client", "subclient", "plan", "storage_policy", "schedule")
+
+    # entity types fully refreshed on sync by default, as their marker misses their changes
+    FULL_REFRESH_TYPES = ("client", "subclient", "plan", "storage_policy")
+
+    def __init__(self, commcell_object: Commcell, path: str) -> None:
+        """Initialize the ConfigStore, and create its table if the store is new.
+
+        Args:
+            commcell_object: Instance of the Commcell class.
+            path: Path of the SQLite file of the store.
+
+        Example:
+            >>> store = ConfigStore(commcell, '/var/lib/drift/commcell.db')
+
+        #ai-gen-doc
+        """
+        self._commcell_object = commcell_object
+        self._cvpysdk_object = commcell_object._cvpysdk_object
+        self._services = commcell_object._services
+        self._update_response_ = commcell_object._update_response_
+        self.path = path
+
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entities ("
+                "entity_type TEXT NOT NULL, entity_id TEXT NOT NULL, name TEXT, "
+                "marker TEXT NOT NULL, payload TEXT NOT NULL, synced_time INTEGER NOT NULL, "
+                "PRIMARY KEY (entity_type, entity_id))"
+            )
+
+    def __repr__(self) -> str:
+        """Return the string representation of the ConfigStore.
+
+        Returns:
+            A string with the commcell name and the path of the store.
+
+        #ai-gen-doc
+        """
+        return (
+            f'ConfigStore class instance for Commcell: "{self._commcell_object.commserv_name}"'
+            f' at "{self.path}"'
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get a connection to the SQLite database of the store.
+
+        Returns:
+            sqlite3.Connection: A new connection to the database.
+
+        #ai-gen-doc
+        """
+        return sqlite3.connect(self.path)
+
+    @staticmethod
+    def _get_marker(entry: dict) -> str:
+        """Get the modification marker of the list entry of an entity.
+
+        Args:
+            entry: The entry of the entity in its list call.
+
+        Returns:
+            str: SHA-256 fingerprint of the entry.
+
+        #ai-gen-doc
+        """
+        return hashlib.sha256(
+            json.dumps(entry, sort_keys=True, separators=(",", ":"), default=str).encode()
+        ).hexdigest()
+
+    def _get_json(self, url: str) -> dict:
+        """Get the JSON response of a GET request.
+
+        Args:
+            url: URL of the request.
+
+        Returns:
+            dict: The JSON response, empty if the response has no body.
+
+        Raises:
+            SDKException: If the response is not success.
+
+        #ai-gen-doc
+        """
+        flag, response = self._cvpysdk_object.make_request("GET", url)
+
+        if not flag:
+            raise SDKException("Response", "101", self._update_response_(response.text))
+
+        return response.json() or {}
+
+    def _list_entities(
+        self, entity_types: list[str], clients: list[str] | None, max_workers: int
+    ) -> dict[tuple[str, str], tuple[str, dict]]:
+        """List the entities of the given types, with their list entries.
+
+        Args:
+            entity_types: The entity types to list.
+            clients: Names of the clients to list the clients and subclients of, or None
+                for all the clients.
+            max_workers: Maximum number of list calls sent concurrently.
+
+        Returns:
+            dict: Name and list entry of the entities, by (entity_type, entity_id).
+
+        Raises:
+            SDKException: If a list call fails.
+
+        #ai-gen-doc
+        """
+        entities = {}
+
+        if "client" in entity_types or "subclient" in entity_types:
+            snapshot = self._commcell_object.inventory.snapshot(
+                scope="subclient" if "subclient" in entity_types else "client",
+                clients=clients,
+                max_workers=max_workers,
+            )
+
+            if snapshot.errors:
+                # entities under a failed list call would be reported as removed
+                raise SDKException("ConfigStore", "102", str(next(iter(snapshot.errors.values()))))
+
+            for level in ("client", "subclient"):
+                if level in entity_types:
+                    for node in snapshot.nodes(level):
+                        entities[(level, node.id)] = (node.name, node.properties)
+
+        if "plan" in entity_types:
+            for plan in self._get_json(self._services["PLANS"]).get("plans") or []:
+                entities[("plan", str(plan["plan"]["planId"]))] = (
+                    plan["plan"]["planName"].lower(),
+                    plan,
+                )
+
+        if "storage_policy" in entity_types:
+            for policy in self._get_json(self._services["STORAGE_POLICY"]).get("policies") or []:
+                entities[("storage_policy", str(policy["storagePolicyId"]))] = (
+                    policy["storagePolicyName"].lower(),
+                    policy,
+                )
+
+        if "schedule" in entity_types:
+            task_details = self._get_json(self._services["COMMCELL_SCHEDULES"]).get("taskDetail")
+            for task_detail in task_details or []:
+                task = task_detail["task"]
+                entities[("schedule", str(task["taskId"]))] = (
+                    str(task.get("taskName") or task["taskId"]).lower(),
+                    task_detail,
+                )
+
+        return entities
+
+    def _fetch_payload(self, entity_type: str, entity_id: str, entry: dict) -> dict:
+        """Fetch the full properties of an entity.
+
+        Args:
+            entity_type: The type of the entity.
+            entity_id: The id of the entity.
+            entry: The entry of the entity in its list call.
+
+        Returns:
+            dict: The full properties of the entity.
+
+        Raises:
+            SDKException: If the response is not success.
+
+        #ai-gen-doc
+        """
+        if entity_type == "client":
+            return self._get_json(self._services["CLIENT"] % entity_id)
+        if entity_type == "plan":
+            return self._get_json(self._services["PLAN"] % entity_id)
+        if entity_type == "storage_policy":
+            return self._get_json(self._services["GET_STORAGE_POLICY_ADVANCED"] % entity_id)
+
+        # the list entries of the subclients and the schedules are their full properties
+        return entry
+
+    def load(self, entity_type: str | None = None) -> dict[tuple[str, str], dict]:
+        """Load the entities in the store.
+
+        Args:
+            entity_type: The type of the entities to load, or None for all the entities.
+                Default is None.
+
+        Returns:
+            dict: Name, marker, properties and sync time of the entities, by
+            (entity_type, entity_id).
+
+        Example:
+            >>> plans = store.load('plan')
+            >>> for (_, plan_id), plan in plans.items():
+            ...     print(plan_id, plan['name'])
+
+        #ai-gen-doc
+        """
+        query = "SELECT entity_type, entity_id, name, marker, payload, synced_time FROM entities"
+        parameters = ()
+        if entity_type is not None:
+            query += " WHERE entity_type = ?"
+            parameters = (entity_type,)
+
+        with closing(self._connect()) as connection:
+            rows = connection.execute(query, parameters).fetchall()
+
+        return {
+            (row[0], row[1]): {
+                "name": row[2],
+                "marker": row[3],
+                "payload": json.loads(row[4]),
+                "synced_time": row[5],
+            }
+            for row in rows
+        }
+
+    def sync(
+        self,
+        entity_types: Iterable[str] | None = None,
+        clients: list[str] | None = None,
+        max_workers: int = 8,
+        full_refresh: bool | None = None,
+        save: bool = True,
+    ) -> ConfigDiff:
+        """Sync the store with the configuration of the commcell, and get the differences.
+
+        The entities are listed with one call per entity type, and the full properties are
+        fetched only for the entities that are not in the store, or have a different marker.
+
+        Incremental sync only detects the clients, plans and storage policies that are added,
+        removed or renamed, as their list entries do not change when their settings are
+        modified. So by default their full properties are fetched on every sync, with one
+        request per entity. The subclients are compared on every sync too, but their list
+        entries are their full properties, so this needs no extra request.
+
+        Args:
+            entity_types: The entity types to sync, or None for all the entity types.
+                Default is None.
+            clients: Names of the clients to sync the clients and subclients of, or None for
+                all the clients. The removed clients and subclients are only detected when
+                all the clients are synced. Default is None.
+            max_workers: Maximum number of requests sent concurrently. Default is 8.
+            full_refresh: Whether to fetch the full properties of all the entities, to detect
+                the changes that do not change the list entries. Default is None, to fully
+                refresh only the entity types in `FULL_REFRESH_TYPES`. Set to False to only
+                detect the added, removed and renamed entities, without a request per entity.
+            save: Whether to save the changes in the store. Set to False to only check the
+                drift from the stored configuration. Default is True.
+
+        Returns:
+            ConfigDiff: The differences between the stored and the current configuration.
+
+        Raises:
+            SDKException: If an entity type or max_workers is not valid, or if a request fails.
+
+        Example:
+            >>> store = ConfigStore(commcell, 'commcell.db')
+            >>> diff = store.sync(entity_types=['plan', 'schedule'])
+            >>> for entity_type, entity_id, name, paths in diff.modified:
+            ...     print(entity_type, name, paths)
+
+        #ai-gen-doc
+        """
+        entity_types = list(self.ENTITY_TYPES if entity_types is None else entity_types)
+
+        if any(entity_type not in self.ENTITY_TYPES for entity_type in entity_types):
+            raise SDKException("ConfigStore", "101")
+
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise SDKException("ConfigStore", "102", "max_workers should be a positive integer")
+
+        stored = {}
+        for entity_type in entity_types:
+            stored.update(self.load(entity_type))
+
+        entities = self._list_entities(entity_types, clients, max_workers)
+        markers = {key: self._get_marker(entry) for key, (_, entry) in entities.items()}
+
+        def is_full_refresh(entity_type):
+            if full_refresh is None:
+                return entity_type in self.FULL_REFRESH_TYPES
+            return full_refresh
+
+        to_fetch = [
+            key
+            for key in entities
+            if is_full_refresh(key[0])
+            or key not in stored
+            or stored[key]["marker"] != markers[key]
+        ]
+
+        payloads = {}
+        if to_fetch:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(to_fetch))) as executor:
+                fetched = executor.map(
+                    lambda key: self._fetch_payload(key[0], key[1], entities[key][1]), to_fetch
+                )
+                payloads = dict(zip(to_fetch, fetched))
+
+        diff = ConfigDiff()
+        rows = []
+        synced_time = int(time.time())
+
+        for key, payload in payloads.items():
+            name = entities[key][0]
+
+            if key not in stored:
+                diff.added.append((*key, name))
+            else:
+                changed_paths = ConfigDiff._get_changed_paths(stored[key]["payload"], payload)
+                if changed_paths:
+                    diff.modified.append((*key, name, changed_paths))
+                elif stored[key]["marker"] == markers[key]:
+                    continue
+
+            rows.append((*key, name, markers[key], json.dumps(payload, default=str), synced_time))
+
+        for key, entity in stored.items():
+            # clients and subclients of the clients not synced are kept as they are
+            if clients is not None and key[0] in ("client", "subclient"):
+                continue
+
+            if key not in entities:
+                diff.removed.append((*key, entity["name"]))
+
+        if save:
+            with closing(self._connect()) as connection, connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO entities (entity_type, entity_id, name, marker, "
+                    "payload, synced_time) VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                connection.executemany(
+                    "DELETE FROM entities WHERE entity_type = ? AND entity_id = ?",
+                    [entity[:2] for entity in diff.removed],
+                )
+
+        return diff
@@ -30,6 +30,8 @@ SQLDefines              --  Class which maintains the defines list for SQL Serve
 
 AdvancedJobDetailType   --  Enum to maintain advanced job details info type
 
+JobStateEvent           --  Enum to maintain the job state change events of job subscriptions
+
 VSALiveSyncStatus       --  Enum to maintain status of the VSA Live sync
 
 VSAFailOverStatus       --  Enum to maintain Failover status of the VSA Live sync
@@ -644,6 +646,16 @@ class AdvancedJobDetailType(Enum):
     BKUP_INFO = 16
 
 
+class JobStateEvent(Enum):
+    """Class to maintain the job state change events raised by the job subscriptions"""
+
+    STARTED = "started"
+    PHASE_CHANGED = "phase_changed"
+    PENDING = "pending"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
 class VSALiveSyncStatus(Enum):
     """Class to maintain status of the VSA Live sync"""
 
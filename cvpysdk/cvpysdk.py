@@ -298,7 +298,7 @@ class CVPySDK:
         else:
             return "User already logged out"
 
-    def _request(self, **kwargs):
+    def _request(self, session=None, **kwargs):
         """Executes the request on the Server with the given parameters.
 
         If the certificate path is given and the Web Service starts with **https**,
@@ -306,6 +306,11 @@ class CVPySDK:
         its value.
 
         Args:
+            session     (requests.Session)  --  session to send the request with, to reuse its
+            pooled connections
+
+                default: None, a new connection is opened for the request
+
             **kwargs    --  dict of keyword arguments, same as accepted by the
 
                 **requests.request** method
@@ -315,10 +320,12 @@ class CVPySDK:
             **requests.request** method
 
         """
+        requester = requests if session is None else session
+
         if self._certificate_path and self._commcell_object._web_service.startswith("https"):
-            return requests.request(verify=self._certificate_path, **kwargs)
+            return requester.request(verify=self._certificate_path, **kwargs)
         else:
-            return requests.request(verify=self._verify_ssl, **kwargs)
+            return requester.request(verify=self._verify_ssl, **kwargs)
 
     def who_am_i(self, authtoken=None):
         """Get the username of the user, to whom the Authtoken belongs to.
@@ -424,6 +431,9 @@ class CVPySDK:
 
                 remove_processing_info  (bool)      --  removes the processing instruction info from response.json()
 
+                session     (requests.Session)      --  session to send the request with, to
+                reuse its pooled connections
+
         Returns:
             tuple:
                 (True, response)    -   in case of success
@@ -440,6 +450,8 @@ class CVPySDK:
                 requests.exceptions.ConnectionError
 
         """
+        session = kwargs.get("session")
+
         try:
             if headers is None:
                 headers = self._commcell_object._headers.copy()
@@ -450,10 +462,17 @@ class CVPySDK:
             if method == "POST":
                 if isinstance(payload, dict | list):
                     if files is not None:
-                        response = self._request(method=method, url=url, files=files, data=payload)
+                        response = self._request(
+                            session=session, method=method, url=url, files=files, data=payload
+                        )
                     else:
                         response = self._request(
-                            method=method, url=url, headers=headers, json=payload, stream=stream
+                            session=session,
+                            method=method,
+                            url=url,
+                            headers=headers,
+                            json=payload,
+                            stream=stream,
                         )
                 else:
                     try:
@@ -475,14 +494,23 @@ class CVPySDK:
                             headers["Content-type"] = "text/plain"
 
                     response = self._request(
-                        method=method, url=url, headers=headers, data=payload, stream=stream
+                        session=session,
+                        method=method,
+                        url=url,
+                        headers=headers,
+                        data=payload,
+                        stream=stream,
                     )
             elif method == "GET":
-                response = self._request(method=method, url=url, headers=headers, stream=stream)
+                response = self._request(
+                    session=session, method=method, url=url, headers=headers, stream=stream
+                )
             elif method == "PUT":
-                response = self._request(method=method, url=url, headers=headers, json=payload)
+                response = self._request(
+                    session=session, method=method, url=url, headers=headers, json=payload
+                )
             elif method == "DELETE":
-                response = self._request(method=method, url=url, headers=headers)
+                response = self._request(session=session, method=method, url=url, headers=headers)
             else:
                 raise SDKException("CVPySDK", "102", f"HTTP method {method} not supported")
 
@@ -75,6 +75,13 @@ Datasource:
 
     import_data(data)                   --  imports/pumps given data into data source.
 
+    _get_import_batches()               --  splits the documents into batches by count and size
+
+    _import_batch()                     --  imports a single batch, retrying it on failure
+
+    import_data_stream(data)            --  imports the documents of an iterable in batches,
+                                                sent concurrently
+
     delete_content()                    --  deletes the contents of the data source.
 
     refresh()                           --  refresh the properties of the datasource
@@ -106,6 +113,13 @@ DataSource Attributes
 
 from __future__ import annotations
 
+import json
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from requests.exceptions import RequestException
+
 from ..exception import SDKException
 from .handler import Handlers
 from .sedstype import SEDS_TYPE_DICT
@@ -1058,6 +1072,9 @@ class Datasource:
     def import_data(self, data: list) -> None:
         """Import or pump the given data into the data source for indexing.
 
+        The whole list is sent in a single request. Use `import_data_stream()` to import a large
+        number of documents, or the documents of a generator, in batches.
+
         Args:
             data: A list of key-value pairs representing the data to be indexed and pumped into Solr.
 
@@ -1090,6 +1107,171 @@ class Datasource:
         response_string = self._commcell_object._update_response_(response.text)
         raise SDKException("Response", "101", response_string)
 
+    @staticmethod
+    def _get_import_batches(
+        data: Iterable[dict], batch_size: int, max_batch_bytes: int
+    ) -> Iterator[tuple[list, int]]:
+        """Split the documents into batches, limited by the document count and the JSON size.
+
+        The documents are read from the iterable lazily, one batch at a time. A document
+        larger than `max_batch_bytes` is sent in a batch of its own.
+
+        Args:
+            data: Iterable of the documents to import.
+            batch_size: Maximum number of documents in a batch.
+            max_batch_bytes: Maximum size of the JSON body of a batch, in bytes.
+
+        Yields:
+            Tuple of the list of documents of the batch, and the size of its JSON body.
+
+        #ai-gen-doc
+        """
+        # the JSON body of a batch is the list of documents, with ", " between them
+        batch, batch_bytes = [], 2
+        for document in data:
+            document_bytes = len(json.dumps(document).encode())
+            if batch and (
+                len(batch) >= batch_size or batch_bytes + 2 + document_bytes > max_batch_bytes
+            ):
+                yield batch, batch_bytes
+                batch, batch_bytes = [], 2
+
+            batch_bytes += document_bytes + (2 if batch else 0)
+            batch.append(document)
+
+        if batch:
+            yield batch, batch_bytes
+
+    def _import_batch(
+        self, index: int, batch: list, batch_bytes: int, max_retries: int, retry_delay: float
+    ) -> dict:
+        """Import a single batch of documents, retrying it on failure.
+
+        Args:
+            index: Index of the batch in the stream.
+            batch: List of documents of the batch.
+            batch_bytes: Size of the JSON body of the batch, in bytes.
+            max_retries: Number of times a failed batch is retried.
+            retry_delay: Seconds to wait before the first retry, doubled for each retry after.
+
+        Returns:
+            dict: The result of the batch, with the keys batch, documents, bytes, attempts,
+            seconds, documents_per_second and error, which is the exception raised by the
+            last attempt, or None if the batch was imported.
+
+        #ai-gen-doc
+        """
+        start_time = time.monotonic()
+        error = None
+
+        for attempt in range(1, max_retries + 2):
+            if attempt > 1:
+                time.sleep(retry_delay * 2 ** (attempt - 2))
+
+            try:
+                self.import_data(batch)
+                error = None
+                break
+            except (SDKException, RequestException) as excp:
+                error = excp
+
+        seconds = time.monotonic() - start_time
+        return {
+            "batch": index,
+            "documents": len(batch),
+            "bytes": batch_bytes,
+            "attempts": attempt,
+            "seconds": seconds,
+            "documents_per_second": len(batch) / seconds if seconds else None,
+            "error": error,
+        }
+
+    def import_data_stream(
+        self,
+        data: Iterable[dict],
+        batch_size: int = 1000,
+        max_batch_bytes: int = 8 * 1024 * 1024,
+        max_workers: int = 4,
+        max_retries: int = 2,
+        retry_delay: float = 1,
+        callback: Callable[[dict], None] | None = None,
+    ) -> list[dict]:
+        """Import the documents of an iterable into the data source, in concurrent batches.
+
+        The documents are read lazily from the iterable, which can be a generator, and split
+        into batches by the document count and the size of the JSON body. The batches are sent
+        by a bounded pool of worker threads, and no more than twice `max_workers` batches are
+        held in memory, so the iterable is only read as fast as the batches are imported.
+        A failed batch is retried on its own, without resending the other batches.
+
+        Args:
+            data: Iterable of the documents to import, as dictionaries of field values.
+            batch_size: Maximum number of documents in a batch. Default is 1000.
+            max_batch_bytes: Maximum size of the JSON body of a batch, in bytes.
+                Default is 8 MB.
+            max_workers: Maximum number of batches sent concurrently. Default is 4.
+            max_retries: Number of times a failed batch is retried. Default is 2.
+            retry_delay: Seconds to wait before the first retry of a batch, doubled for each
+                retry after. Default is 1.
+            callback: Function called with the result of each batch, as the batches complete.
+                Default is None.
+
+        Returns:
+            list: The result of each batch, in the order of the batches, as a dictionary with
+            the keys batch, documents, bytes, attempts, seconds, documents_per_second and
+            error, which is the exception raised by the last attempt of a failed batch, or
+            None.
+
+        Raises:
+            SDKException: If batch_size, max_batch_bytes or max_workers is not a positive
+                integer, or max_retries is negative.
+
+        Example:
+            >>> def read_cmdb():
+            ...     for row in cursor:
+            ...         yield {"id": row[0], "name": row[1]}
+            >>> results = datasource.import_data_stream(read_cmdb(), batch_size=5000)
+            >>> failed = [result for result in results if result["error"]]
+            >>> print(f"Imported {sum(r['documents'] for r in results)} documents")
+
+        #ai-gen-doc
+        """
+        for value in (batch_size, max_batch_bytes, max_workers):
+            if not isinstance(value, int) or value < 1:
+                raise SDKException("Datacube", "101")
+
+        if not isinstance(max_retries, int) or max_retries < 0:
+            raise SDKException("Datacube", "101")
+
+        results = []
+
+        def collect(futures):
+            for future in futures:
+                result = future.result()
+                results.append(result)
+                if callback is not None:
+                    callback(result)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = set()
+            batches = self._get_import_batches(data, batch_size, max_batch_bytes)
+
+            for index, (batch, batch_bytes) in enumerate(batches):
+                # wait for a batch to complete before reading more of the input
+                if len(pending) >= 2 * max_workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+
+                pending.add(
+                    executor.submit(
+                        self._import_batch, index, batch, batch_bytes, max_retries, retry_delay
+                    )
+                )
+
+            collect(wait(pending).done)
+
+        return sorted(results, key=lambda result: result["batch"])
+
     def delete_content(self) -> None:
         """Delete the content of the data source from Data Cube.
 
@@ -50,11 +50,14 @@ Handler:
 
     get_handler_data()          -- Execute the handler
 
+    iter_handler_data()         -- Execute the handler page by page, streaming the documents
+
     share()                     -- Share the handler with user or usergroup
 
 """
 
 from ..exception import SDKException
+from .search_iterator import SearchIterator
 
 
 class Handlers:
@@ -515,15 +518,67 @@ class Handler:
             "GET", self._execute_handler
         )
         if flag:
-            if response.json() and "response" in response.json():
-                return response.json()["response"]
-            if "error" in response.json():
-                error_message = response.json()["error"]["errLogMessage"]
+            response_json = response.json()
+            if response_json and "response" in response_json:
+                return response_json["response"]
+            if "error" in response_json:
+                error_message = response_json["error"]["errLogMessage"]
                 o_str = f'Failed to execute handler on datasource\nError: "{error_message}"'
                 raise SDKException("Datacube", "102", o_str)
             raise SDKException("Datacube", "102", "No response object in Json")
         raise SDKException("Response", "101", response.text)
 
+    def iter_handler_data(
+        self,
+        handler_filter: str = "",
+        page_size: int = 500,
+        limit: int | None = None,
+        start: int = 0,
+        prefetch: bool = True,
+    ) -> SearchIterator:
+        """Execute the handler page by page, streaming the documents of its results.
+
+        The `start` and `rows` parameters of each page are added to the handler filter, so
+        the filter should not contain them.
+
+        Args:
+            handler_filter: Optional string filter to apply during handler execution.
+            page_size: Number of documents fetched with each request. Default is 500.
+            limit: Maximum number of documents to return, or None for all the documents.
+                Default is None.
+            start: Offset of the first document to return. Default is 0.
+            prefetch: Whether to fetch the next page while the current page is consumed.
+                Default is True.
+
+        Returns:
+            SearchIterator: Iterator yielding the documents, with the number of documents
+            found as its num_found attribute.
+
+        Raises:
+            SDKException: If the input is not valid, or the execution of a page fails.
+
+        Example:
+            >>> documents = handler.iter_handler_data("q=FileExtension:pdf", page_size=1000)
+            >>> for document in documents:
+            ...     print(document["FileName"])
+            >>> print(f"Total documents: {documents.num_found}")
+
+        #ai-gen-doc
+        """
+        if not isinstance(handler_filter, str):
+            raise SDKException("Datacube", "101")
+
+        def fetch_page(offset: int, rows: int) -> tuple[int, list, dict]:
+            page_filter = f"start={offset}&rows={rows}"
+            if handler_filter:
+                page_filter = f"{handler_filter}&{page_filter}"
+            response = self.get_handler_data(page_filter)
+            return response.get("numFound", 0), response.get("docs", []), {}
+
+        return SearchIterator(
+            fetch_page, page_size=page_size, limit=limit, start=start, prefetch=prefetch
+        )
+
     def share(
         self,
         permission_list: list,
@@ -0,0 +1,227 @@
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""Helper file for streaming the documents of the paged searches of Data Cube and Activate apps.
+
+SearchIterator is the only class defined in this file.
+
+SearchIterator: Class for iterating over the documents of a search, page by page, fetching the
+next page in the background while the current page is consumed
+
+
+SearchIterator:
+===============
+    __init__(fetch_page, page_size, limit, start, prefetch)    --  initialise the iterator
+
+    __repr__()                      --  returns the string representation of the iterator
+
+    __iter__()                      --  iterates over the documents of the search
+
+    _get_rows()                     --  returns the number of rows of the page at an offset
+
+    pages()                         --  iterates over the pages of documents of the search
+
+SearchIterator Attributes
+-------------------------
+
+    **num_found**                   --  returns the number of documents matching the search
+
+    **facets**                      --  returns the facet / stats details of the first page
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+from ..exception import SDKException
+
+
+class SearchIterator:
+    """
+    Iterator over the documents of a paged search.
+
+    The search is run page by page with the `fetch_page` function, which takes the start offset
+    and the number of rows of a page, and returns the number of documents found, the documents
+    of the page and the facet / stats details, in the format returned by the `search()` methods
+    of the Activate apps. While the documents of a page are consumed, the next page is fetched
+    in the background, and the iteration stops at the end of the results or once `limit`
+    documents are returned.
+
+    Key Features:
+        - Streaming of the documents of any paged search
+        - Prefetch of the next page in a background thread
+        - Early stop at a limit on the number of documents
+
+    #ai-gen-doc
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[[int, int], tuple[int, list, dict]],
+        page_size: int = 500,
+        limit: int | None = None,
+        start: int = 0,
+        prefetch: bool = True,
+    ) -> None:
+        """Initialize the SearchIterator.
+
+        Args:
+            fetch_page: Function taking the start offset and the number of rows of a page, and
+                returning the number of documents found, the list of documents of the page,
+                and the facet / stats details.
+            page_size: Number of documents fetched with each request. Default is 500.
+            limit: Maximum number of documents to return, or None for all the documents.
+                Default is None.
+            start: Offset of the first document to return. Default is 0.
+            prefetch: Whether to fetch the next page while the current page is consumed.
+                Default is True.
+
+        Raises:
+            SDKException: If page_size is not a positive integer, or limit or start is negative.
+
+        Example:
+            >>> iterator = SearchIterator(
+            ...     lambda start, rows: handler_ops.search(params={'start': start, 'rows': rows}),
+            ...     page_size=1000,
+            ...     limit=5000
+            ... )
+
+        #ai-gen-doc
+        """
+        if not isinstance(page_size, int) or page_size < 1:
+            raise SDKException("Datacube", "101")
+
+        if limit is not None and (not isinstance(limit, int) or limit < 0):
+            raise SDKException("Datacube", "101")
+
+        if not isinstance(start, int) or start < 0:
+            raise SDKException("Datacube", "101")
+
+        self._fetch_page = fetch_page
+        self.page_size = page_size
+        self.limit = limit
+        self.start = start
+        self.prefetch = prefetch
+        self._num_found = None
+        self._facets = None
+
+    def __repr__(self) -> str:
+        """Return the string representation of the SearchIterator instance.
+
+        Returns:
+            A string with the page size and limit of the iterator.
+
+        #ai-gen-doc
+        """
+        return f"SearchIterator class instance (page_size={self.page_size}, limit={self.limit})"
+
+    def __iter__(self) -> Iterator[dict]:
+        """Iterate over the documents of the search.
+
+        Yields:
+            dict: The details of each document.
+
+        #ai-gen-doc
+        """
+        for page in self.pages():
+            yield from page
+
+    def _get_rows(self, offset: int) -> int:
+        """Get the number of rows of the page at the given offset.
+
+        Args:
+            offset: Start offset of the page.
+
+        Returns:
+            The number of rows to fetch, or 0 if no more documents are to be returned.
+
+        #ai-gen-doc
+        """
+        end = float("inf")
+        if self.limit is not None:
+            end = self.start + self.limit
+        if self._num_found is not None:
+            end = min(end, self._num_found)
+        return int(max(0, min(self.page_size, end - offset)))
+
+    def pages(self) -> Iterator[list]:
+        """Iterate over the pages of documents of the search.
+
+        Yields:
+            list: The documents of each page.
+
+        Raises:
+            SDKException: If the search of a page fails.
+
+        Example:
+            >>> for page in iterator.pages():
+            ...     print(f"Fetched {len(page)} documents")
+
+        #ai-gen-doc
+        """
+        offset = self.start
+        rows = self._get_rows(offset)
+        if not rows:
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self._fetch_page, offset, rows)
+
+            while future is not None:
+                num_found, docs, facets = future.result()
+                future = None
+
+                if self._num_found is None:
+                    self._num_found = int(num_found)
+                    self._facets = facets
+
+                # the page may have less documents than requested, at the end of the results
+                docs = docs[:rows]
+                offset += len(docs)
+                rows = self._get_rows(offset) if docs else 0
+
+                if rows and self.prefetch:
+                    future = executor.submit(self._fetch_page, offset, rows)
+
+                if docs:
+                    yield docs
+
+                if rows and future is None:
+                    future = executor.submit(self._fetch_page, offset, rows)
+
+    @property
+    def num_found(self) -> int | None:
+        """Get the number of documents matching the search.
+
+        Returns:
+            The number of documents found, or None if no page is fetched yet.
+
+        #ai-gen-doc
+        """
+        return self._num_found
+
+    @property
+    def facets(self) -> dict | None:
+        """Get the facet / stats details returned with the first page of the search.
+
+        Returns:
+            The facet / stats details, or None if no page is fetched yet.
+
+        #ai-gen-doc
+        """
+        return self._facets
@@ -118,6 +118,7 @@ from xml.parsers.expat import ExpatError
 import xmltodict
 
 from .exception import SDKException
+from .file_transfer import FileDownloader
 
 
 class DownloadCenter:
@@ -1087,9 +1088,24 @@ class DownloadCenter:
             response_string = self._update_response_(response.text)
             raise SDKException("Response", "101", response_string)
 
-    def download_package(self, package, download_location, platform=None, download_type=None):
+    def download_package(
+        self,
+        package,
+        download_location,
+        platform=None,
+        download_type=None,
+        chunk_size=1024**2,
+        max_streams=4,
+        resume=True,
+        checksum=None,
+        progress_callback=None,
+    ):
         """Downloads the given package from Download Center to the path specified.
 
+        The package is downloaded with concurrent byte range streams if the server supports
+        them, and with a single stream otherwise. A partial download of the package at the
+        same path is resumed.
+
         Args:
             package             (str)   --  name of the pacakge to be downloaded
 
@@ -1107,6 +1123,27 @@ class DownloadCenter:
 
                 default: None
 
+            chunk_size          (int)   --  number of bytes read from the stream at a time
+
+                default: 1 MB
+
+            max_streams         (int)   --  maximum number of concurrent byte range streams
+
+                default: 4
+
+            resume              (bool)  --  whether to resume a partial download of the package
+
+                default: True
+
+            checksum            (str)   --  expected SHA-256 hex digest of the package
+
+                default: None, the checksum is not verified
+
+            progress_callback   (callable)  --  function called with the downloaded bytes and
+            the size of the package, as the package is downloaded
+
+                default: None
+
         Returns:
             str     -   path on local machine where the file has been downloaded
 
@@ -1128,6 +1165,8 @@ class DownloadCenter:
 
                 if response was not success
 
+                if checksum of the downloaded package does not match
+
         """
 
         # get the id of the package, if it is a valid package
@@ -1275,25 +1314,18 @@ class DownloadCenter:
             # full path of the file on local machine to be downloaded
             download_path = os.path.join(download_location, file_name)
 
-            # execute request to get the stream of content
+            # download the stream of content
             # using request id returned in the previous response
-            flag1, response1 = self._cvpysdk_object.make_request(
-                "POST",
+            downloader = FileDownloader(
+                self._commcell_object,
                 self._services["DOWNLOAD_VIA_STREAM"],
                 request_xml.format(package_id, platform_id, download_type, request_id),
-                stream=True,
+                chunk_size=chunk_size,
+                max_streams=max_streams,
+                checksum=checksum,
+                progress_callback=progress_callback,
             )
-
-            # download chunks of 1MB each
-            chunk_size = 1024**2
-
-            if flag1:
-                with open(download_path, "wb") as file_pointer:
-                    for content in response1.iter_content(chunk_size=chunk_size):
-                        file_pointer.write(content)
-            else:
-                response_string = self._update_response_(response1.text)
-                raise SDKException("Response", "101", response_string)
+            downloader.download(download_path, resume=resume)
         else:
             response_string = self._update_response_(response.text)
             raise SDKException("Response", "101", response_string)
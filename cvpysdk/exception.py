@@ -122,6 +122,23 @@ EXCEPTION_DICT = {
         "103": "Time Value should be greater than current time",
         "104": "Time Value entered is not of correct format",
     },
+    "BackupDispatcher": {
+        "101": "Input should be a Subclient, Subclients or Backupset object",
+        "102": "",
+    },
+    "ConfigStore": {
+        "101": "Entity type should be one of client / subclient / plan / storage_policy / schedule",
+        "102": "",
+    },
+    "CommcellInventory": {
+        "101": "Scope should be one of client / agent / instance / backupset / subclient",
+        "102": "",
+    },
+    "FileTransfer": {
+        "101": "Data type of the input(s) is not valid",
+        "102": "",
+        "103": "Checksum of the downloaded file does not match the expected checksum",
+    },
     "Backupset": {
         "101": "Data type of the input(s) is not valid",
         "102": "",
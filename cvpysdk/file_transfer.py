@@ -0,0 +1,954 @@
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""Helper file for the transfer of large files between the machine running the SDK and the commcell.
+
+FileDownloader and FileUploader are the classes defined in this file.
+
+FileDownloader: Class for downloading a file from a stream API with concurrent byte range
+requests, resume of partial downloads, and checksum verification
+
+FileUploader:   Class for uploading a file to a chunked upload API, streaming the chunks from
+disk while the previous chunk is sent
+
+
+FileDownloader:
+===============
+    __init__(commcell_object, url, payload, method, ...)    --  initialise the downloader
+
+    __repr__()                      --  returns the string representation of the downloader
+
+    _parse_content_range()          --  parses the Content-Range header of a response
+
+    _open_stream()                  --  sends the request for the content from an offset
+
+    _load_state()                   --  loads the state of a partial parallel download
+
+    _save_state()                   --  saves the state of a parallel download
+
+    _split_parts()                  --  splits a byte range in parts for the download streams
+
+    _update_progress()              --  adds the written bytes to the progress of the download
+
+    _download_part()                --  downloads a part of the file, retrying on failures
+
+    _download_parts()               --  downloads the parts of the file concurrently
+
+    _download()                     --  downloads the file to the partial file
+
+    _is_complete()                  --  checks if a partial file of the full size is complete
+
+    _verify_checksum()              --  verifies the checksum of the downloaded file
+
+    download(download_path, resume) --  downloads the file to the given path
+
+FileDownloader Attributes
+-------------------------
+
+    **downloaded_bytes**            --  returns the number of bytes downloaded so far
+
+    **total_bytes**                 --  returns the size of the file, if known
+
+
+FileUploader:
+=============
+    __init__(send_chunk, chunk_size, header_size, ...)  --  initialise the uploader
+
+    __repr__()                      --  returns the string representation of the uploader
+
+    _read_chunk()                   --  reads a chunk of the file into a buffer
+
+    _send_chunk()                   --  sends a chunk, retrying on failures
+
+    upload(file_path, offset)       --  uploads the file, and returns the transfer statistics
+
+FileUploader Attributes
+-----------------------
+
+    **sent_bytes**                  --  returns the number of bytes of the file sent so far
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, BinaryIO
+
+import requests
+
+from .exception import SDKException
+
+if TYPE_CHECKING:
+    from .commcell import Commcell
+
+_CONTENT_RANGE = re.compile(r"bytes\s+(?:(\d+)-(\d+)|\*)/(\d+|\*)")
+
+
+class _RangeNotSupported(Exception):
+    """Raised when the server stops serving byte ranges during a resumed download."""
+
+
+class FileDownloader:
+    """
+    Downloader of a file from a stream API of the commcell.
+
+    The content is requested with a `Range` header. If the server answers with the partial
+    content of the file, the remaining bytes are split in parts, downloaded by concurrent
+    streams into a `.part` file, and the progress of the parts is saved to a `.part.json`
+    state file. If the server ignores the `Range` header, the file is downloaded with a
+    single stream. A later download of the same file resumes from the partial file, and
+    each stream is retried from its last written byte on network failures.
+
+    Key Features:
+        - Configurable chunk size of the streams
+        - Concurrent byte range streams, with fallback to a single stream
+        - Resume of the partial downloads
+        - Checksum verification and progress callbacks
+
+    #ai-gen-doc
+    """
+
+    def __init__(
+        self,
+        commcell_object: Commcell,
+        url: str,
+        payload: dict | str | None = None,
+        method: str = "POST",
+        chunk_size: int = 1024**2,
+        max_streams: int = 4,
+        min_part_size: int = 16 * 1024**2,
+        checksum: str | None = None,
+        checksum_algorithm: str = "sha256",
+        progress_callback: Callable[[int, int | None], None] | None = None,
+        max_retries: int = 3,
+        retry_delay: float = 1,
+    ) -> None:
+        """Initialize the FileDownloader.
+
+        Args:
+            commcell_object: Instance of the Commcell class.
+            url: URL of the stream API to download the content from.
+            payload: Request body of the stream API. Default is None.
+            method: HTTP method of the stream API. Default is "POST".
+            chunk_size: Number of bytes read from a stream at a time. Default is 1 MB.
+            max_streams: Maximum number of concurrent byte range streams. Default is 4.
+            min_part_size: Minimum number of bytes downloaded by each stream. Default is 16 MB.
+            checksum: Expected hex digest of the file, or None to skip the verification.
+                Default is None.
+            checksum_algorithm: Name of the hashlib algorithm of the checksum.
+                Default is "sha256".
+            progress_callback: Function called with the number of downloaded bytes and the
+                size of the file, or None if not known, as the content is written.
+                Default is None.
+            max_retries: Number of retries of a stream after a network failure. Default is 3.
+            retry_delay: Seconds to wait before the first retry, doubled on each retry.
+                Default is 1.
+
+        Raises:
+            SDKException: If any of the inputs is not valid.
+
+        Example:
+            >>> downloader = FileDownloader(
+            ...     commcell, commcell._services['DOWNLOAD_VIA_STREAM'], request_json,
+            ...     max_streams=8, checksum='9f86d081884c7d65...'
+            ... )
+
+        #ai-gen-doc
+        """
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise SDKException("FileTransfer", "101")
+
+        if not isinstance(max_streams, int) or max_streams < 1:
+            raise SDKException("FileTransfer", "101")
+
+        if not isinstance(min_part_size, int) or min_part_size < 1:
+            raise SDKException("FileTransfer", "101")
+
+        if not isinstance(max_retries, int) or max_retries < 0:
+            raise SDKException("FileTransfer", "101")
+
+        if checksum_algorithm not in hashlib.algorithms_available:
+            raise SDKException(
+                "FileTransfer", "102", f"Checksum algorithm {checksum_algorithm} not supported"
+            )
+
+        self._commcell_object = commcell_object
+        self._cvpysdk_object = commcell_object._cvpysdk_object
+        self._update_response_ = commcell_object._update_response_
+        self.url = url
+        self.payload = payload
+        self.method = method
+        self.chunk_size = chunk_size
+        self.max_streams = max_streams
+        self.min_part_size = min_part_size
+        self.checksum = checksum
+        self.checksum_algorithm = checksum_algorithm
+        self.progress_callback = progress_callback
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+
+        self._lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._session = None
+        self._downloaded = 0
+        self._total_size = None
+
+    def __repr__(self) -> str:
+        """Return the string representation of the FileDownloader instance.
+
+        Returns:
+            A string with the URL and the number of streams of the downloader.
+
+        #ai-gen-doc
+        """
+        return f'FileDownloader class instance for "{self.url}" (max_streams={self.max_streams})'
+
+    @staticmethod
+    def _parse_content_range(
+        response: requests.Response,
+    ) -> tuple[int | None, int | None, int | None] | None:
+        """Parse the Content-Range header of a response.
+
+        Args:
+            response: Response of the stream API.
+
+        Returns:
+            tuple: The first byte, the last byte and the size of the file, or None if the
+            header is missing. The bytes are None for an unsatisfied range, and the size is
+            None if the server did not send it.
+
+        #ai-gen-doc
+        """
+        match = _CONTENT_RANGE.match(response.headers.get("Content-Range", ""))
+        if not match:
+            return None
+
+        return tuple(None if value in (None, "*") else int(value) for value in match.groups())
+
+    def _open_stream(self, start: int | None = None, end: int | None = None) -> requests.Response:
+        """Send the request for the content of the file, from the given offset.
+
+        Args:
+            start: First byte to request, or None to request the whole file without a
+                `Range` header. Default is None.
+            end: Last byte to request, or None to request up to the end of the file.
+                Default is None.
+
+        Returns:
+            requests.Response: The streamed response of the server.
+
+        #ai-gen-doc
+        """
+        headers = self._commcell_object._headers.copy()
+        if start is not None:
+            headers["Range"] = f"bytes={start}-" if end is None else f"bytes={start}-{end}"
+
+        # the stream APIs return 206 for the partial content, so the status is checked
+        # by the caller instead of the flag
+        _, response = self._cvpysdk_object.make_request(
+            self.method,
+            self.url,
+            self.payload,
+            headers=headers,
+            stream=True,
+            session=self._session,
+        )
+        return response
+
+    @staticmethod
+    def _load_state(state_path: str) -> dict | None:
+        """Load the state of a partial parallel download.
+
+        Args:
+            state_path: Path of the state file.
+
+        Returns:
+            dict: The size of the file and the parts of the download, or None if the state
+            file does not exist or is not valid.
+
+        #ai-gen-doc
+        """
+        try:
+            with open(state_path) as state_file:
+                state = json.load(state_file)
+            if isinstance(state.get("size"), int) and isinstance(state.get("parts"), list):
+                return state
+        except (OSError, ValueError, AttributeError):
+            pass
+
+        return None
+
+    def _save_state(self, state_path: str, parts: list[list[int]]) -> None:
+        """Save the state of a parallel download, to resume it later.
+
+        Args:
+            state_path: Path of the state file.
+            parts: The first byte, last byte and number of written bytes of each part.
+
+        #ai-gen-doc
+        """
+        with self._state_lock:
+            with self._lock:
+                state = {"size": self._total_size, "parts": [list(part) for part in parts]}
+
+            with open(f"{state_path}.tmp", "w") as state_file:
+                json.dump(state, state_file)
+            os.replace(f"{state_path}.tmp", state_path)
+
+    def _split_parts(self, start: int, total: int) -> list[list[int]]:
+        """Split the bytes from the given offset to the end of the file in parts.
+
+        Args:
+            start: First byte to download.
+            total: Size of the file.
+
+        Returns:
+            list: The first byte, last byte and number of written bytes of each part.
+
+        #ai-gen-doc
+        """
+        remaining = total - start
+        if remaining <= 0:
+            return []
+
+        count = max(1, min(self.max_streams, remaining // self.min_part_size))
+        part_size = -(-remaining // count)
+
+        return [
+            [offset, min(offset + part_size, total) - 1, 0]
+            for offset in range(start, total, part_size)
+        ]
+
+    def _update_progress(self, size: int) -> None:
+        """Add the bytes written to the file to the progress of the download.
+
+        Args:
+            size: Number of bytes written, negative when a download restarts.
+
+        #ai-gen-doc
+        """
+        with self._lock:
+            self._downloaded += size
+            downloaded, total = self._downloaded, self._total_size
+
+        if self.progress_callback is not None and size > 0:
+            self.progress_callback(downloaded, total)
+
+    def _download_part(
+        self,
+        part_path: str,
+        part: list,
+        parts: list[list[int]] | None = None,
+        state_path: str | None = None,
+        response: requests.Response | None = None,
+    ) -> None:
+        """Download a part of the file, retrying from its last written byte on failures.
+
+        The part is downloaded with a byte range request, unless its last byte is not known,
+        in which case the whole file is downloaded, and restarted from the first byte on
+        failures. The written bytes are only counted in the part once they are flushed to
+        the file, so the saved state never covers bytes lost in a crash.
+
+        Args:
+            part_path: Path of the partial file.
+            part: The first byte, last byte and number of written bytes of the part. The
+                last byte is None for a download without byte ranges.
+            parts: All the parts of the download, saved to the state file. Default is None.
+            state_path: Path of the state file, or None for a download without state.
+                Default is None.
+            response: Response already opened for the part. Default is None.
+
+        Raises:
+            SDKException: If the part can not be downloaded after the retries.
+
+        #ai-gen-doc
+        """
+        start, end = part[0], part[1]
+        ranged = end is not None
+        attempt = 0
+
+        while not ranged or start + part[2] <= end:
+            position = start + part[2]
+            pending = 0
+
+            try:
+                if response is None:
+                    if ranged:
+                        response = self._open_stream(position, end)
+                        content_range = self._parse_content_range(response)
+                        if response.status_code == 200 or (
+                            response.status_code == 206
+                            and (content_range is None or content_range[0] != position)
+                        ):
+                            raise _RangeNotSupported()
+                    else:
+                        response = self._open_stream()
+
+                    if response.status_code != (206 if ranged else 200):
+                        raise SDKException(
+                            "Response", "101", self._update_response_(response.text)
+                        )
+
+                with open(part_path, "r+b" if ranged else "wb") as file_pointer:
+                    file_pointer.seek(position)
+                    for content in response.iter_content(chunk_size=self.chunk_size):
+                        if ranged:
+                            content = content[: end + 1 - position]
+                        if not content:
+                            break
+
+                        file_pointer.write(content)
+                        position += len(content)
+                        pending += len(content)
+                        self._update_progress(len(content))
+
+                        if state_path is not None and pending >= 64 * self.chunk_size:
+                            file_pointer.flush()
+                            with self._lock:
+                                part[2] += pending
+                            pending = 0
+                            self._save_state(state_path, parts)
+
+                        if ranged and position > end:
+                            break
+
+                if not ranged or position > end:
+                    with self._lock:
+                        part[2] += pending
+                    return
+
+                raise requests.exceptions.ChunkedEncodingError(
+                    f"Stream ended at byte {position} of the part ending at byte {end}"
+                )
+            except (requests.exceptions.RequestException, SDKException) as excp:
+                with self._lock:
+                    part[2] += pending
+
+                attempt += 1
+                if attempt > self.max_retries:
+                    if isinstance(excp, SDKException):
+                        raise
+                    raise SDKException("Response", "101", str(excp)) from excp
+
+                if not ranged:
+                    # the download without byte ranges restarts from the first byte
+                    self._update_progress(-part[2])
+                    part[2] = 0
+
+                time.sleep(self.retry_delay * 2 ** (attempt - 1))
+            finally:
+                if response is not None:
+                    response.close()
+                    response = None
+
+    def _download_parts(
+        self,
+        part_path: str,
+        state_path: str,
+        parts: list[list[int]],
+        response: requests.Response | None = None,
+    ) -> None:
+        """Download the incomplete parts of the file concurrently.
+
+        Args:
+            part_path: Path of the partial file.
+            state_path: Path of the state file.
+            parts: The first byte, last byte and number of written bytes of each part.
+            response: Response already opened for the first incomplete part. Default is None.
+
+        Raises:
+            SDKException: If a part can not be downloaded.
+
+        #ai-gen-doc
+        """
+        incomplete = [part for part in parts if part[0] + part[2] <= part[1]]
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(self.max_streams, len(incomplete))) as pool:
+                futures = [
+                    pool.submit(
+                        self._download_part,
+                        part_path,
+                        part,
+                        parts,
+                        state_path,
+                        response if index == 0 else None,
+                    )
+                    for index, part in enumerate(incomplete)
+                ]
+                for future in futures:
+                    future.result()
+        finally:
+            self._save_state(state_path, parts)
+
+    def _download(self, part_path: str, state_path: str, resume: bool) -> None:
+        """Download the file to the partial file.
+
+        Args:
+            part_path: Path of the partial file.
+            state_path: Path of the state file.
+            resume: Whether to resume from the existing partial file.
+
+        Raises:
+            SDKException: If the file can not be downloaded.
+
+        #ai-gen-doc
+        """
+        has_partial_file = resume and os.path.isfile(part_path)
+        state = self._load_state(state_path) if has_partial_file else None
+
+        parts = state["parts"] if state else None
+        offset = 0
+        if parts is not None:
+            self._total_size = state["size"]
+            self._downloaded = sum(part[2] for part in parts)
+            incomplete = [part[0] + part[2] for part in parts if part[0] + part[2] <= part[1]]
+            if not incomplete:
+                return
+            position = min(incomplete)
+        else:
+            if has_partial_file:
+                offset = os.path.getsize(part_path)
+            position = offset
+
+        response = self._open_stream(position)
+        content_range = self._parse_content_range(response)
+        status_code = response.status_code
+        total = content_range[2] if content_range else None
+
+        if (
+            status_code == 206
+            and content_range is not None
+            and content_range[0] == position
+            and total is not None
+            and (parts is None or state["size"] == total)
+        ):
+            self._total_size = total
+            if parts is None:
+                parts = self._split_parts(offset, total)
+                if offset:
+                    parts.insert(0, [0, offset - 1, offset])
+
+                # the state is saved before the partial file is extended to its full size, so
+                # a pre-allocated partial file is never resumed as a contiguous download
+                self._save_state(state_path, parts)
+                with open(part_path, "ab") as file_pointer:
+                    file_pointer.truncate(total)
+
+            self._downloaded = sum(part[2] for part in parts)
+            try:
+                self._download_parts(part_path, state_path, parts, response)
+            except _RangeNotSupported:
+                if not resume:
+                    raise SDKException(
+                        "FileTransfer", "102", "Server stopped serving the byte ranges"
+                    )
+                self._download(part_path, state_path, False)
+            return
+
+        if status_code != 200:
+            response.close()
+
+            if resume and status_code in (206, 416):
+                if (
+                    status_code == 416
+                    and parts is None
+                    and offset
+                    and total == offset
+                    and self._is_complete(part_path)
+                ):
+                    self._total_size = self._downloaded = total
+                    return
+
+                # the size of the file changed, or the partial file is not valid
+                self._download(part_path, state_path, False)
+                return
+
+            response = self._open_stream()
+
+        if response.status_code != 200:
+            response_string = self._update_response_(response.text)
+            response.close()
+            raise SDKException("Response", "101", response_string)
+
+        # the server does not support byte ranges, download the file with a single stream
+        if os.path.isfile(state_path):
+            os.remove(state_path)
+
+        content_length = response.headers.get("Content-Length")
+        self._total_size = int(content_length) if content_length else None
+        self._downloaded = 0
+        self._download_part(part_path, [0, None, 0], response=response)
+
+    def _is_complete(self, part_path: str) -> bool:
+        """Check whether a partial file of the full size, without a state file, is complete.
+
+        Such a file may also have been pre-allocated by a parallel download whose state file
+        was lost, so it is only trusted if its checksum matches the expected checksum.
+
+        Args:
+            part_path: Path of the partial file.
+
+        Returns:
+            bool: True if the checksum of the file matches, False if it does not, or if no
+            checksum is given.
+
+        #ai-gen-doc
+        """
+        if not self.checksum:
+            return False
+
+        try:
+            self._verify_checksum(part_path)
+        except SDKException:
+            return False
+
+        return True
+
+    def _verify_checksum(self, part_path: str) -> None:
+        """Verify the checksum of the downloaded file.
+
+        Args:
+            part_path: Path of the downloaded file.
+
+        Raises:
+            SDKException: If the checksum of the file does not match the expected checksum.
+
+        #ai-gen-doc
+        """
+        digest = hashlib.new(self.checksum_algorithm)
+        with open(part_path, "rb") as file_pointer:
+            for content in iter(lambda: file_pointer.read(self.chunk_size), b""):
+                digest.update(content)
+
+        if digest.hexdigest().lower() != self.checksum.lower():
+            raise SDKException("FileTransfer", "103")
+
+    def download(self, download_path: str, resume: bool = True) -> str:
+        """Download the file to the given path.
+
+        The content is written to `<download_path>.part`, and the file is moved to the given
+        path once it is complete and its checksum is verified.
+
+        Args:
+            download_path: Path on the local machine to download the file to.
+            resume: Whether to resume from an existing partial download of the file.
+                Default is True.
+
+        Returns:
+            str: Path of the downloaded file.
+
+        Raises:
+            SDKException: If the file can not be downloaded, or its checksum does not match.
+
+        Example:
+            >>> downloader.download('/tmp/packages/Package.tar', resume=True)
+            '/tmp/packages/Package.tar'
+
+        #ai-gen-doc
+        """
+        part_path = f"{download_path}.part"
+        state_path = f"{part_path}.json"
+
+        if not resume:
+            for path in (part_path, state_path):
+                if os.path.isfile(path):
+                    os.remove(path)
+
+        self._session = requests.Session()
+        try:
+            self._download(part_path, state_path, resume)
+        finally:
+            self._session.close()
+            self._session = None
+
+        if not os.path.isfile(part_path):
+            # empty file with no content streamed
+            open(part_path, "wb").close()
+
+        if self.checksum:
+            try:
+                self._verify_checksum(part_path)
+            except SDKException:
+                os.remove(part_path)
+                if os.path.isfile(state_path):
+                    os.remove(state_path)
+                raise
+
+        os.replace(part_path, download_path)
+        if os.path.isfile(state_path):
+            os.remove(state_path)
+
+        return download_path
+
+    @property
+    def downloaded_bytes(self) -> int:
+        """Get the number of bytes downloaded so far.
+
+        Returns:
+            The number of bytes written to the file, including the resumed bytes.
+
+        #ai-gen-doc
+        """
+        return self._downloaded
+
+    @property
+    def total_bytes(self) -> int | None:
+        """Get the size of the file being downloaded.
+
+        Returns:
+            The size of the file, or None if the server did not send it.
+
+        #ai-gen-doc
+        """
+        return self._total_size
+
+
+class FileUploader:
+    """
+    Uploader of a file to a chunked upload API of the commcell.
+
+    The file is read from disk in chunks, into two buffers that are reused for the whole
+    upload, so the next chunk is read while the current chunk is sent, and the chunks are
+    passed to the API as memory views of the buffers, without copying them. The upload
+    protocol is implemented by the `send_chunk` function, which is called for each chunk, in
+    order, with the chunk, its offset in the file, and whether it is the last chunk. A chunk
+    that fails to send is retried, so the upload resumes from the failed chunk instead of
+    restarting from the first byte.
+
+    Key Features:
+        - Streaming of the chunks from disk, with read-ahead of the next chunk
+        - Reused buffers, with an optional header area for the request of each chunk
+        - Retries of the failed chunks, and start from an offset of the file
+        - Progress callbacks with the throughput of the upload
+
+    #ai-gen-doc
+    """
+
+    def __init__(
+        self,
+        send_chunk: Callable[[memoryview, int, bool], None],
+        chunk_size: int = 2 * 1024**2,
+        header_size: int = 0,
+        progress_callback: Callable[[int, int, float], None] | None = None,
+        max_retries: int = 3,
+        retry_delay: float = 1,
+    ) -> None:
+        """Initialize the FileUploader.
+
+        Args:
+            send_chunk: Function sending a chunk to the upload API, called with the chunk, the
+                offset of the chunk in the file, and whether it is the last chunk. The chunk
+                starts with `header_size` bytes for the function to fill with the header of
+                the request. The function raises an exception if the chunk is not uploaded.
+            chunk_size: Number of bytes of the file sent in each chunk. Default is 2 MB.
+            header_size: Number of bytes reserved before the data of each chunk, for the
+                header of the request. Default is 0.
+            progress_callback: Function called after each chunk with the number of bytes
+                sent, the size of the file, and the throughput in bytes per second.
+                Default is None.
+            max_retries: Number of retries of a chunk after a failure. Default is 3.
+            retry_delay: Seconds to wait before the first retry, doubled on each retry.
+                Default is 1.
+
+        Raises:
+            SDKException: If any of the inputs is not valid.
+
+        Example:
+            >>> uploader = FileUploader(send_chunk, chunk_size=8 * 1024**2)
+
+        #ai-gen-doc
+        """
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise SDKException("FileTransfer", "101")
+
+        if not isinstance(header_size, int) or header_size < 0:
+            raise SDKException("FileTransfer", "101")
+
+        if not isinstance(max_retries, int) or max_retries < 0:
+            raise SDKException("FileTransfer", "101")
+
+        self._send = send_chunk
+        self.chunk_size = chunk_size
+        self.header_size = header_size
+        self.progress_callback = progress_callback
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._sent = 0
+
+    def __repr__(self) -> str:
+        """Return the string representation of the FileUploader instance.
+
+        Returns:
+            A string with the chunk size of the uploader.
+
+        #ai-gen-doc
+        """
+        return f"FileUploader class instance (chunk_size={self.chunk_size})"
+
+    def _read_chunk(
+        self, file_pointer: BinaryIO, buffer: bytearray, offset: int, size: int
+    ) -> memoryview:
+        """Read a chunk of the file into a buffer, after its header area.
+
+        Args:
+            file_pointer: File opened in binary mode.
+            buffer: Buffer to read the chunk into.
+            offset: Offset of the chunk in the file.
+            size: Number of bytes to read.
+
+        Returns:
+            memoryview: The view of the header area and the bytes read.
+
+        #ai-gen-doc
+        """
+        view = memoryview(buffer)
+        file_pointer.seek(offset)
+
+        read = 0
+        while read < size:
+            count = file_pointer.readinto(view[self.header_size + read : self.header_size + size])
+            if not count:
+                break
+            read += count
+
+        return view[: self.header_size + read]
+
+    def _send_chunk(self, chunk: memoryview, offset: int, is_last: bool) -> None:
+        """Send a chunk with the send function, retrying on failures.
+
+        Args:
+            chunk: The header area and the data of the chunk.
+            offset: Offset of the chunk in the file.
+            is_last: Whether it is the last chunk of the file.
+
+        Raises:
+            SDKException: If the chunk can not be sent after the retries.
+
+        #ai-gen-doc
+        """
+        attempt = 0
+        while True:
+            try:
+                self._send(chunk, offset, is_last)
+                return
+            except (requests.exceptions.RequestException, SDKException) as excp:
+                attempt += 1
+                if attempt > self.max_retries:
+                    if isinstance(excp, SDKException):
+                        raise
+                    raise SDKException(
+                        "FileTransfer", "102", f"Failed to upload the chunk at byte {offset}"
+                    ) from excp
+
+                time.sleep(self.retry_delay * 2 ** (attempt - 1))
+
+    def upload(self, file_path: str, offset: int = 0) -> dict:
+        """Upload the file, from the given offset.
+
+        Args:
+            file_path: Path of the file on the local machine.
+            offset: Offset of the file to start the upload from, to resume an upload which
+                already sent the previous bytes. Default is 0.
+
+        Returns:
+            dict: The transfer statistics of the upload, with the keys
+
+                - ``bytes``: number of bytes sent
+                - ``chunks``: number of chunks sent
+                - ``seconds``: duration of the upload
+                - ``throughput``: bytes sent per second
+
+        Raises:
+            SDKException: If the offset is not valid, or a chunk can not be uploaded.
+
+        Example:
+            >>> uploader.upload('/tmp/training_data.zip')
+            {'bytes': 52428800, 'chunks': 25, 'seconds': 4.2, 'throughput': 12483047.6}
+
+        #ai-gen-doc
+        """
+        file_size = os.path.getsize(file_path)
+        if not isinstance(offset, int) or not 0 <= offset <= file_size:
+            raise SDKException("FileTransfer", "101")
+
+        buffers = [bytearray(self.header_size + self.chunk_size) for _ in range(2)]
+        start_time = time.monotonic()
+        self._sent = 0
+        chunks = 0
+
+        with open(file_path, "rb") as file_pointer, ThreadPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(
+                self._read_chunk,
+                file_pointer,
+                buffers[0],
+                offset,
+                min(self.chunk_size, file_size - offset),
+            )
+
+            while future is not None:
+                chunk = future.result()
+                size = len(chunk) - self.header_size
+                is_last = offset + size >= file_size or not size
+
+                # read the next chunk into the other buffer, while this chunk is sent
+                future = None
+                if not is_last:
+                    future = pool.submit(
+                        self._read_chunk,
+                        file_pointer,
+                        buffers[(chunks + 1) % 2],
+                        offset + size,
+                        min(self.chunk_size, file_size - offset - size),
+                    )
+
+                self._send_chunk(chunk, offset, is_last)
+
+                offset += size
+                chunks += 1
+                self._sent += size
+
+                if self.progress_callback is not None:
+                    elapsed = time.monotonic() - start_time
+                    self.progress_callback(
+                        offset, file_size, self._sent / elapsed if elapsed else 0.0
+                    )
+
+        elapsed = time.monotonic() - start_time
+        return {
+            "bytes": self._sent,
+            "chunks": chunks,
+            "seconds": elapsed,
+            "throughput": self._sent / elapsed if elapsed else 0.0,
+        }
+
+    @property
+    def sent_bytes(self) -> int:
+        """Get the number of bytes of the file sent so far.
+
+        Returns:
+            The number of bytes of the file sent by the current or last upload.
+
+        #ai-gen-doc
+        """
+        return self._sent
@@ -89,6 +89,7 @@ from typing import TYPE_CHECKING, List, Optional, Union
 
 from .datacube.constants import IndexServerConstants
 from .exception import SDKException
+from .properties_view import to_plain
 
 if TYPE_CHECKING:
     import requests
@@ -504,9 +505,11 @@ class HACCluster:
             raise SDKException("HACClusters", "102")
         self.cluster_client_obj = self.commcell.clients.get(self._cluster_name)
         self._cluster_id = self.cluster_client_obj.client_id
-        self._cluster_properties = self.cluster_client_obj.properties["pseudoClientInfo"][
-            "distributedClusterInstanceProperties"
-        ]["clusterConfig"]["cloudInfo"]
+        self._cluster_properties = to_plain(
+            self.cluster_client_obj.properties["pseudoClientInfo"][
+                "distributedClusterInstanceProperties"
+            ]["clusterConfig"]["cloudInfo"]
+        )
         self.cluster_nodes = self._cluster_properties["cloudNodes"]
 
     def modify_node(
@@ -92,6 +92,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from .datacube.constants import IndexServerConstants
 from .exception import SDKException
+from .properties_view import to_plain
 
 if TYPE_CHECKING:
     from .commcell import Commcell
@@ -564,9 +565,11 @@ class IndexPool:
             raise SDKException("IndexPools", "102")
         self.pool_client = self.commcell.clients.get(self.pool_name)
         self._pool_id = self.pool_client.client_id
-        self.pool_properties = self.pool_client.properties["pseudoClientInfo"][
-            "distributedClusterInstanceProperties"
-        ]["clusterConfig"]["cloudInfo"]
+        self.pool_properties = to_plain(
+            self.pool_client.properties["pseudoClientInfo"][
+                "distributedClusterInstanceProperties"
+            ]["clusterConfig"]["cloudInfo"]
+        )
         self.pool_nodes = self.pool_properties["cloudNodes"]
 
     def node_info(self, node_name: str) -> dict:
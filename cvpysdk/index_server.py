@@ -16,12 +16,15 @@
 
 """File for performing index server related operations on the commcell
 
-IndexServers, IndexServer and _Roles are 3 classes defined in this file
+IndexServers, IndexServer, SolrQueryRouter and _Roles are 4 classes defined in this file
 
 IndexServers:   Class for representing all the index servers associated with the commcell
 
 IndexServer:    Class for a instance of a single index server of the commcell
 
+SolrQueryRouter:    Class for spreading the solr queries of an index server across its
+healthy nodes
+
 _Roles:         Class for storing all the cloud role details
 
 "IndexServerOSType" is the enum class used to represent os type of IS
@@ -106,6 +109,14 @@ IndexServer
 
     execute_solr_query()                --  Creates solr url based on input and executes it on solr on given core
 
+    _execute_solr_query_on_client()     --  executes a solr url on the index server node itself, for the
+                                            queries forbidden from the SDK machine
+
+    _get_unique_key()                   --  returns the unique key field of the schema of a core
+
+    iter_solr_query()                   --  streams the documents matching a solr query, using cursor
+                                            based deep paging
+
     get_index_node()                    --  returns an Index server node object for given node name
 
     get_os_info()                       --  returns the OS type for the Index server
@@ -158,6 +169,34 @@ IndexServer Attributes
 
     **fs_collection**                   --  Returns the multinode collection name of File System Index
 
+    **query_router**                    --  returns the SolrQueryRouter spreading the solr queries
+                                            across the nodes of the index server
+
+
+SolrQueryRouter
+===============
+
+    __init__()                          --  initializes the router for the given index server
+
+    __repr__()                          --  returns the string to represent the instance
+
+    _get_session()                      --  returns the pooled HTTP session of a node
+
+    _check_health()                     --  checks the health of a node, and caches the result
+
+    _is_healthy()                       --  returns the cached health of a node
+
+    _record_latency()                   --  updates the moving average query latency of a node
+
+    _get_nodes()                        --  returns the nodes to try a query on, in order
+
+    healthy_nodes()                     --  returns the nodes currently considered healthy
+
+    refresh_health()                    --  checks the health of all the nodes again
+
+    execute_solr_query()                --  executes a solr query on the next healthy node
+
+    close()                             --  closes the pooled sessions of the nodes
 
 IndexNode
 =========
@@ -210,15 +249,23 @@ _Roles Attributes
 import enum
 import http.client as httplib
 import json
+import threading
+import time
+from collections.abc import Iterator
 from copy import deepcopy
+from itertools import cycle
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from urllib.parse import quote
+
+import requests
+from requests.exceptions import RequestException
 
 from .datacube.constants import IndexServerConstants
 from .exception import SDKException
+from .properties_view import to_plain
 
 if TYPE_CHECKING:
-    import requests
-
+    from cvpysdk.client import Client
     from cvpysdk.commcell import Commcell
 
 
@@ -803,6 +850,7 @@ class IndexServer:
             self._cloud_id = self._get_cloud_id()
         self._properties = None
         self._roles_obj = None
+        self._query_router = None
         self.plan_info = None
         self.os_type = None
         self.refresh()
@@ -1348,35 +1396,182 @@ class IndexServer:
         if flag and response.json():
             return response.json()
         elif response.status_code == httplib.FORBIDDEN:
-            cmd = f'(Invoke-WebRequest -UseBasicParsing -uri "{solr_url}").content'
             client_obj = None
             if solr_client:
                 client_obj = self._commcell_obj.clients.get(solr_client)
             else:
                 # if no client is passed, then take first client in index server cloud
                 client_obj = self._commcell_obj.clients.get(self.client_name[0])
-            exit_code, output, error_message = client_obj.execute_script(
-                script_type="PowerShell", script=cmd
+            return self._execute_solr_query_on_client(solr_url, client_obj)
+        raise SDKException("IndexServers", "104", "Something went wrong while querying solr")
+
+    @staticmethod
+    def _execute_solr_query_on_client(solr_url: str, client_obj: "Client") -> dict:
+        """Execute the Solr query URL on the index server node, through a PowerShell script.
+
+        Used when the Solr requests from the SDK machine are forbidden by the index server.
+
+        Args:
+            solr_url: The complete Solr query URL.
+            client_obj: The Client object of the index server node to run the query on.
+
+        Returns:
+            dict: The content of the Solr response as a dictionary.
+
+        Raises:
+            SDKException: If the script fails, or its output is not a valid Solr response.
+
+        #ai-gen-doc
+        """
+        cmd = f'(Invoke-WebRequest -UseBasicParsing -uri "{solr_url}").content'
+        exit_code, output, error_message = client_obj.execute_script(
+            script_type="PowerShell", script=cmd
+        )
+        if exit_code != 0:
+            raise SDKException(
+                "IndexServers",
+                "104",
+                f"Something went wrong while querying solr - {exit_code}",
             )
-            if exit_code != 0:
-                raise SDKException(
-                    "IndexServers",
-                    "104",
-                    f"Something went wrong while querying solr - {exit_code}",
-                )
-            elif error_message:
-                raise SDKException(
-                    "IndexServers",
-                    "104",
-                    f"Something went wrong while querying solr - {error_message}",
-                )
-            try:
-                return json.loads(output.strip())
-            except Exception:
-                raise SDKException(
-                    "IndexServers", "104", f"Something went wrong while querying solr - {output}"
+        elif error_message:
+            raise SDKException(
+                "IndexServers",
+                "104",
+                f"Something went wrong while querying solr - {error_message}",
+            )
+        try:
+            return json.loads(output.strip())
+        except Exception:
+            raise SDKException(
+                "IndexServers", "104", f"Something went wrong while querying solr - {output}"
+            )
+
+    def _get_unique_key(self, core_name: str, solr_client: Optional[str] = None) -> str:
+        """Get the unique key field of the schema of the given core.
+
+        Args:
+            core_name: The name of the Solr core or collection.
+            solr_client: Optional; the Index Server client name to send the request to. If not
+                provided, the first node of the index server is used.
+
+        Returns:
+            The name of the unique key field of the core.
+
+        Raises:
+            SDKException: If the unique key of the core could not be fetched.
+
+        #ai-gen-doc
+        """
+        server_url = self.server_url[0]
+        if solr_client is not None:
+            server_url = self.server_url[self.client_name.index(solr_client)]
+
+        flag, response = self._cvpysdk_object.make_request(
+            "GET", f"{server_url}/solr/{core_name}/schema/uniquekey?wt=json"
+        )
+        if flag and response.json() and "uniqueKey" in response.json():
+            return response.json()["uniqueKey"]
+        raise SDKException(
+            "IndexServers", "104", f"Failed to get the unique key of the core {core_name}"
+        )
+
+    def iter_solr_query(
+        self,
+        core_name: str,
+        select_dict: Optional[dict] = None,
+        attr_list: Optional[set] = None,
+        op_params: Optional[dict] = None,
+        batch_rows: int = 1000,
+        solr_client: Optional[str] = None,
+        spread_nodes: bool = False,
+        unique_key: Optional[str] = None,
+    ) -> Iterator[dict]:
+        """Stream the documents matching a Solr query, using cursor based deep paging.
+
+        The documents are fetched `batch_rows` at a time with the Solr `cursorMark` parameter,
+        so the cost of each page does not grow with the offset as it does with `start`. The
+        sort on the unique key field of the core, which the cursor requires, is added to the
+        sort in `op_params`, or used as the sort if none is given.
+
+        Args:
+            core_name: The name of the Solr core or collection to query.
+            select_dict: Optional; a dictionary of the search criteria, in the formats
+                supported by `execute_solr_query()`.
+            attr_list: Optional; a set of column names to be returned in the results.
+            op_params: Optional; a dictionary of additional Solr query parameters. The `start`,
+                `rows` and `cursorMark` parameters are set by this method.
+            batch_rows: Number of documents fetched with each request. Default is 1000.
+            solr_client: Optional; the Index Server client name to execute the queries on. If
+                not provided, the first node of the index server is used.
+            spread_nodes: Whether to send the requests of the pages to the nodes of the index
+                server in turn. Default is False.
+            unique_key: Optional; the unique key field of the core. If not provided, it is
+                read from the schema of the core.
+
+        Returns:
+            Iterator[dict]: A generator yielding the documents of the result set.
+
+        Raises:
+            SDKException: If batch_rows is not a positive integer, the client name is not a
+                node of the index server, or a query fails.
+
+        Example:
+            >>> documents = index_server.iter_solr_query(
+            ...     core_name='UserMbx_core',
+            ...     select_dict={'datatype': 2},
+            ...     attr_list={'contentid', 'folder'},
+            ...     batch_rows=5000,
+            ...     spread_nodes=True
+            ... )
+            >>> for document in documents:
+            ...     print(document['folder'])
+
+        #ai-gen-doc
+        """
+        if not isinstance(batch_rows, int) or batch_rows < 1:
+            raise SDKException("IndexServers", "101")
+
+        if solr_client is not None and solr_client not in self.client_name:
+            raise SDKException("IndexServers", "104", "client name not found in this index server")
+
+        if spread_nodes:
+            nodes = cycle(self.client_name)
+        else:
+            nodes = cycle([solr_client])
+
+        if unique_key is None:
+            unique_key = self._get_unique_key(core_name, solr_client)
+
+        op_params = {
+            key: value
+            for key, value in (op_params or {}).items()
+            if key not in ("start", "rows", "cursorMark")
+        }
+        sort = op_params.get("sort", "")
+        sort_fields = [field.split()[0] for field in sort.split(",") if field.strip()]
+        if unique_key not in sort_fields:
+            sort = f"{sort},{unique_key} asc" if sort else f"{unique_key} asc"
+        op_params["sort"] = quote(sort)
+        op_params["rows"] = batch_rows
+
+        def iter_documents():
+            cursor_mark = "*"
+            while True:
+                response = self.execute_solr_query(
+                    core_name,
+                    solr_client=next(nodes),
+                    select_dict=select_dict,
+                    attr_list=attr_list,
+                    op_params={**op_params, "cursorMark": quote(cursor_mark, safe="")},
                 )
-        raise SDKException("IndexServers", "104", "Something went wrong while querying solr")
+                yield from response.get("response", {}).get("docs", [])
+
+                next_cursor_mark = response.get("nextCursorMark")
+                if next_cursor_mark is None or next_cursor_mark == cursor_mark:
+                    return
+                cursor_mark = next_cursor_mark
+
+        return iter_documents()
 
     def get_index_node(self, node_name: str) -> "IndexNode":
         """Retrieve the IndexNode object for the specified index server node name.
@@ -1418,7 +1613,7 @@ class IndexServer:
         plan_details = (
             instance_props.get("clusterConfig", {}).get("cloudInfo", {}).get("planInfo", {})
         )
-        return plan_details
+        return to_plain(plan_details)
 
     def get_os_info(self) -> str:
         """Retrieve the operating system type for the Index server.
@@ -1689,6 +1884,327 @@ class IndexServer:
         """
         return f"fsindex_{''.join(letter for letter in self.cloud_name if letter.isalnum())}_multinode"
 
+    @property
+    def query_router(self) -> "SolrQueryRouter":
+        """Get the query router spreading the Solr queries across the nodes of the index server.
+
+        Returns:
+            SolrQueryRouter: The router of the index server, with the round robin strategy.
+
+        Example:
+            >>> response = index_server.query_router.execute_solr_query(
+            ...     'UserMbx_core', select_dict={'keyword': 'invoice'}
+            ... )
+
+        #ai-gen-doc
+        """
+        if self._query_router is None:
+            self._query_router = SolrQueryRouter(self)
+        return self._query_router
+
+
+class SolrQueryRouter:
+    """
+    Routes the read queries of an index server across its healthy nodes.
+
+    The queries are sent to the nodes in turn, or to the node with the lowest moving average
+    latency, skipping the nodes whose health check failed. The health of each node is cached
+    for `health_ttl` seconds, and each node has its own HTTP session, so its connections are
+    pooled and reused across the queries.
+
+    A node which forbids the Solr requests from the SDK machine is remembered, along with its
+    Client object, and its later queries are run through the node directly, without first
+    trying the HTTP request again.
+
+    Key Features:
+        - Round robin or least latency selection of the nodes
+        - Cached node health from the health summary of the nodes
+        - Failover to the next node on connection and server errors
+        - Pooled connections per node
+
+    #ai-gen-doc
+    """
+
+    STRATEGIES = ("round_robin", "least_latency")
+
+    def __init__(
+        self,
+        index_server: IndexServer,
+        strategy: str = "round_robin",
+        health_ttl: float = 60,
+        latency_weight: float = 0.3,
+    ) -> None:
+        """Initialize the SolrQueryRouter for the given index server.
+
+        Args:
+            index_server: Instance of the IndexServer class.
+            strategy: Strategy to select the node of a query, either round_robin or
+                least_latency. Default is round_robin.
+            health_ttl: Seconds for which the health of a node is cached. Default is 60.
+            latency_weight: Weight of the latest query in the moving average latency of a
+                node. Default is 0.3.
+
+        Raises:
+            SDKException: If the strategy is not supported, or health_ttl is negative.
+
+        Example:
+            >>> router = SolrQueryRouter(index_server, strategy='least_latency')
+
+        #ai-gen-doc
+        """
+        if strategy not in self.STRATEGIES:
+            raise SDKException(
+                "IndexServers", "104", f"Unsupported query routing strategy [{strategy}]"
+            )
+
+        if not isinstance(health_ttl, (int, float)) or health_ttl < 0:
+            raise SDKException("IndexServers", "101")
+
+        self._index_server = index_server
+        self._cvpysdk_object = index_server._cvpysdk_object
+        self.strategy = strategy
+        self.health_ttl = health_ttl
+        self.latency_weight = latency_weight
+
+        self._lock = threading.Lock()
+        self._sessions = {}
+        self._health = {}
+        self._latency = {}
+        self._forbidden_nodes = {}
+        self._next_node = 0
+
+    def __repr__(self) -> str:
+        """Return the string representation of the SolrQueryRouter instance.
+
+        Returns:
+            A string with the index server name and the strategy of the router.
+
+        #ai-gen-doc
+        """
+        return (
+            f'SolrQueryRouter class instance for index server: "{self._index_server.engine_name}"'
+            f" (strategy={self.strategy})"
+        )
+
+    def _get_session(self, node: str) -> requests.Session:
+        """Get the HTTP session of the node, creating it on first use.
+
+        Args:
+            node: Client name of the index server node.
+
+        Returns:
+            requests.Session: The session holding the pooled connections to the node.
+
+        #ai-gen-doc
+        """
+        with self._lock:
+            if node not in self._sessions:
+                self._sessions[node] = requests.Session()
+            return self._sessions[node]
+
+    def _check_health(self, node: str) -> bool:
+        """Check the health of the node from its health summary, and cache the result.
+
+        Args:
+            node: Client name of the index server node.
+
+        Returns:
+            True if the health summary of the node could be fetched, False otherwise.
+
+        #ai-gen-doc
+        """
+        start_time = time.monotonic()
+        try:
+            self._index_server.get_health_indicators(node)
+            healthy = True
+        except (SDKException, RequestException):
+            healthy = False
+
+        with self._lock:
+            self._health[node] = (healthy, time.monotonic())
+            if healthy:
+                self._latency.setdefault(node, time.monotonic() - start_time)
+
+        return healthy
+
+    def _is_healthy(self, node: str) -> bool:
+        """Get the health of the node, checking it again once the cached result expires.
+
+        Args:
+            node: Client name of the index server node.
+
+        Returns:
+            True if the node is considered healthy, False otherwise.
+
+        #ai-gen-doc
+        """
+        healthy, checked_time = self._health.get(node, (None, 0))
+        if healthy is None or time.monotonic() - checked_time > self.health_ttl:
+            return self._check_health(node)
+        return healthy
+
+    def _record_latency(self, node: str, seconds: float | None) -> None:
+        """Update the moving average query latency of the node, or mark it unhealthy.
+
+        Args:
+            node: Client name of the index server node.
+            seconds: Duration of the query on the node, or None if the node failed the query.
+
+        #ai-gen-doc
+        """
+        with self._lock:
+            if seconds is None:
+                self._health[node] = (False, time.monotonic())
+                return
+
+            average = self._latency.get(node)
+            if average is None:
+                self._latency[node] = seconds
+            else:
+                self._latency[node] = average + self.latency_weight * (seconds - average)
+
+    def _get_nodes(self) -> list[str]:
+        """Get the nodes to try a query on, in the order of the strategy of the router.
+
+        The healthy nodes come first, followed by the unhealthy nodes, which are only tried
+        if all the healthy nodes fail the query.
+
+        Returns:
+            list: The client names of the index server nodes.
+
+        #ai-gen-doc
+        """
+        nodes = list(self._index_server.client_name)
+
+        if self.strategy == "round_robin":
+            with self._lock:
+                start = self._next_node % len(nodes)
+                self._next_node += 1
+            nodes = nodes[start:] + nodes[:start]
+        else:
+            nodes.sort(key=lambda node: self._latency.get(node, 0))
+
+        healthy = [node for node in nodes if self._is_healthy(node)]
+        return healthy + [node for node in nodes if node not in healthy]
+
+    def healthy_nodes(self) -> list[str]:
+        """Get the nodes of the index server currently considered healthy.
+
+        Returns:
+            list: The client names of the healthy nodes.
+
+        Example:
+            >>> print(index_server.query_router.healthy_nodes())
+            ['node1', 'node3']
+
+        #ai-gen-doc
+        """
+        return [node for node in self._index_server.client_name if self._is_healthy(node)]
+
+    def refresh_health(self) -> None:
+        """Check the health of all the nodes of the index server again.
+
+        Example:
+            >>> index_server.query_router.refresh_health()
+
+        #ai-gen-doc
+        """
+        for node in self._index_server.client_name:
+            self._check_health(node)
+
+    def execute_solr_query(
+        self,
+        core_name: str,
+        select_dict: Optional[dict] = None,
+        attr_list: Optional[set] = None,
+        op_params: Optional[dict] = None,
+    ) -> dict:
+        """Execute a Solr query on the next healthy node of the index server.
+
+        The query fails over to the next node on a connection error or a server error of a
+        node, which is then marked unhealthy until its health is checked again.
+
+        Args:
+            core_name: The name of the Solr core or collection to query.
+            select_dict: Optional; a dictionary of the search criteria, in the formats
+                supported by `IndexServer.execute_solr_query()`.
+            attr_list: Optional; a set of column names to be returned in the results.
+            op_params: Optional; a dictionary of additional Solr query parameters.
+
+        Returns:
+            dict: The content of the Solr response as a dictionary.
+
+        Raises:
+            SDKException: If the query is rejected by Solr, or fails on all the nodes.
+
+        Example:
+            >>> router = SolrQueryRouter(index_server, strategy='least_latency')
+            >>> response = router.execute_solr_query(
+            ...     'UserMbx_core', select_dict={'datatype': 2}, op_params={'rows': 0}
+            ... )
+            >>> print(response['response']['numFound'])
+
+        #ai-gen-doc
+        """
+        query = self._index_server._create_solr_query(select_dict, attr_list, op_params)
+        server_urls = dict(zip(self._index_server.client_name, self._index_server.server_url))
+        errors = []
+
+        for node in self._get_nodes():
+            solr_url = f"{server_urls[node]}/solr/{core_name}/select?{query}"
+
+            if node in self._forbidden_nodes:
+                return self._index_server._execute_solr_query_on_client(
+                    solr_url, self._forbidden_nodes[node]
+                )
+
+            start_time = time.monotonic()
+            try:
+                flag, response = self._cvpysdk_object.make_request(
+                    "GET", solr_url, session=self._get_session(node)
+                )
+            except RequestException as excp:
+                self._record_latency(node, None)
+                errors.append(f"{node}: {excp}")
+                continue
+
+            if flag and response.json():
+                self._record_latency(node, time.monotonic() - start_time)
+                return response.json()
+
+            if response.status_code == httplib.FORBIDDEN:
+                client_obj = self._index_server._commcell_obj.clients.get(node)
+                with self._lock:
+                    self._forbidden_nodes[node] = client_obj
+                return self._index_server._execute_solr_query_on_client(solr_url, client_obj)
+
+            if response.status_code < 500:
+                raise SDKException(
+                    "IndexServers", "104", f"Solr query failed on [{node}] - {response.text}"
+                )
+
+            self._record_latency(node, None)
+            errors.append(f"{node}: {response.status_code}")
+
+        raise SDKException(
+            "IndexServers", "104", f"Solr query failed on all the index server nodes - {errors}"
+        )
+
+    def close(self) -> None:
+        """Close the pooled HTTP sessions of the nodes.
+
+        Example:
+            >>> index_server.query_router.close()
+
+        #ai-gen-doc
+        """
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+
+        for session in sessions:
+            session.close()
+
 
 class IndexNode:
     """
@@ -1748,9 +2264,11 @@ class IndexNode:
         self.commcell.clients.refresh()
         self.index_node_client = self.commcell.clients.get(self.index_node_name)
         # TODO: Rewrite Index server API logic to access client properties
-        self.index_client_properties = self.index_node_client.properties.get(
-            "pseudoClientInfo", {}
-        ).get("indexServerProperties", {})
+        self.index_client_properties = to_plain(
+            self.index_node_client.properties.get("pseudoClientInfo", {}).get(
+                "indexServerProperties", {}
+            )
+        )
 
     @property
     def node_name(self) -> str:
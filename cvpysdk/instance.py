@@ -136,6 +136,8 @@ Instance:
 
     update_properties()             --  to update the instance properties
 
+    properties_copy()               --  returns a deep copy of the instance properties
+
     instance_id()                   --  id of this instance
 
     instance_name()                 --  name of this instance
@@ -173,6 +175,7 @@ from base64 import b64encode
 from .constants import AppIDAType
 from .exception import SDKException
 from .job import Job
+from .properties_view import PropertiesView, to_plain
 from .schedules import SchedulePattern, Schedules
 from .subclient import Subclients
 
@@ -2830,10 +2833,11 @@ class Instance:
 
                     if response code is not as expected
 
-        **Note** self.properties can be used to get a deep copy of all the properties, modify the properties which you
-        need to change and use the update_properties method to set the properties
+        **Note** self.properties_copy() can be used to get a deep copy of all the properties, modify the
+        properties which you need to change and use the update_properties method to set the properties
 
         """
+        properties_dict = to_plain(properties_dict)
         request_json = {"instanceProperties": {}}
 
         request_json["instanceProperties"].update(properties_dict)
@@ -2863,7 +2867,11 @@ class Instance:
 
     @property
     def properties(self):
-        """Returns the instance properties"""
+        """Returns a read-only view of the instance properties"""
+        return PropertiesView(self._properties)
+
+    def properties_copy(self):
+        """Returns a deep copy of the instance properties, which can be modified"""
         return copy.deepcopy(self._properties)
 
     @property
@@ -33,9 +33,6 @@ SQLServerInstance:
 
     _get_sql_restore_options()      --  returns the dict containing destination sql server names
 
-    _run_backup()                   --  runs full backup for this subclients and appends the
-    job object to the return list
-
     _process_browse_request()       --  processes response received for Browse request
 
     _recoverypoint_request_json()   --  returns a json to be sent to server to create
@@ -101,7 +98,6 @@ SQLServerInstance Attributes:
 
 import datetime
 import re
-import threading
 import time
 from typing import Any, Dict, List, Optional, Union
 
@@ -627,25 +623,6 @@ class SQLServerInstance(Instance):
             raise SDKException("Response", "101", response_string)
         return response.json()
 
-    def _run_backup(self, subclient_name: str, return_list: list) -> None:
-        """Trigger a full backup job for the specified subclient and append the resulting Job object to a list.
-
-        If an exception occurs while running the backup job for the subclient, an instance of the SDKException class
-        is appended to the provided list instead.
-
-        Args:
-            subclient_name: The name of the subclient for which to trigger the backup.
-            return_list: The list to which the resulting Job object or SDKException instance will be appended.
-
-        #ai-gen-doc
-        """
-        try:
-            job = self.subclients.get(subclient_name).backup("Full")
-            if job:
-                return_list.append(job)
-        except SDKException as excp:
-            return_list.append(excp)
-
     def _process_browse_request(
         self, browse_request: dict, get_full_details: bool = False
     ) -> (list, list):
@@ -1130,21 +1107,9 @@ class SQLServerInstance(Instance):
 
         #ai-gen-doc
         """
-        return_list = []
-        thread_list = []
-
-        all_subclients = self.subclients._subclients
-
-        if all_subclients:
-            for subclient in all_subclients:
-                thread = threading.Thread(target=self._run_backup, args=(subclient, return_list))
-                thread_list.append(thread)
-                thread.start()
-
-        for thread in thread_list:
-            thread.join()
-
-        return return_list
+        return self._commcell_object.backup_dispatcher.run(
+            self.subclients, check_enabled=False, backup_level="Full"
+        )
 
     def browse(self, get_full_details: bool = False) -> Union[list, dict]:
         """Retrieve the list of backed up databases for this SQL Server instance.
@@ -20,6 +20,8 @@
 
 JobController:  Class for managing jobs on this commcell
 
+JobRecord:      Compact record of a job from the jobs list response
+
 JobManagement:  Class for performing Job Management operations
 
 Job:            Class for keeping track of a job and perform various operations on it.
@@ -46,6 +48,13 @@ JobController
                                 --  executes a request on the server to suspend/resume/kill all
                                         the jobs on the commserver.
 
+    _perform_job_operation(job_id, operation_type)
+                                --  executes a suspend/resume/kill request for a single job
+
+    modify_jobs(operation_type, job_ids)
+                                --  suspends/resumes/kills the given or the filtered jobs
+                                        concurrently, reporting the outcome per job
+
     get_active_job_summary()    --  Returns a dict with summary of active jobs
 
     all_jobs()                  --  returns all the jobs on this commcell
@@ -62,6 +71,39 @@ JobController
 
     suspend_all_jobs()          -- Suspends all jobs on the commcell
 
+    kill_jobs(job_ids)          -- Kills the given or the filtered jobs
+
+    resume_jobs(job_ids)        -- Resumes the given or the filtered jobs
+
+    suspend_jobs(job_ids)       -- Suspends the given or the filtered jobs
+
+    bulk_fetch(job_ids, parts)  -- Fetches the events, logs and details of many jobs concurrently
+
+    subscribe(job_filter, callback)
+                                -- Subscribes the callback to the job state change events
+
+    unsubscribe(subscription_id)
+                                -- Removes the job state change subscription
+
+    unsubscribe_all()           -- Removes all subscriptions and stops the job state poller
+
+    summarize_jobs(jobs)        -- Returns the per-client, per-agent and per-status aggregates
+                                        of the given jobs
+
+
+JobRecord
+=========
+
+    __init__(job_id, **attributes)  --  initializes the compact record of a job
+
+    __repr__()                      --  returns the string representation of the record
+
+    from_summary(job_summary)       --  creates the record from a raw job summary
+
+    from_dict(job_dict)             --  creates the record from a basic job dictionary
+
+    to_dict()                       --  returns the record as a basic job dictionary
+
 
 JobManagement
 ==============
@@ -288,16 +330,105 @@ ErrorRule
 """
 
 import copy
+import itertools
+import threading
 import time
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Union
 
-from .constants import AdvancedJobDetailType, ApplicationGroup
+from requests.exceptions import RequestException
+
+from .constants import AdvancedJobDetailType, ApplicationGroup, JobStateEvent
 from .exception import SDKException
 
 if TYPE_CHECKING:
     from cvpysdk.commcell import Commcell
 
 
+def _request_job_events(commcell_object: "Commcell", job_id: Union[int, str]) -> List[Dict]:
+    """Get the CommServe events of a job.
+
+    Args:
+        commcell_object: Instance of the Commcell class.
+        job_id: ID of the job.
+
+    Returns:
+        List of the event dictionaries of the job.
+
+    Raises:
+        SDKException: If the response is not success, or has no events.
+
+    #ai-gen-doc
+    """
+    flag, response = commcell_object._cvpysdk_object.make_request(
+        "GET", commcell_object._services["JOB_EVENTS"] % job_id
+    )
+    if flag:
+        response_json = response.json()
+        if response_json and "commservEvents" in response_json:
+            return response_json["commservEvents"]
+        raise SDKException("Job", "104")
+    raise SDKException("Response", "101", commcell_object._update_response_(response.text))
+
+
+def _request_job_logs(commcell_object: "Commcell", job_id: Union[int, str]) -> List[str]:
+    """Get the log lines of a job.
+
+    Args:
+        commcell_object: Instance of the Commcell class.
+        job_id: ID of the job.
+
+    Returns:
+        List of the log lines of the job.
+
+    Raises:
+        SDKException: If the response is not success, or is empty.
+
+    #ai-gen-doc
+    """
+    flag, response = commcell_object._cvpysdk_object.make_request(
+        method="GET", url=commcell_object._services["GET_LOGS"] % job_id
+    )
+    if flag and response.text:
+        return response.text.split("\n")
+    raise SDKException("Response", "102")
+
+
+def _request_advanced_job_details(
+    commcell_object: "Commcell", job_id: Union[int, str], info_type: AdvancedJobDetailType
+) -> Dict[str, Any]:
+    """Get the advanced details of a job for the given detail type.
+
+    Args:
+        commcell_object: Instance of the Commcell class.
+        job_id: ID of the job.
+        info_type: Member of the AdvancedJobDetailType enum.
+
+    Returns:
+        Dictionary with the advanced details of the job.
+
+    Raises:
+        SDKException: If the response is empty or not success.
+
+    #ai-gen-doc
+    """
+    url = commcell_object._services["ADVANCED_JOB_DETAIL_TYPE"] % (job_id, info_type.value)
+    flag, response = commcell_object._cvpysdk_object.make_request("GET", url)
+
+    if not flag:
+        raise SDKException("Response", "101", commcell_object._update_response_(response.text))
+
+    response_json = response.json()
+    if not response_json:
+        raise SDKException("Response", "102")
+
+    if response_json.get("errorCode", 0) != 0:
+        error_message = response_json.get("errorMessage")
+        raise SDKException("Job", "102", f'Failed to fetch details.\nError: "{error_message}"')
+
+    return response_json
+
+
 class JobController:
     """
     Controller class for managing jobs associated with a CommCell.
@@ -342,6 +473,8 @@ class JobController:
         self._services = commcell_object._services
         self._update_response_ = commcell_object._update_response_
 
+        self._job_watcher = None
+
     def __str__(self) -> str:
         """Return a formatted string representation of all active jobs on this Commcell.
 
@@ -512,11 +645,12 @@ class JobController:
         Args:
             **options: Optional keyword arguments to customize the job query.
                 - job_summary (str, optional): If set to 'full', returns the complete job summary for each job.
+                  If set to 'record', returns a compact JobRecord for each job.
                   Otherwise, returns a filtered set of job attributes.
 
         Returns:
-            Dictionary mapping job IDs to job details. Each value is either the full job summary or a
-            filtered dictionary of job attributes, depending on the 'job_summary' option.
+            Dictionary mapping job IDs to job details. Each value is either the full job summary, a
+            JobRecord, or a filtered dictionary of job attributes, depending on the 'job_summary' option.
 
         Raises:
             SDKException: If the server response is empty or unsuccessful.
@@ -537,73 +671,39 @@ class JobController:
         )
 
         jobs_dict = {}
+        job_summary_type = options.get("job_summary", "").lower()
 
         if flag:
             try:
-                if response.json():
-                    if "jobs" in response.json():
-                        all_jobs = response.json()["jobs"]
-
-                        for job in all_jobs:
-                            if "jobSummary" in job and job["jobSummary"]["isVisible"] is True:
-                                job_summary = job["jobSummary"]
-                                job_id = job_summary["jobId"]
-
-                                if options.get("job_summary", "").lower() == "full":
-                                    jobs_dict[job_id] = job_summary
-                                else:
-                                    status = job_summary["status"]
-                                    operation = job_summary.get("localizedOperationName", "")
-                                    percent_complete = job_summary["percentComplete"]
-                                    backup_level = job_summary.get("backupLevelName")
-
-                                    app_type = ""
-                                    job_type = ""
-                                    pending_reason = ""
-                                    subclient_id = ""
-                                    client_id = ""
-                                    client_name = ""
-                                    job_elapsed_time = 0
-                                    job_start_time = 0
-
-                                    if "jobElapsedTime" in job_summary:
-                                        job_elapsed_time = job_summary["jobElapsedTime"]
-
-                                    if "jobStartTime" in job_summary:
-                                        job_start_time = job_summary["jobStartTime"]
-
-                                    if "appTypeName" in job_summary:
-                                        app_type = job_summary["appTypeName"]
-
-                                    if "jobType" in job_summary:
-                                        job_type = job_summary["jobType"]
-
-                                    if "pendingReason" in job_summary:
-                                        pending_reason = job_summary["pendingReason"]
-
-                                    if "subclient" in job_summary:
-                                        job_subclient = job_summary["subclient"]
-                                        if "subclientId" in job_subclient:
-                                            subclient_id = job_subclient["subclientId"]
-                                        if "clientId" in job_subclient:
-                                            client_id = job_subclient["clientId"]
-                                        if "clientName" in job_subclient:
-                                            client_name = job_subclient["clientName"]
-
-                                    jobs_dict[job_id] = {
-                                        "operation": operation,
-                                        "status": status,
-                                        "app_type": app_type,
-                                        "job_type": job_type,
-                                        "percent_complete": percent_complete,
-                                        "pending_reason": pending_reason,
-                                        "client_id": client_id,
-                                        "client_name": client_name,
-                                        "subclient_id": subclient_id,
-                                        "backup_level": backup_level,
-                                        "job_start_time": job_start_time,
-                                        "job_elapsed_time": job_elapsed_time,
-                                    }
+                response_json = response.json()
+                if response_json:
+                    for job in response_json.get("jobs", []):
+                        job_summary = job.get("jobSummary")
+                        if not job_summary or job_summary["isVisible"] is not True:
+                            continue
+
+                        job_id = job_summary["jobId"]
+
+                        if job_summary_type == "full":
+                            jobs_dict[job_id] = job_summary
+                        elif job_summary_type == "record":
+                            jobs_dict[job_id] = JobRecord.from_summary(job_summary)
+                        else:
+                            job_subclient = job_summary.get("subclient", {})
+                            jobs_dict[job_id] = {
+                                "operation": job_summary.get("localizedOperationName", ""),
+                                "status": job_summary["status"],
+                                "app_type": job_summary.get("appTypeName", ""),
+                                "job_type": job_summary.get("jobType", ""),
+                                "percent_complete": job_summary["percentComplete"],
+                                "pending_reason": job_summary.get("pendingReason", ""),
+                                "client_id": job_subclient.get("clientId", ""),
+                                "client_name": job_subclient.get("clientName", ""),
+                                "subclient_id": job_subclient.get("subclientId", ""),
+                                "backup_level": job_summary.get("backupLevelName"),
+                                "job_start_time": job_summary.get("jobStartTime", 0),
+                                "job_elapsed_time": job_summary.get("jobElapsedTime", 0),
+                            }
 
                     return jobs_dict
 
@@ -669,6 +769,124 @@ class JobController:
         else:
             raise SDKException("Response", "102")
 
+    def _perform_job_operation(self, job_id: int, operation_type: str) -> None:
+        """Execute a suspend, resume or kill request for a single job without constructing a Job.
+
+        Args:
+            job_id: ID of the job.
+            operation_type: The operation to perform. Valid options are 'suspend', 'resume' or 'kill'.
+
+        Raises:
+            SDKException: If the request fails or the response contains an error.
+
+        #ai-gen-doc
+        """
+        job_map = {"suspend": "SUSPEND_JOB", "resume": "RESUME_JOB", "kill": "KILL_JOB"}
+
+        flag, response = self._cvpysdk_object.make_request(
+            "POST", self._services[job_map[operation_type]] % job_id
+        )
+
+        if not flag:
+            raise SDKException("Response", "101", self._update_response_(response.text))
+
+        response_json = response.json()
+        if response_json:
+            if "errors" in response_json:
+                error_list = response_json["errors"][0]["errList"][0]
+                error_code = error_list["errorCode"]
+                error_message = error_list["errLogMessage"].strip()
+            else:
+                error_code = response_json.get("errorCode", 0)
+                error_message = response_json.get("errorMessage", "nil")
+
+            if error_code != 0:
+                raise SDKException(
+                    "Job", "102", f'Job {operation_type} failed\nError: "{error_message}"'
+                )
+
+    def modify_jobs(
+        self,
+        operation_type: str,
+        job_ids: Optional[List[Union[int, str]]] = None,
+        max_workers: int = 8,
+        **options: Any,
+    ) -> Dict[str, Any]:
+        """Suspend, resume or kill the given jobs, or the jobs matching a jobs list filter.
+
+        The operation is sent for each job directly, without constructing a Job object, with
+        at most `max_workers` requests in flight. A failure for one job does not stop the
+        operation for the other jobs; the outcome of every job is reported in the result.
+
+        Args:
+            operation_type: The operation to perform. Valid options are 'suspend', 'resume' or 'kill'.
+            job_ids: List of job IDs to perform the operation on. If not given, the jobs are
+                selected with the jobs list filter given in `options`.
+            max_workers: Maximum number of concurrent requests. Default is 8.
+            **options: Jobs list filter used when `job_ids` is not given, accepting the same
+                options as `_get_jobs_request_json`, e.g. category, clients_list, job_type_list,
+                lookup_time, entity. The category defaults to 'ACTIVE' and limit to 10000.
+                At least one filter option other than limit and offset is required, so the
+                operation is never sent to all the jobs of the Commcell by default; use
+                `suspend_all_jobs`, `resume_all_jobs` or `kill_all_jobs` for that.
+
+        Returns:
+            Dictionary with the outcome of the operation:
+                - succeeded (List[int]): IDs of the jobs the operation succeeded for.
+                - failed (Dict[int, str]): Mapping of job ID to the error for the jobs the
+                  operation failed for.
+
+        Raises:
+            SDKException: If the operation type or a job ID is not valid, neither job IDs
+                nor a jobs list filter are given, or the jobs list request fails.
+
+        Example:
+            >>> result = commcell.job_controller.modify_jobs('suspend', job_ids=[101, 102, 103])
+            >>> print(f"Suspended: {result['succeeded']}, failed: {result['failed']}")
+            >>> # Suspend all the active backup jobs of a client
+            >>> commcell.job_controller.modify_jobs(
+            ...     'suspend', clients_list=['client1'], job_type_list=['Backup']
+            ... )
+
+        #ai-gen-doc
+        """
+        if operation_type not in ("suspend", "resume", "kill"):
+            raise SDKException("Job", "102", "Invalid input")
+
+        if job_ids is None:
+            if not set(options) - {"limit", "offset"}:
+                raise SDKException(
+                    "Job", "101", "Job IDs or a jobs list filter are required for the operation"
+                )
+
+            options.setdefault("category", "ACTIVE")
+            options.setdefault("limit", 10000)
+            job_ids = list(self._get_jobs_list(**options))
+
+        try:
+            job_ids = [int(job_id) for job_id in job_ids]
+        except (TypeError, ValueError):
+            raise SDKException("Job", "101")
+
+        result = {"succeeded": [], "failed": {}}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._perform_job_operation, job_id, operation_type): job_id
+                for job_id in job_ids
+            }
+            for future in as_completed(futures):
+                job_id = futures[future]
+                try:
+                    future.result()
+                    result["succeeded"].append(job_id)
+                except SDKException as excp:
+                    result["failed"][job_id] = excp.exception_message
+                except (RequestException, ValueError) as excp:
+                    result["failed"][job_id] = str(excp)
+
+        return result
+
     def all_jobs(
         self,
         client_name: Optional[str] = None,
@@ -692,7 +910,7 @@ class JobController:
                 - hide_admin_jobs (bool): Whether to exclude admin jobs. Default is False.
                 - clients_list (List[str]): List of client names to filter jobs.
                 - job_type_list (List[str]): List of job operation types.
-                - job_summary (str): 'basic' or 'full' summary. Default is 'basic'.
+                - job_summary (str): 'basic', 'full' or 'record' summary. Default is 'basic'.
 
         Returns:
             Dictionary mapping job IDs to their details, matching the specified criteria.
@@ -743,7 +961,7 @@ class JobController:
                 - hide_admin_jobs (bool): Whether to exclude admin jobs. Default is False.
                 - clients_list (List[str]): List of client names to filter jobs.
                 - job_type_list (List[str]): List of job operation types.
-                - job_summary (str): 'basic' or 'full' summary of jobs. Default is 'basic'.
+                - job_summary (str): 'basic', 'full' or 'record' summary of jobs. Default is 'basic'.
                 - entity (Dict[str, Any]): Entity details for associated jobs (e.g., {"dataSourceId": 2575}).
 
         Returns:
@@ -798,7 +1016,7 @@ class JobController:
                 - hide_admin_jobs (bool): Whether to exclude admin jobs (default: False).
                 - clients_list (List[str]): List of client names to filter jobs.
                 - job_type_list (List[str]): List of job operation types.
-                - job_summary (str): 'basic' or 'full' job summary (default: 'basic').
+                - job_summary (str): 'basic', 'full' or 'record' job summary (default: 'basic').
                 - entity (Dict[str, Any]): Entity details for associated jobs (e.g., {"dataSourceId": 2575}).
 
         Returns:
@@ -853,6 +1071,69 @@ class JobController:
         """
         self._modify_all_jobs("resume")
 
+    def suspend_jobs(
+        self, job_ids: Optional[List[Union[int, str]]] = None, **options: Any
+    ) -> Dict[str, Any]:
+        """Suspend the given jobs, or the active jobs matching the jobs list filter.
+
+        Args:
+            job_ids: List of job IDs to suspend. If not given, the jobs are selected with the
+                jobs list filter given in `options`.
+            **options: `max_workers` and the jobs list filter options accepted by `modify_jobs`.
+
+        Returns:
+            Dictionary with the 'succeeded' job IDs and the 'failed' job IDs mapped to their error.
+
+        Example:
+            >>> result = commcell.job_controller.suspend_jobs([101, 102])
+            >>> print(result['failed'])
+
+        #ai-gen-doc
+        """
+        return self.modify_jobs("suspend", job_ids, **options)
+
+    def resume_jobs(
+        self, job_ids: Optional[List[Union[int, str]]] = None, **options: Any
+    ) -> Dict[str, Any]:
+        """Resume the given jobs, or the active jobs matching the jobs list filter.
+
+        Args:
+            job_ids: List of job IDs to resume. If not given, the jobs are selected with the
+                jobs list filter given in `options`.
+            **options: `max_workers` and the jobs list filter options accepted by `modify_jobs`.
+
+        Returns:
+            Dictionary with the 'succeeded' job IDs and the 'failed' job IDs mapped to their error.
+
+        Example:
+            >>> result = commcell.job_controller.resume_jobs(clients_list=['client1'])
+            >>> print(result['succeeded'])
+
+        #ai-gen-doc
+        """
+        return self.modify_jobs("resume", job_ids, **options)
+
+    def kill_jobs(
+        self, job_ids: Optional[List[Union[int, str]]] = None, **options: Any
+    ) -> Dict[str, Any]:
+        """Kill the given jobs, or the active jobs matching the jobs list filter.
+
+        Args:
+            job_ids: List of job IDs to kill. If not given, the jobs are selected with the
+                jobs list filter given in `options`.
+            **options: `max_workers` and the jobs list filter options accepted by `modify_jobs`.
+
+        Returns:
+            Dictionary with the 'succeeded' job IDs and the 'failed' job IDs mapped to their error.
+
+        Example:
+            >>> result = commcell.job_controller.kill_jobs([101, 102])
+            >>> print(result['succeeded'])
+
+        #ai-gen-doc
+        """
+        return self.modify_jobs("kill", job_ids, **options)
+
     def kill_all_jobs(self) -> None:
         """Terminate all active jobs on the CommServe server.
 
@@ -890,6 +1171,871 @@ class JobController:
         """
         return Job(self._commcell_object, job_id)
 
+    def _fetch_job_part(self, job_id: int, part: Any, details: Optional[Dict] = None) -> Any:
+        """Fetch one part of the job information directly, without constructing a Job object.
+
+        Args:
+            job_id: ID of the job.
+            part: Name of the part to fetch, or an AdvancedJobDetailType member.
+            details: Job details already fetched for this job, used for the parts derived
+                from the job details.
+
+        Returns:
+            The value of the part, in the same format as the matching Job method.
+
+        Raises:
+            SDKException: If the part is not valid or the response is empty or unsuccessful.
+
+        #ai-gen-doc
+        """
+        if isinstance(part, AdvancedJobDetailType):
+            return _request_advanced_job_details(self._commcell_object, job_id, part)
+
+        if part == "summary":
+            flag, response = self._cvpysdk_object.make_request(
+                "GET", self._services["JOB"] % job_id
+            )
+            if not flag:
+                raise SDKException("Response", "101", self._update_response_(response.text))
+
+            for job in (response.json() or {}).get("jobs", []):
+                return job["jobSummary"]
+            raise SDKException("Job", "104")
+
+        if part in ("details", "vm_list", "child_jobs"):
+            if details is None:
+                payload = {"jobId": int(job_id), "showAttempt": True}
+                flag, response = self._cvpysdk_object.make_request(
+                    "POST", self._services["JOB_DETAILS"], payload
+                )
+                if not flag:
+                    raise SDKException("Response", "101", self._update_response_(response.text))
+
+                response_json = response.json()
+                if not response_json:
+                    raise SDKException("Response", "102")
+                if "job" not in response_json:
+                    raise SDKException("Job", "105", f"Response JSON: {response_json}")
+                details = response_json["job"]
+
+            if part == "details":
+                return details
+
+            vm_status = details.get("jobDetail", {}).get("clientStatusInfo", {}).get("vmStatus")
+            if part == "vm_list":
+                return vm_status or []
+            return list(vm_status) if vm_status else None
+
+        if part == "events":
+            return _request_job_events(self._commcell_object, job_id)
+
+        if part == "logs":
+            return _request_job_logs(self._commcell_object, job_id)
+
+        raise SDKException("Job", "102", f"Invalid job information part: {part}")
+
+    def _fetch_job_parts(self, job_id: int, parts: List[Any]) -> Dict[str, Any]:
+        """Fetch the requested parts of the job information for a single job.
+
+        Failures are recorded per part under the 'errors' key instead of being raised.
+
+        Args:
+            job_id: ID of the job.
+            parts: Parts of the job information to fetch.
+
+        Returns:
+            Dictionary mapping each part to its value, with an 'errors' dictionary mapping
+            the parts that could not be fetched to the exception raised.
+
+        #ai-gen-doc
+        """
+        results = {"errors": {}}
+        details = None
+
+        for part in parts:
+            try:
+                if part in ("details", "vm_list", "child_jobs") and details is None:
+                    details = self._fetch_job_part(job_id, "details")
+                results[part] = self._fetch_job_part(job_id, part, details)
+            except (SDKException, RequestException, ValueError) as excp:
+                results["errors"][part] = excp
+
+        return results
+
+    def bulk_fetch(
+        self,
+        job_ids: List[Union[int, str]],
+        parts: Optional[List[Any]] = None,
+        max_workers: int = 8,
+    ) -> Iterator[tuple]:
+        """Fetch the events, logs, details and other information of many jobs concurrently.
+
+        The information is requested directly from the job APIs, without constructing a Job
+        object for each job, and the results are yielded as soon as all the parts of a job
+        are fetched. Failures, including connection errors and responses which are not valid
+        JSON, do not stop the iteration, they are reported per job under the 'errors' key of
+        its result.
+
+        Args:
+            job_ids: List of job IDs to fetch the information for.
+            parts: Parts of the job information to fetch. Valid values are 'summary',
+                'details', 'events', 'logs', 'vm_list', 'child_jobs', and members of the
+                AdvancedJobDetailType enum. Default is ['events', 'logs', 'details'].
+            max_workers: Maximum number of jobs fetched concurrently. Default is 8.
+
+        Returns:
+            Iterator of (job_id, results) tuples in the order the jobs complete, where results
+            maps each requested part to its value, and 'errors' maps the parts that failed to
+            the exception raised.
+
+        Raises:
+            SDKException: If a job ID is not an integer or a part is not valid.
+
+        Example:
+            >>> failed = commcell.job_controller.finished_jobs(job_filter='Backup', limit=2000)
+            >>> for job_id, result in commcell.job_controller.bulk_fetch(
+            ...     failed, parts=['events', 'details'], max_workers=16
+            ... ):
+            ...     if not result['errors']:
+            ...         print(job_id, len(result['events']))
+
+        #ai-gen-doc
+        """
+        parts = list(parts or ["events", "logs", "details"])
+
+        valid_parts = ("summary", "details", "events", "logs", "vm_list", "child_jobs")
+        for part in parts:
+            if not isinstance(part, AdvancedJobDetailType) and part not in valid_parts:
+                raise SDKException("Job", "102", f"Invalid job information part: {part}")
+
+        try:
+            job_ids = [int(job_id) for job_id in job_ids]
+        except (TypeError, ValueError):
+            raise SDKException("Job", "101")
+
+        def fetch_all():
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            try:
+                futures = {
+                    executor.submit(self._fetch_job_parts, job_id, parts): job_id
+                    for job_id in job_ids
+                }
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        return fetch_all()
+
+    def subscribe(
+        self,
+        job_filter: Any,
+        callback: Any,
+        events: Optional[List[Any]] = None,
+        **watcher_options: Any,
+    ) -> int:
+        """Subscribe to job state change events on this Commcell.
+
+        All the subscriptions of the Commcell share one background poller, which fetches the
+        jobs list once per poll interval and diffs it against the previous snapshot. Callbacks
+        are invoked on a bounded thread pool as callback(event, record, previous_record), where
+        record and previous_record are JobRecord instances.
+
+        Args:
+            job_filter: None to receive events for all jobs, a callable accepting a JobRecord
+                and returning a bool, or a dictionary mapping JobRecord attribute names to a
+                value or a list of accepted values (e.g., {"client_name": "client1"}).
+            callback: Callable invoked for every matching event.
+            events: List of JobStateEvent members or values ('started', 'phase_changed',
+                'pending', 'completed', 'failed') to subscribe to. Defaults to all events.
+            **watcher_options: Options of the poller, used when it is created by the first
+                subscription. To change the options of a running poller, call
+                `unsubscribe_all` first:
+                    - poll_interval (int): Seconds between two polls. Default is 30.
+                    - max_workers (int): Threads running the callbacks. Default is 4.
+                    - max_pending (int): Callbacks queued before the poller waits. Default is 1000.
+                    - lookup_time (int): Hours of finished jobs in every snapshot. Default is 1.
+                    - limit (int): Maximum jobs fetched in every snapshot. Default is 5000.
+
+        Returns:
+            int: ID of the subscription, to be passed to `unsubscribe`.
+
+        Raises:
+            SDKException: If the callback, filter or events are not valid, or watcher options
+                are passed while the poller is running.
+
+        Example:
+            >>> def on_failure(event, record, previous):
+            ...     print(f"Job {record.job_id} on {record.client_name}: {event.value}")
+            >>> subscription_id = commcell.job_controller.subscribe(
+            ...     {"job_type": "Backup"}, on_failure, events=["failed"]
+            ... )
+            >>> commcell.job_controller.unsubscribe(subscription_id)
+
+        #ai-gen-doc
+        """
+        if watcher_options and self._job_watcher is not None:
+            if self._job_watcher.is_running:
+                raise SDKException(
+                    "Job",
+                    "102",
+                    "Job state poller is already running, call unsubscribe_all() before "
+                    "changing its options",
+                )
+
+            self._job_watcher = None
+
+        if self._job_watcher is None:
+            self._job_watcher = _JobStateWatcher(self, **watcher_options)
+
+        return self._job_watcher.add(job_filter, callback, events)
+
+    def unsubscribe(self, subscription_id: int) -> None:
+        """Remove a job state change subscription.
+
+        The background poller is stopped once the last subscription is removed.
+
+        Args:
+            subscription_id: ID of the subscription returned by `subscribe`.
+
+        Raises:
+            SDKException: If no subscription exists with the given ID.
+
+        Example:
+            >>> subscription_id = commcell.job_controller.subscribe(None, print)
+            >>> commcell.job_controller.unsubscribe(subscription_id)
+
+        #ai-gen-doc
+        """
+        if self._job_watcher is None:
+            raise SDKException(
+                "Job", "102", f"No job subscription exists with ID: {subscription_id}"
+            )
+
+        self._job_watcher.remove(subscription_id)
+
+    def unsubscribe_all(self) -> None:
+        """Remove all the job state change subscriptions and stop the background poller.
+
+        Example:
+            >>> commcell.job_controller.unsubscribe_all()
+
+        #ai-gen-doc
+        """
+        if self._job_watcher is not None:
+            self._job_watcher.stop()
+            self._job_watcher = None
+
+    @staticmethod
+    def summarize_jobs(jobs: Union[Dict[Any, Any], List[Any]]) -> Dict[str, Any]:
+        """Aggregate job counts, sizes and durations in a single pass over the given jobs.
+
+        Accepts the output of `all_jobs`, `active_jobs` or `finished_jobs` in any of the
+        'basic', 'record' or 'full' summary forms, either as the returned dictionary or
+        as an iterable of its values.
+
+        Args:
+            jobs: Dictionary of job id to job details, or an iterable of JobRecord instances,
+                basic job dictionaries or full job summaries.
+
+        Returns:
+            Dictionary with the aggregated job statistics:
+                - total_jobs (int): Number of jobs processed.
+                - total_bytes (int): Sum of the application size of all jobs.
+                - total_media_bytes (int): Sum of the media size on disk of all jobs.
+                - total_elapsed_time (int): Sum of the elapsed time of all jobs, in seconds.
+                - throughput (float): Application bytes processed per elapsed second.
+                - by_client (Dict[str, int]): Job count per client name.
+                - by_agent (Dict[str, int]): Job count per agent (application type).
+                - by_status (Dict[str, int]): Job count per job status.
+                - bytes_by_client (Dict[str, int]): Application bytes per client name.
+
+        Example:
+            >>> jobs = commcell.job_controller.finished_jobs(limit=100000, job_summary='record')
+            >>> stats = commcell.job_controller.summarize_jobs(jobs)
+            >>> print(f"Failed jobs: {stats['by_status'].get('Failed', 0)}")
+            >>> print(f"Throughput: {stats['throughput']:.2f} bytes/sec")
+
+        #ai-gen-doc
+        """
+        if isinstance(jobs, dict):
+            jobs = jobs.values()
+
+        by_client = {}
+        by_agent = {}
+        by_status = {}
+        bytes_by_client = {}
+        total_jobs = total_bytes = total_media_bytes = total_elapsed_time = 0
+
+        for job in jobs:
+            if not isinstance(job, JobRecord):
+                job = JobRecord.from_dict(job)
+
+            client_name = job.client_name
+            job_bytes = job.size_of_application
+
+            total_jobs += 1
+            total_bytes += job_bytes
+            total_media_bytes += job.media_size
+            total_elapsed_time += job.job_elapsed_time
+
+            by_client[client_name] = by_client.get(client_name, 0) + 1
+            by_agent[job.app_type] = by_agent.get(job.app_type, 0) + 1
+            by_status[job.status] = by_status.get(job.status, 0) + 1
+            bytes_by_client[client_name] = bytes_by_client.get(client_name, 0) + job_bytes
+
+        return {
+            "total_jobs": total_jobs,
+            "total_bytes": total_bytes,
+            "total_media_bytes": total_media_bytes,
+            "total_elapsed_time": total_elapsed_time,
+            "throughput": total_bytes / total_elapsed_time if total_elapsed_time else 0.0,
+            "by_client": by_client,
+            "by_agent": by_agent,
+            "by_status": by_status,
+            "bytes_by_client": bytes_by_client,
+        }
+
+
+class JobRecord:
+    """
+    Compact, read-only record of a single job from the jobs list response.
+
+    JobRecord keeps only the commonly used attributes of a job summary in fixed slots,
+    avoiding the per-job dictionary built for the 'basic' summary and the reference to
+    the complete raw summary kept for the 'full' summary. It is intended for reports
+    that process a large number of jobs at once.
+
+    Key Features:
+        - Slot based storage of the job attributes
+        - Construction from a raw job summary or a basic job dictionary
+        - Conversion back to the basic job dictionary format
+
+    #ai-gen-doc
+    """
+
+    __slots__ = (
+        "job_id",
+        "operation",
+        "status",
+        "app_type",
+        "job_type",
+        "percent_complete",
+        "pending_reason",
+        "client_id",
+        "client_name",
+        "subclient_id",
+        "backup_level",
+        "job_start_time",
+        "job_elapsed_time",
+        "size_of_application",
+        "media_size",
+        "phase",
+    )
+
+    def __init__(
+        self,
+        job_id: int,
+        operation: str = "",
+        status: str = "",
+        app_type: str = "",
+        job_type: str = "",
+        percent_complete: int = 0,
+        pending_reason: str = "",
+        client_id: Union[int, str] = "",
+        client_name: str = "",
+        subclient_id: Union[int, str] = "",
+        backup_level: Optional[str] = None,
+        job_start_time: int = 0,
+        job_elapsed_time: int = 0,
+        size_of_application: int = 0,
+        media_size: int = 0,
+        phase: str = "",
+    ) -> None:
+        """Initialize a JobRecord with the given job attributes.
+
+        Args:
+            job_id: ID of the job.
+            operation: Localized operation name of the job.
+            status: Current status of the job.
+            app_type: Name of the agent (application type) of the job.
+            job_type: Type of the job.
+            percent_complete: Progress of the job in percent.
+            pending_reason: Reason for the job being in pending state.
+            client_id: ID of the client the job ran for.
+            client_name: Name of the client the job ran for.
+            subclient_id: ID of the subclient the job ran for.
+            backup_level: Backup level name, if applicable.
+            job_start_time: Start time of the job as a unix timestamp.
+            job_elapsed_time: Elapsed time of the job in seconds.
+            size_of_application: Size of the application data processed, in bytes.
+            media_size: Size of the media written to disk, in bytes.
+            phase: Name of the current phase of the job.
+
+        #ai-gen-doc
+        """
+        self.job_id = job_id
+        self.operation = operation
+        self.status = status
+        self.app_type = app_type
+        self.job_type = job_type
+        self.percent_complete = percent_complete
+        self.pending_reason = pending_reason
+        self.client_id = client_id
+        self.client_name = client_name
+        self.subclient_id = subclient_id
+        self.backup_level = backup_level
+        self.job_start_time = job_start_time
+        self.job_elapsed_time = job_elapsed_time
+        self.size_of_application = size_of_application
+        self.media_size = media_size
+        self.phase = phase
+
+    def __repr__(self) -> str:
+        """Return the string representation of the JobRecord instance.
+
+        Returns:
+            str: String representation of the job record.
+
+        Example:
+            >>> record = JobRecord(12345, status='Completed')
+            >>> print(repr(record))
+            JobRecord for job id: "12345", status: "Completed"
+
+        #ai-gen-doc
+        """
+        return f'JobRecord for job id: "{self.job_id}", status: "{self.status}"'
+
+    @classmethod
+    def from_summary(cls, job_summary: Dict[str, Any]) -> "JobRecord":
+        """Create a JobRecord from a raw job summary returned by the jobs API.
+
+        Args:
+            job_summary: The 'jobSummary' dictionary of a job from the jobs list response.
+
+        Returns:
+            JobRecord: The compact record for the job.
+
+        Example:
+            >>> record = JobRecord.from_summary(response_json['jobs'][0]['jobSummary'])
+            >>> print(record.client_name)
+
+        #ai-gen-doc
+        """
+        job_subclient = job_summary.get("subclient", {})
+        return cls(
+            job_summary["jobId"],
+            job_summary.get("localizedOperationName", ""),
+            job_summary.get("status", ""),
+            job_summary.get("appTypeName", ""),
+            job_summary.get("jobType", ""),
+            job_summary.get("percentComplete", 0),
+            job_summary.get("pendingReason", ""),
+            job_subclient.get("clientId", ""),
+            job_subclient.get("clientName", ""),
+            job_subclient.get("subclientId", ""),
+            job_summary.get("backupLevelName"),
+            job_summary.get("jobStartTime", 0),
+            job_summary.get("jobElapsedTime", 0),
+            job_summary.get("sizeOfApplication", 0),
+            job_summary.get("sizeOfMediaOnDisk", 0),
+            job_summary.get("currentPhaseName", ""),
+        )
+
+    @classmethod
+    def from_dict(cls, job_dict: Dict[str, Any]) -> "JobRecord":
+        """Create a JobRecord from a basic job dictionary or a raw job summary.
+
+        Args:
+            job_dict: Job details in the 'basic' format returned by `JobController.all_jobs`,
+                or a raw job summary as returned with job_summary='full'.
+
+        Returns:
+            JobRecord: The compact record for the job.
+
+        Example:
+            >>> jobs = commcell.job_controller.all_jobs()
+            >>> records = [JobRecord.from_dict(job) for job in jobs.values()]
+
+        #ai-gen-doc
+        """
+        if "jobId" in job_dict:
+            return cls.from_summary(job_dict)
+
+        attributes = {key: job_dict[key] for key in cls.__slots__[1:] if key in job_dict}
+        return cls(job_dict.get("job_id", 0), **attributes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the job attributes in the 'basic' job dictionary format.
+
+        Returns:
+            Dictionary with the same keys as the values returned by `JobController.all_jobs`.
+
+        Example:
+            >>> record = JobRecord.from_summary(job_summary)
+            >>> print(record.to_dict()['status'])
+
+        #ai-gen-doc
+        """
+        return {
+            "operation": self.operation,
+            "status": self.status,
+            "app_type": self.app_type,
+            "job_type": self.job_type,
+            "percent_complete": self.percent_complete,
+            "pending_reason": self.pending_reason,
+            "client_id": self.client_id,
+            "client_name": self.client_name,
+            "subclient_id": self.subclient_id,
+            "backup_level": self.backup_level,
+            "job_start_time": self.job_start_time,
+            "job_elapsed_time": self.job_elapsed_time,
+        }
+
+
+class _JobStateWatcher:
+    """
+    Background poller which raises job state change events for a Commcell.
+
+    A single watcher is shared by all the subscriptions of a JobController. It fetches the
+    jobs list once per poll interval, compares it with the previous snapshot and hands the
+    state change events to the matching subscribers on a bounded pool of worker threads.
+
+    Key Features:
+        - One jobs list request per poll interval irrespective of the subscriber count
+        - Started, phase changed, pending, completed and failed events
+        - Filtering of events by job attributes or a custom predicate
+        - Bounded callback executor with backpressure on the poller
+
+    #ai-gen-doc
+    """
+
+    def __init__(
+        self,
+        job_controller: "JobController",
+        poll_interval: int = 30,
+        max_workers: int = 4,
+        max_pending: int = 1000,
+        lookup_time: Union[int, float] = 1,
+        limit: int = 5000,
+    ) -> None:
+        """Initialize the job state watcher.
+
+        Args:
+            job_controller: JobController instance used to fetch the jobs list.
+            poll_interval: Interval in seconds between two jobs list requests.
+            max_workers: Maximum number of threads running the subscriber callbacks.
+            max_pending: Maximum number of callbacks queued before the poller waits.
+            lookup_time: Hours of finished jobs included in every snapshot.
+            limit: Maximum number of jobs fetched in every snapshot.
+
+        #ai-gen-doc
+        """
+        self._job_controller = job_controller
+        self._poll_interval = poll_interval
+        self._max_workers = max_workers
+        self._lookup_time = lookup_time
+        self._limit = limit
+
+        self._subscriptions = {}
+        self._subscription_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._pending = threading.BoundedSemaphore(max_pending)
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._executor = None
+        self._snapshot = None
+
+        self.last_error = None
+
+    @property
+    def is_running(self) -> bool:
+        """Check whether the background poller thread is running.
+
+        Returns:
+            True if the poller is running, False otherwise.
+
+        #ai-gen-doc
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    @staticmethod
+    def _validate_filter(job_filter: Any) -> None:
+        """Validate the job filter of a subscription.
+
+        Args:
+            job_filter: None, a callable accepting a JobRecord, or a dictionary mapping
+                JobRecord attribute names to a value or a list of accepted values.
+
+        Raises:
+            SDKException: If the filter is not of a supported type or refers to an unknown
+                job attribute.
+
+        #ai-gen-doc
+        """
+        if job_filter is None or callable(job_filter):
+            return
+
+        if not isinstance(job_filter, dict):
+            raise SDKException("Job", "108")
+
+        for key in job_filter:
+            if key not in JobRecord.__slots__:
+                raise SDKException("Job", "102", f"Invalid job filter attribute: {key}")
+
+    @staticmethod
+    def _matches(job_filter: Any, record: "JobRecord") -> bool:
+        """Check whether the job record satisfies the job filter of a subscription.
+
+        Args:
+            job_filter: The validated job filter of the subscription.
+            record: The job record to check.
+
+        Returns:
+            True if the record matches the filter, False otherwise.
+
+        #ai-gen-doc
+        """
+        if job_filter is None:
+            return True
+
+        if callable(job_filter):
+            return bool(job_filter(record))
+
+        for key, value in job_filter.items():
+            accepted = value if isinstance(value, (list, tuple, set)) else (value,)
+            if getattr(record, key) not in accepted:
+                return False
+
+        return True
+
+    @staticmethod
+    def _get_events(
+        previous: Dict[int, "JobRecord"], current: Dict[int, "JobRecord"]
+    ) -> List[tuple]:
+        """Compare two job snapshots and return the job state change events.
+
+        Killed jobs are reported with the failed event.
+
+        Args:
+            previous: Snapshot of the jobs from the previous poll, keyed by job id.
+            current: Snapshot of the jobs from the current poll, keyed by job id.
+
+        Returns:
+            List of (JobStateEvent, current record, previous record or None) tuples.
+
+        #ai-gen-doc
+        """
+
+        def finished_event(status):
+            if "failed" in status or "killed" in status:
+                return JobStateEvent.FAILED
+            if "completed" in status or "committed" in status:
+                return JobStateEvent.COMPLETED
+            return None
+
+        events = []
+
+        for job_id, record in current.items():
+            old_record = previous.get(job_id)
+            status = record.status.lower()
+            old_status = old_record.status.lower() if old_record else ""
+
+            if old_record is None:
+                events.append((JobStateEvent.STARTED, record, None))
+            elif record.phase and record.phase != old_record.phase:
+                events.append((JobStateEvent.PHASE_CHANGED, record, old_record))
+
+            if "pending" in status and "pending" not in old_status:
+                events.append((JobStateEvent.PENDING, record, old_record))
+
+            event = finished_event(status)
+            if event is not None and event != finished_event(old_status):
+                events.append((event, record, old_record))
+
+        return events
+
+    def add(self, job_filter: Any, callback: Any, events: Optional[List[Any]] = None) -> int:
+        """Register a subscription and start the poller if it is not running.
+
+        Args:
+            job_filter: None, a callable accepting a JobRecord, or a dictionary mapping
+                JobRecord attribute names to a value or a list of accepted values.
+            callback: Callable invoked as callback(event, record, previous_record).
+            events: JobStateEvent members or their values to subscribe to.
+                Defaults to all the events.
+
+        Returns:
+            int: ID of the subscription.
+
+        Raises:
+            SDKException: If the callback, filter or events are not valid.
+
+        #ai-gen-doc
+        """
+        if not callable(callback):
+            raise SDKException("Job", "108")
+
+        self._validate_filter(job_filter)
+
+        try:
+            events = frozenset(JobStateEvent(event) for event in (events or JobStateEvent))
+        except ValueError as excp:
+            raise SDKException("Job", "102", f"Invalid job state event: {excp}")
+
+        with self._lock:
+            subscription_id = next(self._subscription_ids)
+            self._subscriptions[subscription_id] = (job_filter, callback, events)
+
+        self.start()
+        return subscription_id
+
+    def remove(self, subscription_id: int) -> None:
+        """Remove a subscription, and stop the poller once no subscriptions remain.
+
+        Args:
+            subscription_id: ID of the subscription returned by `add`.
+
+        Raises:
+            SDKException: If no subscription exists with the given ID.
+
+        #ai-gen-doc
+        """
+        with self._lock:
+            if subscription_id not in self._subscriptions:
+                raise SDKException(
+                    "Job", "102", f"No job subscription exists with ID: {subscription_id}"
+                )
+            del self._subscriptions[subscription_id]
+            remaining = len(self._subscriptions)
+
+        if not remaining:
+            self.stop()
+
+    def start(self) -> None:
+        """Start the background poller thread and the callback executor.
+
+        #ai-gen-doc
+        """
+        with self._lock:
+            if self.is_running:
+                return
+
+            self._stop_event = threading.Event()
+            self._snapshot = None
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="cvpysdk-job-events"
+            )
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(self._stop_event,),
+                name="cvpysdk-job-watcher",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self, wait: bool = False) -> None:
+        """Stop the background poller thread and the callback executor.
+
+        Args:
+            wait: Whether to wait for the poller and the queued callbacks to finish.
+
+        #ai-gen-doc
+        """
+        self._stop_event.set()
+
+        thread, self._thread = self._thread, None
+        executor, self._executor = self._executor, None
+
+        if wait and thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def poll(self) -> List[tuple]:
+        """Fetch a new job snapshot and dispatch the events found since the previous one.
+
+        The first poll only records the baseline snapshot and raises no events. The events are
+        dropped once the watcher is stopped, and are only dispatched to the subscriptions which
+        are still registered.
+
+        Returns:
+            List of (JobStateEvent, current record, previous record or None) tuples found.
+
+        #ai-gen-doc
+        """
+        current = self._job_controller.all_jobs(
+            lookup_time=self._lookup_time, limit=self._limit, job_summary="record"
+        )
+
+        previous, self._snapshot = self._snapshot, current
+        if previous is None:
+            return []
+
+        events = self._get_events(previous, current)
+
+        with self._lock:
+            subscriptions = list(self._subscriptions.items())
+
+        for event, record, old_record in events:
+            for subscription_id, (job_filter, callback, subscribed_events) in subscriptions:
+                if self._stop_event.is_set():
+                    return events
+
+                # the subscription may have been removed while the events were dispatched
+                if subscription_id not in self._subscriptions:
+                    continue
+
+                if event in subscribed_events and self._matches(job_filter, record):
+                    self._dispatch(callback, event, record, old_record)
+
+        return events
+
+    def _dispatch(self, callback: Any, *args: Any) -> None:
+        """Run the callback on the executor, waiting while too many callbacks are queued.
+
+        The callback is dropped if the watcher is stopped. It is run inline only when the
+        watcher was never started, e.g. when `poll` is called directly.
+
+        #ai-gen-doc
+        """
+        executor = self._executor
+        if self._stop_event.is_set():
+            return
+
+        if executor is None:
+            callback(*args)
+            return
+
+        self._pending.acquire()
+        try:
+            future = executor.submit(callback, *args)
+        except RuntimeError:
+            self._pending.release()
+            return
+        future.add_done_callback(lambda _: self._pending.release())
+
+    def _run(self, stop_event: threading.Event) -> None:
+        """Poll the jobs list until the watcher is stopped.
+
+        Errors raised while fetching a snapshot are stored in `last_error` and the poller
+        continues with the next interval.
+
+        Args:
+            stop_event: Event signalling this poller thread to stop.
+
+        #ai-gen-doc
+        """
+        while not stop_event.is_set():
+            try:
+                self.poll()
+                self.last_error = None
+            except Exception as excp:
+                self.last_error = excp
+
+            stop_event.wait(self._poll_interval)
+
 
 class JobManagement:
     """
@@ -3565,23 +4711,8 @@ class Job:
         """
         if not isinstance(info_type, AdvancedJobDetailType):
             raise SDKException("Response", "107")
-        url = self._services["ADVANCED_JOB_DETAIL_TYPE"] % (self.job_id, info_type.value)
-        flag, response = self._cvpysdk_object.make_request("GET", url)
-
-        if flag:
-            if response.json():
-                response = response.json()
 
-                if response.get("errorCode", 0) != 0:
-                    error_message = response.json()["errorMessage"]
-                    o_str = f'Failed to fetch details.\nError: "{error_message}"'
-                    raise SDKException("Job", "102", o_str)
-
-                return response
-            else:
-                raise SDKException("Response", "102")
-        else:
-            raise SDKException("Response", "101", self._update_response_(response.text))
+        return _request_advanced_job_details(self._commcell_object, self.job_id, info_type)
 
     def get_events(self) -> List[Dict[str, Any]]:
         """Retrieve the CommServe events associated with this job.
@@ -3601,12 +4732,7 @@ class Job:
 
         #ai-gen-doc
         """
-        flag, response = self._cvpysdk_object.make_request("GET", self._JOB_EVENTS)
-        if flag:
-            if response.json() and "commservEvents" in response.json():
-                return response.json()["commservEvents"]
-            raise SDKException("Job", "104")
-        raise SDKException("Response", "101", self._update_response_(response.text))
+        return _request_job_events(self._commcell_object, self.job_id)
 
     def get_vm_list(self) -> List[Dict[str, Any]]:
         """Retrieve the list of all virtual machines (VMs) associated with this job.
@@ -3705,16 +4831,7 @@ class Job:
 
         #ai-gen-doc
         """
-        service = self._services["GET_LOGS"] % (self.job_id)
-        flag, response = self._cvpysdk_object.make_request(method="GET", url=service)
-
-        if flag:
-            if response.text:
-                return response.text.split("\n")
-            else:
-                raise SDKException("Response", "102")
-        else:
-            raise SDKException("Response", "102")
+        return _request_job_logs(self._commcell_object, self.job_id)
 
 
 class _ErrorRule:
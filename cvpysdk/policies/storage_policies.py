@@ -194,6 +194,16 @@ StoragePolicyCopy:
 
     _mark_jobs_on_copy()                    --  marks job(s) for given operation on a secondary copy
 
+    _get_job_batches()                      --  splits the job ids into batches for marking
+
+    _mark_job_batch()                       --  marks a single batch of jobs on a secondary copy
+
+    _mark_jobs()                            --  marks job(s) in concurrent batches, keeping the
+                                                exceptions of the failed batches
+
+    bulk_mark_jobs()                        --  marks job(s) for given operation on a secondary copy
+                                                in concurrent batches, collecting the failures
+
     pick_for_copy()                         --  marks job(s) to be Picked for Copy to a secondary copy
 
     recopy_jobs()                           --  marks job(s) to be picked for ReCopying to a secondary copy
@@ -280,9 +290,12 @@ Attributes
 from __future__ import annotations
 
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import IntEnum
 from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
+from requests.exceptions import RequestException
+
 from ..client import Client
 from ..exception import SDKException
 from ..job import Job
@@ -4792,12 +4805,122 @@ class StoragePolicyCopy:
     ) -> None:
         """Marks job(s) for given operation on a secondary copy
 
+        The job ids are marked in concurrent batches, and the batches after a failed batch are
+        still marked. The exception is raised once all the batches are processed.
+
         Args:
             job_id    (int or str or list): Job Id(s) that needs to be marked
             operation (JobOperationsOnStorageCopy): Operation that the job(s) needs to be marked for.
                              Operations Supported: (allowcopy/recopy/donotcopy/
                              markJobsBad/pickForVerification/donotPickForVerification)
 
+        Raises:
+            SDKException:
+                if type of input parameters is not string or List of strings
+
+                if any of the job(s) could not be marked
+
+        Usage:
+            This is a private method and should not be called directly.
+        """
+        result, failures = self._mark_jobs(job_id, operation)
+
+        if not failures:
+            return
+
+        # a single failure, or a failed request, is raised as it is, as when the batches were
+        # marked one after the other
+        if len(failures) == 1:
+            raise failures[0]
+
+        for excp in failures:
+            if not isinstance(excp, SDKException) or excp.exception_module == "Response":
+                raise excp
+
+        raise SDKException("Storage", "102", "\n".join(result["errors"]))
+
+    @staticmethod
+    def _get_job_batches(job_ids: list, batch_size: Optional[int] = None) -> List[str]:
+        """Splits the job ids into comma separated batches for the MarkJobsOnCopy qscript
+
+        Args:
+            job_ids    (list): List of job ids to be split
+            batch_size (int): Maximum number of job ids in a batch.
+                              Defaults to batches of about 200 characters, to counter the
+                              limit of URL length in IIS
+
+        Returns:
+            list: List of comma separated job id strings
+
+        Usage:
+            This is a private method and should not be called directly.
+        """
+        if batch_size:
+            return [
+                ",".join(str(id) for id in job_ids[index : index + batch_size])
+                for index in range(0, len(job_ids), batch_size)
+            ]
+
+        job_strings = []
+        string = ""
+        for id in job_ids:
+            string += f",{id}"
+            if len(string) > 200:
+                job_strings.append(string.strip(","))
+                string = ""
+        if string:
+            job_strings.append(string.strip(","))
+
+        return job_strings
+
+    def _mark_job_batch(self, job_string: str, operation: str) -> None:
+        """Sends a single MarkJobsOnCopy qscript request for a batch of job ids
+
+        Args:
+            job_string (str): Comma separated job ids to be marked
+            operation  (str): Operation that the job(s) needs to be marked for
+
+        Raises:
+            SDKException:
+                if the jobs do not belong to the copy
+
+                if the response is empty or not successful
+
+        Usage:
+            This is a private method and should not be called directly.
+        """
+        qcommand = f" -sn MarkJobsOnCopy -si {self._storage_policy_name} -si {self._copy_name} -si {operation} -si {job_string}"
+        url = self._services["EXECUTE_QSCRIPT"] % (qcommand)
+        flag, response = self._commcell_object._cvpysdk_object.make_request("POST", url)
+        if flag:
+            if response.text:
+                if "jobs do not belong" in response.text.lower():
+                    raise SDKException("Storage", "102", response.text.strip())
+            else:
+                raise SDKException("Response", "102")
+        else:
+            response_string = self._commcell_object._update_response_(response.text)
+            raise SDKException("Response", "101", response_string)
+
+    def _mark_jobs(
+        self,
+        job_id: int | str | list,
+        operation: str,
+        batch_size: Optional[int] = None,
+        max_workers: int = 4,
+    ) -> tuple:
+        """Marks the jobs for given operation on a secondary copy in concurrent batches
+
+        Args:
+            job_id      (int or str or list): Job Id(s) that needs to be marked
+            operation   (str): Operation that the job(s) needs to be marked for
+            batch_size  (int): Maximum number of job ids marked in a single request
+            max_workers (int): Maximum number of concurrent requests
+
+        Returns:
+            tuple: The result of the operation, as returned by bulk_mark_jobs, and the
+            exceptions raised by the failed batches, in the order of the batches
+
         Raises:
             SDKException:
                 if type of input parameters is not string or List of strings
@@ -4812,33 +4935,89 @@ class StoragePolicyCopy:
             ):
                 raise SDKException("Storage", "101")
 
-        # send multiple requests to counter limit of URL length in IIS
-        job_strings = []
-        if isinstance(job_id, list):
-            string = ""
-            for id in job_id:
-                string += f",{id}"
-                if len(string) > 200:
-                    job_strings.append(string.strip(","))
-                    string = ""
-            if string:
-                job_strings.append(string.strip(","))
-        else:
-            job_strings.append(job_id)
+        # comma separated job ids are split, so that they are batched like a list of job ids
+        job_ids = []
+        for id in job_id if isinstance(job_id, list) else [job_id]:
+            if isinstance(id, str):
+                job_ids.extend(value.strip() for value in id.split(",") if value.strip())
+            else:
+                job_ids.append(id)
+
+        job_strings = self._get_job_batches(job_ids, batch_size)
 
+        # the job ids of each batch, as they were given, int or str
+        batches = []
+        start = 0
         for string in job_strings:
-            qcommand = f" -sn MarkJobsOnCopy -si {self._storage_policy_name} -si {self._copy_name} -si {operation} -si {string}"
-            url = self._services["EXECUTE_QSCRIPT"] % (qcommand)
-            flag, response = self._commcell_object._cvpysdk_object.make_request("POST", url)
-            if flag:
-                if response.text:
-                    if "jobs do not belong" in response.text.lower():
-                        raise SDKException("Storage", "102", response.text.strip())
-                else:
-                    raise SDKException("Response", "102")
-            else:
-                response_string = self._commcell_object._update_response_(response.text)
-                raise SDKException("Response", "101", response_string)
+            end = start + string.count(",") + 1
+            batches.append(job_ids[start:end])
+            start = end
+
+        result = {"marked": [], "failed": [], "errors": []}
+        failures = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._mark_job_batch, string, operation): index
+                for index, string in enumerate(job_strings)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                batch = batches[index]
+                try:
+                    future.result()
+                    result["marked"].extend(batch)
+                except (SDKException, RequestException) as excp:
+                    result["failed"].extend(batch)
+                    failures[index] = excp
+
+        failures = [failures[index] for index in sorted(failures)]
+        result["errors"] = [
+            excp.exception_message if isinstance(excp, SDKException) else str(excp)
+            for excp in failures
+        ]
+
+        return result, failures
+
+    def bulk_mark_jobs(
+        self,
+        job_id: int | str | list,
+        operation: str,
+        batch_size: Optional[int] = None,
+        max_workers: int = 4,
+    ) -> dict:
+        """Marks a large number of jobs for given operation on a secondary copy, in concurrent batches
+
+        The job ids are split into batches, each marked with one MarkJobsOnCopy request, with
+        up to max_workers requests in flight. A failed batch does not stop the other batches;
+        the failures of all batches are collected in the result instead of being raised.
+
+        Args:
+            job_id      (int or str or list): Job Id(s) that needs to be marked
+            operation   (str): Operation that the job(s) needs to be marked for.
+                             Operations Supported: (allowcopy/recopy/donotcopy/
+                             markJobsBad/pickForVerification/donotPickForVerification)
+            batch_size  (int): Maximum number of job ids marked in a single request.
+                               Defaults to batches of about 200 characters
+            max_workers (int): Maximum number of concurrent requests. Default is 4
+
+        Returns:
+            dict: Result of the operation, with the keys:
+                - marked (list): Job ids of the batches marked successfully, of the same
+                  type as the given job ids
+                - failed (list): Job ids of the batches that failed, of the same type as
+                  the given job ids
+                - errors (list): Error messages of the failed batches
+
+        Raises:
+            SDKException:
+                if type of input parameters is not string or List of strings
+
+        Usage:
+            >>> result = storage_policy_copy.bulk_mark_jobs(job_ids, 'markJobsBad', batch_size=50)
+            >>> print(result['failed'])
+        """
+        return self._mark_jobs(job_id, operation, batch_size, max_workers)[0]
 
     def pick_for_copy(self, job_id: int | str | list) -> None:
         """Marks job(s) to be Picked for Copy to a secondary copy
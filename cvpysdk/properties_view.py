@@ -0,0 +1,310 @@
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""Helper file for the read-only views returned by the properties of the entity classes.
+
+The `properties` attribute of the Client, Agent, Instance, Backupset, Subclient and ClientGroup
+classes returns a read-only view of the properties JSON of the entity, instead of a deep copy
+made on every access. The nested dictionaries and lists are wrapped in views as they are read,
+and a plain copy is only made when the view is copied.
+
+PropertiesView, PropertiesListView and to_plain are defined in this file.
+
+PropertiesView:     Class for the read-only view of a properties dictionary
+
+PropertiesListView: Class for the read-only view of a list inside the properties
+
+to_plain():         returns a plain deep copy of a view, or the value itself
+
+
+PropertiesView:
+===============
+    __init__(data)              --  initialise the view of the dictionary
+
+    __getitem__(key)            --  returns the value of the key, nested values as views
+
+    __iter__()                  --  iterates over the keys of the dictionary
+
+    __len__()                   --  returns the number of keys of the dictionary
+
+    __contains__(key)           --  checks if the key is in the dictionary
+
+    __eq__(other)               --  compares the dictionary with a mapping or view
+
+    __repr__()                  --  returns the string representation of the dictionary
+
+    __copy__()                  --  returns a plain deep copy of the dictionary
+
+    __deepcopy__(memo)          --  returns a plain deep copy of the dictionary
+
+    copy()                      --  returns a plain deep copy of the dictionary
+
+
+PropertiesListView:
+===================
+    __init__(data)              --  initialise the view of the list
+
+    __getitem__(index)          --  returns the item at the index, nested values as views
+
+    __len__()                   --  returns the number of items of the list
+
+    __eq__(other)               --  compares the list with a sequence or view
+
+    __repr__()                  --  returns the string representation of the list
+
+    __copy__()                  --  returns a plain deep copy of the list
+
+    __deepcopy__(memo)          --  returns a plain deep copy of the list
+
+    copy()                      --  returns a plain deep copy of the list
+
+"""
+
+from __future__ import annotations
+
+import copy
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any
+
+
+def _wrap(value: Any) -> Any:
+    """Wrap the dictionaries and lists read from the properties in read-only views.
+
+    Args:
+        value: Value read from the properties.
+
+    Returns:
+        A view for a dictionary or a list, or the value itself.
+
+    #ai-gen-doc
+    """
+    if isinstance(value, dict):
+        return PropertiesView(value)
+    if isinstance(value, list):
+        return PropertiesListView(value)
+    return value
+
+
+def to_plain(value: Any) -> Any:
+    """Return a plain deep copy of a properties view, or the value itself.
+
+    Used by the `update_properties` methods, so a view, or a dictionary built from the
+    views, can be sent as the request JSON.
+
+    Args:
+        value: A PropertiesView, a PropertiesListView, or any other value.
+
+    Returns:
+        A deep copied dictionary or list for the views, the value unchanged otherwise.
+
+    Example:
+        >>> props = to_plain(subclient.properties)
+        >>> props['commonProperties']['description'] = 'Updated description'
+
+    #ai-gen-doc
+    """
+    if isinstance(value, (PropertiesView, PropertiesListView)):
+        return value.copy()
+    return value
+
+
+class PropertiesView(Mapping):
+    """
+    Read-only view of the properties dictionary of an entity.
+
+    The view reads from the dictionary it wraps, so it reflects the current properties of
+    the entity without copying them. The nested dictionaries and lists are returned as views,
+    and `copy()` or `copy.deepcopy()` return a plain dictionary which can be modified and
+    passed to `update_properties()`.
+
+    #ai-gen-doc
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: dict) -> None:
+        """Initialize the PropertiesView.
+
+        Args:
+            data: The properties dictionary to wrap.
+
+        #ai-gen-doc
+        """
+        self._data = data
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the value of the key, with the nested dictionaries and lists as views.
+
+        Args:
+            key: Key of the properties dictionary.
+
+        Returns:
+            The value of the key.
+
+        #ai-gen-doc
+        """
+        return _wrap(self._data[key])
+
+    def __iter__(self) -> Iterator:
+        """Iterate over the keys of the properties dictionary.
+
+        #ai-gen-doc
+        """
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        """Return the number of keys of the properties dictionary.
+
+        #ai-gen-doc
+        """
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        """Check if the key is in the properties dictionary.
+
+        #ai-gen-doc
+        """
+        return key in self._data
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the properties dictionary with a dictionary or another view.
+
+        #ai-gen-doc
+        """
+        if isinstance(other, PropertiesView):
+            return self._data == other._data
+        if isinstance(other, Mapping):
+            return self._data == dict(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """Return the string representation of the properties dictionary.
+
+        #ai-gen-doc
+        """
+        return repr(self._data)
+
+    def __copy__(self) -> dict:
+        """Return a plain deep copy of the properties dictionary.
+
+        #ai-gen-doc
+        """
+        return copy.deepcopy(self._data)
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        """Return a plain deep copy of the properties dictionary.
+
+        #ai-gen-doc
+        """
+        return copy.deepcopy(self._data, memo)
+
+    def copy(self) -> dict:
+        """Return a plain deep copy of the properties dictionary, which can be modified.
+
+        Returns:
+            A deep copy of the wrapped dictionary.
+
+        #ai-gen-doc
+        """
+        return copy.deepcopy(self._data)
+
+
+class PropertiesListView(Sequence):
+    """
+    Read-only view of a list inside the properties of an entity.
+
+    #ai-gen-doc
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: list) -> None:
+        """Initialize the PropertiesListView.
+
+        Args:
+            data: The list to wrap.
+
+        #ai-gen-doc
+        """
+        self._data = data
+
+    def __getitem__(self, index: int | slice) -> Any:
+        """Return the item at the index, with the nested dictionaries and lists as views.
+
+        Args:
+            index: Index or slice of the list.
+
+        Returns:
+            The item at the index, or a view of the slice.
+
+        #ai-gen-doc
+        """
+        if isinstance(index, slice):
+            return PropertiesListView(self._data[index])
+        return _wrap(self._data[index])
+
+    def __len__(self) -> int:
+        """Return the number of items of the list.
+
+        #ai-gen-doc
+        """
+        return len(self._data)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the list with a list or another view.
+
+        #ai-gen-doc
+        """
+        if isinstance(other, PropertiesListView):
+            return self._data == other._data
+        if isinstance(other, (list, tuple)):
+            return self._data == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """Return the string representation of the list.
+
+        #ai-gen-doc
+        """
+        return repr(self._data)
+
+    def __copy__(self) -> list:
+        """Return a plain deep copy of the list.
+
+        #ai-gen-doc
+        """
+        return copy.deepcopy(self._data)
+
+    def __deepcopy__(self, memo: dict) -> list:
+        """Return a plain deep copy of the list.
+
+        #ai-gen-doc
+        """
+        return copy.deepcopy(self._data, memo)
+
+    def copy(self) -> list:
+        """Return a plain deep copy of the list, which can be modified.
+
+        Returns:
+            A deep copy of the wrapped list.
+
+        #ai-gen-doc
+        """
+        return copy.deepcopy(self._data)
@@ -68,13 +68,72 @@ Schedules:
 
     _get_schedules()                --  gets all the schedules associated with the commcell entity
 
+    _parse_task_detail()            --  gets the schedules of a task from its task details
+
     has_schedule(schedule_name)     --  checks if schedule exists for the comcell entity or not
 
+    snapshot()                      --  takes a snapshot of all the schedules of the commcell
+
     delete(schedule_name)           --  deletes the given schedule
 
     refresh()                       --  refresh the schedules associated with the commcell entity
 
 
+ScheduleSnapshot: Snapshot of all the schedules of the commcell, indexed per entity.
+
+ScheduleSnapshot:
+    __init__(commcell_object, task_details)     --  initialise the snapshot from the task details
+
+    __repr__()                      --  returns the string for the instance of the class
+
+    __len__()                       --  returns the number of schedules in the snapshot
+
+    _get_association_key()          --  gets the entity key of a schedule association
+
+    get_entity_key(class_object)    --  gets the entity key of a client/agent/instance/
+                                        backupset/subclient
+
+    get_schedules(class_object)     --  gets the schedules of the entity from the snapshot
+
+    get_task_schedules(task_id)     --  gets the schedules of the task from the snapshot
+
+    get_schedule(schedule_id)       --  gets the details of the schedule from the snapshot
+
+    entity_schedules(class_object)  --  returns a Schedules object served from the snapshot
+
+    forecast(start_time, end_time)  --  forecasts the run times of all the schedules
+
+    _remove_schedule(schedule_id)   --  removes a deleted schedule from the snapshot
+
+
+ScheduleForecast: Forecast of the run times of schedules, expanded locally from their patterns.
+
+ScheduleForecast:
+    __init__(start_time, end_time)  --  initialise the forecast for the given window
+
+    __repr__()                      --  returns the string for the instance of the class
+
+    _get_time_zone(time_zone_name)  --  gets the time zone of a pattern from its name
+
+    _to_epoch(run_date, seconds)    --  gets the epoch of the local time of a run
+
+    _relative_date()                --  gets the date of a relative day of a month
+
+    _runs_on(pattern, run_date)     --  checks if a day based pattern runs on a date
+
+    _expand_pattern(pattern)        --  expands a pattern into its run times in the window
+
+    expand(pattern)                 --  expands a pattern into its run times, once per pattern
+
+    add(schedule_key, pattern)      --  adds a schedule to the forecast
+
+    next_run_time(schedule_key)     --  gets the first run time of a schedule in the window
+
+    hourly_load()                   --  gets the number of runs of the schedules per hour
+
+    peak_concurrency()              --  gets the peak number of concurrent jobs in the window
+
+
 Schedule: Class for performing operations for a specific Schedule.
 
 Schedule:
@@ -134,6 +193,9 @@ Schedule:
 
     active_start_time(active_start_time)            -- sets the start time of schedule pattern
 
+    get_run_times(start_time, end_time)             -- gets the run times of the schedule in
+                                                                the window from its pattern
+
     enable()                                        -- enables the schedule
 
     disable()                                        -- disables the schedule
@@ -151,8 +213,13 @@ Schedule:
 """
 
 import calendar
-from datetime import datetime, timezone
+import json
+import re
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from functools import cache, lru_cache
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from .exception import SDKException
 
@@ -1116,6 +1183,7 @@ class Schedules:
             "Project",
         ],
         operation_type: str = None,
+        snapshot: "ScheduleSnapshot" = None,
     ) -> None:
         """Initialise the Schedules class instance.
 
@@ -1123,6 +1191,12 @@ class Schedules:
             class_object (object): instance of Commcell/Client/Agent/Backupset/Subclient/Inventory/FsoServer/Project class
             operation_type (str, optional): required when commcell object is passed
                                     refer OperationType class for supported op types. Defaults to None.
+            snapshot (ScheduleSnapshot, optional): snapshot of the commcell schedules to get
+                                    the schedules of the entity from, instead of requesting them.
+                                    Only the schedules associated with the entity itself are
+                                    returned; the schedules inherited from its parent entities
+                                    or from client groups are omitted.
+                                    Defaults to None.
 
         Raises:
             SDKException:
@@ -1141,6 +1215,8 @@ class Schedules:
         from .subclient import Subclient
 
         self.class_object = class_object
+        self._snapshot = snapshot
+        self._operation_type = operation_type
         self._single_scheduled_entity = False
         self._task_flags = {}
         self._repr_str = ""
@@ -1284,27 +1360,7 @@ class Schedules:
             if response.json() and "taskDetail" in response.json():
                 subtask_dict = {}
                 for schedule in response.json()["taskDetail"]:
-                    task_id = schedule["task"]["taskId"]
-                    description = ""
-                    task_flags = schedule["task"].get("taskFlags", 0)
-                    if "subTasks" in schedule:
-                        for subtask in schedule["subTasks"]:
-                            schedule_id = subtask["subTask"]["subTaskId"]
-                            if "description" in subtask["subTask"]:
-                                description = subtask["pattern"]["description"].lower()
-                            if "subTaskName" in subtask["subTask"]:
-                                subtask_name = subtask["subTask"]["subTaskName"].lower()
-                            elif description:
-                                subtask_name = description
-                            else:
-                                subtask_name = str(schedule_id)
-                            # change schedule_id as key
-                            subtask_dict[schedule_id] = {
-                                "task_id": task_id,
-                                "schedule_name": subtask_name,
-                                "description": description,
-                                "task_flags": task_flags,
-                            }
+                    subtask_dict.update(self._parse_task_detail(schedule))
 
                 return subtask_dict
             else:
@@ -1313,6 +1369,85 @@ class Schedules:
             response_string = self._commcell_object._update_response_(response.text)
             raise SDKException("Response", "101", response_string)
 
+    @staticmethod
+    def _parse_task_detail(schedule: dict) -> dict:
+        """Gets the schedules of a single task from its task details.
+
+        Args:
+            schedule (dict): task details of the task, from the taskDetail list of the
+                schedules response
+
+        Returns:
+            dict: consists of the schedules of the task
+                {
+                     "schedule_id": {
+                            'task_id': task_id,
+                            'schedule_name': schedule_name,
+                            'description': description,
+                            'task_flags': task_flags
+                        }
+                }
+        """
+        subtask_dict = {}
+        task_id = schedule["task"]["taskId"]
+        description = ""
+        task_flags = schedule["task"].get("taskFlags", 0)
+        if "subTasks" in schedule:
+            for subtask in schedule["subTasks"]:
+                schedule_id = subtask["subTask"]["subTaskId"]
+                if "description" in subtask["subTask"]:
+                    description = subtask["pattern"]["description"].lower()
+                if "subTaskName" in subtask["subTask"]:
+                    subtask_name = subtask["subTask"]["subTaskName"].lower()
+                elif description:
+                    subtask_name = description
+                else:
+                    subtask_name = str(schedule_id)
+                # change schedule_id as key
+                subtask_dict[schedule_id] = {
+                    "task_id": task_id,
+                    "schedule_name": subtask_name,
+                    "description": description,
+                    "task_flags": task_flags,
+                }
+
+        return subtask_dict
+
+    def snapshot(self) -> "ScheduleSnapshot":
+        """Takes a snapshot of all the schedules of the commcell with a single request.
+
+        The snapshot indexes the schedules by associated entity, task id and schedule id,
+        and can serve the schedules of any number of entities without a request per entity.
+
+        Returns:
+            object: instance of the ScheduleSnapshot class
+
+        Raises:
+            SDKException:
+                if the schedules are not the schedules of the commcell
+
+                if response is not success
+
+        Usage:
+            snapshot = commcell.schedules.snapshot()
+            subclient_schedules = snapshot.entity_schedules(subclient_object)
+        """
+        from .commcell import Commcell
+
+        if not isinstance(self.class_object, Commcell) or self._operation_type:
+            raise SDKException(
+                "Schedules", "102", "Snapshot is only supported for the schedules of the commcell"
+            )
+
+        flag, response = self._commcell_object._cvpysdk_object.make_request("GET", self._SCHEDULES)
+
+        if flag:
+            task_details = (response.json() or {}).get("taskDetail", [])
+            return ScheduleSnapshot(self._commcell_object, task_details)
+
+        response_string = self._commcell_object._update_response_(response.text)
+        raise SDKException("Response", "101", response_string)
+
     def _get_sch_id_from_task_id(self, task_id: int) -> int:
         """
         Gets the schedule id from the task id
@@ -1503,6 +1638,8 @@ class Schedules:
                 if response.json():
                     if "errorCode" in response.json():
                         if response.json()["errorCode"] == 0:
+                            if self._snapshot is not None:
+                                self._snapshot._remove_schedule(schedule_id)
                             self.refresh()
                         else:
                             raise SDKException("Schedules", "102", response.json()["errorMessage"])
@@ -1519,10 +1656,691 @@ class Schedules:
     def refresh(self) -> None:
         """Refresh the Schedules associated with the Client / Agent / Backupset / Subclient.
 
+        If the Schedules were created from a snapshot, the schedules are read from the
+        snapshot again, and a new snapshot should be taken to get the latest schedules.
+
         Usage:
             schedules.refresh()
         """
-        self.schedules = self._get_schedules()
+        if self._snapshot is not None:
+            self.schedules = self._snapshot.get_schedules(self.class_object)
+        else:
+            self.schedules = self._get_schedules()
+
+
+class ScheduleSnapshot:
+    """Class for a point in time snapshot of all the schedules of the commcell.
+
+    The task details of all the schedules are fetched with a single request, and indexed
+    by the entity each schedule is associated with, by task id and by schedule id, so the
+    schedules of any number of entities can be looked up without a request per entity.
+
+    Schedules are indexed by the entities in the associations of their task details, at the
+    level of the association (client, agent, instance, backupset or subclient). They are not
+    rolled up to the child entities of the association, and the associations with any other
+    entity, e.g. a client group, are not resolved to its members. So the schedules of an
+    entity in the snapshot omit the schedules it inherits, which the request of its
+    schedules may return. Tasks without a supported association are only indexed by task id
+    and schedule id.
+
+    Attributes:
+        schedules (dict): Dictionary of all the schedules of the commcell, by schedule id.
+
+    Usage:
+        # Take a snapshot of the commcell schedules
+        snapshot = commcell.schedules.snapshot()
+
+        # Get the schedules of a subclient from the snapshot
+        subclient_schedules = snapshot.get_schedules(subclient_object)
+    """
+
+    def __init__(self, commcell_object: "Commcell", task_details: List[Dict]) -> None:
+        """Initialise the ScheduleSnapshot from the task details of the commcell schedules.
+
+        Args:
+            commcell_object (object): instance of the Commcell class
+            task_details (list): taskDetail list of the schedules response
+        """
+        self._commcell_object = commcell_object
+        self.schedules = {}
+        self._entity_schedules = {}
+        self._task_schedules = {}
+        self._patterns = {}
+
+        for task_detail in task_details:
+            subtask_dict = Schedules._parse_task_detail(task_detail)
+            task_id = task_detail["task"]["taskId"]
+            task_flags = task_detail["task"].get("taskFlags") or {}
+
+            for subtask in task_detail.get("subTasks", []):
+                if "pattern" in subtask:
+                    self._patterns[subtask["subTask"]["subTaskId"]] = (
+                        subtask["pattern"],
+                        isinstance(task_flags, dict) and bool(task_flags.get("disabled")),
+                    )
+
+            self.schedules.update(subtask_dict)
+            self._task_schedules.setdefault(task_id, {}).update(subtask_dict)
+
+            for association in task_detail.get("associations", []):
+                entity_key = self._get_association_key(association)
+                if entity_key:
+                    self._entity_schedules.setdefault(entity_key, {}).update(subtask_dict)
+
+    def __repr__(self) -> str:
+        """Representation string for the instance of the ScheduleSnapshot class."""
+        return (
+            f"ScheduleSnapshot class instance for Commcell: "
+            f"{self._commcell_object.commserv_name} ({len(self.schedules)} schedules)"
+        )
+
+    def __len__(self) -> int:
+        """Returns the number of schedules in the snapshot."""
+        return len(self.schedules)
+
+    @staticmethod
+    def _get_association_key(association: Dict) -> Optional[Tuple]:
+        """Gets the key of the entity of a schedule association.
+
+        Args:
+            association (dict): association of the task details of a schedule
+
+        Returns:
+            tuple: key of the associated entity, None if the association is not for a
+                client, agent, instance, backupset or subclient
+        """
+        client_id = int(association.get("clientId") or 0)
+        app_id = int(association.get("applicationId") or association.get("appTypeId") or 0)
+
+        if int(association.get("subclientId") or 0):
+            return "subclient", int(association["subclientId"])
+        if int(association.get("backupsetId") or 0):
+            return "backupset", int(association["backupsetId"])
+        if int(association.get("instanceId") or 0):
+            return "instance", int(association["instanceId"])
+        if client_id and app_id:
+            return "agent", client_id, app_id
+        if client_id:
+            return "client", client_id
+        return None
+
+    @staticmethod
+    def get_entity_key(
+        class_object: Union["Client", "Agent", "Instance", "Backupset", "Subclient"],
+    ) -> Tuple:
+        """Gets the key of the entity of a Client / Agent / Instance / Backupset / Subclient.
+
+        Args:
+            class_object (object): instance of the Client / Agent / Instance / Backupset /
+                Subclient class
+
+        Returns:
+            tuple: key of the entity in the snapshot
+
+        Raises:
+            SDKException:
+                if class object does not belong to any of the supported classes
+        """
+        # imports inside the method definition to avoid cyclic imports
+        from .agent import Agent
+        from .backupset import Backupset
+        from .client import Client
+        from .instance import Instance
+        from .subclient import Subclient
+
+        if isinstance(class_object, Subclient):
+            return "subclient", int(class_object.subclient_id)
+        if isinstance(class_object, Backupset):
+            return "backupset", int(class_object.backupset_id)
+        if isinstance(class_object, Instance):
+            return "instance", int(class_object.instance_id)
+        if isinstance(class_object, Agent):
+            return "agent", int(class_object._client_object.client_id), int(class_object.agent_id)
+        if isinstance(class_object, Client):
+            return "client", int(class_object.client_id)
+
+        raise SDKException("Schedules", "101")
+
+    def get_schedules(
+        self, class_object: Union["Client", "Agent", "Instance", "Backupset", "Subclient"]
+    ) -> Dict:
+        """Gets the schedules associated with the entity from the snapshot.
+
+        The schedules inherited from the parent entities or from client groups are omitted.
+
+        Args:
+            class_object (object): instance of the Client / Agent / Instance / Backupset /
+                Subclient class
+
+        Returns:
+            dict: schedules of the entity, in the same format as Schedules.schedules
+
+        Raises:
+            SDKException:
+                if class object does not belong to any of the supported classes
+
+        Usage:
+            schedules_dict = snapshot.get_schedules(subclient_object)
+        """
+        return dict(self._entity_schedules.get(self.get_entity_key(class_object), {}))
+
+    def get_task_schedules(self, task_id: int) -> Dict:
+        """Gets the schedules of the task from the snapshot.
+
+        Args:
+            task_id (int): id of the task
+
+        Returns:
+            dict: schedules of the task, in the same format as Schedules.schedules
+
+        Usage:
+            schedules_dict = snapshot.get_task_schedules(123)
+        """
+        return dict(self._task_schedules.get(task_id, {}))
+
+    def get_schedule(self, schedule_id: int) -> Optional[Dict]:
+        """Gets the details of the schedule from the snapshot.
+
+        Args:
+            schedule_id (int): id of the schedule
+
+        Returns:
+            dict: task id, name, description and task flags of the schedule,
+                None if the schedule is not in the snapshot
+
+        Usage:
+            schedule_dict = snapshot.get_schedule(456)
+        """
+        return self.schedules.get(schedule_id)
+
+    def entity_schedules(
+        self, class_object: Union["Client", "Agent", "Instance", "Backupset", "Subclient"]
+    ) -> "Schedules":
+        """Returns a Schedules object for the entity, served from the snapshot.
+
+        Args:
+            class_object (object): instance of the Client / Agent / Instance / Backupset /
+                Subclient class
+
+        Returns:
+            object: instance of the Schedules class for the entity
+
+        Usage:
+            subclient_schedules = snapshot.entity_schedules(subclient_object)
+            schedule = subclient_schedules.get(schedule_name='daily incremental')
+        """
+        return Schedules(class_object, snapshot=self)
+
+    def forecast(
+        self,
+        start_time: int,
+        end_time: int,
+        time_zone: Optional[str] = None,
+        include_disabled: bool = False,
+    ) -> "ScheduleForecast":
+        """Forecasts the run times of all the schedules in the snapshot, without requests.
+
+        Args:
+            start_time (int): start of the forecast window, in epoch seconds
+
+            end_time (int): end of the forecast window (excluded), in epoch seconds
+
+            time_zone (str): time zone of the schedules without a time zone, like the
+                CommServe time zone
+                default: None, UTC
+
+            include_disabled (bool): whether to forecast the disabled schedules too
+                default: False
+
+        Returns:
+            object: instance of the ScheduleForecast class with the run times of the
+                schedules, by schedule id
+
+        Raises:
+            SDKException:
+                if the window or the time zone is not valid
+
+        Usage:
+            forecast = snapshot.forecast(start_time, start_time + 7 * 86400)
+            peak, peak_time = forecast.peak_concurrency()
+        """
+        forecast = ScheduleForecast(start_time, end_time, time_zone)
+
+        for schedule_id, (pattern, disabled) in self._patterns.items():
+            if include_disabled or not disabled:
+                forecast.add(schedule_id, pattern)
+
+        return forecast
+
+    def _remove_schedule(self, schedule_id: int) -> None:
+        """Removes a deleted schedule from all the indexes of the snapshot.
+
+        Args:
+            schedule_id (int): id of the schedule
+        """
+        self.schedules.pop(schedule_id, None)
+        self._patterns.pop(schedule_id, None)
+
+        for index in (self._entity_schedules, self._task_schedules):
+            for schedules in index.values():
+                schedules.pop(schedule_id, None)
+
+
+class ScheduleForecast:
+    """Class for forecasting the run times of schedules locally, from their patterns.
+
+    The schedule patterns are expanded into the run times of the schedules within the
+    forecast window, without a request per schedule, and the run times of all the schedules
+    can be aggregated to get the number of runs per hour and the peak number of concurrent
+    jobs in the window.
+
+    The start date and time of a pattern are in the time zone of the pattern, which is
+    resolved from its TimeZoneName as an IANA time zone name, or the UTC offset of the
+    Commvault time zone names such as '(UTC-05:00) Eastern Time (US & Canada)'. Patterns
+    without a time zone, or with the CommServe / Client time zone, use the time zone of
+    the forecast.
+
+    Identical patterns are expanded only once, so forecasting thousands of schedules
+    created from a few templates is cheap.
+
+    Automatic, on demand and after job completes schedules have no run times that can be
+    forecast, and are expanded to an empty list.
+
+    Attributes:
+        start_time (int): start of the forecast window, in epoch seconds
+        end_time (int): end of the forecast window (excluded), in epoch seconds
+        run_times (dict): run times of the added schedules, by schedule key
+
+    Usage:
+        forecast = ScheduleForecast(start_time=1735689600, end_time=1736294400)
+        forecast.add(1, {'freq_type': 4, 'active_start_date': 1735689600,
+                         'active_start_time': 75600, 'freq_recurrence_factor': 1})
+        print(forecast.hourly_load())
+        print(forecast.peak_concurrency(duration=7200))
+    """
+
+    # weekday of python (monday is 0) to the weekday bit of the weekly schedules
+    _WEEKDAY_BITS: Dict[int, int] = {0: 2, 1: 4, 2: 8, 3: 16, 4: 32, 5: 64, 6: 1}
+
+    _DEFAULT_TIME_ZONES = ("", "commserve time zone", "client time zone")
+
+    def __init__(self, start_time: int, end_time: int, time_zone: Optional[str] = None) -> None:
+        """Initialise the ScheduleForecast for the given window.
+
+        Args:
+            start_time (int): start of the forecast window, in epoch seconds
+
+            end_time (int): end of the forecast window (excluded), in epoch seconds
+
+            time_zone (str): time zone of the patterns without a time zone
+                default: None, UTC
+
+        Raises:
+            SDKException:
+                if the window or the time zone is not valid
+        """
+        if not isinstance(start_time, int) or not isinstance(end_time, int):
+            raise SDKException("Schedules", "102", "Forecast window should be epoch seconds")
+
+        if end_time <= start_time:
+            raise SDKException("Schedules", "102", "Forecast window end should be after start")
+
+        self.start_time = start_time
+        self.end_time = end_time
+        self.run_times = {}
+
+        self._time_zone = timezone.utc
+        if time_zone:
+            self._time_zone = self._get_time_zone(time_zone)
+            if self._time_zone is None:
+                raise SDKException("Schedules", "102", f"Unknown time zone: {time_zone}")
+
+        self._expanded = {}
+
+    def __repr__(self) -> str:
+        """Representation string for the instance of the ScheduleForecast class."""
+        return (
+            f"ScheduleForecast class instance for the window {self.start_time} - "
+            f"{self.end_time} ({len(self.run_times)} schedules)"
+        )
+
+    @staticmethod
+    @cache
+    def _get_time_zone(time_zone_name: Optional[str]) -> Optional[tzinfo]:
+        """Gets the time zone of a pattern from its time zone name.
+
+        Args:
+            time_zone_name (str): IANA name of the time zone, or Commvault time zone name
+
+        Returns:
+            tzinfo: time zone for the name, None if the time zone can not be resolved
+        """
+        time_zone_name = (time_zone_name or "").strip()
+
+        if time_zone_name.lower() in ScheduleForecast._DEFAULT_TIME_ZONES:
+            return None
+
+        if time_zone_name.upper() in ("UTC", "GMT", "(UTC)"):
+            return timezone.utc
+
+        try:
+            return ZoneInfo(time_zone_name)
+        except (ZoneInfoNotFoundError, ValueError):
+            pass
+
+        match = re.match(r"\((?:UTC|GMT)\s*([+-])(\d{1,2}):(\d{2})\)", time_zone_name)
+        if match:
+            offset = timedelta(hours=int(match.group(2)), minutes=int(match.group(3)))
+            return timezone(-offset if match.group(1) == "-" else offset)
+
+        if re.match(r"\((?:UTC|GMT)\)", time_zone_name):
+            return timezone.utc
+
+        return None
+
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def _to_epoch(run_date: date, seconds: int, time_zone: tzinfo) -> int:
+        """Gets the epoch of the local time of a run in the given time zone.
+
+        Args:
+            run_date (date): local date of the run
+
+            seconds (int): local time of the run, in seconds since midnight
+
+            time_zone (tzinfo): time zone of the run
+
+        Returns:
+            int: epoch of the run
+        """
+        local_time = datetime.combine(run_date, datetime.min.time()) + timedelta(seconds=seconds)
+        return int(local_time.replace(tzinfo=time_zone).timestamp())
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _relative_date(year: int, month: int, relative: int, weekday: int) -> Optional[date]:
+        """Gets the date of a relative day of the month, like the second monday.
+
+        Args:
+            year (int): year of the date
+
+            month (int): month of the date
+
+            relative (int): 1 - 4 for the first to the fourth day, 5 for the last day
+
+            weekday (int): 1 - 7 for sunday to saturday, 8 for any day, 9 for a weekday,
+                10 for a weekend day
+
+        Returns:
+            date: the relative date, None if the month does not have the relative day
+        """
+        days = [
+            date(year, month, day) for day in range(1, calendar.monthrange(year, month)[1] + 1)
+        ]
+
+        if 1 <= weekday <= 7:
+            days = [day for day in days if day.weekday() == (weekday - 2) % 7]
+        elif weekday == 9:
+            days = [day for day in days if day.weekday() < 5]
+        elif weekday == 10:
+            days = [day for day in days if day.weekday() >= 5]
+        elif weekday != 8:
+            return None
+
+        if relative == 5:
+            return days[-1]
+        if 1 <= relative <= len(days):
+            return days[relative - 1]
+        return None
+
+    @classmethod
+    def _runs_on(cls, pattern: Dict, run_date: date, start_date: date) -> bool:
+        """Checks if a day based schedule pattern runs on the given date.
+
+        Args:
+            pattern (dict): pattern of the schedule
+
+            run_date (date): local date to check
+
+            start_date (date): local start date of the pattern
+
+        Returns:
+            bool: True if the pattern runs on the date, False otherwise
+        """
+        freq_type = pattern["freq_type"]
+        recurrence = max(int(pattern.get("freq_recurrence_factor") or 1), 1)
+        interval = int(pattern.get("freq_interval") or 0)
+        months = (run_date.year - start_date.year) * 12 + run_date.month - start_date.month
+
+        if freq_type == 4:
+            return (run_date - start_date).days % recurrence == 0
+
+        if freq_type == 8:
+            if not interval & cls._WEEKDAY_BITS[run_date.weekday()]:
+                return False
+            # weeks of the weekly schedules start on sunday
+            run_week = run_date - timedelta(days=(run_date.weekday() + 1) % 7)
+            start_week = start_date - timedelta(days=(start_date.weekday() + 1) % 7)
+            return ((run_week - start_week).days // 7) % recurrence == 0
+
+        if freq_type in (16, 32) and months % recurrence:
+            return False
+
+        if freq_type in (64, 128) and run_date.month != recurrence:
+            return False
+
+        if freq_type in (16, 64):
+            # days after the end of the month run on the last day of the month
+            last_day = calendar.monthrange(run_date.year, run_date.month)[1]
+            return run_date.day == min(max(interval, 1), last_day)
+
+        if freq_type in (32, 128):
+            relative_date = cls._relative_date(
+                run_date.year,
+                run_date.month,
+                int(pattern.get("freq_relative_interval") or 1),
+                interval,
+            )
+            return run_date == relative_date
+
+        return False
+
+    def _expand_pattern(self, pattern: Dict) -> List[int]:
+        """Expands the schedule pattern into its run times within the forecast window.
+
+        Args:
+            pattern (dict): pattern of the schedule
+
+        Returns:
+            list: run times of the schedule within the window, in epoch seconds
+        """
+        freq_type = pattern.get("freq_type")
+        if freq_type not in (1, 4, 8, 16, 32, 64, 128, 4096):
+            return []
+
+        time_zone = (
+            self._get_time_zone((pattern.get("timeZone") or {}).get("TimeZoneName"))
+            or self._time_zone
+        )
+        start_date = datetime.fromtimestamp(
+            int(pattern.get("active_start_date") or 0), timezone.utc
+        ).date()
+        start_seconds = int(pattern.get("active_start_time") or 0)
+        end_date = None
+        if pattern.get("active_end_date"):
+            end_date = datetime.fromtimestamp(int(pattern["active_end_date"]), timezone.utc).date()
+        max_runs = int(pattern.get("active_end_occurence") or 0)
+
+        first_run = self._to_epoch(start_date, start_seconds, time_zone)
+
+        if freq_type == 1:
+            return [first_run] if self.start_time <= first_run < self.end_time else []
+
+        if freq_type == 4096:
+            step = max(int(pattern.get("freq_interval") or 30), 1) * 60
+            end_time = self.end_time
+            if end_date is not None:
+                end_time = min(
+                    end_time, self._to_epoch(end_date + timedelta(days=1), 0, time_zone)
+                )
+
+            index = max(0, -(-(self.start_time - first_run) // step))
+            if max_runs:
+                end_time = min(end_time, first_run + max_runs * step)
+            return list(range(first_run + index * step, end_time, step))
+
+        day_times = [start_seconds]
+        subday_interval = int(pattern.get("freq_subday_interval") or 0)
+        if subday_interval > 0:
+            end_seconds = int(pattern.get("active_end_time") or 0)
+            if end_seconds <= start_seconds:
+                end_seconds = 86399
+            day_times = list(range(start_seconds, end_seconds + 1, subday_interval))
+
+        exceptions = 0
+        for repeat_pattern in pattern.get("repeatPattern") or []:
+            if repeat_pattern.get("exception"):
+                exceptions |= int(repeat_pattern.get("onDayNumber") or 0)
+
+        # local dates of the window, with a day of margin for the time zone offsets
+        window_start = datetime.fromtimestamp(self.start_time, timezone.utc).date()
+        window_end = datetime.fromtimestamp(self.end_time, timezone.utc).date()
+        run_date = start_date if max_runs else max(start_date, window_start - timedelta(days=1))
+        last_date = window_end + timedelta(days=1)
+        if end_date is not None:
+            last_date = min(last_date, end_date)
+
+        run_times = []
+        runs = 0
+        while run_date <= last_date:
+            if not exceptions >> (run_date.day - 1) & 1 and self._runs_on(
+                pattern, run_date, start_date
+            ):
+                for seconds in day_times:
+                    run_time = self._to_epoch(run_date, seconds, time_zone)
+                    if run_time < first_run:
+                        continue
+
+                    runs += 1
+                    if max_runs and runs > max_runs:
+                        return run_times
+
+                    if self.start_time <= run_time < self.end_time:
+                        run_times.append(run_time)
+
+            run_date += timedelta(days=1)
+
+        return run_times
+
+    def expand(self, pattern: Dict) -> List[int]:
+        """Expands the schedule pattern into its run times within the forecast window.
+
+        Args:
+            pattern (dict): pattern of the schedule, as in the task details of the schedule
+
+        Returns:
+            list: sorted run times of the schedule within the window, in epoch seconds
+
+        Usage:
+            run_times = forecast.expand(schedule._pattern)
+        """
+        pattern_key = json.dumps(pattern, sort_keys=True, default=str)
+
+        if pattern_key not in self._expanded:
+            self._expanded[pattern_key] = self._expand_pattern(pattern)
+
+        return list(self._expanded[pattern_key])
+
+    def add(self, schedule_key: Any, pattern: Dict) -> List[int]:
+        """Adds a schedule to the forecast.
+
+        Args:
+            schedule_key (any): key of the schedule in the forecast, like the schedule id
+
+            pattern (dict): pattern of the schedule, as in the task details of the schedule
+
+        Returns:
+            list: sorted run times of the schedule within the window, in epoch seconds
+
+        Usage:
+            forecast.add(schedule.schedule_id, schedule._pattern)
+        """
+        self.run_times[schedule_key] = self.expand(pattern)
+        return self.run_times[schedule_key]
+
+    def next_run_time(self, schedule_key: Any) -> Optional[int]:
+        """Gets the first run time of the schedule within the forecast window.
+
+        Args:
+            schedule_key (any): key of the schedule in the forecast
+
+        Returns:
+            int: first run time of the schedule, None if it does not run in the window
+
+        Usage:
+            next_run = forecast.next_run_time(schedule_id)
+        """
+        run_times = self.run_times.get(schedule_key)
+        return run_times[0] if run_times else None
+
+    def hourly_load(self, interval: int = 3600) -> Dict[int, int]:
+        """Gets the number of runs of all the schedules in the forecast, per interval.
+
+        Args:
+            interval (int): length of the intervals, in seconds
+                default: 3600
+
+        Returns:
+            dict: number of runs, by the start epoch of the interval, for the intervals
+                with at least one run
+
+        Usage:
+            for hour, runs in forecast.hourly_load().items():
+                print(hour, runs)
+        """
+        load = Counter(
+            run_time - (run_time - self.start_time) % interval
+            for run_times in self.run_times.values()
+            for run_time in run_times
+        )
+        return dict(sorted(load.items()))
+
+    def peak_concurrency(self, duration: Union[int, Dict[Any, int]] = 3600) -> Tuple[int, int]:
+        """Gets the peak number of concurrent jobs of all the schedules in the forecast.
+
+        Args:
+            duration (int / dict): expected duration of the jobs, in seconds, or a dict of
+                the expected duration of the jobs by schedule key
+                default: 3600
+
+        Returns:
+            tuple: peak number of concurrent jobs, and the epoch at which the peak starts,
+                (0, None) if no jobs run in the window
+
+        Usage:
+            peak, peak_time = forecast.peak_concurrency(duration={schedule_id: 7200})
+        """
+        events = []
+        for schedule_key, run_times in self.run_times.items():
+            if isinstance(duration, dict):
+                job_duration = duration.get(schedule_key, 3600)
+            else:
+                job_duration = duration
+
+            for run_time in run_times:
+                events.append((run_time, 1))
+                events.append((run_time + job_duration, -1))
+
+        # jobs ending at a time are removed before the jobs starting at that time
+        events.sort()
+
+        peak, peak_time, running = 0, None, 0
+        for event_time, change in events:
+            running += change
+            if running > peak:
+                peak, peak_time = running, event_time
+
+        return peak, peak_time
 
 
 class Schedule:
@@ -2507,6 +3325,33 @@ class Schedule:
         self._pattern = schedule_pattern.create_schedule_pattern(pattern_json)
         self._modify_task_properties()
 
+    def get_run_times(
+        self, start_time: int, end_time: int, time_zone: Optional[str] = None
+    ) -> List[int]:
+        """
+        gets the run times of the schedule within the window, forecast from its pattern
+        without a request to the server
+
+        Args:
+            start_time (int): start of the window, in epoch seconds
+
+            end_time (int): end of the window (excluded), in epoch seconds
+
+            time_zone (str): time zone to use if the pattern has no time zone
+                default: None, UTC
+
+        Returns:
+            (list): run times of the schedule, in epoch seconds
+
+        Raises:
+            SDKException:
+                if the window or the time zone is not valid
+
+        Usage:
+            run_times = schedule.get_run_times(start_time, start_time + 86400)
+        """
+        return ScheduleForecast(start_time, end_time, time_zone).expand(self._pattern)
+
     def run_now(self, return_multiple_jobs: bool = False) -> str:
         """
         Triggers the schedule to run immediately
@@ -42,6 +42,8 @@ Subclients:
 
     _process_add_request()      --  to post the add client request
 
+    _get_subclient_object()     --  builds the subclient object of a listed subclient
+
     default_subclient()         --  returns the name of the default subclient
 
     all_subclients()            --  returns dict of all the subclients on commcell
@@ -62,6 +64,12 @@ Subclients:
 
     get(subclient_name)         --  returns the subclient object of the input subclient name
 
+    iter_objects()              --  builds the subclient objects of all the subclients
+    concurrently, yielding them in order
+
+    get_all()                   --  returns the subclient objects of all the subclients, built
+    concurrently
+
     delete(subclient_name)      --  deletes the subclient (subclient name) from the backupset
 
     refresh()                   --  refresh the subclients associated with the Backupset / Instance
@@ -76,6 +84,8 @@ Subclient:
 
     __repr__()                  --  return the subclient name, the instance is associated with
 
+    _from_properties()          --  creates the subclient object from its fetched properties
+
     _get_subclient_id()         --  method to get subclient id, if not specified in __init__ method
 
     _get_subclient_properties() --  get the properties of this subclient
@@ -103,6 +113,8 @@ Subclient:
 
     update_properties()         --  To update the subclient properties
 
+    properties_copy()           --  returns a deep copy of the properties of the subclient
+
     description()               --  update the description of the subclient
 
     content()                   --  update the content of the subclient
@@ -135,6 +147,14 @@ Subclient:
 
     find()                      --  searches a given file/folder name in the subclient content
 
+    iter_browse()               --  gets the content of the backup for this subclient page by page
+
+    iter_find()                 --  searches the subclient content page by page
+
+    walk()                      --  walks the backed up directory tree of the subclient
+
+    aggregate()                 --  gets the count and size of the backed up files of the subclient
+
     list_media()                --  List media required to browse and restore backed up data from the backupset
 
     restore_in_place()          --  Restores the files/folders specified in the
@@ -172,6 +192,9 @@ Subclient Instance Attributes:
 
     **is_blocklevel_backup_enabled**    --  returns True if block level backup is enabled
 
+    **schedules**                       --  returns the schedules of the subclient, fetched
+    on first access
+
 """
 
 from __future__ import annotations
@@ -180,10 +203,13 @@ import copy
 import math
 import time
 from base64 import b64encode
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Union
 
 from .exception import SDKException
 from .job import Job, JobController
+from .properties_view import PropertiesView, to_plain
 from .schedules import SchedulePattern, Schedules
 
 
@@ -272,6 +298,7 @@ class Subclients:
         self._ADD_SUBCLIENT = self._services["ADD_SUBCLIENT"]
 
         self._default_subclient = None
+        self._subclients_properties = {}
 
         # sql server subclient type dict
         self._sqlsubclient_type_dict = {
@@ -439,6 +466,7 @@ class Subclients:
         if flag:
             if response.json() and "subClientProperties" in response.json():
                 return_dict = {}
+                properties_dict = {}
 
                 for dictionary in response.json()["subClientProperties"]:
                     # store the agent, instance, and backupset name for the current subclient
@@ -462,6 +490,7 @@ class Subclients:
                             temp_id = str(dictionary["subClientEntity"]["subclientId"]).lower()
 
                             return_dict[temp_name] = {"id": temp_id, "backupset": backupset}
+                            properties_dict[temp_name] = dictionary
 
                             if dictionary["commonProperties"].get("isDefaultSubclient"):
                                 self._default_subclient = temp_name
@@ -478,6 +507,7 @@ class Subclients:
                                 temp_name = f"{backupset}\\{temp_name}"
 
                             return_dict[temp_name] = {"id": temp_id, "backupset": backupset}
+                            properties_dict[temp_name] = dictionary
 
                             if dictionary["commonProperties"].get("isDefaultSubclient"):
                                 self._default_subclient = temp_name
@@ -497,10 +527,14 @@ class Subclients:
                                     temp_name = f"{backupset}\\{temp_name}"
 
                             return_dict[temp_name] = {"id": temp_id, "backupset": backupset}
+                            properties_dict[temp_name] = dictionary
 
                             if dictionary["commonProperties"].get("isDefaultSubclient"):
                                 self._default_subclient = temp_name
 
+                # the full properties of the subclients are kept to build the subclient
+                # objects in bulk without a request per subclient
+                self._subclients_properties = properties_dict
                 return return_dict
             else:
                 raise SDKException("Response", "102")
@@ -1352,6 +1386,118 @@ class Subclients:
                 "Subclient", "102", f"No subclient exists with name: {subclient_name}"
             )
 
+    def _get_subclient_object(
+        self, subclient_name: str, backupset_objects: dict, prefetch_properties: bool
+    ) -> Subclient:
+        """Build the Subclient object of a subclient listed in this collection.
+
+        Args:
+            subclient_name: The name of the subclient, as listed in `all_subclients`.
+            backupset_objects: Backupset objects of the subclients, by backupset name.
+            prefetch_properties: Whether to build the subclient from the properties of the
+                subclients list call, instead of getting its properties again.
+
+        Returns:
+            Subclient: An instance of the Subclient class for the subclient.
+
+        #ai-gen-doc
+        """
+        subclient = self._subclients[subclient_name]
+        backupset_object = backupset_objects[subclient["backupset"]]
+        subclient_properties = self._subclients_properties.get(subclient_name)
+
+        if prefetch_properties and subclient_properties:
+            return Subclient._from_properties(
+                backupset_object, subclient_name, subclient["id"], subclient_properties
+            )
+
+        return Subclient(backupset_object, subclient_name, subclient["id"])
+
+    def iter_objects(
+        self, max_workers: int = 8, prefetch_properties: bool = True
+    ) -> Iterator[Subclient]:
+        """Build the Subclient objects of all the subclients concurrently, yielding them in order.
+
+        The ids and the full properties of the subclients are taken from the subclients list
+        call of this collection, so building a subclient does not need a request to get its
+        id or its properties. The schedules of the subclients are fetched on first access.
+
+        Args:
+            max_workers: Maximum number of subclient objects built concurrently. Default is 8.
+            prefetch_properties: Whether to build the subclients from the properties of the
+                subclients list call. Set to False to get the properties of each subclient
+                with its own request. Default is True.
+
+        Returns:
+            Iterator over the Subclient objects, in the order of `all_subclients`.
+
+        Raises:
+            SDKException: If max_workers is not a positive integer, or if a subclient object
+                could not be built.
+
+        Example:
+            >>> for subclient in backupset.subclients.iter_objects(max_workers=16):
+            ...     print(subclient.subclient_name, subclient.storage_policy)
+
+        #ai-gen-doc
+        """
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise SDKException("Subclient", "101", "max_workers should be a positive integer")
+
+        subclient_names = list(self._subclients)
+
+        # backupsets of the subclients are resolved once, instead of once per subclient
+        backupset_objects = {}
+        for subclient_name in subclient_names:
+            backupset_name = self._subclients[subclient_name]["backupset"]
+            if backupset_name not in backupset_objects:
+                if self._backupset_object is not None:
+                    backupset_objects[backupset_name] = self._backupset_object
+                else:
+                    backupset_objects[backupset_name] = self._instance_object.backupsets.get(
+                        backupset_name
+                    )
+
+        def _iter_objects() -> Iterator[Subclient]:
+            if not subclient_names:
+                return
+
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(subclient_names))
+            ) as executor:
+                yield from executor.map(
+                    lambda name: self._get_subclient_object(
+                        name, backupset_objects, prefetch_properties
+                    ),
+                    subclient_names,
+                )
+
+        return _iter_objects()
+
+    def get_all(self, max_workers: int = 8, prefetch_properties: bool = True) -> dict:
+        """Build the Subclient objects of all the subclients concurrently.
+
+        Args:
+            max_workers: Maximum number of subclient objects built concurrently. Default is 8.
+            prefetch_properties: Whether to build the subclients from the properties of the
+                subclients list call. Default is True.
+
+        Returns:
+            dict: The Subclient objects, by subclient name, in the order of `all_subclients`.
+
+        Raises:
+            SDKException: If max_workers is not a positive integer, or if a subclient object
+                could not be built.
+
+        Example:
+            >>> subclients = backupset.subclients.get_all()
+            >>> disabled = [name for name, sc in subclients.items() if not sc.is_backup_enabled]
+
+        #ai-gen-doc
+        """
+        subclient_names = list(self._subclients)
+        return dict(zip(subclient_names, self.iter_objects(max_workers, prefetch_properties)))
+
     def delete(self, subclient_name: str) -> None:
         """Delete a subclient from the backupset by its name.
 
@@ -1652,7 +1798,7 @@ class Subclient:
         self._subclient_properties = {}
         self._content = []
 
-        self.schedules = None
+        self._schedules = None
         self.refresh()
 
     def __getattr__(self, attribute: str) -> object:
@@ -1698,6 +1844,38 @@ class Subclient:
             self.subclient_name, self._backupset_object.backupset_name
         )
 
+    @classmethod
+    def _from_properties(
+        cls,
+        backupset_object: object,
+        subclient_name: str,
+        subclient_id: str,
+        subclient_properties: dict,
+    ) -> Subclient:
+        """Create a Subclient object from the properties of the subclient already fetched.
+
+        The object is initialized as with `Subclient(backupset_object, subclient_name,
+        subclient_id)`, except that the given properties are used instead of getting the
+        properties of the subclient with a request. Later calls to `refresh()` get the
+        properties from the Commcell.
+
+        Args:
+            backupset_object: Instance of the Backupset class to which this subclient belongs.
+            subclient_name: Name of the subclient.
+            subclient_id: ID of the subclient.
+            subclient_properties: Full properties of the subclient, as returned in the
+                subClientProperties of the subclients list call.
+
+        Returns:
+            Subclient: An instance of the Subclient class for the agent of the backupset.
+
+        #ai-gen-doc
+        """
+        subclient = cls.__new__(cls, backupset_object, subclient_name, subclient_id)
+        subclient._prefetched_properties = subclient_properties
+        subclient.__init__(backupset_object, subclient_name, subclient_id)
+        return subclient
+
     def _get_subclient_id(self) -> str:
         """Retrieve the subclient ID associated with the specified backupset and client.
 
@@ -1732,28 +1910,33 @@ class Subclient:
         #ai-gen-doc
         """
 
-        flag, response = self._cvpysdk_object.make_request("GET", self._SUBCLIENT)
+        # properties given by the subclients list call are used only once, on initialization
+        subclient_properties = self.__dict__.pop("_prefetched_properties", None)
 
-        if flag:
-            if response.json() and "subClientProperties" in response.json():
-                self._subclient_properties = response.json()["subClientProperties"][0]
+        if subclient_properties is None:
+            flag, response = self._cvpysdk_object.make_request("GET", self._SUBCLIENT)
 
-                if "commonProperties" in self._subclient_properties:
-                    self._commonProperties = self._subclient_properties["commonProperties"]
+            if not flag:
+                raise SDKException("Response", "101", self._update_response_(response.text))
 
-                if "subClientEntity" in self._subclient_properties:
-                    self._subClientEntity = self._subclient_properties["subClientEntity"]
+            if not (response.json() and "subClientProperties" in response.json()):
+                raise SDKException("Response", "102")
 
-                if "proxyClient" in self._subclient_properties:
-                    self._proxyClient = self._subclient_properties["proxyClient"]
+            subclient_properties = response.json()["subClientProperties"][0]
 
-                if "planEntity" in self._subclient_properties:
-                    self._planEntity = self._subclient_properties["planEntity"]
+        self._subclient_properties = subclient_properties
 
-            else:
-                raise SDKException("Response", "102")
-        else:
-            raise SDKException("Response", "101", self._update_response_(response.text))
+        if "commonProperties" in self._subclient_properties:
+            self._commonProperties = self._subclient_properties["commonProperties"]
+
+        if "subClientEntity" in self._subclient_properties:
+            self._subClientEntity = self._subclient_properties["subClientEntity"]
+
+        if "proxyClient" in self._subclient_properties:
+            self._proxyClient = self._subclient_properties["proxyClient"]
+
+        if "planEntity" in self._subclient_properties:
+            self._planEntity = self._subclient_properties["planEntity"]
 
     def _set_subclient_properties(self, attr_name: str, value: str) -> None:
         """Set a property of the subclient and update its value upon a successful POST call.
@@ -1917,6 +2100,8 @@ class Subclient:
         if flag:
             if response.json():
                 if "jobIds" in response.json():
+                    self._backupset_object.invalidate_browse_cache(self._subclient_id)
+
                     if len(response.json()["jobIds"]) == 1:
                         return Job(self._commcell_object, response.json()["jobIds"][0])
                     else:
@@ -2116,8 +2301,8 @@ class Subclient:
 
         This method updates the subclient's configuration by applying the changes specified
         in the `properties_dict`. To modify subclient properties safely, obtain a deep copy
-        of the current properties using `self.properties`, update the desired fields, and
-        then pass the modified dictionary to this method.
+        of the current properties using `self.properties_copy()`, update the desired fields,
+        and then pass the modified dictionary to this method.
 
         Args:
             properties_dict: A dictionary containing the subclient properties to update.
@@ -2128,7 +2313,7 @@ class Subclient:
 
         Example:
             >>> # Get a deep copy of current properties
-            >>> props = subclient.properties
+            >>> props = subclient.properties_copy()
             >>> # Modify a property
             >>> props['commonProperties']['description'] = "Updated description"
             >>> # Update the subclient with new properties
@@ -2136,6 +2321,7 @@ class Subclient:
 
         #ai-gen-doc
         """
+        properties_dict = to_plain(properties_dict)
         request_json = {"subClientProperties": {}}
 
         request_json["subClientProperties"].update(properties_dict)
@@ -2160,11 +2346,15 @@ class Subclient:
             )
 
     @property
-    def properties(self) -> dict:
-        """Get the properties of the subclient.
+    def properties(self) -> PropertiesView:
+        """Get a read-only view of the properties of the subclient.
+
+        The view reads the current properties without copying them. Use `properties_copy()`
+        to get a dictionary which can be modified and passed to `update_properties()`.
 
         Returns:
-            dict: A dictionary containing the subclient's properties and configuration details.
+            PropertiesView: A read-only mapping of the subclient's properties and configuration
+                details.
 
         Example:
             >>> subclient = Subclient()
@@ -2172,6 +2362,21 @@ class Subclient:
             >>> print(props)
             {'subclientName': 'default', 'backupSetName': 'BackupSet1', ...}
 
+        #ai-gen-doc
+        """
+        return PropertiesView(self._subclient_properties)
+
+    def properties_copy(self) -> dict:
+        """Get a deep copy of the properties of the subclient, which can be modified.
+
+        Returns:
+            dict: A deep copy of the subclient's properties.
+
+        Example:
+            >>> props = subclient.properties_copy()
+            >>> props['commonProperties']['description'] = "Updated description"
+            >>> subclient.update_properties(props)
+
         #ai-gen-doc
         """
         return copy.deepcopy(self._subclient_properties)
@@ -2236,7 +2441,7 @@ class Subclient:
             >>> # The subclient's display name is now set to "Critical Data Subclient"
         #ai-gen-doc
         """
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         update_properties["subClientEntity"]["subclientName"] = display_name
         self.update_properties(update_properties)
 
@@ -3027,7 +3232,7 @@ class Subclient:
 
         properties_dict = {"clientName": proxy_name}
 
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         update_properties["commonProperties"]["snapCopyInfo"]["snapToTapeProxyToUse"] = (
             properties_dict
         )
@@ -3048,7 +3253,7 @@ class Subclient:
         """
 
         properties_dict = {"clientId": 0}
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         update_properties["commonProperties"]["snapCopyInfo"]["snapToTapeProxyToUse"] = (
             properties_dict
         )
@@ -3066,7 +3271,7 @@ class Subclient:
 
         properties_dict = {"clientName": proxy_name}
 
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         update_properties["commonProperties"]["snapCopyInfo"]["separateProxyForSnapToTape"] = (
             properties_dict
         )
@@ -3076,7 +3281,7 @@ class Subclient:
         """method to unset separate proxy server for backup copy for IntelliSnap subclient"""
 
         properties_dict = {"clientId": 0}
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         update_properties["commonProperties"]["snapCopyInfo"]["separateProxyForSnapToTape"] = (
             properties_dict
         )
@@ -3282,6 +3487,120 @@ class Subclient:
 
         return self._backupset_object.find(options)
 
+    def iter_browse(self, *args: Any, **kwargs: Any) -> Iterator[tuple[str, dict]]:
+        """Browse the content of the Subclient page by page, yielding the items lazily.
+
+        Accepts the same options as `browse`, along with `page_size` (default 1000) and
+        `prefetch` (default True). Refer to `Backupset.iter_browse` for details.
+
+        Returns:
+            Iterator of (path, metadata) tuples, with the same metadata as returned by `browse`.
+
+        Example:
+            >>> for path, metadata in subclient.iter_browse(path='c:\\hello'):
+            ...     print(path, metadata['size'])
+
+        #ai-gen-doc
+        """
+        if args and isinstance(args[0], dict):
+            options = args[0]
+        else:
+            options = kwargs
+
+        options["_subclient_id"] = self._subclient_id
+
+        return self._backupset_object.iter_browse(options)
+
+    def iter_find(self, *args: Any, **kwargs: Any) -> Iterator[tuple[str, dict]]:
+        """Search the backed up content of the subclient page by page, yielding the items lazily.
+
+        Accepts the same filter options as `find`, along with `page_size` (default 1000) and
+        `prefetch` (default True). Refer to `Backupset.iter_find` for details.
+
+        Returns:
+            Iterator of (path, metadata) tuples, with the same metadata as returned by `find`.
+
+        Example:
+            >>> for path, metadata in subclient.iter_find(file_name='*.pst'):
+            ...     print(path)
+
+        #ai-gen-doc
+        """
+        if args and isinstance(args[0], dict):
+            options = args[0]
+        else:
+            options = kwargs
+
+        options["_subclient_id"] = self._subclient_id
+
+        return self._backupset_object.iter_find(options)
+
+    def walk(
+        self,
+        top: str = "\\",
+        max_depth: int | None = None,
+        max_workers: int = 4,
+        onerror: Callable[[SDKException], None] | None = None,
+        **options: Any,
+    ) -> Iterator[tuple[str, list[str], list[str]]]:
+        """Walk the backed up directory tree of the subclient, similar to `os.walk`.
+
+        The folders are browsed concurrently, with up to `max_workers` browse requests in
+        flight. Refer to `Backupset.walk` for details.
+
+        Args:
+            top: The backed up path to start walking from. Default is the root.
+            max_depth: Maximum depth of the folders to browse below `top`. Default is None.
+            max_workers: Maximum number of concurrent browse requests. Default is 4.
+            onerror: Function called with the SDKException of a folder that failed to browse.
+            **options: Browse options applied to each folder.
+
+        Returns:
+            Iterator of (dirpath, dirnames, filenames) tuples, one for each folder.
+
+        Example:
+            >>> for dirpath, dirnames, filenames in subclient.walk('c:\\data'):
+            ...     print(dirpath, filenames)
+
+        #ai-gen-doc
+        """
+        options["_subclient_id"] = self._subclient_id
+
+        return self._backupset_object.walk(top, max_depth, max_workers, onerror, **options)
+
+    def aggregate(
+        self,
+        path: str = "\\",
+        group_by: str | None = None,
+        groups: list | None = None,
+        max_workers: int = 4,
+        **options: Any,
+    ) -> dict:
+        """Get the count and total size of the backed up files of the subclient, without listing them.
+
+        The values are optionally grouped by 'folder', 'extension' or 'mtime'. Refer to
+        `Backupset.aggregate` for details.
+
+        Args:
+            path: The backed up folder to aggregate the files of, recursively.
+            group_by: How to group the files: None, 'folder', 'extension' or 'mtime'.
+            groups: The folder names, file extensions or modification time bucket boundaries.
+            max_workers: Maximum number of concurrent aggregate requests. Default is 4.
+            **options: Browse options for the requests.
+
+        Returns:
+            Dictionary with the 'count' and 'size' of the files, or of each group.
+
+        Example:
+            >>> subclient.aggregate('c:\\data', group_by='folder')
+            {'logs': {'count': 12, 'size': 4096}, 'reports': {'count': 3, 'size': 1024}}
+
+        #ai-gen-doc
+        """
+        options["_subclient_id"] = self._subclient_id
+
+        return self._backupset_object.aggregate(path, group_by, groups, max_workers, **options)
+
     def list_media(self, *args: Any, **kwargs: Any) -> list[Any] | dict[str, Any]:
         """List the media required to browse and restore backed up data from the subclient.
 
@@ -3719,7 +4038,28 @@ class Subclient:
         #ai-gen-doc
         """
         self._get_subclient_properties()
-        self.schedules = Schedules(self)
+        self._schedules = None
+
+    @property
+    def schedules(self) -> Schedules:
+        """Get the Schedules instance configured for this Subclient.
+
+        The schedules are fetched when the property is first accessed after the subclient
+        is initialized or refreshed.
+
+        Returns:
+            Schedules: An object representing all schedules associated with the subclient.
+
+        Example:
+            >>> schedules = subclient.schedules  # Access schedules property
+            >>> print(f"Schedules object: {schedules}")
+
+        #ai-gen-doc
+        """
+        if self._schedules is None:
+            self._schedules = Schedules(self)
+
+        return self._schedules
 
     @property
     def software_compression(self) -> bool:
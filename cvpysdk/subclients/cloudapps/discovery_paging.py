@@ -0,0 +1,145 @@
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""Helper file for streaming the discovered content of the cloud apps clients, page by page.
+
+iter_cloud_discovery is the only function defined in this file.
+
+iter_cloud_discovery():     returns a generator over the records discovered for a cloud apps
+client, fetching the pages of the CLOUD_DISCOVERY API concurrently
+
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from ...exception import SDKException
+
+if TYPE_CHECKING:
+    from ...cvpysdk import CVPySDK
+
+MAX_DISCOVERY_PAGES = 10000
+"""Hard limit on the number of pages fetched for one discovery listing."""
+
+
+def iter_cloud_discovery(
+    cvpysdk_object: CVPySDK,
+    update_response: Callable[[str], str],
+    discover_url: str,
+    records_key: str,
+    page_size: int = 500,
+    max_workers: int = 4,
+    max_pages: int = MAX_DISCOVERY_PAGES,
+) -> Iterator[dict]:
+    """Stream the records discovered for a cloud apps client, page by page.
+
+    The first page is fetched to get the total number of records from its `pagingInfo`, and
+    the remaining pages are then fetched concurrently by a bounded pool of threads, and
+    yielded in order. If the total is not returned, the pages are fetched one after the
+    other, until a page has less records than the page size. The listing stops on a page
+    without the records key, and after `max_pages` pages.
+
+    Args:
+        cvpysdk_object: Instance of the CVPySDK class, to send the requests with.
+        update_response: Function returning the error message of a failed response.
+        discover_url: URL of the CLOUD_DISCOVERY API, with the discovery type if needed.
+        records_key: Key of the records in the response, e.g. "userAccounts".
+        page_size: Number of records fetched with each request. Default is 500.
+        max_workers: Maximum number of pages fetched concurrently. Default is 4.
+        max_pages: Maximum number of pages to fetch. Default is MAX_DISCOVERY_PAGES.
+
+    Returns:
+        Iterator[dict]: Generator over the discovered records.
+
+    Raises:
+        SDKException: If any of the inputs is not valid, or the response of a page is not
+            success.
+
+    Example:
+        >>> users = iter_cloud_discovery(
+        ...     commcell._cvpysdk_object, commcell._update_response_,
+        ...     f"{discover_url}&eDiscoverType=8", "userAccounts"
+        ... )
+        >>> for user in users:
+        ...     print(user['smtpAddress'])
+
+    #ai-gen-doc
+    """
+    for value in (page_size, max_workers, max_pages):
+        if not isinstance(value, int) or value < 1:
+            raise SDKException("Subclient", "101")
+
+    def get_page(page: int) -> tuple[list | None, int | None]:
+        """Gets the records of a page, and the total number of records"""
+        flag, response = cvpysdk_object.make_request(
+            "GET", f"{discover_url}&pageSize={page_size}&offset={page}"
+        )
+
+        if not flag:
+            raise SDKException("Response", "101", update_response(response.text))
+
+        response_json = response.json() if response else None
+        if not response_json:
+            return None, None
+
+        total = response_json.get("pagingInfo", {}).get("totalRecords")
+        return response_json.get(records_key), total
+
+    def generator() -> Iterator[dict]:
+        """Yields the records of the pages"""
+        records, total = get_page(0)
+        if not records:
+            return
+
+        yield from records
+
+        if isinstance(total, int) and total >= 0:
+            pages = min(-(-total // page_size), max_pages)
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pending = deque()
+                next_page = 1
+                try:
+                    while pending or next_page < pages:
+                        while next_page < pages and len(pending) < max_workers:
+                            pending.append(executor.submit(get_page, next_page))
+                            next_page += 1
+
+                        records, _ = pending.popleft().result()
+                        if not records:
+                            return
+
+                        yield from records
+                finally:
+                    for future in pending:
+                        future.cancel()
+            return
+
+        # the total is not known, fetch the pages one after the other
+        page = 1
+        while len(records) >= page_size and page < max_pages:
+            records, _ = get_page(page)
+            if not records:
+                return
+
+            yield from records
+            page += 1
+
+    return generator()
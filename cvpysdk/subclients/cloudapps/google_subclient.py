@@ -65,6 +65,8 @@ GoogleSubclient:
 
     browse_content()                    --  Fetches discovered content based on discovery type
 
+    iter_discovered_content()           --  Streams discovered content, fetching the pages concurrently
+
     verify_groups_discovery()           --  Verifies that groups discovery is complete
 
     search_for_shareddrive()            --  Searches for a specific shared drive details from discovered list
@@ -92,6 +94,7 @@ from __future__ import annotations
 
 import copy
 import time
+from collections.abc import Iterator
 from typing import Any, Dict, List, Optional
 
 from cvpysdk.job import Job
@@ -100,6 +103,7 @@ from ...constants import AppIDAType
 from ...exception import SDKException
 from ..casubclient import CloudAppsSubclient
 from . import google_constants as constants
+from .discovery_paging import iter_cloud_discovery
 
 
 class GoogleSubclient(CloudAppsSubclient):
@@ -837,44 +841,58 @@ class GoogleSubclient(CloudAppsSubclient):
             attempt += 1
             time.sleep(10)
 
+        return list(self.iter_discovered_content(discovery_type))
+
+    def iter_discovered_content(
+        self, discovery_type: int, page_size: int = 500, max_workers: int = 4
+    ) -> Iterator[dict]:
+        """Stream the discovered content of a discovery type, page by page.
+
+        The first page returns the total number of records, and the remaining pages are fetched
+        concurrently by a bounded pool of threads. The records are yielded in order, as the
+        pages are received, instead of being collected in a list.
+
+        Args:
+            discovery_type: The type of content to be discovered.
+                - 8: Users
+                - 25: Shared Drives
+                - 5: Groups
+            page_size: Number of records fetched with each request. Default is 500.
+            max_workers: Maximum number of pages fetched concurrently. Default is 4.
+
+        Returns:
+            Iterator[dict]: Generator over the discovered records.
+
+        Raises:
+            SDKException: If the discovery type is not supported, or the response from the
+                server is not successful.
+
+        Example:
+            >>> for user in subclient.iter_discovered_content(8, max_workers=8):
+            ...     print(user['smtpAddress'])
+
+        #ai-gen-doc
+        """
+        records_keys = {8: "userAccounts", 25: "folders", 5: "groups"}
+        if discovery_type not in records_keys:
+            raise SDKException(
+                "Subclient", "101", f"Discovery type should be one of {list(records_keys)}"
+            )
+
         browse_content = self._services["CLOUD_DISCOVERY"] % (
             self._instance_object.instance_id,
             self._client_object.client_id,
             AppIDAType.CLOUD_APP.value,
         )
 
-        # determines the number of accounts to return in response
-        page_size = 500
-        offset = 0
-
-        records = []
-        while True:
-            discover_query = f"{browse_content}&pageSize={page_size}&offset={offset}&eDiscoverType={discovery_type}"
-            flag, response = self._cvpysdk_object.make_request("GET", discover_query)
-            offset += 1
-            if flag:
-                if response and response.json():
-                    if discovery_type == 8:
-                        if "userAccounts" in response.json():
-                            curr_records = response.json().get("userAccounts", [])
-                            records.extend(curr_records)
-                            if len(curr_records) < page_size:
-                                break
-                    elif discovery_type == 25:
-                        if "folders" in response.json():
-                            curr_records = response.json().get("folders", [])
-                            records.extend(curr_records)
-                            if len(curr_records) < page_size:
-                                break
-                    elif discovery_type == 5:
-                        if "groups" in response.json():
-                            curr_groups = response.json().get("groups", [])
-                            records.extend(curr_groups)
-                            if len(curr_groups) < page_size:
-                                break
-            else:
-                raise SDKException("Response", "101", self._update_response_(response.text))
-        return records
+        return iter_cloud_discovery(
+            self._cvpysdk_object,
+            self._update_response_,
+            f"{browse_content}&eDiscoverType={discovery_type}",
+            records_keys[discovery_type],
+            page_size=page_size,
+            max_workers=max_workers,
+        )
 
     def verify_groups_discovery(self) -> tuple[bool, int]:
         """Verify whether the groups discovery process is complete.
@@ -901,34 +919,7 @@ class GoogleSubclient(CloudAppsSubclient):
 
         #ai-gen-doc
         """
-        browse_content = self._services["CLOUD_DISCOVERY"] % (
-            self._instance_object.instance_id,
-            self._client_object.client_id,
-            AppIDAType.CLOUD_APP.value,
-        )
-
-        # determines the number of accounts to return in response
-        page_size = 500
-        offset = 0
-
-        groups = []
-        while True:
-            discover_query = (
-                f"{browse_content}&pageSize={page_size}&offset={offset}&eDiscoverType=5"
-            )
-            flag, response = self._cvpysdk_object.make_request("GET", discover_query)
-            offset += 1
-
-            if flag:
-                if response and response.json():
-                    if "groups" in response.json():
-                        curr_groups = response.json().get("groups", [])
-                        groups.extend(curr_groups)
-                        if len(curr_groups) < page_size:
-                            break
-            else:
-                raise SDKException("Response", "101", self._update_response_(response.text))
-        return groups
+        return list(self.iter_discovered_content(5))
 
     def verify_shareddrive_discovery(self) -> tuple[bool, int]:
         """Verify that the discovery of all shared drives has completed.
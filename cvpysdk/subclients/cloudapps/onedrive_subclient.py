@@ -37,6 +37,9 @@ OneDriveSubclient:
 
     add_users_onedrive_for_business_client()                            --  Adds user to OneDrive for Business Client
 
+    iter_discovered_users()                                             --  Streams the discovered users, fetching the
+                                                                            pages concurrently
+
     search_for_user()                                                   --  Searches for a specific user's details from
                                                                             discovered list
 
@@ -105,6 +108,7 @@ import time
 from ...constants import AppIDAType
 from ...exception import SDKException
 from ..casubclient import CloudAppsSubclient
+from .discovery_paging import iter_cloud_discovery
 from .onedrive_constants import OneDriveConstants
 
 
@@ -761,6 +765,48 @@ class OneDriveSubclient(CloudAppsSubclient):
         else:
             raise SDKException("Response", "101", self._update_response_(response.text))
 
+    def iter_discovered_users(self, page_size=500, max_workers=4):
+        """Streams the discovered users of the client, page by page
+
+        The first page returns the total number of users, and the remaining pages are fetched
+        concurrently by a bounded pool of threads
+
+        Args:
+
+            page_size   (int)   --  number of users fetched with each request
+
+                default: 500
+
+            max_workers (int)   --  maximum number of pages fetched concurrently
+
+                default: 4
+
+        Returns:
+
+            generator   --  generator over the discovered user accounts
+
+        Raises:
+
+            SDKException:
+
+                if response is not success
+
+        """
+        browse_content = self._services["CLOUD_DISCOVERY"] % (
+            self._instance_object.instance_id,
+            self._client_object.client_id,
+            AppIDAType.CLOUD_APP.value,
+        )
+
+        return iter_cloud_discovery(
+            self._cvpysdk_object,
+            self._update_response_,
+            browse_content,
+            "userAccounts",
+            page_size=page_size,
+            max_workers=max_workers,
+        )
+
     def search_for_user(self, user_id):
         """Searches for a specific user's details from discovered list
 
@@ -157,7 +157,7 @@ class DB2Subclient(Subclient):
         To disable data backup
 
         """
-        properties = self.properties
+        properties = self.properties_copy()
         properties["db2SubclientProp"]["db2BackupData"] = False
         properties["db2SubclientProp"]["skipLogsInBackupImage"] = 0
         properties["db2SubclientProp"]["db2BackupMode"] = 0
@@ -172,7 +172,7 @@ class DB2Subclient(Subclient):
         To enable table level browse
 
         """
-        properties = self.properties
+        properties = self.properties_copy()
         properties["db2SubclientProp"]["enableTableBrowse"] = True
         self.update_properties(properties_dict=properties)
 
@@ -180,7 +180,7 @@ class DB2Subclient(Subclient):
         """
         To enable DB2 ACS backup
         """
-        properties = self.properties
+        properties = self.properties_copy()
         properties["commonProperties"]["snapCopyInfo"]["useDB2ACSInterface"] = True
         self.update_properties(properties_dict=properties)
 
@@ -2088,7 +2088,7 @@ class UsermailboxSubclient(ExchangeSubclient):
 
         #ai-gen-doc
         """
-        self.agentproperties = self._agent_object.properties
+        self.agentproperties = self._agent_object.properties_copy()
         self.agentproperties["onePassProperties"]["onePassProp"]["ewsDetails"]["bUseEWS"] = True
         self.agentproperties["onePassProperties"]["onePassProp"]["ewsDetails"][
             "ewsConnectionUrl"
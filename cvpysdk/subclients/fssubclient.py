@@ -1256,7 +1256,7 @@ class FileSystemSubclient(Subclient):
         Args:
             set_vtl_multiple_drives (bool)  --  Enable or disable VTL multiple drives on IBMi
         """
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         if isinstance(set_vtl_multiple_drives, bool):
             update_properties["fsSubClientProp"]["backupUsingMultipleDrives"] = (
                 set_vtl_multiple_drives
@@ -1283,7 +1283,7 @@ class FileSystemSubclient(Subclient):
         Args:
             value   (str)  --  To set pending records changes value for backup data.
         """
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         if isinstance(value, str):
             update_properties["fsSubClientProp"]["pendingRecordChange"] = value
         else:
@@ -1308,7 +1308,7 @@ class FileSystemSubclient(Subclient):
         Args:
             value   (str)  --  To set other pending changes value for backup data.
         """
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         if isinstance(value, str):
             update_properties["fsSubClientProp"]["otherPendingChange"] = value
         else:
@@ -1405,7 +1405,7 @@ class FileSystemSubclient(Subclient):
 
                 if value is invalid
         """
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         if isinstance(synclib_config, dict):
             update_properties["fsSubClientProp"] = synclib_config
         else:
@@ -2041,14 +2041,14 @@ class FileSystemSubclient(Subclient):
 
     def enable_content_indexing(self, policy_id):
         """Enables Content indexing and add the policy associations"""
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         update_properties["fsSubClientProp"]["enableContentIndexing"] = True
         update_properties["fsSubClientProp"]["contentIndexingPolicy"] = int(policy_id)
         self.update_properties(update_properties)
 
     def disable_content_indexing(self):
         """Disables Content indexing and disassociate the CI policy"""
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         update_properties["fsSubClientProp"]["enableContentIndexing"] = False
         self.update_properties(update_properties)
 
@@ -2072,7 +2072,7 @@ class FileSystemSubclient(Subclient):
 
             value   (bool)  -- To enable or disbale catalog acl
         """
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         if isinstance(value, bool):
             update_properties["fsSubClientProp"]["catalogACL"] = value
         else:
@@ -2247,7 +2247,7 @@ class FileSystemSubclient(Subclient):
                 if parameters are not valid
         """
         self.onetouch_option = True
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         if isinstance(dr_config, dict):
             update_properties["fsSubClientProp"]["ibmiSubclientprop"] = dr_config
         else:
@@ -2277,7 +2277,7 @@ class FileSystemSubclient(Subclient):
             Raises:
                 None
         """
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         if isinstance(value, bool):
             update_properties["fsSubClientProp"]["backupSaveFileData"] = value
         else:
@@ -2302,7 +2302,7 @@ class FileSystemSubclient(Subclient):
         Args:
             value   (bool)  --  To enable or disable spool file data backup.
         """
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         if isinstance(value, bool):
             update_properties["fsSubClientProp"]["backupSpooledFileData"] = value
         else:
@@ -2327,7 +2327,7 @@ class FileSystemSubclient(Subclient):
         Args:
             value   (bool)  --  To enable or disable queue data backup.
         """
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         if isinstance(value, bool):
             update_properties["fsSubClientProp"]["backupQueueData"] = value
         else:
@@ -2352,7 +2352,7 @@ class FileSystemSubclient(Subclient):
         Args:
             value   (bool)  --  To enable or disable private authorities backup.
         """
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         if isinstance(value, bool):
             update_properties["fsSubClientProp"]["backupPrivateAuthority"] = value
         else:
@@ -2375,7 +2375,7 @@ class FileSystemSubclient(Subclient):
         Args:
             value   (str)  --  To set target and release for  backup data.
         """
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         if isinstance(value, str):
             update_properties["fsSubClientProp"]["targetReleaseForBackupData"] = value
         else:
@@ -2398,7 +2398,7 @@ class FileSystemSubclient(Subclient):
         Args:
             value   (str)  --  To set access path value for  backup data.
         """
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         if isinstance(value, str):
             update_properties["fsSubClientProp"]["saveAccessPath"] = value
         else:
@@ -2421,7 +2421,7 @@ class FileSystemSubclient(Subclient):
         Args:
             value   (str)  --  To set update history value for  backup data.
         """
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         if isinstance(value, str):
             update_properties["fsSubClientProp"]["updateHistory"] = value
         else:
@@ -2444,7 +2444,7 @@ class FileSystemSubclient(Subclient):
         Args:
             value   (str)  --  To set IBMi compression value for  backup data.
         """
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         if isinstance(value, str):
             update_properties["fsSubClientProp"]["ibmiCompression"] = value
         else:
@@ -2487,7 +2487,7 @@ class FileSystemSubclient(Subclient):
 
                 if value is invalid
         """
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         if isinstance(swa_config, dict):
             update_properties["fsSubClientProp"] = swa_config
         else:
@@ -2567,7 +2567,7 @@ class FileSystemSubclient(Subclient):
                 value  (list)   --  Specifies the nodes, a list of strings, values are data access node host names.
         """
 
-        update_properties = self.properties
+        update_properties = self.properties_copy()
 
         access_nodes = []
         for access_node in value:
@@ -2596,7 +2596,7 @@ class FileSystemSubclient(Subclient):
                 value   (bool)  --  Enables or disables the property by setting True or False respectively.
 
         """
-        update_properties = self.properties
+        update_properties = self.properties_copy()
 
         if isinstance(value, bool):
             update_properties["fsSubClientProp"]["enableNetworkShareAutoMount"] = value
@@ -2626,7 +2626,7 @@ class FileSystemSubclient(Subclient):
                 password    (str)   --  The password
         """
 
-        update_properties = self.properties
+        update_properties = self.properties_copy()
 
         if isinstance(value, dict):
             update_properties["impersonateUser"]["userName"] = value["username"]
@@ -666,7 +666,7 @@ class SharepointSubclient(SharepointSuperSubclient):
             cert_string         (str)       --      Certificate String
             cert_password       (str)       --      Certificate Password
         """
-        properties_dict = self._backupset_object.properties
+        properties_dict = self._backupset_object.properties_copy()
         azure_app_list = (
             properties_dict["sharepointBackupSet"]["spOffice365BackupSetProp"]
             .get("azureAppList", {})
@@ -710,7 +710,7 @@ class SharepointSubclient(SharepointSuperSubclient):
         if not isinstance(app_ids, list):
             app_ids = [app_ids]
 
-        properties_dict = self._backupset_object.properties
+        properties_dict = self._backupset_object.properties_copy()
         azure_app_list = properties_dict["sharepointBackupSet"]["spOffice365BackupSetProp"][
             "azureAppList"
         ]["azureApps"]
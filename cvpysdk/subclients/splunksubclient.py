@@ -111,7 +111,7 @@ class SplunkSubclient(BigDataAppsSubclient):
 
         """
 
-        subclient_prop = self.properties
+        subclient_prop = self.properties_copy()
         index_list_copy = list(index_list)
         content_prop_dict = {
             "path": "indexes/" + index_list_copy[0],
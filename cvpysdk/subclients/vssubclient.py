@@ -161,6 +161,7 @@ from cvpysdk.plan import Plans
 from ..client import Client
 from ..constants import HypervisorType, VSAObjects, VsInstanceType
 from ..exception import SDKException
+from ..properties_view import to_plain
 from ..subclient import Subclient
 
 
@@ -673,7 +674,7 @@ class VirtualServerSubclient(Subclient):
             value   (Boolean)   True/False
 
         """
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         update_properties["vsaSubclientProp"]["quiesceGuestFileSystemAndApplications"] = value
         self.update_properties(update_properties)
 
@@ -739,7 +740,7 @@ class VirtualServerSubclient(Subclient):
             value   (Boolean)   True/False
 
         """
-        update_properties = self.properties
+        update_properties = self.properties_copy()
         update_properties["vsaSubclientProp"]["useChangedTrackingOnVM"] = value
         self.update_properties(update_properties)
 
@@ -749,6 +750,7 @@ class VirtualServerSubclient(Subclient):
         Args:
             properties_dict         (dict):     dict of all propterties of subclient
         """
+        properties_dict = to_plain(properties_dict)
         properties_dict.update(
             {
                 "vmFilterOperationType": "OVERWRITE",
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 
 from cvpysdk.activateapps.ediscovery_utils import (
@@ -26,3 +28,33 @@ class TestEdiscoveryClientOperations:
 class TestEdiscoveryDataSources:
     def test_class_exists(self):
         assert EdiscoveryDataSources is not None
+
+
+@pytest.mark.unit
+class TestEdiscoveryClientOperationsIterSearch:
+    """Tests for the paged EdiscoveryClientOperations.iter_search."""
+
+    def test_iter_search_pages_with_limit(self):
+        calls = []
+
+        def search(criteria=None, attr_list=None, params=None):
+            calls.append(params)
+            start, rows = params["start"], params["rows"]
+            return 10, [{"id": i} for i in range(start, start + rows)], {"stats": 1}
+
+        ops = object.__new__(EdiscoveryClientOperations)
+        with patch.object(ops, "search", side_effect=search):
+            documents = ops.iter_search(
+                criteria="Size:[10 TO 1024]",
+                params={"start": "2", "rows": "50", "sort": "Size asc"},
+                page_size=3,
+                limit=5,
+                prefetch=False,
+            )
+            assert [doc["id"] for doc in documents] == [2, 3, 4, 5, 6]
+
+        assert calls == [
+            {"sort": "Size asc", "start": 2, "rows": 3},
+            {"sort": "Size asc", "start": 5, "rows": 2},
+        ]
+        assert documents.facets == {"stats": 1}
@@ -201,3 +201,49 @@ class TestDatasource:
         ds = self._create_datasource(mock_commcell)
         with pytest.raises(SDKException):
             ds.update_datasource_schema(["not_a_dict"])
+
+    def test_import_data_stream_batches_by_count_and_size(self, mock_commcell, mock_response):
+        ds = self._create_datasource(mock_commcell)
+        ds._datacube_import_data = "import_url"
+        make_request = mock_commcell._cvpysdk_object.make_request
+        make_request.return_value = (True, mock_response(json_data={"errorCode": 0}))
+        documents = ({"id": i, "name": "x" * (100 if i == 5 else 1)} for i in range(7))
+        completed = []
+
+        results = ds.import_data_stream(
+            documents, batch_size=3, max_batch_bytes=100, max_workers=2, callback=completed.append
+        )
+
+        # the large document is sent in a batch of its own
+        assert [result["documents"] for result in results] == [3, 2, 1, 1]
+        assert sorted(result["batch"] for result in completed) == [0, 1, 2, 3]
+        assert all(result["error"] is None and result["attempts"] == 1 for result in results)
+        assert results[0]["bytes"] == len(
+            '[{"id": 0, "name": "x"}, {"id": 1, "name": "x"}, {"id": 2, "name": "x"}]'
+        )
+        sent = sorted(doc["id"] for call in make_request.call_args_list for doc in call[0][2])
+        assert sent == list(range(7))
+
+    def test_import_data_stream_retries_failed_batch(self, mock_commcell, mock_response):
+        ds = self._create_datasource(mock_commcell)
+        ds._datacube_import_data = "import_url"
+        mock_commcell._update_response_.side_effect = lambda text: text
+        failed = (False, mock_response(status_code=500, text="failed"))
+        success = (True, mock_response(json_data={"errorCode": 0}))
+        mock_commcell._cvpysdk_object.make_request.side_effect = [failed, success, failed, failed]
+
+        results = ds.import_data_stream(
+            [{"id": 1}, {"id": 2}], batch_size=1, max_workers=1, max_retries=1, retry_delay=0
+        )
+
+        assert [result["attempts"] for result in results] == [2, 2]
+        assert results[0]["error"] is None
+        assert isinstance(results[1]["error"], SDKException)
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"batch_size": 0}, {"max_workers": "4"}, {"max_retries": -1}]
+    )
+    def test_import_data_stream_invalid_arguments(self, mock_commcell, kwargs):
+        ds = self._create_datasource(mock_commcell)
+        with pytest.raises(SDKException):
+            ds.import_data_stream([{"id": 1}], **kwargs)
@@ -124,3 +124,21 @@ class TestHandler:
         mock_commcell._cvpysdk_object.make_request.return_value = (False, resp)
         with pytest.raises(SDKException):
             handler.get_handler_data()
+
+    def test_iter_handler_data_pages(self, mock_commcell, mock_response):
+        handler = self._create_handler(mock_commcell)
+        pages = [
+            {"response": {"numFound": 3, "docs": [{"id": 1}, {"id": 2}]}},
+            {"response": {"numFound": 3, "docs": [{"id": 3}]}},
+        ]
+        mock_commcell._cvpysdk_object.make_request.side_effect = [
+            (True, mock_response(json_data=page)) for page in pages
+        ]
+
+        documents = handler.iter_handler_data("q=*:*", page_size=2)
+
+        assert [doc["id"] for doc in documents] == [1, 2, 3]
+        assert documents.num_found == 3
+        urls = [call[0][1] for call in mock_commcell._cvpysdk_object.make_request.call_args_list]
+        assert urls[0].endswith("?q=*:*&start=0&rows=2")
+        assert urls[1].endswith("?q=*:*&start=2&rows=1")
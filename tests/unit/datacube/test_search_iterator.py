@@ -0,0 +1,79 @@
+"""Unit tests for cvpysdk.datacube.search_iterator module."""
+
+import threading
+
+import pytest
+
+from cvpysdk.datacube.search_iterator import SearchIterator
+from cvpysdk.exception import SDKException
+
+
+def _make_fetch_page(num_found, calls):
+    """Helper to build a fetch_page function over num_found numbered documents."""
+
+    def fetch_page(start, rows):
+        calls.append((start, rows))
+        docs = [{"id": i} for i in range(start, min(start + rows, num_found))]
+        return num_found, docs, {"facet": num_found}
+
+    return fetch_page
+
+
+@pytest.mark.unit
+class TestSearchIterator:
+    """Tests for the SearchIterator class."""
+
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_iterates_all_pages(self, prefetch):
+        calls = []
+        iterator = SearchIterator(_make_fetch_page(7, calls), page_size=3, prefetch=prefetch)
+
+        assert [doc["id"] for doc in iterator] == list(range(7))
+        assert calls == [(0, 3), (3, 3), (6, 1)]
+        assert iterator.num_found == 7
+        assert iterator.facets == {"facet": 7}
+
+    def test_limit_and_start(self):
+        calls = []
+        iterator = SearchIterator(_make_fetch_page(100, calls), page_size=4, limit=6, start=10)
+
+        assert [doc["id"] for doc in iterator] == list(range(10, 16))
+        assert calls == [(10, 4), (14, 2)]
+
+    def test_prefetch_fetches_next_page_before_consumed(self):
+        calls = []
+        fetched = threading.Event()
+        fetch_page = _make_fetch_page(10, calls)
+
+        def fetch_and_notify(start, rows):
+            result = fetch_page(start, rows)
+            if start:
+                fetched.set()
+            return result
+
+        pages = SearchIterator(fetch_and_notify, page_size=5).pages()
+
+        next(pages)
+        assert fetched.wait(timeout=5)
+        assert calls == [(0, 5), (5, 5)]
+
+    def test_stops_on_empty_page(self):
+        calls = []
+
+        def fetch_page(start, rows):
+            calls.append((start, rows))
+            return 100, [] if start else [{"id": 0}], {}
+
+        assert len(list(SearchIterator(fetch_page, page_size=1))) == 1
+        assert calls == [(0, 1), (1, 1)]
+
+    def test_zero_limit_does_not_search(self):
+        calls = []
+
+        assert list(SearchIterator(_make_fetch_page(5, calls), limit=0)) == []
+        assert calls == []
+
+    @pytest.mark.parametrize("kwargs", [{"page_size": 0}, {"limit": -1}, {"start": "10"}])
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(SDKException):
+            SearchIterator(lambda start, rows: (0, [], {}), **kwargs)
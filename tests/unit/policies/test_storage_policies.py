@@ -3,7 +3,7 @@ from unittest.mock import patch
 import pytest
 
 from cvpysdk.exception import SDKException
-from cvpysdk.policies.storage_policies import StoragePolicies, StoragePolicy
+from cvpysdk.policies.storage_policies import StoragePolicies, StoragePolicy, StoragePolicyCopy
 
 
 @pytest.mark.unit
@@ -62,3 +62,125 @@ class TestStoragePolicies:
             sp = StoragePolicies(mock_commcell)
             sp.refresh()
         assert mock_get.call_count == 2
+
+
+@pytest.mark.unit
+class TestStoragePolicyCopyMarkJobs:
+    """Tests for StoragePolicyCopy.bulk_mark_jobs."""
+
+    def _make_copy(self, mock_commcell):
+        with patch.object(StoragePolicyCopy, "__init__", lambda self, *a, **kw: None):
+            copy = StoragePolicyCopy.__new__(StoragePolicyCopy)
+        copy._commcell_object = mock_commcell
+        copy._services = mock_commcell._services
+        copy._storage_policy_name = "sp1"
+        copy._copy_name = "copy1"
+        return copy
+
+    def test_get_job_batches_by_size(self):
+        assert StoragePolicyCopy._get_job_batches([1, 2, 3, 4, 5], batch_size=2) == [
+            "1,2",
+            "3,4",
+            "5",
+        ]
+
+    def test_get_job_batches_default_length(self):
+        batches = StoragePolicyCopy._get_job_batches(list(range(100000, 100100)))
+        assert all(len(batch) <= 210 for batch in batches)
+        assert ",".join(batches).split(",") == [str(i) for i in range(100000, 100100)]
+
+    def test_bulk_mark_jobs_collects_failures(self, mock_commcell, mock_response):
+        def make_request(method, url, payload=None):
+            if "-si 3,4" in url:
+                return True, mock_response(text="Jobs do not belong to the copy")
+            return True, mock_response(text="Success")
+
+        mock_commcell._cvpysdk_object.make_request.side_effect = make_request
+        copy = self._make_copy(mock_commcell)
+        result = copy.bulk_mark_jobs([1, 2, 3, 4, 5], "markJobsBad", batch_size=2)
+
+        assert sorted(result["marked"]) == [1, 2, 5]
+        assert sorted(result["failed"]) == [3, 4]
+        assert len(result["errors"]) == 1
+
+    def test_bulk_mark_jobs_keeps_str_job_ids(self, mock_commcell, mock_response):
+        mock_commcell._cvpysdk_object.make_request.return_value = (
+            True,
+            mock_response(text="Success"),
+        )
+        copy = self._make_copy(mock_commcell)
+
+        assert copy.bulk_mark_jobs(["1", "2"], "markJobsBad")["marked"] == ["1", "2"]
+        assert copy.bulk_mark_jobs(7, "markJobsBad")["marked"] == [7]
+
+    def test_mark_jobs_bad_raises_on_failure(self, mock_commcell, mock_response):
+        mock_commcell._cvpysdk_object.make_request.return_value = (
+            True,
+            mock_response(text="jobs do not belong"),
+        )
+        copy = self._make_copy(mock_commcell)
+        with pytest.raises(SDKException):
+            copy.mark_jobs_bad([1, 2])
+
+    @pytest.mark.parametrize("job_ids", ["101,102", "101, 102"])
+    def test_comma_separated_job_ids(self, mock_commcell, mock_response, job_ids):
+        mock_commcell._cvpysdk_object.make_request.return_value = (
+            True,
+            mock_response(text="Success"),
+        )
+        copy = self._make_copy(mock_commcell)
+
+        assert copy.bulk_mark_jobs(job_ids, "recopy")["marked"] == ["101", "102"]
+        copy._mark_jobs_on_copy(job_ids, "recopy")
+
+        url = mock_commcell._cvpysdk_object.make_request.call_args.args[1]
+        assert url.endswith("-si recopy -si 101,102")
+
+    def test_single_failed_request_is_raised_as_it_is(self, mock_commcell, mock_response):
+        mock_commcell._cvpysdk_object.make_request.return_value = (
+            False,
+            mock_response(status_code=500, text="failed"),
+        )
+        mock_commcell._update_response_.side_effect = lambda text: text
+        copy = self._make_copy(mock_commcell)
+
+        with pytest.raises(SDKException) as excinfo:
+            copy.mark_jobs_bad([1, 2])
+
+        assert (excinfo.value.exception_module, excinfo.value.exception_id) == ("Response", "101")
+
+    def test_failed_request_is_raised_before_job_errors(self, mock_commcell, mock_response):
+        def make_request(method, url, payload=None):
+            if "-si 3,4" in url:
+                return True, mock_response(text="Jobs do not belong to the copy")
+            if "-si 5" in url:
+                return True, mock_response(text="")
+            return True, mock_response(text="Success")
+
+        mock_commcell._cvpysdk_object.make_request.side_effect = make_request
+        copy = self._make_copy(mock_commcell)
+
+        batches = ["1,2", "3,4", "5"]
+        with patch.object(StoragePolicyCopy, "_get_job_batches", return_value=batches):
+            with pytest.raises(SDKException) as excinfo:
+                copy._mark_jobs_on_copy([1, 2, 3, 4, 5], "markJobsBad")
+
+        assert (excinfo.value.exception_module, excinfo.value.exception_id) == ("Response", "102")
+
+    def test_job_errors_of_all_batches_are_raised(self, mock_commcell, mock_response):
+        mock_commcell._cvpysdk_object.make_request.return_value = (
+            True,
+            mock_response(text="Jobs do not belong to the copy"),
+        )
+        copy = self._make_copy(mock_commcell)
+
+        with patch.object(StoragePolicyCopy, "_get_job_batches", return_value=["1,2", "3"]):
+            with pytest.raises(SDKException) as excinfo:
+                copy._mark_jobs_on_copy([1, 2, 3], "markJobsBad")
+
+        assert (excinfo.value.exception_module, excinfo.value.exception_id) == ("Storage", "102")
+
+    def test_invalid_job_ids_raise(self, mock_commcell):
+        copy = self._make_copy(mock_commcell)
+        with pytest.raises(SDKException):
+            copy.bulk_mark_jobs([1, "2"], "markJobsBad")
@@ -0,0 +1,95 @@
+"""Unit tests for cvpysdk/subclients/cloudapps/discovery_paging.py"""
+
+import pytest
+
+from cvpysdk.exception import SDKException
+from cvpysdk.subclients.cloudapps.discovery_paging import iter_cloud_discovery
+
+URL = "https://example.com/api/Instance/1/CloudDiscovery?clientId=2&eDiscoverType=8"
+
+
+def _make_pager(mock_commcell, mock_response, total, page_size=500, with_total=True, **kwargs):
+    """Helper to build the discovery generator over `total` users."""
+    users = [{"smtpAddress": f"user{index}@example.com"} for index in range(total)]
+    requested = []
+
+    def make_request(method, url):
+        page = int(url.split("&offset=")[1])
+        requested.append(page)
+        response_json = {"userAccounts": users[page * page_size : (page + 1) * page_size]}
+        if with_total:
+            response_json["pagingInfo"] = {"totalRecords": total}
+        return True, mock_response(json_data=response_json)
+
+    mock_commcell._cvpysdk_object.make_request.side_effect = make_request
+    records = iter_cloud_discovery(
+        mock_commcell._cvpysdk_object,
+        lambda text: text,
+        URL,
+        "userAccounts",
+        page_size=page_size,
+        **kwargs,
+    )
+    return records, users, requested
+
+
+@pytest.mark.unit
+class TestIterCloudDiscovery:
+    """Tests for the iter_cloud_discovery function."""
+
+    def test_pages_fetched_concurrently_in_order(self, mock_commcell, mock_response):
+        records, users, requested = _make_pager(
+            mock_commcell, mock_response, 1203, page_size=100, max_workers=3
+        )
+
+        assert list(records) == users
+        assert sorted(requested) == list(range(13))
+
+    def test_unknown_total_fetches_until_short_page(self, mock_commcell, mock_response):
+        records, users, requested = _make_pager(
+            mock_commcell, mock_response, 250, page_size=100, with_total=False
+        )
+
+        assert list(records) == users
+        assert requested == [0, 1, 2]
+
+    def test_missing_records_key_stops(self, mock_commcell, mock_response):
+        mock_commcell._cvpysdk_object.make_request.return_value = (
+            True,
+            mock_response(json_data={"pagingInfo": {"totalRecords": 0}}),
+        )
+
+        records = iter_cloud_discovery(
+            mock_commcell._cvpysdk_object, lambda text: text, URL, "userAccounts"
+        )
+
+        assert list(records) == []
+        mock_commcell._cvpysdk_object.make_request.assert_called_once()
+
+    def test_max_pages_is_a_hard_stop(self, mock_commcell, mock_response):
+        records, users, requested = _make_pager(
+            mock_commcell, mock_response, 1000, page_size=100, with_total=False, max_pages=4
+        )
+
+        assert list(records) == users[:400]
+        assert requested == [0, 1, 2, 3]
+
+    def test_failed_page_raises(self, mock_commcell, mock_response):
+        mock_commcell._cvpysdk_object.make_request.return_value = (
+            False,
+            mock_response(status_code=500, text="failed"),
+        )
+
+        records = iter_cloud_discovery(
+            mock_commcell._cvpysdk_object, lambda text: text, URL, "userAccounts"
+        )
+
+        with pytest.raises(SDKException):
+            next(records)
+
+    @pytest.mark.parametrize("kwargs", [{"page_size": 0}, {"max_workers": 0}, {"max_pages": 0}])
+    def test_invalid_arguments(self, mock_commcell, kwargs):
+        with pytest.raises(SDKException):
+            iter_cloud_discovery(
+                mock_commcell._cvpysdk_object, lambda text: text, URL, "userAccounts", **kwargs
+            )
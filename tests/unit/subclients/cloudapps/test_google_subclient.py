@@ -2,6 +2,7 @@
 
 import pytest
 
+from cvpysdk.exception import SDKException
 from cvpysdk.subclients.casubclient import CloudAppsSubclient
 from cvpysdk.subclients.cloudapps.google_subclient import GoogleSubclient
 
@@ -36,3 +37,10 @@ class TestGoogleSubclient:
         assert hasattr(GoogleSubclient, "in_place_restore")
         assert hasattr(GoogleSubclient, "process_index_retention_rules")
         assert hasattr(GoogleSubclient, "browse_content")
+
+    def test_iter_discovered_content_rejects_unknown_type(self):
+        """iter_discovered_content should raise for an unsupported discovery type."""
+        subclient = object.__new__(GoogleSubclient)
+
+        with pytest.raises(SDKException):
+            subclient.iter_discovered_content(99)
@@ -43,7 +43,7 @@ class TestSplunkSubclient:
     def test_subclient_content_setter_updates_properties(self):
         """subclient_content setter should build proper content list."""
         sub = object.__new__(SplunkSubclient)
-        sub._properties = {
+        sub._subclient_properties = {
             "splunkProps": {
                 "contentList": [
                     {"title": "old_index", "path": "indexes/old_index", "level": 1, "type": 1}
@@ -51,8 +51,9 @@ class TestSplunkSubclient:
             }
         }
         sub.update_properties = MagicMock()
-        with patch.object(
-            type(sub), "properties", new_callable=lambda: property(lambda self: self._properties)
-        ):
-            sub.subclient_content = ["new_idx1", "new_idx2"]
-            sub.update_properties.assert_called_once()
+        sub.subclient_content = ["new_idx1", "new_idx2"]
+        sub.update_properties.assert_called_once()
+        content_list = sub.update_properties.call_args[0][0]["splunkProps"]["contentList"]
+        assert [content["title"] for content in content_list] == ["new_idx1", "new_idx2"]
+        # the setter modifies a copy, not the cached properties
+        assert sub._subclient_properties["splunkProps"]["contentList"][0]["title"] == "old_index"
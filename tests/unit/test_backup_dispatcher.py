@@ -0,0 +1,156 @@
+"""Unit tests for cvpysdk/backup_dispatcher.py module."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from cvpysdk.backup_dispatcher import BackupDispatcher, TokenBucket
+from cvpysdk.backupset import Backupset
+from cvpysdk.exception import SDKException
+from cvpysdk.subclient import Subclient, Subclients
+
+
+def _make_subclient(name, enabled=True, storage_policy="sp1", job=None):
+    """Helper to build a Subclient-like mock returning a job on backup."""
+    subclient = MagicMock(spec=Subclient)
+    subclient.subclient_name = name
+    subclient.is_backup_enabled = enabled
+    subclient.storage_policy = storage_policy
+    subclient.backup.return_value = job if job is not None else f"job-{name}"
+    return subclient
+
+
+def _make_subclients(*subclients):
+    """Helper to build a Subclients-like mock for the given subclient mocks."""
+    by_name = {subclient.subclient_name: subclient for subclient in subclients}
+    collection = MagicMock(spec=Subclients)
+    collection.all_subclients = {name: {"id": str(i)} for i, name in enumerate(by_name)}
+    collection.iter_objects.side_effect = lambda **kwargs: iter(by_name.values())
+    collection.get.side_effect = AssertionError("subclient properties fetched one by one")
+    return collection
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+    """Tests for the TokenBucket rate limiter."""
+
+    def test_burst_then_rate(self):
+        with (
+            patch("cvpysdk.backup_dispatcher.time.monotonic", return_value=0),
+            patch("cvpysdk.backup_dispatcher.time.sleep") as sleep,
+        ):
+            bucket = TokenBucket(rate=2, burst=2)
+            bucket.acquire()
+            bucket.acquire()
+            bucket.acquire()
+            bucket.acquire()
+
+        assert [c.args[0] for c in sleep.call_args_list] == [0.5, 1.0]
+
+    def test_tokens_refill_over_time(self):
+        with (
+            patch("cvpysdk.backup_dispatcher.time.monotonic", side_effect=[0, 10, 20]),
+            patch("cvpysdk.backup_dispatcher.time.sleep") as sleep,
+        ):
+            bucket = TokenBucket(rate=1, burst=1)
+            bucket.acquire()
+            bucket.acquire()
+
+        sleep.assert_not_called()
+
+
+@pytest.mark.unit
+class TestBackupDispatcher:
+    """Tests for the BackupDispatcher class."""
+
+    def test_runs_subclients_across_collections_in_order(self, mock_commcell):
+        sub1, sub2, sub3 = (_make_subclient(name) for name in ("a", "b", "c"))
+        dispatcher = BackupDispatcher(mock_commcell, max_workers=2, rate=None)
+
+        jobs = dispatcher.run([sub1, _make_subclients(sub2, sub3)], backup_level="Full")
+
+        assert jobs == ["job-a", "job-b", "job-c"]
+        sub1.backup.assert_called_once_with(backup_level="Full")
+
+    def test_backupset_uses_its_subclients(self, mock_commcell):
+        backupset = MagicMock(spec=Backupset)
+        backupset.subclients = _make_subclients(_make_subclient("a"))
+        dispatcher = BackupDispatcher(mock_commcell, rate=None)
+
+        assert dispatcher.run(backupset) == ["job-a"]
+
+    def test_skips_disabled_subclients(self, mock_commcell):
+        subclients = [
+            _make_subclient("a"),
+            _make_subclient("b", enabled=False),
+            _make_subclient("c", storage_policy=None),
+        ]
+        dispatcher = BackupDispatcher(mock_commcell, rate=None)
+
+        assert dispatcher.run(subclients) == ["job-a"]
+        assert len(dispatcher.run(subclients, check_enabled=False)) == 3
+
+    def test_errors_are_returned(self, mock_commcell):
+        subclient = _make_subclient("a")
+        subclient.backup.side_effect = SDKException("Subclient", "102", "failed")
+        dispatcher = BackupDispatcher(mock_commcell, rate=None)
+
+        result = dispatcher.run(subclient)
+
+        assert isinstance(result[0], SDKException)
+
+    def test_connection_error_is_returned_for_the_subclient(self, mock_commcell):
+        failing = _make_subclient("a")
+        failing.backup.side_effect = requests.exceptions.ConnectionError("connection reset")
+        dispatcher = BackupDispatcher(mock_commcell, rate=None)
+
+        result = dispatcher.run([failing, _make_subclient("b")])
+
+        assert isinstance(result[0], requests.exceptions.ConnectionError)
+        assert result[1] == "job-b"
+
+    def test_concurrency_is_bounded(self, mock_commcell):
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def backup(**kwargs):
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            threading.Event().wait(0.01)
+            with lock:
+                running.pop()
+            return "job"
+
+        subclients = [_make_subclient(str(i)) for i in range(12)]
+        for subclient in subclients:
+            subclient.backup.side_effect = backup
+
+        dispatcher = BackupDispatcher(mock_commcell, max_workers=3, rate=None)
+
+        assert len(dispatcher.run(subclients)) == 12
+        assert max(peak) <= 3
+
+    def test_rate_limit_is_applied(self, mock_commcell):
+        dispatcher = BackupDispatcher(mock_commcell, max_workers=1, rate=5, burst=1)
+
+        with patch.object(TokenBucket, "acquire") as acquire:
+            dispatcher.run([_make_subclient("a"), _make_subclient("b")])
+
+        assert acquire.call_count == 2
+
+    def test_invalid_input(self, mock_commcell):
+        dispatcher = BackupDispatcher(mock_commcell)
+
+        with pytest.raises(SDKException):
+            dispatcher.run(["subclient"])
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"max_workers": 0}, {"rate": 0}, {"rate": "fast"}, {"burst": 0}]
+    )
+    def test_invalid_limits(self, mock_commcell, kwargs):
+        with pytest.raises(SDKException):
+            BackupDispatcher(mock_commcell, **kwargs)
@@ -1,10 +1,11 @@
 """Unit tests for cvpysdk/backupset.py module."""
 
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from cvpysdk.backupset import Backupsets
+from cvpysdk.backupset import Backupsets, BrowseEntry
 from cvpysdk.exception import SDKException
 
 
@@ -83,3 +84,532 @@ class TestBackupsetsGetItem:
             backupsets = Backupsets(agent)
         with pytest.raises(IndexError):
             backupsets["nonexistent"]
+
+
+def _make_backupset(mock_commcell):
+    """Helper to build a Backupset without fetching its properties."""
+    from cvpysdk.backupset import Backupset
+
+    agent = _make_agent_object(mock_commcell)
+    agent.agent_name = "generic"
+
+    instance = MagicMock()
+    instance._agent_object = agent
+    instance.instance_id = "1"
+    instance.instance_name = "defaultinstancename"
+
+    with patch.object(Backupset, "refresh"):
+        return Backupset(instance, "defaultbackupset", "1")
+
+
+def _browse_response(mock_response, names):
+    """Helper to build a browse response with a file item for each of the names."""
+    result_set = [
+        {
+            "displayName": name,
+            "path": f"\\data\\{name}",
+            "flags": {"file": True},
+            "size": 10,
+            "modificationTime": 0,
+            "advancedData": {"backupTime": 0},
+        }
+        for name in names
+    ]
+    browse_result = {"dataResultSet": result_set} if result_set else {}
+    return mock_response(json_data={"browseResponses": [{"browseResult": browse_result}]})
+
+
+@pytest.mark.unit
+class TestBackupsetIterBrowse:
+    """Tests for Backupset.iter_browse and Backupset.iter_find."""
+
+    def _set_pages(self, mock_commcell, mock_response, pages):
+        responses = [(True, _browse_response(mock_response, page)) for page in pages]
+        mock_commcell._cvpysdk_object.make_request.side_effect = responses
+
+    def _skip_nodes(self, mock_commcell):
+        return [
+            c.args[2]["queries"][0]["dataParam"]["paging"]["skipNode"]
+            for c in mock_commcell._cvpysdk_object.make_request.call_args_list
+        ]
+
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_pages_with_skip_node(self, mock_commcell, mock_response, prefetch):
+        self._set_pages(mock_commcell, mock_response, [["a", "b"], ["c", "d"], ["e"]])
+        backupset = _make_backupset(mock_commcell)
+
+        items = list(backupset.iter_browse(path="\\data", page_size=2, prefetch=prefetch))
+
+        assert [path for path, _ in items] == [f"\\data\\{n}" for n in "abcde"]
+        assert items[0][1]["type"] == "File"
+        assert self._skip_nodes(mock_commcell) == [0, 2, 4]
+
+    def test_empty_page_after_full_page_stops(self, mock_commcell, mock_response):
+        self._set_pages(mock_commcell, mock_response, [["a", "b"], []])
+        backupset = _make_backupset(mock_commcell)
+
+        items = list(backupset.iter_browse(path="\\data", page_size=2, prefetch=False))
+
+        assert len(items) == 2
+
+    def test_empty_response_after_full_page_is_not_retried(self, mock_commcell, mock_response):
+        mock_commcell._cvpysdk_object.make_request.side_effect = [
+            (True, _browse_response(mock_response, ["a", "b"])),
+            (True, mock_response(json_data={})),
+        ]
+        backupset = _make_backupset(mock_commcell)
+
+        with patch("cvpysdk.backupset.time.sleep") as sleep:
+            items = list(backupset.iter_browse(path="\\data", page_size=2, prefetch=False))
+
+        assert len(items) == 2
+        assert mock_commcell._cvpysdk_object.make_request.call_count == 2
+        sleep.assert_not_called()
+
+    def test_iter_find_sets_filters(self, mock_commcell, mock_response):
+        self._set_pages(mock_commcell, mock_response, [["a"]])
+        backupset = _make_backupset(mock_commcell)
+
+        items = list(backupset.iter_find(file_name="*.txt"))
+
+        request_json = mock_commcell._cvpysdk_object.make_request.call_args.args[2]
+        assert request_json["opType"] == 1
+        assert request_json["queries"][0]["whereClause"][0]["criteria"]["values"] == ["*.txt"]
+        assert request_json["queries"][0]["dataParam"]["paging"]["pageSize"] == 1000
+        assert len(items) == 1
+
+
+@pytest.mark.unit
+class TestBrowseEntry:
+    """Tests for the BrowseEntry browse item record."""
+
+    RESULT = {
+        "displayName": "a.txt",
+        "name": "a.txt",
+        "path": "\\data\\a.txt",
+        "flags": {"file": True, "deleted": "1"},
+        "size": 10,
+        "modificationTime": "1700000000",
+        "advancedData": {"backupTime": "1700000100", "sizeOnMedia": 5},
+    }
+
+    def test_to_dict_matches_legacy_format(self):
+        entry = BrowseEntry.from_result(self.RESULT, "\\data", show_deleted=True)
+        metadata = entry.to_dict()
+
+        assert metadata == {
+            "name": "a.txt",
+            "snap_display_name": "a.txt",
+            "size": 10,
+            "modified_time": time.strftime("%d/%m/%Y %H:%M:%S", time.localtime(1700000000)),
+            "type": "File",
+            "backup_time": time.strftime("%d/%m/%Y %H:%M:%S", time.localtime(1700000100)),
+            "advanced_data": self.RESULT["advancedData"],
+            "deleted": True,
+        }
+
+    def test_raw_epochs_and_dict_access(self):
+        entry = BrowseEntry.from_result(self.RESULT, "\\data")
+
+        assert entry.modification_epoch == 1700000000
+        assert entry.backup_epoch == 1700000100
+        assert entry["type"] == "File"
+        assert entry["deleted"] is None
+        assert entry.get("threatAnalysisData") is None
+        assert "size" in entry
+        with pytest.raises(KeyError):
+            entry["unknown"]
+
+    def test_missing_times_and_path(self):
+        entry = BrowseEntry.from_result({"displayName": "dir", "flags": {}}, "\\data")
+
+        assert entry.path == "\\data\\dir"
+        assert entry.type == "Folder"
+        assert entry.modified_time is None
+        assert entry.backup_time is None
+
+    def test_browse_compact_entries(self, mock_commcell, mock_response):
+        mock_commcell._cvpysdk_object.make_request.return_value = (
+            True,
+            _browse_response(mock_response, ["a", "b"]),
+        )
+        backupset = _make_backupset(mock_commcell)
+
+        paths, legacy = backupset.browse(path="\\data")
+        _, entries = backupset.browse(path="\\data", compact_entries=True)
+
+        assert all(isinstance(entry, BrowseEntry) for entry in entries.values())
+        assert {path: entries[path].to_dict() for path in paths} == legacy
+
+
+@pytest.mark.unit
+class TestBackupsetWalk:
+    """Tests for Backupset.walk."""
+
+    TREE = {
+        "\\data": [("a", "Folder"), ("b", "Folder"), ("f1", "File")],
+        "\\data\\a": [("c", "Folder"), ("f2", "File")],
+        "\\data\\a\\c": [("f3", "File")],
+        "\\data\\b": [],
+    }
+
+    def _make_backupset(self, mock_commcell, failing=()):
+        backupset = _make_backupset(mock_commcell)
+        browsed = []
+
+        def do_browse(options, retry=10):
+            path = options["path"]
+            browsed.append(path)
+            if path in failing:
+                raise SDKException("Response", "101")
+            items = self.TREE[path]
+            if not items:
+                raise SDKException("Subclient", "110")
+            entries = {
+                f"{path}\\{name}": BrowseEntry(f"{path}\\{name}", name=name, item_type=item_type)
+                for name, item_type in items
+            }
+            return list(entries), entries
+
+        backupset._do_browse = do_browse
+        return backupset, browsed
+
+    def test_walks_whole_tree(self, mock_commcell):
+        backupset, _ = self._make_backupset(mock_commcell)
+
+        result = {
+            dirpath: (sorted(dirs), files)
+            for dirpath, dirs, files in backupset.walk("\\data\\", max_workers=2)
+        }
+
+        assert result == {
+            "\\data": (["a", "b"], ["f1"]),
+            "\\data\\a": (["c"], ["f2"]),
+            "\\data\\a\\c": ([], ["f3"]),
+            "\\data\\b": ([], []),
+        }
+
+    def test_max_depth_and_pruning(self, mock_commcell):
+        backupset, browsed = self._make_backupset(mock_commcell)
+
+        for _, dirs, _ in backupset.walk("\\data", max_depth=1):
+            if "b" in dirs:
+                dirs.remove("b")
+
+        assert sorted(browsed) == ["\\data", "\\data\\a"]
+
+    def test_onerror(self, mock_commcell):
+        backupset, _ = self._make_backupset(mock_commcell, failing=("\\data\\a",))
+        errors = []
+
+        dirpaths = [dirpath for dirpath, _, _ in backupset.walk("\\data", onerror=errors.append)]
+
+        assert sorted(dirpaths) == ["\\data", "\\data\\b"]
+        assert errors[0].exception_id == "101"
+
+    def test_error_raised_without_onerror(self, mock_commcell):
+        backupset, _ = self._make_backupset(mock_commcell, failing=("\\data",))
+
+        with pytest.raises(SDKException):
+            list(backupset.walk("\\data"))
+
+    def test_empty_folder_response_is_not_retried(self, mock_commcell, mock_response):
+        folder = {"displayName": "e", "path": "\\data\\e", "flags": {}}
+        mock_commcell._cvpysdk_object.make_request.side_effect = [
+            (
+                True,
+                mock_response(
+                    json_data={"browseResponses": [{"browseResult": {"dataResultSet": [folder]}}]}
+                ),
+            ),
+            (True, mock_response(json_data={})),
+        ]
+        backupset = _make_backupset(mock_commcell)
+
+        with patch("cvpysdk.backupset.time.sleep") as sleep:
+            result = list(backupset.walk("\\data", max_workers=1))
+
+        assert result == [("\\data", ["e"], []), ("\\data\\e", [], [])]
+        assert mock_commcell._cvpysdk_object.make_request.call_count == 2
+        sleep.assert_not_called()
+
+    def test_invalid_inputs(self, mock_commcell):
+        backupset, _ = self._make_backupset(mock_commcell)
+
+        with pytest.raises(SDKException):
+            backupset.walk("\\data", max_depth=-1)
+        with pytest.raises(SDKException):
+            backupset.walk("\\data", max_workers=0)
+
+
+@pytest.mark.unit
+class TestBackupsetBrowseCache:
+    """Tests for the browse response cache of the Backupset."""
+
+    def _make_backupset(self, mock_commcell, mock_response, **cache_options):
+        mock_commcell._cvpysdk_object.make_request.return_value = (
+            True,
+            _browse_response(mock_response, ["a", "b"]),
+        )
+        backupset = _make_backupset(mock_commcell)
+        backupset.enable_browse_cache(**cache_options)
+        return backupset, mock_commcell._cvpysdk_object.make_request
+
+    def test_repeated_browse_is_cached(self, mock_commcell, mock_response):
+        backupset, make_request = self._make_backupset(mock_commcell, mock_response)
+
+        first = backupset.browse(path="\\data")
+        second = backupset.browse(path="\\data")
+        backupset.browse(path="\\data", show_deleted=True)
+
+        assert first == second
+        assert make_request.call_count == 2
+
+    def test_ttl_expiry(self, mock_commcell, mock_response):
+        backupset, make_request = self._make_backupset(mock_commcell, mock_response, ttl=10)
+
+        with patch("cvpysdk.backupset.time.monotonic", side_effect=[0, 5, 20, 20]):
+            backupset.browse(path="\\data")
+            backupset.browse(path="\\data")
+            backupset.browse(path="\\data")
+
+        assert make_request.call_count == 2
+
+    def test_lru_eviction(self, mock_commcell, mock_response):
+        backupset, make_request = self._make_backupset(mock_commcell, mock_response, max_entries=2)
+
+        for path in ("\\a", "\\b", "\\a", "\\c", "\\a", "\\b"):
+            backupset.browse(path=path)
+
+        # \b is evicted when \c is cached, as \a was used more recently
+        assert make_request.call_count == 4
+        assert len(backupset._browse_cache) == 2
+
+    def test_invalidate_subclient(self, mock_commcell, mock_response):
+        backupset, make_request = self._make_backupset(mock_commcell, mock_response)
+
+        backupset.browse(path="\\data", _subclient_id=5)
+        backupset.browse(path="\\data", _subclient_id=6)
+        backupset.invalidate_browse_cache(5)
+        backupset.browse(path="\\data", _subclient_id=5)
+        backupset.browse(path="\\data", _subclient_id=6)
+
+        assert make_request.call_count == 3
+
+    def test_disable_browse_cache(self, mock_commcell, mock_response):
+        backupset, make_request = self._make_backupset(mock_commcell, mock_response)
+        backupset.disable_browse_cache()
+
+        backupset.browse(path="\\data")
+        backupset.browse(path="\\data")
+
+        assert make_request.call_count == 2
+
+    def test_invalid_options(self, mock_commcell, mock_response):
+        backupset, _ = self._make_backupset(mock_commcell, mock_response)
+
+        with pytest.raises(SDKException):
+            backupset.enable_browse_cache(ttl=0)
+        with pytest.raises(SDKException):
+            backupset.enable_browse_cache(max_entries=0)
+
+
+@pytest.mark.unit
+class TestBackupsetAggregate:
+    """Tests for Backupset.aggregate."""
+
+    def _aggregate_response(self, mock_response, count, size):
+        return mock_response(
+            json_data={
+                "browseResponses": [
+                    {"queryId": "count", "browseResult": {"aggrResultSet": [{"count": count}]}},
+                    {"queryId": "size", "browseResult": {"aggrResultSet": [{"result": size}]}},
+                ]
+            }
+        )
+
+    def _request_jsons(self, mock_commcell):
+        return [c.args[2] for c in mock_commcell._cvpysdk_object.make_request.call_args_list]
+
+    def test_aggregate_without_grouping(self, mock_commcell, mock_response):
+        mock_commcell._cvpysdk_object.make_request.return_value = (
+            True,
+            self._aggregate_response(mock_response, 3, 300),
+        )
+        backupset = _make_backupset(mock_commcell)
+
+        result = backupset.aggregate("\\data\\", to_time=1700000000)
+
+        request_json = self._request_jsons(mock_commcell)[0]
+        assert result == {"count": 3, "size": 300}
+        assert request_json["paths"] == [{"path": "\\data\\**\\*"}]
+        assert [query["aggrParam"]["aggrType"] for query in request_json["queries"]] == [
+            "COUNT",
+            "SUM",
+        ]
+
+    def test_group_by_extension(self, mock_commcell, mock_response):
+        mock_commcell._cvpysdk_object.make_request.return_value = (
+            True,
+            self._aggregate_response(mock_response, 2, 20),
+        )
+        backupset = _make_backupset(mock_commcell)
+
+        result = backupset.aggregate("\\data", group_by="extension", groups=["txt", ".pdf"])
+
+        values = sorted(
+            request_json["queries"][0]["whereClause"][1]["criteria"]["values"][0]
+            for request_json in self._request_jsons(mock_commcell)
+        )
+        assert result == {"txt": {"count": 2, "size": 20}, ".pdf": {"count": 2, "size": 20}}
+        assert values == ["*.pdf", "*.txt"]
+
+    def test_group_by_folder(self, mock_commcell, mock_response):
+        folders = mock_response(
+            json_data={
+                "browseResponses": [
+                    {
+                        "browseResult": {
+                            "dataResultSet": [
+                                {
+                                    "displayName": "logs",
+                                    "path": "\\data\\logs",
+                                    "flags": {"directory": True},
+                                },
+                                {"displayName": "a.txt", "flags": {"file": True}},
+                            ]
+                        }
+                    }
+                ]
+            }
+        )
+        mock_commcell._cvpysdk_object.make_request.side_effect = [
+            (True, folders),
+            (True, self._aggregate_response(mock_response, 1, 10)),
+        ]
+        backupset = _make_backupset(mock_commcell)
+
+        result = backupset.aggregate("\\data", group_by="folder")
+
+        assert result == {"logs": {"count": 1, "size": 10}}
+        assert self._request_jsons(mock_commcell)[1]["paths"] == [{"path": "\\data\\logs\\**\\*"}]
+
+    def test_group_by_mtime(self, mock_commcell, mock_response):
+        mock_commcell._cvpysdk_object.make_request.return_value = (
+            True,
+            self._aggregate_response(mock_response, 4, 40),
+        )
+        backupset = _make_backupset(mock_commcell)
+
+        result = backupset.aggregate(group_by="mtime", groups=[0, 100, 200], max_workers=1)
+
+        assert list(result) == [(0, 100), (100, 200)]
+
+    def test_aggregate_responses_matched_by_query_id(self, mock_commcell, mock_response):
+        def aggregate_response(query_id, aggr_type, field, count, result):
+            return {
+                "respType": 0,
+                "queryId": query_id,
+                "workflowJobId": 0,
+                "browseResult": {
+                    "totalItemsFound": 0,
+                    "aggrResultSet": [
+                        {"aggrType": aggr_type, "field": field, "count": count, "result": result}
+                    ],
+                },
+            }
+
+        mock_commcell._cvpysdk_object.make_request.return_value = (
+            True,
+            mock_response(
+                json_data={
+                    "browseResponses": [
+                        aggregate_response("size", "SUM", "FileSize", 2, 4096),
+                        aggregate_response("count", "COUNT", "Flags", 7, 7),
+                    ]
+                }
+            ),
+        )
+        backupset = _make_backupset(mock_commcell)
+
+        assert backupset.aggregate("\\data") == {"count": 7, "size": 4096}
+
+    @pytest.mark.parametrize(
+        "browse_responses",
+        [
+            [
+                {"browseResult": {"aggrResultSet": [{"count": 3}]}},
+                {"browseResult": {"aggrResultSet": [{"result": 300}]}},
+            ],
+            [
+                {"queryId": "count", "browseResult": {"aggrResultSet": [{"count": 3}]}},
+                {"queryId": "size", "browseResult": {"aggrResultSet": [{"sum": 300}]}},
+            ],
+            [
+                {"queryId": "count", "browseResult": {"aggrResultSet": [{"count": 3}]}},
+                {"queryId": "size", "browseResult": {}},
+            ],
+        ],
+    )
+    def test_unexpected_aggregate_response_raises(
+        self, mock_commcell, mock_response, browse_responses
+    ):
+        mock_commcell._cvpysdk_object.make_request.return_value = (
+            True,
+            mock_response(json_data={"browseResponses": browse_responses}),
+        )
+        backupset = _make_backupset(mock_commcell)
+
+        with pytest.raises(SDKException):
+            backupset.aggregate("\\data")
+
+    def test_missing_aggregates_raises(self, mock_commcell, mock_response):
+        mock_commcell._cvpysdk_object.make_request.return_value = (
+            True,
+            mock_response(json_data={"browseResponses": [{"browseResult": {}}]}),
+        )
+        backupset = _make_backupset(mock_commcell)
+
+        with pytest.raises(SDKException):
+            backupset.aggregate("\\data")
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"group_by": "owner"},
+            {"group_by": "extension"},
+            {"group_by": "mtime", "groups": [200, 100]},
+            {"max_workers": 0},
+        ],
+    )
+    def test_invalid_inputs(self, mock_commcell, kwargs):
+        backupset = _make_backupset(mock_commcell)
+
+        with pytest.raises(SDKException):
+            backupset.aggregate("\\data", **kwargs)
+
+
+@pytest.mark.unit
+class TestBackupsetSchedules:
+    """Tests for the lazily loaded Backupset.schedules."""
+
+    def test_schedules_loaded_on_first_access(self, mock_commcell):
+        from cvpysdk.backupset import Backupset
+
+        backupset = _make_backupset(mock_commcell)
+
+        with (
+            patch.object(Backupset, "_get_backupset_properties"),
+            patch("cvpysdk.backupset.Subclients"),
+            patch("cvpysdk.backupset.Schedules") as schedules,
+        ):
+            backupset.refresh()
+            assert schedules.call_count == 0
+
+            assert backupset.schedules is schedules.return_value
+            backupset.schedules
+            assert schedules.call_count == 1
+
+            backupset.refresh()
+            backupset.schedules
+            assert schedules.call_count == 2
@@ -22,3 +22,26 @@ class TestClient:
 
     def test_has_repr(self):
         assert hasattr(Client, "__repr__")
+
+    def test_upload_file_sends_chunks_with_request_id(
+        self, tmp_path, mock_commcell, mock_response
+    ):
+        (tmp_path / "data.bin").write_bytes(b"x" * 5000)
+        client = object.__new__(Client)
+        client._commcell_object = mock_commcell
+        client._cvpysdk_object = mock_commcell._cvpysdk_object
+        client._services = mock_commcell._services
+        client._client_id = "5"
+        mock_commcell._cvpysdk_object.make_request.side_effect = [
+            (True, mock_response(json_data={"requestId": 7, "chunkOffset": 2048})),
+            (True, mock_response(json_data={"requestId": 7, "chunkOffset": 4096})),
+            (True, mock_response(json_data={"requestId": 7, "chunkOffset": 5000})),
+        ]
+
+        stats = client.upload_file(str(tmp_path / "data.bin"), "/tmp/upload", chunk_size=2048)
+
+        calls = mock_commcell._cvpysdk_object.make_request.call_args_list
+        assert stats["chunks"] == 3
+        assert [call.args[1].endswith("requestId=7") for call in calls] == [False, True, True]
+        assert [call.kwargs["headers"]["FileEOF"] for call in calls] == ["0", "0", "1"]
+        assert b"".join(bytes(call.args[2]) for call in calls) == b"x" * 5000
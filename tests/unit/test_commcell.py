@@ -26,6 +26,23 @@ class TestCommcellContextManager:
             cc._cvpysdk_object._logout.assert_called_once()
 
 
+@pytest.mark.unit
+class TestCommcellRefresh:
+    """Tests for Commcell.refresh."""
+
+    def test_refresh_stops_job_subscriptions(self):
+        with patch.object(Commcell, "__init__", lambda x, *a, **kw: None):
+            cc = Commcell.__new__(Commcell)
+            cc._commserv_details_set = True
+            job_controller = MagicMock()
+            cc._job_controller = job_controller
+
+            cc.refresh()
+
+            job_controller.unsubscribe_all.assert_called_once()
+            assert cc._job_controller is None
+
+
 @pytest.mark.unit
 class TestCommcellUpdateResponse:
     """Tests for _update_response_ method."""
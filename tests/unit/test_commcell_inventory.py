@@ -0,0 +1,154 @@
+"""Unit tests for cvpysdk/commcell_inventory.py module."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cvpysdk.commcell_inventory import CommcellInventory, InventoryNode
+from cvpysdk.exception import SDKException
+
+RESPONSES = {
+    "Agent?clientId=1": {
+        "agentProperties": [
+            {"idaEntity": {"appName": "File System", "applicationId": 33}},
+            {"idaEntity": {"appName": "SQL Server", "applicationId": 81}},
+        ]
+    },
+    "Instance?clientId=1": {
+        "instanceProperties": [
+            {
+                "instance": {
+                    "appName": "File System",
+                    "applicationId": 33,
+                    "instanceName": "DefaultInstanceName",
+                    "instanceId": 1,
+                }
+            },
+            {"instance": {"appName": "SQL Server", "instanceName": "sql1", "instanceId": 5}},
+        ]
+    },
+    "Backupset?clientId=1&propertyLevel=10": {
+        "backupsetProperties": [
+            {
+                "backupSetEntity": {
+                    "backupsetName": "defaultBackupSet",
+                    "backupsetId": 10,
+                    "instanceId": 1,
+                }
+            }
+        ]
+    },
+    "Subclient?clientId=1&applicationId=33&propertyLevel=20": {
+        "subClientProperties": [
+            {
+                "subClientEntity": {
+                    "subclientName": "default",
+                    "subclientId": 100,
+                    "backupsetId": 10,
+                }
+            },
+            {"subClientEntity": {"subclientName": "sc1", "subclientId": 101, "backupsetId": 10}},
+        ]
+    },
+}
+
+
+def _make_inventory(mock_commcell, mock_response):
+    """Helper to build a CommcellInventory serving the list calls from RESPONSES."""
+
+    def make_request(method, url):
+        path = url.split("/api/")[-1]
+        if path in RESPONSES:
+            return True, mock_response(json_data=RESPONSES[path])
+        return False, mock_response(status_code=500, text="failed")
+
+    mock_commcell._cvpysdk_object.make_request.side_effect = make_request
+    mock_commcell._update_response_.side_effect = lambda text: text
+    mock_commcell.clients.all_clients = {"client1": {"id": "1"}, "client2": {"id": "2"}}
+    return CommcellInventory(mock_commcell)
+
+
+@pytest.mark.unit
+class TestCommcellInventory:
+    """Tests for the CommcellInventory and InventorySnapshot classes."""
+
+    def test_snapshot_builds_tree(self, mock_commcell, mock_response):
+        inventory = _make_inventory(mock_commcell, mock_response)
+
+        snapshot = inventory.snapshot(max_workers=2)
+
+        assert len(snapshot) == 9
+        assert [node.name for node in snapshot.nodes("agent")] == ["file system", "sql server"]
+        assert snapshot.get_node(("instance", 5)).parent.name == "sql server"
+        assert snapshot.find("subclient", "SC1")[0].path == [
+            "client1",
+            "file system",
+            "defaultinstancename",
+            "defaultbackupset",
+            "sc1",
+        ]
+        assert list(snapshot.errors) == [("client", 2)]
+        # agents of both clients, then instances, backupsets and subclients of client1
+        assert mock_commcell._cvpysdk_object.make_request.call_count == 5
+
+    def test_scope_and_clients_limit_the_fetch(self, mock_commcell, mock_response):
+        inventory = _make_inventory(mock_commcell, mock_response)
+
+        snapshot = inventory.snapshot(scope="agent", clients=["Client1"])
+
+        assert [node.key for node in snapshot.nodes("agent")] == [
+            ("agent", 1, 33),
+            ("agent", 1, 81),
+        ]
+        assert snapshot.nodes("instance") == []
+        mock_commcell._cvpysdk_object.make_request.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"scope": "job"}, {"max_workers": 0}, {"max_workers": "many"}]
+    )
+    def test_invalid_arguments(self, mock_commcell, mock_response, kwargs):
+        inventory = _make_inventory(mock_commcell, mock_response)
+
+        with pytest.raises(SDKException):
+            inventory.snapshot(**kwargs)
+
+    def test_hydrate_creates_each_object_once(self, mock_commcell, mock_response):
+        snapshot = _make_inventory(mock_commcell, mock_response).snapshot()
+
+        with (
+            patch("cvpysdk.client.Client") as client_cls,
+            patch("cvpysdk.agent.Agent") as agent_cls,
+            patch("cvpysdk.instance.Instance") as instance_cls,
+            patch("cvpysdk.backupset.Backupset") as backupset_cls,
+            patch("cvpysdk.subclient.Subclient._from_properties") as from_properties,
+        ):
+            from_properties.side_effect = lambda backupset, name, *args: MagicMock(name=name)
+            subclients = list(snapshot.iter_objects("subclient", max_workers=2))
+
+        assert len(subclients) == 2
+        client_cls.assert_called_once_with(mock_commcell, "client1", "1")
+        agent_cls.assert_called_once_with(client_cls.return_value, "file system", "33")
+        instance_cls.assert_called_once()
+        backupset_cls.assert_called_once_with(instance_cls.return_value, "defaultbackupset", "10")
+        from_properties.assert_any_call(
+            backupset_cls.return_value,
+            "sc1",
+            "101",
+            snapshot.find("subclient", "sc1")[0].properties,
+        )
+
+
+@pytest.mark.unit
+class TestInventoryNode:
+    """Tests for the InventoryNode class."""
+
+    def test_iter_descendants(self):
+        client = InventoryNode("client", "1", "client1")
+        agent = InventoryNode("agent", "33", "file system", client)
+        instance = InventoryNode("instance", "1", "defaultinstancename", agent)
+        client.children.append(agent)
+        agent.children.append(instance)
+
+        assert list(client.iter_descendants()) == [agent, instance]
+        assert list(client.iter_descendants("instance")) == [instance]
+        assert agent.key == ("agent", 1, 33)
@@ -0,0 +1,173 @@
+"""Unit tests for cvpysdk/config_store.py module."""
+
+import copy
+from unittest.mock import MagicMock
+
+import pytest
+
+from cvpysdk.commcell_inventory import InventoryNode
+from cvpysdk.config_store import ConfigDiff, ConfigStore
+from cvpysdk.exception import SDKException
+
+
+def _make_commcell(mock_commcell, mock_response, responses, subclients=()):
+    """Helper to build a commcell serving the GET requests from the responses dict."""
+
+    def make_request(method, url):
+        path = url.split("/api/")[-1]
+        if path in responses:
+            return True, mock_response(json_data=copy.deepcopy(responses[path]))
+        return False, mock_response(status_code=500, text="failed")
+
+    client = InventoryNode("client", "1", "client1", properties={"id": "1"})
+    nodes = {
+        "client": [client],
+        "subclient": [
+            InventoryNode("subclient", str(subclient_id), name, client, properties)
+            for subclient_id, name, properties in subclients
+        ],
+    }
+
+    mock_commcell._cvpysdk_object.make_request.side_effect = make_request
+    mock_commcell._update_response_.side_effect = lambda text: text
+    mock_commcell.inventory.snapshot.return_value.errors = {}
+    mock_commcell.inventory.snapshot.return_value.nodes.side_effect = nodes.__getitem__
+    return mock_commcell
+
+
+@pytest.mark.unit
+class TestConfigStore:
+    """Tests for the ConfigStore class."""
+
+    RESPONSES = {
+        "V2/Plan": {"plans": [{"plan": {"planId": 7, "planName": "Server Plan"}}]},
+        "V2/Plan/7": {"plan": {"rpo": {"backupFrequency": 1}, "name": "server plan"}},
+    }
+
+    def test_sync_fetches_only_changed_entities(self, tmp_path, mock_commcell, mock_response):
+        responses = copy.deepcopy(self.RESPONSES)
+        commcell = _make_commcell(mock_commcell, mock_response, responses)
+        store = ConfigStore(commcell, str(tmp_path / "commcell.db"))
+        make_request = commcell._cvpysdk_object.make_request
+
+        diff = store.sync(entity_types=["plan"])
+
+        assert diff.added == [("plan", "7", "server plan")]
+        assert store.load("plan")[("plan", "7")]["payload"] == responses["V2/Plan/7"]
+
+        # unchanged list entry, the plan properties are not fetched again
+        make_request.reset_mock()
+        assert not store.sync(entity_types=["plan"], full_refresh=False)
+        make_request.assert_called_once()
+
+        # changed list entry, the plan properties are fetched and compared
+        responses["V2/Plan"]["plans"][0]["plan"]["numAssocEntities"] = 3
+        responses["V2/Plan/7"]["plan"]["rpo"]["backupFrequency"] = 4
+        diff = store.sync(entity_types=["plan"], full_refresh=False)
+
+        assert diff.modified == [("plan", "7", "server plan", ["plan.rpo.backupFrequency"])]
+        assert store.load("plan")[("plan", "7")]["payload"]["plan"]["rpo"] == {
+            "backupFrequency": 4
+        }
+
+    def test_removed_entities_and_drift_check(self, tmp_path, mock_commcell, mock_response):
+        responses = copy.deepcopy(self.RESPONSES)
+        commcell = _make_commcell(mock_commcell, mock_response, responses)
+        store = ConfigStore(commcell, str(tmp_path / "commcell.db"))
+        store.sync(entity_types=["plan"])
+
+        responses["V2/Plan"]["plans"] = []
+        diff = store.sync(entity_types=["plan"], save=False)
+
+        assert diff.removed == [("plan", "7", "server plan")]
+        assert diff.changes("plan")["removed"] == diff.removed
+        assert list(store.load("plan")) == [("plan", "7")]
+
+        store.sync(entity_types=["plan"])
+        assert store.load("plan") == {}
+
+    def test_subclients_use_list_properties(self, tmp_path, mock_commcell, mock_response):
+        properties = {"commonProperties": {"enableBackup": True}}
+        commcell = _make_commcell(
+            mock_commcell, mock_response, {}, subclients=[(11, "default", properties)]
+        )
+        store = ConfigStore(commcell, str(tmp_path / "commcell.db"))
+
+        diff = store.sync(entity_types=["subclient"])
+
+        assert diff.added == [("subclient", "11", "default")]
+        assert store.load("subclient")[("subclient", "11")]["payload"] == properties
+        commcell._cvpysdk_object.make_request.assert_not_called()
+        commcell.inventory.snapshot.assert_called_once_with(
+            scope="subclient", clients=None, max_workers=8
+        )
+
+    def test_client_settings_drift_detected_by_default(
+        self, tmp_path, mock_commcell, mock_response
+    ):
+        responses = {"Client/1": {"clientProperties": [{"client": {"jobResultsDir": "C:\\a"}}]}}
+        commcell = _make_commcell(mock_commcell, mock_response, responses)
+        store = ConfigStore(commcell, str(tmp_path / "commcell.db"))
+        store.sync(entity_types=["client"])
+
+        # the list entry of the client is unchanged, only its settings are modified
+        responses["Client/1"]["clientProperties"][0]["client"]["jobResultsDir"] = "D:\\a"
+        make_request = commcell._cvpysdk_object.make_request
+        make_request.reset_mock()
+
+        assert not store.sync(entity_types=["client"], full_refresh=False)
+        make_request.assert_not_called()
+
+        diff = store.sync(entity_types=["client"])
+        assert diff.modified == [("client", "1", "client1", ["clientProperties"])]
+
+    def test_storage_policy_settings_drift_detected_by_default(
+        self, tmp_path, mock_commcell, mock_response
+    ):
+        responses = {
+            "StoragePolicy": {"policies": [{"storagePolicyId": 5, "storagePolicyName": "SP1"}]},
+            "v2/StoragePolicy/5?propertyLevel=10": {
+                "policies": [{"copies": [{"retentionRules": {"retainBackupDataForDays": 30}}]}]
+            },
+        }
+        commcell = _make_commcell(mock_commcell, mock_response, responses)
+        store = ConfigStore(commcell, str(tmp_path / "commcell.db"))
+        store.sync(entity_types=["storage_policy"])
+
+        # the list entry of the storage policy is unchanged, only its retention is modified
+        copies = responses["v2/StoragePolicy/5?propertyLevel=10"]["policies"][0]["copies"]
+        copies[0]["retentionRules"]["retainBackupDataForDays"] = 7
+
+        assert not store.sync(entity_types=["storage_policy"], full_refresh=False)
+
+        diff = store.sync(entity_types=["storage_policy"])
+        assert diff.modified == [("storage_policy", "5", "sp1", ["policies"])]
+
+    @pytest.mark.parametrize("kwargs", [{"entity_types": ["job"]}, {"max_workers": 0}])
+    def test_invalid_arguments(self, tmp_path, mock_commcell, mock_response, kwargs):
+        commcell = _make_commcell(mock_commcell, mock_response, {})
+        store = ConfigStore(commcell, str(tmp_path / "commcell.db"))
+
+        with pytest.raises(SDKException):
+            store.sync(**kwargs)
+
+    def test_failed_list_call_raises(self, tmp_path, mock_commcell, mock_response):
+        commcell = _make_commcell(mock_commcell, mock_response, {})
+        commcell.inventory.snapshot.return_value.errors = {
+            ("client", 1): SDKException("Response", "101")
+        }
+        store = ConfigStore(commcell, str(tmp_path / "commcell.db"))
+
+        with pytest.raises(SDKException):
+            store.sync(entity_types=["client"])
+
+
+@pytest.mark.unit
+class TestConfigDiff:
+    """Tests for the ConfigDiff class."""
+
+    def test_changed_paths(self):
+        old = {"a": {"b": 1, "c": [1, 2]}, "d": 1}
+        new = {"a": {"b": 2, "c": [1, 2]}, "e": MagicMock()}
+
+        assert ConfigDiff._get_changed_paths(old, new) == ["a.b", "d", "e"]
@@ -32,3 +32,30 @@ class TestDownloadCenter:
         # refresh is called once in __init__ and once explicitly
         assert mock_props.call_count == 2
         assert mock_pkgs.call_count == 2
+
+    def test_download_package_uses_file_downloader(self, tmp_path, mock_commcell, mock_response):
+        with (
+            patch.object(DownloadCenter, "_get_properties"),
+            patch.object(DownloadCenter, "_get_packages"),
+        ):
+            dc = DownloadCenter(mock_commcell)
+        dc._packages = {
+            "pkg": {"id": 5, "platforms": {"windows": {"id": 3, "download_type": ["exe"]}}}
+        }
+        mock_commcell._cvpysdk_object.make_request.return_value = (
+            True,
+            mock_response(
+                json_data={"errList": [], "fileContent": {"fileName": "pkg.exe", "requestId": 9}}
+            ),
+        )
+
+        with patch("cvpysdk.download_center.FileDownloader") as downloader_cls:
+            downloader_cls.return_value.download.side_effect = lambda path, resume: path
+            path = dc.download_package("pkg", str(tmp_path), max_streams=8, resume=False)
+
+        assert path == str(tmp_path / "pkg.exe")
+        args, kwargs = downloader_cls.call_args
+        assert args[1] == mock_commcell._services["DOWNLOAD_VIA_STREAM"]
+        assert 'requestId="9"' in args[2]
+        assert kwargs["max_streams"] == 8
+        downloader_cls.return_value.download.assert_called_once_with(path, resume=False)
@@ -0,0 +1,294 @@
+"""Unit tests for cvpysdk/file_transfer.py module."""
+
+import hashlib
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from cvpysdk.exception import SDKException
+from cvpysdk.file_transfer import FileDownloader, FileUploader
+
+CONTENT = bytes(range(256)) * 40
+
+
+class _StreamServer:
+    """Fake stream API serving CONTENT, with optional byte range support and failures."""
+
+    def __init__(self, content=CONTENT, ranges=True, drop_first_range=None):
+        self.content = content
+        self.ranges = ranges
+        self.drop_first_range = drop_first_range
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def __call__(self, method, url, payload=None, headers=None, stream=False, session=None):
+        range_header = headers.get("Range")
+        with self._lock:
+            self.requests.append(range_header)
+
+        response = MagicMock()
+        response.text = "failed"
+        size = len(self.content)
+
+        if range_header and self.ranges:
+            start, _, end = range_header[len("bytes=") :].partition("-")
+            start, end = int(start), int(end) if end else size - 1
+            if start >= size:
+                response.status_code = 416
+                response.headers = {"Content-Range": f"bytes */{size}"}
+                return False, response
+
+            body = self.content[start : end + 1]
+            response.status_code = 206
+            response.headers = {"Content-Range": f"bytes {start}-{end}/{size}"}
+        else:
+            body = self.content
+            response.status_code = 200
+            response.headers = {"Content-Length": str(size)}
+
+        drop = range_header is not None and range_header == self.drop_first_range
+        if drop:
+            self.drop_first_range = None
+
+        def iter_content(chunk_size):
+            for index in range(0, len(body), chunk_size):
+                if drop and index:
+                    raise requests.exceptions.ChunkedEncodingError("connection reset")
+                yield body[index : index + chunk_size]
+
+        response.iter_content.side_effect = iter_content
+        return response.status_code == 200, response
+
+
+def _make_downloader(mock_commcell, server, **kwargs):
+    """Helper to build a FileDownloader for the fake stream API."""
+    mock_commcell._cvpysdk_object.make_request.side_effect = server
+    mock_commcell._update_response_.side_effect = lambda text: text
+    kwargs.setdefault("chunk_size", 256)
+    kwargs.setdefault("min_part_size", 2048)
+    kwargs.setdefault("retry_delay", 0)
+    return FileDownloader(
+        mock_commcell, "https://example.com/stream", {"requestId": "1"}, **kwargs
+    )
+
+
+@pytest.mark.unit
+class TestFileDownloader:
+    """Tests for the FileDownloader class."""
+
+    def test_parallel_range_download(self, tmp_path, mock_commcell):
+        server = _StreamServer()
+        progress = []
+        downloader = _make_downloader(
+            mock_commcell,
+            server,
+            checksum=hashlib.sha256(CONTENT).hexdigest(),
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+        path = str(tmp_path / "package.tar")
+
+        assert downloader.download(path) == path
+
+        assert (tmp_path / "package.tar").read_bytes() == CONTENT
+        assert sorted(server.requests) == [
+            "bytes=0-",
+            "bytes=2560-5119",
+            "bytes=5120-7679",
+            "bytes=7680-10239",
+        ]
+        assert progress[-1] == (len(CONTENT), len(CONTENT))
+        assert downloader.downloaded_bytes == downloader.total_bytes == len(CONTENT)
+        assert sorted(item.name for item in tmp_path.iterdir()) == ["package.tar"]
+
+    def test_single_stream_without_range_support(self, tmp_path, mock_commcell):
+        server = _StreamServer(ranges=False)
+        downloader = _make_downloader(mock_commcell, server)
+
+        downloader.download(str(tmp_path / "package.tar"))
+
+        assert (tmp_path / "package.tar").read_bytes() == CONTENT
+        assert server.requests == ["bytes=0-"]
+
+    def test_resume_from_partial_file(self, tmp_path, mock_commcell):
+        (tmp_path / "package.tar.part").write_bytes(CONTENT[:3000])
+        server = _StreamServer()
+        downloader = _make_downloader(mock_commcell, server, max_streams=1)
+
+        downloader.download(str(tmp_path / "package.tar"))
+
+        assert (tmp_path / "package.tar").read_bytes() == CONTENT
+        assert server.requests == ["bytes=3000-"]
+
+    def test_resume_from_state_file(self, tmp_path, mock_commcell):
+        size = len(CONTENT)
+        partial = CONTENT[:1000] + bytes(4120) + CONTENT[5120:6000] + bytes(size - 6000)
+        (tmp_path / "package.tar.part").write_bytes(partial)
+        (tmp_path / "package.tar.part.json").write_text(
+            json.dumps({"size": size, "parts": [[0, 5119, 1000], [5120, size - 1, 880]]})
+        )
+        server = _StreamServer()
+        downloader = _make_downloader(mock_commcell, server)
+
+        downloader.download(str(tmp_path / "package.tar"))
+
+        assert (tmp_path / "package.tar").read_bytes() == CONTENT
+        assert sorted(server.requests) == ["bytes=1000-", "bytes=6000-10239"]
+        assert not (tmp_path / "package.tar.part.json").exists()
+
+    def test_complete_partial_file_is_not_downloaded(self, tmp_path, mock_commcell):
+        (tmp_path / "package.tar.part").write_bytes(CONTENT)
+        server = _StreamServer()
+        downloader = _make_downloader(
+            mock_commcell, server, checksum=hashlib.sha256(CONTENT).hexdigest()
+        )
+
+        downloader.download(str(tmp_path / "package.tar"))
+
+        assert (tmp_path / "package.tar").read_bytes() == CONTENT
+        assert server.requests == [f"bytes={len(CONTENT)}-"]
+
+    def test_full_size_partial_file_without_checksum_is_downloaded(self, tmp_path, mock_commcell):
+        (tmp_path / "package.tar.part").write_bytes(bytes(len(CONTENT)))
+        server = _StreamServer()
+        downloader = _make_downloader(mock_commcell, server)
+
+        downloader.download(str(tmp_path / "package.tar"))
+
+        assert (tmp_path / "package.tar").read_bytes() == CONTENT
+        assert server.requests[0] == f"bytes={len(CONTENT)}-"
+        assert "bytes=0-" in server.requests
+
+    def test_resume_after_kill_before_first_chunk(self, tmp_path, mock_commcell, monkeypatch):
+        server = _StreamServer()
+        downloader = _make_downloader(mock_commcell, server)
+
+        def killed(*args, **kwargs):
+            raise KeyboardInterrupt
+
+        with monkeypatch.context() as patch:
+            patch.setattr(downloader, "_download_parts", killed)
+            with pytest.raises(KeyboardInterrupt):
+                downloader.download(str(tmp_path / "package.tar"))
+
+        assert (tmp_path / "package.tar.part").stat().st_size == len(CONTENT)
+        assert (tmp_path / "package.tar.part.json").exists()
+
+        server.requests.clear()
+        downloader.download(str(tmp_path / "package.tar"))
+
+        assert (tmp_path / "package.tar").read_bytes() == CONTENT
+        assert sorted(server.requests)[0] == "bytes=0-"
+
+    def test_dropped_stream_resumes_from_last_byte(self, tmp_path, mock_commcell):
+        server = _StreamServer(drop_first_range="bytes=5120-7679")
+        downloader = _make_downloader(mock_commcell, server)
+
+        downloader.download(str(tmp_path / "package.tar"))
+
+        assert (tmp_path / "package.tar").read_bytes() == CONTENT
+        assert "bytes=5376-7679" in server.requests
+
+    def test_checksum_mismatch_raises(self, tmp_path, mock_commcell):
+        downloader = _make_downloader(mock_commcell, _StreamServer(), checksum="0" * 64)
+
+        with pytest.raises(SDKException):
+            downloader.download(str(tmp_path / "package.tar"))
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_failed_response_raises(self, tmp_path, mock_commcell):
+        response = MagicMock(status_code=500, headers={}, text="failed")
+        mock_commcell._cvpysdk_object.make_request.return_value = (False, response)
+        mock_commcell._update_response_.side_effect = lambda text: text
+        downloader = FileDownloader(mock_commcell, "https://example.com/stream")
+
+        with pytest.raises(SDKException):
+            downloader.download(str(tmp_path / "package.tar"))
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"chunk_size": 0}, {"max_streams": 0}, {"max_retries": -1}, {"checksum_algorithm": "x"}],
+    )
+    def test_invalid_arguments(self, mock_commcell, kwargs):
+        with pytest.raises(SDKException):
+            FileDownloader(mock_commcell, "https://example.com/stream", **kwargs)
+
+
+@pytest.mark.unit
+class TestFileUploader:
+    """Tests for the FileUploader class."""
+
+    def test_upload_streams_chunks_in_order(self, tmp_path):
+        (tmp_path / "data.zip").write_bytes(CONTENT)
+        received = []
+        progress = []
+
+        def send_chunk(chunk, offset, is_last):
+            chunk[:2] = b"HD"
+            received.append((bytes(chunk), offset, is_last))
+
+        uploader = FileUploader(
+            send_chunk,
+            chunk_size=4096,
+            header_size=2,
+            progress_callback=lambda sent, total, rate: progress.append((sent, total)),
+        )
+        stats = uploader.upload(str(tmp_path / "data.zip"))
+
+        assert [(offset, is_last) for _, offset, is_last in received] == [
+            (0, False),
+            (4096, False),
+            (8192, True),
+        ]
+        assert all(chunk.startswith(b"HD") for chunk, _, _ in received)
+        assert b"".join(chunk[2:] for chunk, _, _ in received) == CONTENT
+        assert progress[-1] == (len(CONTENT), len(CONTENT))
+        assert stats["bytes"] == uploader.sent_bytes == len(CONTENT)
+        assert stats["chunks"] == 3
+
+    def test_failed_chunk_is_retried(self, tmp_path):
+        (tmp_path / "data.zip").write_bytes(CONTENT)
+        received = []
+        failures = [requests.exceptions.ConnectionError("connection reset")]
+
+        def send_chunk(chunk, offset, is_last):
+            if offset == 4096 and failures:
+                raise failures.pop()
+            received.append((bytes(chunk), offset))
+
+        FileUploader(send_chunk, chunk_size=4096, retry_delay=0).upload(str(tmp_path / "data.zip"))
+
+        assert [offset for _, offset in received] == [0, 4096, 8192]
+        assert b"".join(chunk for chunk, _ in received) == CONTENT
+
+    def test_chunk_failing_after_retries_raises(self, tmp_path):
+        (tmp_path / "data.zip").write_bytes(CONTENT)
+
+        def send_chunk(chunk, offset, is_last):
+            raise requests.exceptions.ConnectionError("connection reset")
+
+        uploader = FileUploader(send_chunk, chunk_size=4096, max_retries=1, retry_delay=0)
+        with pytest.raises(SDKException):
+            uploader.upload(str(tmp_path / "data.zip"))
+
+        assert uploader.sent_bytes == 0
+
+    def test_upload_from_offset_and_empty_file(self, tmp_path):
+        (tmp_path / "data.zip").write_bytes(CONTENT)
+        (tmp_path / "empty.zip").write_bytes(b"")
+        received = []
+
+        def send_chunk(chunk, offset, is_last):
+            received.append((bytes(chunk), offset, is_last))
+
+        uploader = FileUploader(send_chunk, chunk_size=8192)
+        uploader.upload(str(tmp_path / "data.zip"), offset=6000)
+        uploader.upload(str(tmp_path / "empty.zip"))
+
+        assert received == [(CONTENT[6000:], 6000, True), (b"", 0, True)]
+
+        with pytest.raises(SDKException):
+            uploader.upload(str(tmp_path / "data.zip"), offset=len(CONTENT) + 1)
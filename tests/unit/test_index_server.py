@@ -1,4 +1,4 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -75,3 +75,177 @@ class TestIndexServers:
             idx._all_index_servers = {}
         with pytest.raises(SDKException):
             idx.get("nonexistent")
+
+
+def _make_index_server(mock_commcell):
+    """Helper to build a two node IndexServer without the requests made by __init__."""
+    from cvpysdk.datacube.constants import IndexServerConstants
+    from cvpysdk.index_server import IndexServer
+
+    index_server = object.__new__(IndexServer)
+    index_server._engine_name = "indexserver1"
+    index_server._commcell_obj = mock_commcell
+    index_server._cvpysdk_object = mock_commcell._cvpysdk_object
+    index_server._properties = {
+        IndexServerConstants.CLIENT_NAME: ["node1", "node2"],
+        IndexServerConstants.CI_SERVER_URL: ["http://node1:20000", "http://node2:20000"],
+    }
+    return index_server
+
+
+@pytest.mark.unit
+class TestIndexServerIterSolrQuery:
+    """Tests for the cursor based IndexServer.iter_solr_query."""
+
+    PAGES = {
+        "%2A": {
+            "response": {"docs": [{"contentid": "a"}, {"contentid": "b"}]},
+            "nextCursorMark": "AoE+/1=",
+        },
+        "AoE%2B%2F1%3D": {"response": {"docs": [{"contentid": "c"}]}, "nextCursorMark": "AoE+/2="},
+        "AoE%2B%2F2%3D": {"response": {"docs": []}, "nextCursorMark": "AoE+/2="},
+    }
+
+    def _serve(self, mock_commcell, mock_response):
+        def make_request(method, url):
+            if url.endswith("/schema/uniquekey?wt=json"):
+                return True, mock_response(json_data={"uniqueKey": "contentid"})
+            cursor_mark = url.split("cursorMark=")[1].split("&")[0]
+            return True, mock_response(json_data=self.PAGES[cursor_mark])
+
+        mock_commcell._cvpysdk_object.make_request.side_effect = make_request
+        return mock_commcell._cvpysdk_object.make_request
+
+    def test_iterates_all_pages(self, mock_commcell, mock_response):
+        make_request = self._serve(mock_commcell, mock_response)
+        index_server = _make_index_server(mock_commcell)
+
+        documents = index_server.iter_solr_query(
+            "core1", op_params={"start": 10, "sort": "datetime desc"}, batch_rows=2
+        )
+
+        assert [document["contentid"] for document in documents] == ["a", "b", "c"]
+        urls = [call[0][1] for call in make_request.call_args_list]
+        assert urls[0] == "http://node1:20000/solr/core1/schema/uniquekey?wt=json"
+        assert all(url.startswith("http://node1:20000/solr/core1/select?") for url in urls[1:])
+        assert "sort=datetime%20desc%2Ccontentid%20asc" in urls[1]
+        assert "&rows=2" in urls[1] and "start=" not in urls[1]
+
+    def test_spread_nodes_round_robin(self, mock_commcell, mock_response):
+        make_request = self._serve(mock_commcell, mock_response)
+        index_server = _make_index_server(mock_commcell)
+
+        list(index_server.iter_solr_query("core1", spread_nodes=True, unique_key="contentid"))
+
+        hosts = [call[0][1].split("/solr/")[0] for call in make_request.call_args_list]
+        assert hosts == ["http://node1:20000", "http://node2:20000", "http://node1:20000"]
+
+    @pytest.mark.parametrize("kwargs", [{"batch_rows": 0}, {"solr_client": "node3"}])
+    def test_invalid_arguments(self, mock_commcell, kwargs):
+        index_server = _make_index_server(mock_commcell)
+
+        with pytest.raises(SDKException):
+            index_server.iter_solr_query("core1", **kwargs)
+
+
+@pytest.mark.unit
+class TestSolrQueryRouter:
+    """Tests for the SolrQueryRouter class."""
+
+    RESPONSE = {"response": {"numFound": 1, "docs": [{"contentid": "a"}]}}
+
+    def _make_router(self, mock_commcell, mock_response, status_codes=None, **kwargs):
+        from cvpysdk.index_server import SolrQueryRouter
+
+        status_codes = status_codes or {}
+
+        def make_request(method, url, session=None):
+            status_code = status_codes.get(url.split("/solr/")[0], 200)
+            if status_code == 200:
+                return True, mock_response(json_data=self.RESPONSE)
+            return False, mock_response(status_code=status_code, text="error")
+
+        mock_commcell._cvpysdk_object.make_request.side_effect = make_request
+        index_server = _make_index_server(mock_commcell)
+        index_server.get_health_indicators = MagicMock()
+        return SolrQueryRouter(index_server, **kwargs)
+
+    def _hosts(self, mock_commcell):
+        return [
+            call[0][1].split("/solr/")[0]
+            for call in mock_commcell._cvpysdk_object.make_request.call_args_list
+        ]
+
+    def test_round_robin_with_pooled_sessions(self, mock_commcell, mock_response):
+        router = self._make_router(mock_commcell, mock_response)
+
+        for _ in range(4):
+            assert router.execute_solr_query("core1", {"datatype": 2}) == self.RESPONSE
+
+        assert (
+            self._hosts(mock_commcell)
+            == [
+                "http://node1:20000",
+                "http://node2:20000",
+            ]
+            * 2
+        )
+        sessions = [
+            call[1]["session"]
+            for call in mock_commcell._cvpysdk_object.make_request.call_args_list
+        ]
+        assert sessions[0] is sessions[2] and sessions[0] is not sessions[1]
+        # the health of each node is checked once, and cached
+        assert router._index_server.get_health_indicators.call_count == 2
+
+    def test_failover_marks_node_unhealthy(self, mock_commcell, mock_response):
+        router = self._make_router(
+            mock_commcell, mock_response, status_codes={"http://node1:20000": 503}
+        )
+
+        router.execute_solr_query("core1")
+        router.execute_solr_query("core1")
+
+        assert self._hosts(mock_commcell) == [
+            "http://node1:20000",
+            "http://node2:20000",
+            "http://node2:20000",
+        ]
+        assert router.healthy_nodes() == ["node2"]
+
+    def test_client_errors_are_not_retried(self, mock_commcell, mock_response):
+        router = self._make_router(
+            mock_commcell, mock_response, status_codes={"http://node1:20000": 400}
+        )
+
+        with pytest.raises(SDKException):
+            router.execute_solr_query("core1")
+        assert router.healthy_nodes() == ["node1", "node2"]
+
+    def test_forbidden_node_reuses_fallback_client(self, mock_commcell, mock_response):
+        router = self._make_router(
+            mock_commcell,
+            mock_response,
+            status_codes={"http://node1:20000": 403, "http://node2:20000": 403},
+        )
+        client = mock_commcell.clients.get.return_value
+        client.execute_script.return_value = (0, '{"response": {"numFound": 0}}', "")
+
+        for _ in range(4):
+            assert router.execute_solr_query("core1") == {"response": {"numFound": 0}}
+
+        assert mock_commcell._cvpysdk_object.make_request.call_count == 2
+        assert mock_commcell.clients.get.call_count == 2
+        assert client.execute_script.call_count == 4
+
+    def test_least_latency_strategy(self, mock_commcell, mock_response):
+        router = self._make_router(mock_commcell, mock_response, strategy="least_latency")
+        router._latency = {"node1": 0.5, "node2": 0.1}
+
+        router.execute_solr_query("core1")
+
+        assert self._hosts(mock_commcell) == ["http://node2:20000"]
+
+    def test_invalid_strategy(self, mock_commcell, mock_response):
+        with pytest.raises(SDKException):
+            self._make_router(mock_commcell, mock_response, strategy="random")
@@ -3,9 +3,11 @@
 from unittest.mock import patch
 
 import pytest
+import requests
 
+from cvpysdk.constants import JobStateEvent
 from cvpysdk.exception import SDKException
-from cvpysdk.job import Job, JobController
+from cvpysdk.job import Job, JobController, JobRecord, _JobStateWatcher
 
 
 @pytest.mark.unit
@@ -144,3 +146,359 @@ class TestJobProperties:
             job = Job.__new__(Job)
             job._job_id = "42"
             assert job.job_id == "42"
+
+
+def _jobs_response(mock_response, *summaries):
+    return mock_response(
+        json_data={"jobs": [{"jobSummary": {"isVisible": True, **s}} for s in summaries]}
+    )
+
+
+@pytest.mark.unit
+class TestJobControllerJobsList:
+    """Tests for JobController._get_jobs_list summary formats."""
+
+    summary = {
+        "jobId": 10,
+        "status": "Completed",
+        "percentComplete": 100,
+        "appTypeName": "File System",
+        "jobElapsedTime": 50,
+        "sizeOfApplication": 1000,
+        "subclient": {"clientId": 2, "clientName": "c1", "subclientId": 7},
+    }
+
+    def test_basic_summary(self, mock_commcell, mock_response):
+        mock_commcell._cvpysdk_object.make_request.return_value = (
+            True,
+            _jobs_response(mock_response, self.summary),
+        )
+        jobs = JobController(mock_commcell)._get_jobs_list()
+        assert jobs[10]["client_name"] == "c1"
+        assert jobs[10]["subclient_id"] == 7
+        assert jobs[10]["pending_reason"] == ""
+        assert jobs[10]["job_elapsed_time"] == 50
+
+    def test_record_summary(self, mock_commcell, mock_response):
+        mock_commcell._cvpysdk_object.make_request.return_value = (
+            True,
+            _jobs_response(mock_response, self.summary),
+        )
+        jobs = JobController(mock_commcell)._get_jobs_list(job_summary="record")
+        record = jobs[10]
+        assert isinstance(record, JobRecord)
+        assert record.size_of_application == 1000
+        assert not hasattr(record, "__dict__")
+
+    def test_invisible_jobs_skipped(self, mock_commcell, mock_response):
+        mock_commcell._cvpysdk_object.make_request.return_value = (
+            True,
+            _jobs_response(mock_response, {**self.summary, "isVisible": False}),
+        )
+        assert JobController(mock_commcell)._get_jobs_list() == {}
+
+
+@pytest.mark.unit
+class TestJobRecord:
+    """Tests for the JobRecord class and JobController.summarize_jobs."""
+
+    def test_to_dict_matches_basic_format(self):
+        record = JobRecord.from_summary(TestJobControllerJobsList.summary)
+        assert record.to_dict()["client_id"] == 2
+        assert record.to_dict()["backup_level"] is None
+
+    def test_from_dict_round_trip(self):
+        record = JobRecord.from_dict({"status": "Failed", "client_name": "c2"})
+        assert record.status == "Failed"
+        assert record.client_name == "c2"
+
+    def test_summarize_jobs(self):
+        jobs = {
+            1: JobRecord(
+                1,
+                status="Completed",
+                app_type="FS",
+                client_name="a",
+                job_elapsed_time=10,
+                size_of_application=100,
+            ),
+            2: JobRecord(
+                2,
+                status="Failed",
+                app_type="FS",
+                client_name="b",
+                job_elapsed_time=10,
+                size_of_application=300,
+            ),
+            3: {"status": "Completed", "app_type": "SQL", "client_name": "a"},
+        }
+        stats = JobController.summarize_jobs(jobs)
+        assert stats["total_jobs"] == 3
+        assert stats["total_bytes"] == 400
+        assert stats["throughput"] == 20.0
+        assert stats["by_client"] == {"a": 2, "b": 1}
+        assert stats["by_agent"] == {"FS": 2, "SQL": 1}
+        assert stats["by_status"] == {"Completed": 2, "Failed": 1}
+        assert stats["bytes_by_client"] == {"a": 100, "b": 300}
+
+    def test_summarize_empty(self):
+        assert JobController.summarize_jobs([])["throughput"] == 0.0
+
+
+@pytest.mark.unit
+class TestJobSubscriptions:
+    """Tests for JobController.subscribe and the job state watcher."""
+
+    def _watcher(self, mock_commcell, snapshots):
+        jc = JobController(mock_commcell)
+        watcher = _JobStateWatcher(jc)
+        jc.all_jobs = lambda **kw: snapshots.pop(0)
+        watcher.start = lambda: None
+        return watcher
+
+    def test_first_poll_is_baseline(self, mock_commcell):
+        watcher = self._watcher(mock_commcell, [{1: JobRecord(1, status="Running")}])
+        assert watcher.poll() == []
+
+    def test_events_from_snapshot_diff(self, mock_commcell):
+        watcher = self._watcher(
+            mock_commcell,
+            [
+                {1: JobRecord(1, status="Running", phase="Scan")},
+                {
+                    1: JobRecord(1, status="Running", phase="Backup"),
+                    2: JobRecord(2, status="Pending"),
+                },
+                {
+                    1: JobRecord(1, status="Completed", phase="Backup"),
+                    2: JobRecord(2, status="Failed"),
+                },
+            ],
+        )
+        received = []
+        watcher.add(None, lambda event, record, old: received.append((event, record.job_id)), None)
+
+        watcher.poll()
+        watcher.poll()
+        watcher.poll()
+        assert received == [
+            (JobStateEvent.PHASE_CHANGED, 1),
+            (JobStateEvent.STARTED, 2),
+            (JobStateEvent.PENDING, 2),
+            (JobStateEvent.COMPLETED, 1),
+            (JobStateEvent.FAILED, 2),
+        ]
+
+    def test_filter_and_event_selection(self, mock_commcell):
+        watcher = self._watcher(
+            mock_commcell,
+            [
+                {},
+                {
+                    1: JobRecord(1, status="Failed", client_name="a"),
+                    2: JobRecord(2, status="Failed", client_name="b"),
+                },
+            ],
+        )
+        received = []
+        watcher.add(
+            {"client_name": ["a"]}, lambda *args: received.append(args[1].job_id), ["failed"]
+        )
+
+        watcher.poll()
+        watcher.poll()
+        assert received == [1]
+
+    def test_no_callback_runs_once_stopped_during_poll(self, mock_commcell):
+        watcher = self._watcher(
+            mock_commcell,
+            [{}, {1: JobRecord(1, status="Running"), 2: JobRecord(2, status="Running")}],
+        )
+        received = []
+
+        def callback(event, record, old):
+            received.append(record.job_id)
+            watcher.stop()
+
+        watcher.add(None, callback)
+        watcher.add(None, lambda *args: received.append("second"))
+
+        watcher.poll()
+        watcher.poll()
+        assert received == [1]
+
+    def test_removed_subscription_gets_no_events_of_running_poll(self, mock_commcell):
+        watcher = self._watcher(mock_commcell, [{}, {1: JobRecord(1, status="Running")}])
+        received = []
+        second = None
+
+        def callback(event, record, old):
+            received.append("first")
+            watcher.remove(second)
+
+        watcher.add(None, callback)
+        second = watcher.add(None, lambda *args: received.append("second"))
+
+        watcher.poll()
+        watcher.poll()
+        assert received == ["first"]
+
+    def test_invalid_filter_raises(self, mock_commcell):
+        watcher = _JobStateWatcher(JobController(mock_commcell))
+        with pytest.raises(SDKException):
+            watcher.add({"unknown": 1}, print)
+        with pytest.raises(SDKException):
+            watcher.add(None, print, ["exploded"])
+
+    def test_unsubscribe_stops_poller(self, mock_commcell):
+        jc = JobController(mock_commcell)
+        jc.all_jobs = lambda **kw: {}
+        subscription_id = jc.subscribe(None, print, poll_interval=60)
+        assert jc._job_watcher.is_running
+        jc.unsubscribe(subscription_id)
+        assert not jc._job_watcher.is_running
+        with pytest.raises(SDKException):
+            jc.unsubscribe(subscription_id)
+
+    def test_watcher_options_of_running_poller_raise(self, mock_commcell):
+        jc = JobController(mock_commcell)
+        jc.all_jobs = lambda **kw: {}
+        jc.subscribe(None, print, poll_interval=60)
+        watcher = jc._job_watcher
+
+        jc.subscribe(None, print)
+        with pytest.raises(SDKException):
+            jc.subscribe(None, print, poll_interval=10)
+
+        jc.unsubscribe_all()
+        jc.subscribe(None, print, poll_interval=10)
+        assert jc._job_watcher is not watcher
+        assert jc._job_watcher._poll_interval == 10
+        jc.unsubscribe_all()
+
+
+@pytest.mark.unit
+class TestJobControllerBulkFetch:
+    """Tests for JobController.bulk_fetch."""
+
+    def _make_request(self, mock_response):
+        def make_request(method, url, payload=None):
+            if "Events" in url:
+                return True, mock_response(json_data={"commservEvents": [{"eventCode": 1}]})
+            if "Logs" in url:
+                if "/2/" in url:
+                    return False, mock_response(status_code=500)
+                resp = mock_response(text="line1\nline2")
+                return True, resp
+            if url.endswith("JobDetails"):
+                vm_status = [{"vmName": "vm1"}]
+                return True, mock_response(
+                    json_data={"job": {"jobDetail": {"clientStatusInfo": {"vmStatus": vm_status}}}}
+                )
+            raise AssertionError(url)
+
+        return make_request
+
+    def test_bulk_fetch_results(self, mock_commcell, mock_response):
+        mock_commcell._cvpysdk_object.make_request.side_effect = self._make_request(mock_response)
+        jc = JobController(mock_commcell)
+        results = dict(jc.bulk_fetch([1, "2"], parts=["events", "logs", "vm_list"], max_workers=2))
+
+        assert set(results) == {1, 2}
+        assert results[1]["events"] == [{"eventCode": 1}]
+        assert results[1]["logs"] == ["line1", "line2"]
+        assert results[1]["vm_list"] == [{"vmName": "vm1"}]
+        assert results[1]["errors"] == {}
+        assert "logs" in results[2]["errors"]
+
+    def test_details_fetched_once(self, mock_commcell, mock_response):
+        mock_commcell._cvpysdk_object.make_request.side_effect = self._make_request(mock_response)
+        jc = JobController(mock_commcell)
+        list(jc.bulk_fetch([1], parts=["details", "vm_list", "child_jobs"]))
+        assert mock_commcell._cvpysdk_object.make_request.call_count == 1
+
+    def test_transport_and_json_errors_are_recorded(self, mock_commcell, mock_response):
+        make_request = self._make_request(mock_response)
+
+        def failing_make_request(method, url, payload=None):
+            if url.endswith("jobId=1"):
+                raise requests.exceptions.ConnectionError("connection reset")
+            if "Events" in url:
+                resp = mock_response()
+                resp.json.side_effect = ValueError("not JSON")
+                return True, resp
+            return make_request(method, url, payload)
+
+        mock_commcell._cvpysdk_object.make_request.side_effect = failing_make_request
+        jc = JobController(mock_commcell)
+        results = dict(jc.bulk_fetch([1, 3], parts=["events", "logs"]))
+
+        assert isinstance(results[1]["errors"]["events"], requests.exceptions.ConnectionError)
+        assert isinstance(results[3]["errors"]["events"], ValueError)
+        assert results[3]["logs"] == ["line1", "line2"]
+
+    def test_invalid_part_raises(self, mock_commcell):
+        with pytest.raises(SDKException):
+            JobController(mock_commcell).bulk_fetch([1], parts=["bogus"])
+
+    def test_invalid_job_id_raises(self, mock_commcell):
+        with pytest.raises(SDKException):
+            JobController(mock_commcell).bulk_fetch(["abc"])
+
+
+@pytest.mark.unit
+class TestJobControllerModifyJobs:
+    """Tests for JobController.modify_jobs and the bulk job operation wrappers."""
+
+    def _make_request(self, mock_response):
+        def make_request(method, url, payload=None):
+            if "/2/" in url:
+                return True, mock_response(
+                    json_data={"errors": [{"errList": [{"errorCode": 1, "errLogMessage": "no"}]}]}
+                )
+            return True, mock_response(json_data={"errorCode": 0})
+
+        return make_request
+
+    def test_per_job_outcome(self, mock_commcell, mock_response):
+        mock_commcell._cvpysdk_object.make_request.side_effect = self._make_request(mock_response)
+        result = JobController(mock_commcell).suspend_jobs([1, 2, "3"], max_workers=2)
+        assert sorted(result["succeeded"]) == [1, 3]
+        assert "no" in result["failed"][2]
+        urls = sorted(c.args[1] for c in mock_commcell._cvpysdk_object.make_request.call_args_list)
+        assert all(url.endswith("/action/pause") for url in urls)
+
+    def test_filter_selects_jobs(self, mock_commcell, mock_response):
+        mock_commcell._cvpysdk_object.make_request.side_effect = self._make_request(mock_response)
+        jc = JobController(mock_commcell)
+        with patch.object(jc, "_get_jobs_list", return_value={4: {}, 5: {}}) as jobs_list:
+            result = jc.kill_jobs(job_type_list=["Backup"])
+        jobs_list.assert_called_once_with(job_type_list=["Backup"], category="ACTIVE", limit=10000)
+        assert sorted(result["succeeded"]) == [4, 5]
+
+    def test_invalid_operation_raises(self, mock_commcell):
+        with pytest.raises(SDKException):
+            JobController(mock_commcell).modify_jobs("pause", [1])
+
+    def test_no_job_ids_or_filter_raises(self, mock_commcell):
+        jc = JobController(mock_commcell)
+        with patch.object(jc, "_get_jobs_list") as jobs_list:
+            with pytest.raises(SDKException):
+                jc.kill_jobs()
+            with pytest.raises(SDKException):
+                jc.kill_jobs(None, limit=10)
+        jobs_list.assert_not_called()
+        mock_commcell._cvpysdk_object.make_request.assert_not_called()
+
+    def test_connection_error_is_reported_per_job(self, mock_commcell, mock_response):
+        make_request = self._make_request(mock_response)
+
+        def failing_make_request(method, url, payload=None):
+            if "/1/" in url:
+                raise requests.exceptions.ConnectionError("connection reset")
+            return make_request(method, url, payload)
+
+        mock_commcell._cvpysdk_object.make_request.side_effect = failing_make_request
+        result = JobController(mock_commcell).resume_jobs([1, 3])
+        assert result["succeeded"] == [3]
+        assert "connection reset" in result["failed"][1]
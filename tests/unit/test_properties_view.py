@@ -0,0 +1,69 @@
+"""Unit tests for cvpysdk/properties_view.py module."""
+
+import copy
+import json
+
+import pytest
+
+from cvpysdk.properties_view import PropertiesListView, PropertiesView, to_plain
+
+PROPERTIES = {
+    "commonProperties": {"description": "", "enableBackup": True},
+    "content": [{"path": "/data"}, {"path": "/logs"}],
+    "subClientEntity": {"subclientId": 5},
+}
+
+
+@pytest.mark.unit
+class TestPropertiesView:
+    """Tests for the PropertiesView and PropertiesListView classes."""
+
+    def test_nested_values_are_views(self):
+        view = PropertiesView(copy.deepcopy(PROPERTIES))
+
+        assert isinstance(view["commonProperties"], PropertiesView)
+        assert isinstance(view["content"], PropertiesListView)
+        assert isinstance(view["content"][0], PropertiesView)
+        assert isinstance(view["content"][:1], PropertiesListView)
+        assert view["subClientEntity"]["subclientId"] == 5
+        assert view.get("missing", {}) == {}
+        assert [item["path"] for item in view["content"]] == ["/data", "/logs"]
+
+    def test_view_is_read_only(self):
+        view = PropertiesView(copy.deepcopy(PROPERTIES))
+
+        with pytest.raises(TypeError):
+            view["commonProperties"]["description"] = "changed"
+        with pytest.raises(TypeError):
+            view["content"][0] = {}
+        with pytest.raises(AttributeError):
+            view["content"].append({})
+
+    def test_view_reflects_the_wrapped_dictionary(self):
+        data = copy.deepcopy(PROPERTIES)
+        view = PropertiesView(data)
+
+        data["commonProperties"]["description"] = "updated"
+
+        assert view["commonProperties"]["description"] == "updated"
+        assert view == data
+        assert view["content"] == data["content"]
+        assert repr(view) == repr(data)
+
+    def test_copies_are_plain(self):
+        view = PropertiesView(copy.deepcopy(PROPERTIES))
+
+        for plain in (view.copy(), copy.copy(view), copy.deepcopy(view), to_plain(view)):
+            assert type(plain) is dict
+            assert type(plain["content"]) is list
+            assert plain == PROPERTIES
+            plain["content"].append({"path": "/tmp"})
+
+        assert len(view["content"]) == 2
+        assert json.loads(json.dumps(to_plain(view))) == PROPERTIES
+
+    def test_to_plain_returns_other_values_unchanged(self):
+        data = {"key": "value"}
+
+        assert to_plain(data) is data
+        assert to_plain(None) is None
@@ -1,9 +1,16 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from cvpysdk.exception import SDKException
-from cvpysdk.schedules import OperationType, SchedulePattern, Schedules
+from cvpysdk.schedules import (
+    OperationType,
+    ScheduleForecast,
+    SchedulePattern,
+    Schedules,
+    ScheduleSnapshot,
+)
+from cvpysdk.services import get_services
 
 
 @pytest.mark.unit
@@ -124,3 +131,258 @@ class TestSchedules:
             )
             schedules = Schedules(mock_commcell)
             assert schedules.schedules == {}
+
+
+def _task_detail(task_id, schedule_ids, associations=None):
+    """Helper to build the task details of a schedule task."""
+    detail = {
+        "task": {"taskId": task_id},
+        "subTasks": [
+            {"subTask": {"subTaskId": schedule_id, "subTaskName": f"schedule {schedule_id}"}}
+            for schedule_id in schedule_ids
+        ],
+    }
+    if associations is not None:
+        detail["associations"] = associations
+    return detail
+
+
+@pytest.mark.unit
+class TestScheduleSnapshot:
+    """Tests for Schedules.snapshot and the ScheduleSnapshot class."""
+
+    TASK_DETAILS = [
+        _task_detail(1, [11], [{"clientId": 2, "subclientId": 5, "backupsetId": 4}]),
+        _task_detail(2, [21, 22], [{"clientId": 2, "applicationId": 33}, {"clientId": 3}]),
+        _task_detail(3, [31]),
+    ]
+
+    def _make_commcell(self, mock_response):
+        from cvpysdk.commcell import Commcell
+
+        commcell = MagicMock(spec=Commcell)
+        commcell._services = get_services("https://example.com/webconsole/api/")
+        commcell._cvpysdk_object = MagicMock()
+        commcell.commserv_name = "testcs"
+        commcell._cvpysdk_object.make_request.return_value = (
+            True,
+            mock_response(json_data={"taskDetail": self.TASK_DETAILS}),
+        )
+        return commcell
+
+    def _make_entities(self):
+        from cvpysdk.agent import Agent
+        from cvpysdk.client import Client
+        from cvpysdk.subclient import Subclient
+
+        subclient = MagicMock(spec=Subclient)
+        subclient.subclient_id = "5"
+        subclient._backupset_object = MagicMock()
+        agent = MagicMock(spec=Agent)
+        agent._client_object = MagicMock(client_id="2")
+        agent.agent_id = "33"
+        client = MagicMock(spec=Client)
+        client.client_id = "3"
+        return subclient, agent, client
+
+    def test_snapshot_indexes_schedules(self, mock_response):
+        commcell = self._make_commcell(mock_response)
+        subclient, agent, client = self._make_entities()
+
+        snapshot = Schedules(commcell).snapshot()
+
+        assert len(snapshot) == 4
+        assert list(snapshot.get_schedules(subclient)) == [11]
+        assert list(snapshot.get_schedules(agent)) == [21, 22]
+        assert list(snapshot.get_schedules(client)) == [21, 22]
+        assert list(snapshot.get_task_schedules(3)) == [31]
+        assert snapshot.get_schedule(31)["schedule_name"] == "schedule 31"
+        # one request for the commcell schedules, and one for the snapshot
+        assert commcell._cvpysdk_object.make_request.call_count == 2
+
+    def test_inherited_and_client_group_schedules_are_omitted(self, mock_response):
+        commcell = self._make_commcell(mock_response)
+        _, agent, client = self._make_entities()
+        client.client_id = "2"
+        task_details = self.TASK_DETAILS + [_task_detail(4, [41], [{"clientGroupId": 8}])]
+
+        snapshot = ScheduleSnapshot(commcell, task_details)
+
+        assert snapshot.get_schedule(41) is not None
+        assert list(snapshot.get_task_schedules(4)) == [41]
+        # the schedules are only indexed at the level of their association
+        assert list(snapshot.get_schedules(agent)) == [21, 22]
+        assert list(snapshot.get_schedules(client)) == []
+
+    def test_entity_schedules_served_from_snapshot(self, mock_response):
+        commcell = self._make_commcell(mock_response)
+        subclient, _, _ = self._make_entities()
+        subclient._commcell_object = commcell
+        snapshot = Schedules(commcell).snapshot()
+        make_request = commcell._cvpysdk_object.make_request
+        make_request.reset_mock()
+
+        schedules = snapshot.entity_schedules(subclient)
+
+        assert schedules.schedules == {11: snapshot.get_schedule(11)}
+        assert schedules.has_schedule("schedule 11")
+        make_request.assert_not_called()
+
+    def test_delete_removes_from_snapshot(self, mock_response):
+        commcell = self._make_commcell(mock_response)
+        subclient, _, _ = self._make_entities()
+        subclient._commcell_object = commcell
+        snapshot = Schedules(commcell).snapshot()
+        schedules = snapshot.entity_schedules(subclient)
+        commcell._cvpysdk_object.make_request.return_value = (
+            True,
+            mock_response(json_data={"errorCode": 0}),
+        )
+
+        schedules.delete(schedule_id=11)
+
+        assert schedules.schedules == {}
+        assert snapshot.get_schedule(11) is None
+
+    def test_snapshot_of_entity_schedules_raises(self, mock_response):
+        commcell = self._make_commcell(mock_response)
+        _, _, client = self._make_entities()
+        client._commcell_object = commcell
+
+        with pytest.raises(SDKException):
+            Schedules(client).snapshot()
+
+
+# 2025-01-01 00:00 UTC, a wednesday
+JAN_1 = 1735689600
+DAY = 86400
+
+
+def _pattern(freq_type, **kwargs):
+    """Helper to build a schedule pattern starting on 2025-01-01."""
+    pattern = {"freq_type": freq_type, "active_start_date": JAN_1, "active_start_time": 0}
+    pattern.update(kwargs)
+    return pattern
+
+
+@pytest.mark.unit
+class TestScheduleForecast:
+    """Tests for the ScheduleForecast class."""
+
+    def test_daily(self):
+        forecast = ScheduleForecast(JAN_1, JAN_1 + 7 * DAY)
+        pattern = _pattern(4, active_start_time=75600, freq_recurrence_factor=2)
+
+        assert forecast.expand(pattern) == [JAN_1 + day * DAY + 75600 for day in (0, 2, 4, 6)]
+
+    def test_weekly_days_and_recurrence(self):
+        forecast = ScheduleForecast(JAN_1, JAN_1 + 21 * DAY)
+        # monday and wednesday, every other week
+        pattern = _pattern(8, freq_interval=2 | 8, freq_recurrence_factor=2)
+
+        assert forecast.expand(pattern) == [JAN_1, JAN_1 + 12 * DAY, JAN_1 + 14 * DAY]
+
+    @pytest.mark.parametrize(
+        "pattern, expected_day",
+        [
+            (_pattern(16, freq_interval=15, freq_recurrence_factor=1), 14),
+            # last friday of the month
+            (_pattern(32, freq_interval=6, freq_relative_interval=5), 30),
+            # second weekday of the month
+            (_pattern(32, freq_interval=9, freq_relative_interval=2), 1),
+            # 31st of february runs on its last day
+            (_pattern(64, freq_interval=31, freq_recurrence_factor=2), 58),
+            # first sunday of march
+            (
+                _pattern(128, freq_interval=1, freq_relative_interval=1, freq_recurrence_factor=3),
+                60,
+            ),
+        ],
+    )
+    def test_monthly_and_yearly(self, pattern, expected_day):
+        forecast = ScheduleForecast(
+            JAN_1, JAN_1 + (31 if pattern["freq_type"] < 64 else 365) * DAY
+        )
+
+        assert forecast.expand(pattern) == [JAN_1 + expected_day * DAY]
+
+    def test_time_zones(self):
+        forecast = ScheduleForecast(JAN_1, JAN_1 + DAY)
+
+        new_york = _pattern(
+            1, active_start_time=3600, timeZone={"TimeZoneName": "America/New_York"}
+        )
+        india = _pattern(
+            1,
+            active_start_time=36000,
+            timeZone={"TimeZoneName": "(UTC+05:30) Chennai, Kolkata, Mumbai, New Delhi"},
+        )
+
+        assert forecast.expand(new_york) == [JAN_1 + 6 * 3600]
+        assert forecast.expand(india) == [JAN_1 + 36000 - 19800]
+        assert ScheduleForecast(JAN_1, JAN_1 + DAY, "Asia/Tokyo").expand(
+            _pattern(1, active_start_date=JAN_1 + DAY, active_start_time=3600)
+        ) == [JAN_1 + DAY + 3600 - 9 * 3600]
+
+    def test_exceptions_repeat_and_end_occurrence(self):
+        forecast = ScheduleForecast(JAN_1, JAN_1 + 5 * DAY)
+        pattern = _pattern(
+            4,
+            freq_subday_interval=8 * 3600,
+            active_end_time=23 * 3600,
+            repeatPattern=[
+                {"exception": True, "onDayNumber": SchedulePattern.exception_dates([2])}
+            ],
+            active_end_occurence=5,
+        )
+
+        assert forecast.expand(pattern) == [
+            JAN_1,
+            JAN_1 + 8 * 3600,
+            JAN_1 + 16 * 3600,
+            JAN_1 + 2 * DAY,
+            JAN_1 + 2 * DAY + 8 * 3600,
+        ]
+
+    def test_continuous_and_unsupported(self):
+        forecast = ScheduleForecast(JAN_1 + 5400, JAN_1 + 4 * 3600)
+
+        assert forecast.expand(_pattern(4096, freq_interval=60)) == [
+            JAN_1 + 2 * 3600,
+            JAN_1 + 3 * 3600,
+        ]
+        assert forecast.expand(_pattern(1024)) == []
+
+    def test_load_and_peak_concurrency(self):
+        forecast = ScheduleForecast(JAN_1, JAN_1 + 2 * DAY)
+        daily = _pattern(4, active_start_time=3600)
+        for schedule_id in range(3):
+            forecast.add(schedule_id, daily)
+        forecast.add(3, _pattern(1, active_start_time=5400))
+
+        # identical patterns are expanded only once
+        assert len(forecast._expanded) == 2
+        assert forecast.next_run_time(3) == JAN_1 + 5400
+        assert forecast.hourly_load() == {JAN_1 + 3600: 4, JAN_1 + DAY + 3600: 3}
+        assert forecast.peak_concurrency(duration=1800) == (3, JAN_1 + 3600)
+        assert forecast.peak_concurrency(duration={3: 60, 0: 3600}) == (4, JAN_1 + 5400)
+
+    @pytest.mark.parametrize(
+        "args", [(JAN_1, JAN_1), (JAN_1, "tomorrow"), (JAN_1, JAN_1 + DAY, "Mars/Olympus")]
+    )
+    def test_invalid_forecast(self, args):
+        with pytest.raises(SDKException):
+            ScheduleForecast(*args)
+
+    def test_snapshot_forecast_skips_disabled(self):
+        task_details = [
+            _task_detail(1, [11]),
+            _task_detail(2, [21]),
+        ]
+        task_details[0]["subTasks"][0]["pattern"] = _pattern(4, active_start_time=3600)
+        task_details[1]["subTasks"][0]["pattern"] = _pattern(4, active_start_time=3600)
+        task_details[1]["task"]["taskFlags"] = {"disabled": True}
+        snapshot = ScheduleSnapshot(MagicMock(), task_details)
+
+        assert snapshot.forecast(JAN_1, JAN_1 + DAY).run_times == {11: [JAN_1 + 3600]}
+        assert len(snapshot.forecast(JAN_1, JAN_1 + DAY, include_disabled=True).run_times) == 2
@@ -153,3 +153,171 @@ class TestSubclientRepr:
         sc._backupset_object.backupset_name = "defaultbackupset"
         result = repr(sc)
         assert "default" in result
+
+
+@pytest.mark.unit
+class TestSubclientProcessBackupResponse:
+    """Tests for Subclient._process_backup_response."""
+
+    def test_backup_job_invalidates_browse_cache(self, mock_commcell, mock_response):
+        sc = object.__new__(Subclient)
+        sc._subclient_id = "7"
+        sc._commcell_object = mock_commcell
+        sc._backupset_object = MagicMock()
+
+        with patch("cvpysdk.subclient.Job") as job:
+            result = sc._process_backup_response(True, mock_response(json_data={"jobIds": ["9"]}))
+
+        assert result is job.return_value
+        sc._backupset_object.invalidate_browse_cache.assert_called_once_with("7")
+
+
+@pytest.mark.unit
+class TestSubclientProperties:
+    """Tests for the read-only Subclient.properties view."""
+
+    def _make_subclient(self):
+        sc = object.__new__(Subclient)
+        sc._subclient_properties = {
+            "subClientEntity": {"subclientName": "default"},
+            "content": [{"path": "C:\\data"}],
+        }
+        sc._subClientEntity = sc._subclient_properties["subClientEntity"]
+        return sc
+
+    def test_properties_is_read_only_view(self):
+        sc = self._make_subclient()
+
+        props = sc.properties
+
+        assert props["content"][0]["path"] == "C:\\data"
+        assert props == sc._subclient_properties
+        with pytest.raises(TypeError):
+            props["subClientEntity"]["subclientName"] = "renamed"
+        assert props["subClientEntity"]._data is sc._subclient_properties["subClientEntity"]
+
+    def test_properties_copy_is_independent(self):
+        sc = self._make_subclient()
+
+        props = sc.properties_copy()
+        props["content"].append({"path": "D:\\data"})
+
+        assert len(sc.properties["content"]) == 1
+
+    def test_update_properties_accepts_view(self):
+        sc = self._make_subclient()
+        sc._cvpysdk_object = MagicMock()
+        sc._cvpysdk_object.make_request.return_value = (True, MagicMock())
+        sc._SUBCLIENT = "Subclient/5"
+
+        with (
+            patch.object(Subclient, "_process_update_response", return_value=(True, "0", "")),
+            patch.object(Subclient, "refresh"),
+        ):
+            sc.update_properties(sc.properties)
+
+        request_json = sc._cvpysdk_object.make_request.call_args[0][2]
+        assert type(request_json["subClientProperties"]["content"]) is list
+        assert request_json["subClientProperties"]["content"] == [{"path": "C:\\data"}]
+
+
+@pytest.mark.unit
+class TestSubclientSchedules:
+    """Tests for the lazily loaded Subclient.schedules."""
+
+    def test_schedules_loaded_on_first_access(self, mock_commcell):
+        backupset = _make_backupset_object(mock_commcell)
+        backupset._commcell_object = mock_commcell
+
+        with (
+            patch.object(Subclient, "_get_subclient_properties") as get_properties,
+            patch("cvpysdk.subclient.Schedules") as schedules,
+        ):
+            subclient = Subclient(backupset, "default", "5")
+            assert schedules.call_count == 0
+
+            assert subclient.schedules is schedules.return_value
+            assert subclient.schedules is schedules.return_value
+            assert schedules.call_count == 1
+
+            subclient.refresh()
+            assert schedules.call_count == 1
+            subclient.schedules
+            assert schedules.call_count == 2
+
+        assert get_properties.call_count == 2
+
+
+def _subclient_properties(name, subclient_id, backupset="defaultbackupset"):
+    """Helper to build the properties of a subclient in the subclients list response."""
+    return {
+        "subClientEntity": {
+            "appName": "file system",
+            "instanceName": "default",
+            "backupsetName": backupset,
+            "subclientName": name,
+            "subclientId": subclient_id,
+        },
+        "commonProperties": {"isDefaultSubclient": name == "default"},
+    }
+
+
+@pytest.mark.unit
+class TestSubclientsGetAll:
+    """Tests for Subclients.get_all and Subclients.iter_objects."""
+
+    def _make_subclients(self, mock_commcell, mock_response):
+        bs = _make_backupset_object(mock_commcell)
+        bs._commcell_object = mock_commcell
+        mock_commcell._cvpysdk_object.make_request.return_value = (
+            True,
+            mock_response(
+                json_data={
+                    "subClientProperties": [
+                        _subclient_properties("default", 11),
+                        _subclient_properties("sc1", 12),
+                        _subclient_properties("other", 13, backupset="otherbackupset"),
+                    ]
+                }
+            ),
+        )
+        return bs, Subclients(bs)
+
+    def test_get_all_uses_list_properties(self, mock_commcell, mock_response):
+        bs, subclients = self._make_subclients(mock_commcell, mock_response)
+        make_request = mock_commcell._cvpysdk_object.make_request
+        make_request.reset_mock()
+
+        result = subclients.get_all(max_workers=2)
+
+        assert list(result) == ["default", "sc1"]
+        assert result["sc1"].subclient_id == "12"
+        assert result["sc1"]._backupset_object is bs
+        assert result["default"]._commonProperties == {"isDefaultSubclient": True}
+        make_request.assert_not_called()
+
+    def test_refresh_after_prefetch_gets_properties(self, mock_commcell, mock_response):
+        _, subclients = self._make_subclients(mock_commcell, mock_response)
+        subclient = next(subclients.iter_objects())
+        make_request = mock_commcell._cvpysdk_object.make_request
+        make_request.reset_mock()
+
+        subclient.refresh()
+
+        make_request.assert_called_once()
+
+    def test_without_prefetch_gets_properties(self, mock_commcell, mock_response):
+        _, subclients = self._make_subclients(mock_commcell, mock_response)
+        make_request = mock_commcell._cvpysdk_object.make_request
+        make_request.reset_mock()
+
+        result = list(subclients.iter_objects(prefetch_properties=False))
+
+        assert [subclient.subclient_name for subclient in result] == ["default", "sc1"]
+        assert make_request.call_count == 2
+
+    def test_invalid_max_workers(self, mock_commcell, mock_response):
+        _, subclients = self._make_subclients(mock_commcell, mock_response)
+
+        with pytest.raises(SDKException):
+            subclients.iter_objects(max_workers=0)